@@ -11,12 +11,14 @@ The client also validates node readiness after operations using Kubernetes API.
 Operations are tracked using the Operation and OperationContext classes for metrics
 and troubleshooting.
 """
+# pylint: disable=too-many-lines
 
+import functools
 import logging
 import os
 import subprocess
 import time
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 # Third party imports
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
@@ -28,10 +30,18 @@ from azure.mgmt.containerservice import ContainerServiceClient
 # Local imports
 from utils.logger_config import get_logger, setup_logging
 from utils.common import get_env_vars
+from utils.operation_limiter import ClusterOperationLimiter
 from utils.provisioning_instrumentation import (
+    ReadyNodeTracker,
     begin_create_or_update_with_retry,
     instrument_nodepool_provisioning,
+    instrument_provisioning,
+    run_pipelined_steps,
 )
+from utils.readiness_timeline import add_observed_readiness
+from .arm_lro import AdaptiveArmPolling, ArmLroTracker
+from .arm_throttle import ArmThrottlePolicy, get_arm_throttle_governor
+from .credential_broker import AKS_AAD_SCOPE, get_credential_broker
 from .kubernetes_client import KubernetesClient
 
 # Configure logging
@@ -77,27 +87,49 @@ class AKSClient:
         """
         Run ARM operation and K8s node readiness check concurrently using threads.
         Delegates to provisioning_instrumentation.instrument_nodepool_provisioning.
+
+        The cluster's operation slot is taken before both timers start and held
+        until the ARM operation completes; the wait for it is recorded as
+        ``operation_slot_wait_seconds``.
         """
+        operation_slot = self._acquire_operation_slot(cluster_name, op, label=label)
+
         def arm_callable():
-            return begin_create_or_update_with_retry(
-                self.aks_client, self.resource_group,
-                cluster_name, node_pool_name, parameters, label=label,
-            )
+            try:
+                return begin_create_or_update_with_retry(
+                    self.aks_client, self.resource_group,
+                    cluster_name, node_pool_name, parameters, label=label, op=op,
+                )
+            finally:
+                operation_slot.release()
+
+        node_ready_times = {}
 
         def k8s_wait_callable():
             return self.k8s_client.wait_for_nodes_ready(
                 node_count=node_count,
                 operation_timeout_in_minutes=self.operation_timeout_minutes,
                 label_selector=f"agentpool={node_pool_name}",
+                ready_timestamps=node_ready_times,
             )
 
-        return instrument_nodepool_provisioning(
-            node_pool_name=node_pool_name,
-            op=op,
-            arm_callable=arm_callable,
-            k8s_wait_callable=k8s_wait_callable,
-            label=label,
-        )
+        try:
+            return instrument_nodepool_provisioning(
+                node_pool_name=node_pool_name,
+                op=op,
+                arm_callable=arm_callable,
+                k8s_wait_callable=k8s_wait_callable,
+                label=label,
+                ready_timestamps=node_ready_times,
+            )
+        finally:
+            operation_slot.release()
+
+    def _acquire_operation_slot(self, cluster_name: str, op, label: str = ""):
+        """Take a control-plane operation slot on the cluster and record the wait in ``op``."""
+        operation_slot = self.operation_limiter.acquire(cluster_name, label=label)
+        op.add_metadata("operation_slot_wait_seconds", round(operation_slot.waited, 3))
+        return operation_slot
 
     def __init__(
         self,
@@ -133,18 +165,23 @@ class AKSClient:
         self.cluster_name = cluster_name
         self.vm_size = None  # Initialize vm_size attribute
 
-        # Set up authentication
+        # Set up authentication. The credential chain is resolved once per
+        # process and its tokens are shared by every client through the broker.
         if use_managed_identity:
             mi_client_id = os.getenv("AZURE_MI_ID")
             if mi_client_id:
                 logger.info("Using Managed Identity with client ID for authentication")
-                self.credential = ManagedIdentityCredential(client_id=mi_client_id)
+                credential_key = ("managed_identity", mi_client_id)
+                credential_factory = functools.partial(ManagedIdentityCredential, client_id=mi_client_id)
             else:
                 logger.info("Using default Managed Identity for authentication")
-                self.credential = ManagedIdentityCredential()
+                credential_key = ("managed_identity", None)
+                credential_factory = ManagedIdentityCredential
         else:
             logger.info("Using DefaultAzureCredential for authentication")
-            self.credential = DefaultAzureCredential()
+            credential_key = ("default",)
+            credential_factory = DefaultAzureCredential
+        self.credential = get_credential_broker(credential_key, credential_factory)
         # Set up retry policy
         retry_policy = RetryPolicy(
             retry_mode=RetryMode.Exponential,
@@ -152,11 +189,18 @@ class AKSClient:
             backoff_factor=1.0,  # Exponential backoff factor
         )
         transport = RequestsTransport(retry_policy=retry_policy)
+        # Every SDK request attempt (including LRO polls and retries) draws
+        # from the process-wide ARM throttle governor shared with raw REST calls.
+        self.arm_throttle = get_arm_throttle_governor()
+        # Bounds concurrent node pool operations per cluster when one client is
+        # shared by several node pools (crud/main.py ``matrix``); unlimited by default.
+        self.operation_limiter = ClusterOperationLimiter()
         # Initialize AKS client
         self.aks_client = ContainerServiceClient(
             credential=self.credential,
             subscription_id=self.subscription_id,
             transport=transport,
+            per_retry_policies=[ArmThrottlePolicy(self.arm_throttle)],
         )
         if not self.aks_client:
             error_msg = "Failed to initialize AKS client."
@@ -172,6 +216,12 @@ class AKSClient:
         except Exception as e:
             logger.warning(f"Failed to initialize Kubernetes client: {str(e)}")
             self.k8s_client = None
+        if self.k8s_client:
+            # AAD clusters: serve Kubernetes API tokens from the broker instead of running kubelogin.
+            try:
+                self.k8s_client.set_token_provider(lambda: self.credential.token(AKS_AAD_SCOPE))
+            except Exception as e:
+                logger.warning(f"Keeping kubeconfig authentication, token provider not set: {str(e)}")
 
         logger.info("AKS client initialized successfully")
 
@@ -476,7 +526,7 @@ class AKSClient:
         # Create operation context to track the operation
         with self._get_operation_context()(
             "create_node_pool", "azure", metadata, result_dir=self.result_dir
-        ) as op:
+        ) as op, self.arm_throttle.track(op):
             try:
                 # Build parameters for node pool creation
                 parameters = {
@@ -501,6 +551,7 @@ class AKSClient:
                 if enable_managed_gpu:
                     # Fully managed GPU: use az CLI (aks-preview) since the stable SDK
                     # doesn't expose gpuProfile.nvidia.managementMode
+                    start_time = time.time()
                     self.add_managed_gpu_node_pool(
                         node_pool_name=node_pool_name,
                         cluster_name=cluster_name,
@@ -510,10 +561,15 @@ class AKSClient:
                         gpu_mig_strategy=gpu_mig_strategy,
                     )
                     label_selector = f"agentpool={node_pool_name}"
+                    node_ready_times = {}
                     ready_nodes = self.k8s_client.wait_for_nodes_ready(
                         node_count=node_count,
                         operation_timeout_in_minutes=self.operation_timeout_minutes,
                         label_selector=label_selector,
+                        ready_timestamps=node_ready_times,
+                    )
+                    add_observed_readiness(
+                        op, "observed_node_readiness_times", start_time, ready_nodes, node_ready_times
                     )
                 else:
                     # Run ARM and K8s readiness concurrently to capture both timings
@@ -527,29 +583,40 @@ class AKSClient:
 
                 # Verify NVIDIA drivers for managed GPU only (fully managed uses systemd)
                 pod_logs = None
+                gpu_timings = {}
                 if gpu_node_pool and not enable_managed_gpu and node_count > 0:
                     logger.info(
                         f"Verifying NVIDIA drivers for GPU node pool '{node_pool_name}'"
                     )
-                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
+                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                        ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                    )
                     op.add_metadata("nvidia_driver_logs", pod_logs)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
 
                 # For fully managed GPU, verify systemd services are active then confirm GPU access
                 if enable_managed_gpu and node_count > 0:
                     logger.info(
                         f"Verifying managed GPU systemd services for '{node_pool_name}'"
                     )
-                    service_status = self.k8s_client.verify_managed_gpu_systemd_services(ready_nodes)
+                    service_status = self.k8s_client.verify_managed_gpu_systemd_services(
+                        ready_nodes, timings=gpu_timings.setdefault("managed_gpu_services", {})
+                    )
                     op.add_metadata("managed_gpu_service_status", service_status)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
                     logger.info(
                         f"Verifying nvidia-smi for managed GPU node pool '{node_pool_name}'"
                     )
-                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
+                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                        ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                    )
                     op.add_metadata("nvidia_driver_logs", pod_logs)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
 
                 # Add additional metadata
                 op.add_metadata("ready_nodes", len(ready_nodes) if ready_nodes else 0)
                 op.add_metadata("node_pool_name", node_pool_name)
+                op.add_metadata("token_acquisition", self.credential.summary())
                 op.add_metadata(
                     "nodepool_info",                   
                         self.get_node_pool(node_pool_name, cluster_name).as_dict(),
@@ -578,6 +645,7 @@ class AKSClient:
         scale_step_size: int = 1,
         gpu_instance_profile: Optional[str] = None,
         gpu_mig_strategy: Optional[str] = None,
+        pipelined: bool = False,
     ) -> Any:
         """
         Scale a node pool to the specified node count.
@@ -590,6 +658,9 @@ class AKSClient:
             gpu_node_pool: Whether this is a GPU-enabled node pool (default: False)
             progressive: Whether to scale progressively in steps (default: False)
             scale_step_size: Number of nodes to add/remove in each step if progressive (default: 1)
+            pipelined: Whether progressive steps are pipelined, i.e. the next step is
+                       submitted as soon as the previous step's ARM operation completes
+                       (default: False)
 
         Returns:
             The scaled node pool object
@@ -647,12 +718,13 @@ class AKSClient:
                 node_pool=node_pool,
                 gpu_instance_profile=gpu_instance_profile,
                 gpu_mig_strategy=gpu_mig_strategy,
+                pipelined=pipelined,
             )
 
         # Create operation context to track the operation
         with self._get_operation_context()(
             operation_type, "azure", metadata, result_dir=self.result_dir
-        ) as op:
+        ) as op, self.arm_throttle.track(op):
             try:
                 # Store VM size for metrics
                 self.vm_size = node_pool.vm_size
@@ -687,24 +759,34 @@ class AKSClient:
                 )
 
                 pod_logs = None
+                gpu_timings = {}
                 if gpu_node_pool and not enable_managed_gpu and operation_type == "scale_up" and node_count > 0:
                     logger.info(
                         f"Verifying NVIDIA drivers for GPU node pool '{node_pool_name}'"
                     )
-                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
+                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                        ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                    )
                     op.add_metadata("nvidia_driver_logs", pod_logs)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
 
                 if enable_managed_gpu and operation_type == "scale_up" and node_count > 0:
                     logger.info(
                         f"Verifying managed GPU systemd services for '{node_pool_name}'"
                     )
-                    service_status = self.k8s_client.verify_managed_gpu_systemd_services(ready_nodes)
+                    service_status = self.k8s_client.verify_managed_gpu_systemd_services(
+                        ready_nodes, timings=gpu_timings.setdefault("managed_gpu_services", {})
+                    )
                     op.add_metadata("managed_gpu_service_status", service_status)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
                     logger.info(
                         f"Verifying nvidia-smi for managed GPU node pool '{node_pool_name}'"
                     )
-                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
+                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                        ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                    )
                     op.add_metadata("nvidia_driver_logs", pod_logs)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
                     if gpu_instance_profile:
                         logger.info(
                             f"Verifying MIG allocatable resources for profile {gpu_instance_profile}"
@@ -713,6 +795,7 @@ class AKSClient:
                         op.add_metadata("mig_allocatable", mig_status)
 
                 op.add_metadata("ready_nodes", len(ready_nodes))
+                op.add_metadata("token_acquisition", self.credential.summary())
 
                 return True
 
@@ -766,7 +849,7 @@ class AKSClient:
         # Create operation context to track the operation
         with self._get_operation_context()(
             "delete_node_pool", "azure", metadata, result_dir=self.result_dir
-        ) as op:
+        ) as op, self.arm_throttle.track(op):
             try:
                 logger.info(
                     f"Deleting node pool {node_pool_name} from cluster {cluster_name}"
@@ -776,15 +859,23 @@ class AKSClient:
                 op.add_metadata(
                     "cluster_info", self.get_cluster_data(cluster_name)
                 )
-                # Always use no-wait for the Azure operation
-                operation = self.aks_client.agent_pools.begin_delete(
-                    resource_group_name=self.resource_group,
-                    resource_name=cluster_name,
-                    agent_pool_name=node_pool_name,
-                )
+                with self.operation_limiter.slot(cluster_name) as slot_wait:
+                    op.add_metadata("operation_slot_wait_seconds", round(slot_wait, 3))
+                    lro_tracker = ArmLroTracker(
+                        kind=f"agentpool_delete:{node_pool_name}",
+                        label=f"Node pool {node_pool_name} deletion ",
+                    )
+                    # Always use no-wait for the Azure operation
+                    operation = self.aks_client.agent_pools.begin_delete(
+                        resource_group_name=self.resource_group,
+                        resource_name=cluster_name,
+                        agent_pool_name=node_pool_name,
+                        polling=AdaptiveArmPolling(lro_tracker),
+                    )
 
-                logger.info("Waiting for node pool deletion to complete...")
-                operation.result()  # Wait for completion
+                    logger.info("Waiting for node pool deletion to complete...")
+                    operation.result()  # Wait for completion
+                op.add_metadata("arm_lro", lro_tracker.summary())
                 logger.info(f"Node pool {node_pool_name} deleted successfully")
 
                 return True
@@ -808,6 +899,7 @@ class AKSClient:
         node_pool: Optional[Any] = None,
         gpu_instance_profile: Optional[str] = None,
         gpu_mig_strategy: Optional[str] = None,
+        pipelined: bool = False,
     ) -> Any:
         """
         Scale a node pool progressively with specified step size
@@ -821,6 +913,9 @@ class AKSClient:
             cluster_name: The name of the AKS cluster
             gpu_node_pool: Whether this is a GPU-enabled node pool (default: False)
             node_pool: The node pool object to use for scaling. If None, will fetch it.
+            pipelined: Submit each step as soon as the previous step's ARM operation
+                       completes instead of waiting for its nodes (default: False).
+                       See ``_pipelined_progressive_scale``.
 
         Returns:
             The final node pool object or False if scaling failed
@@ -858,6 +953,21 @@ class AKSClient:
 
         logger.info(f"Planned scaling steps: {list(steps)}")
 
+        if pipelined:
+            return self._pipelined_progressive_scale(
+                node_pool_name=node_pool_name,
+                current_count=current_count,
+                steps=list(steps),
+                scale_step_size=scale_step_size,
+                operation_type=operation_type,
+                cluster_name=cluster_name or self.get_cluster_name(),
+                gpu_node_pool=gpu_node_pool,
+                enable_managed_gpu=enable_managed_gpu,
+                node_pool=node_pool,
+                gpu_instance_profile=gpu_instance_profile,
+                gpu_mig_strategy=gpu_mig_strategy,
+            )
+
         completed_steps = []
 
         # Execute scaling operation for each step
@@ -884,7 +994,7 @@ class AKSClient:
             # Create operation context for this specific step
             with self._get_operation_context()(
                 operation_type, "azure", step_metadata, result_dir=self.result_dir
-            ) as op:
+            ) as op, self.arm_throttle.track(op):
                 logger.info(
                     f"Scaling from {previous_count} to {step} nodes (step {step_index + 1}/{len(steps)})"
                 )
@@ -925,27 +1035,11 @@ class AKSClient:
                             f"Waiting {wait_time}s before next scaling operation..."
                         )
                         time.sleep(wait_time)
-                    if step == target_count and gpu_node_pool and operation_type == "scale_up" and step > 0:
-                        logger.info(
-                            f"Verifying NVIDIA drivers for GPU node pool '{node_pool_name}' after reaching final target"
-                        )
-                        pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
-                        op.add_metadata("nvidia_driver_logs", pod_logs)
-
-                    if step == target_count and enable_managed_gpu and operation_type == "scale_up" and step > 0:
-                        logger.info(
-                            f"Verifying managed GPU systemd services for '{node_pool_name}' after reaching final target"
-                        )
-                        service_status = self.k8s_client.verify_managed_gpu_systemd_services(ready_nodes)
-                        op.add_metadata("managed_gpu_service_status", service_status)
-
-                    if step == target_count and gpu_instance_profile and operation_type == "scale_up" and step > 0:
-                        logger.info(
-                            f"Verifying MIG allocatable resources for profile {gpu_instance_profile}"
+                    if step == target_count and operation_type == "scale_up" and step > 0:
+                        self._verify_gpu_after_final_step(
+                            op, node_pool_name, ready_nodes, gpu_node_pool,
+                            enable_managed_gpu, gpu_instance_profile,
                         )
-                        mig_status = self.k8s_client.verify_mig_allocatable(ready_nodes, gpu_instance_profile)
-                        op.add_metadata("mig_allocatable", mig_status)
-
 
                 except Exception as e:
                     logger.error(f"Error at step {step}: {str(e)}")
@@ -958,3 +1052,155 @@ class AKSClient:
 
         # Return True on successful completion
         return True
+
+    def _verify_gpu_after_final_step(
+        self,
+        op,
+        node_pool_name: str,
+        ready_nodes: list,
+        gpu_node_pool: bool,
+        enable_managed_gpu: bool,
+        gpu_instance_profile: Optional[str],
+    ) -> None:
+        """Run the GPU verifications that follow the final step of a progressive scale-up."""
+        gpu_timings = {}
+        if gpu_node_pool:
+            logger.info(
+                f"Verifying NVIDIA drivers for GPU node pool '{node_pool_name}' after reaching final target"
+            )
+            pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+            )
+            op.add_metadata("nvidia_driver_logs", pod_logs)
+            op.add_metadata("gpu_verification_timings", gpu_timings)
+
+        if enable_managed_gpu:
+            logger.info(
+                f"Verifying managed GPU systemd services for '{node_pool_name}' after reaching final target"
+            )
+            service_status = self.k8s_client.verify_managed_gpu_systemd_services(
+                ready_nodes, timings=gpu_timings.setdefault("managed_gpu_services", {})
+            )
+            op.add_metadata("managed_gpu_service_status", service_status)
+            op.add_metadata("gpu_verification_timings", gpu_timings)
+
+        if gpu_instance_profile:
+            logger.info(
+                f"Verifying MIG allocatable resources for profile {gpu_instance_profile}"
+            )
+            mig_status = self.k8s_client.verify_mig_allocatable(ready_nodes, gpu_instance_profile)
+            op.add_metadata("mig_allocatable", mig_status)
+
+    def _pipelined_progressive_scale(
+        self,
+        node_pool_name: str,
+        current_count: int,
+        steps: List[int],
+        scale_step_size: int,
+        operation_type: str,
+        cluster_name: str,
+        gpu_node_pool: bool = False,
+        enable_managed_gpu: bool = False,
+        node_pool: Optional[Any] = None,
+        gpu_instance_profile: Optional[str] = None,
+        gpu_mig_strategy: Optional[str] = None,
+    ) -> bool:
+        """
+        Progressive scaling where step N+1 is submitted as soon as step N's ARM operation completes.
+
+        Node readiness of every step keeps being tracked in the background by a
+        single ``ReadyNodeTracker``, and each step is still recorded as its own
+        operation with ``command_execution_time`` and ``node_readiness_time``
+        measured from that step's start. The cluster and node pool are fetched
+        once per run instead of before every step; each step records the node
+        pool snapshot with its own target ``count``.
+
+        Returns:
+            True on successful completion
+        """
+        target_count = steps[-1]
+        cluster_info = self.get_cluster_data(cluster_name)
+        nodepool_info = self.get_node_pool(node_pool_name, cluster_name).as_dict()
+        readiness_timeout = self.operation_timeout_minutes * 60
+        label_selector = f"agentpool={node_pool_name}"
+
+        def run_step(step_index, step, control_plane_done):
+            previous_count = current_count if step_index == 0 else steps[step_index - 1]
+            step_metadata = {
+                "node_pool_name": node_pool_name,
+                "current_count": previous_count,
+                "target_count": step,
+                "scale_step_size": scale_step_size,
+                "cluster_name": cluster_name,
+                "gpu_node_pool": gpu_node_pool,
+                "pipelined": True,
+                **self._gpu_mode_metadata(
+                    gpu_node_pool,
+                    enable_managed_gpu,
+                    gpu_instance_profile,
+                    gpu_mig_strategy,
+                ),
+            }
+            with self._get_operation_context()(
+                operation_type, "azure", step_metadata, result_dir=self.result_dir
+            ) as op, self.arm_throttle.track(op):
+                logger.info(
+                    f"Scaling from {previous_count} to {step} nodes (step {step_index + 1}/{len(steps)}, pipelined)"
+                )
+                try:
+                    op.add_metadata("nodepool_info", {**nodepool_info, "count": step})
+                    op.add_metadata("cluster_info", cluster_info)
+                    # The next step only changes the count after this step's ARM
+                    # operation has completed, so the shared object is safe here.
+                    node_pool.count = step
+
+                    try:
+                        operation_slot = self._acquire_operation_slot(
+                            cluster_name, op, label=f"step {step} "
+                        )
+                    except Exception:
+                        control_plane_done.set()
+                        raise
+
+                    def arm_callable():
+                        try:
+                            return begin_create_or_update_with_retry(
+                                self.aks_client, self.resource_group,
+                                cluster_name, node_pool_name, node_pool,
+                                label=f"step {step} ", op=op,
+                            )
+                        finally:
+                            operation_slot.release()
+                            control_plane_done.set()
+
+                    try:
+                        ready_nodes = instrument_provisioning(
+                            node_pool_name=node_pool_name,
+                            op=op,
+                            control_plane_callable=arm_callable,
+                            k8s_wait_callable=lambda: tracker.wait_for(step, readiness_timeout),
+                            label=f"step {step} ",
+                        )
+                    finally:
+                        operation_slot.release()
+                    op.add_metadata("ready_nodes", len(ready_nodes))
+                    if step == target_count and operation_type == "scale_up" and step > 0:
+                        self._verify_gpu_after_final_step(
+                            op, node_pool_name, ready_nodes, gpu_node_pool,
+                            enable_managed_gpu, gpu_instance_profile,
+                        )
+                except Exception as e:
+                    logger.error(f"Error at step {step}: {str(e)}")
+                    op.add_metadata("error", str(e))
+                    raise
+
+        with ReadyNodeTracker(
+            lambda: self.k8s_client.get_ready_nodes(label_selector=label_selector, lightweight=True),
+            scaling_up=operation_type == "scale_up",
+        ) as tracker:
+            run_pipelined_steps(steps, run_step, label=f"[{node_pool_name}] ")
+
+        logger.info(
+            f"Pipelined progressive scaling from {current_count} to {target_count} completed successfully"
+        )
+        return True
@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 """AKS Machine API client.
 
 Extends ``AKSClient`` with raw Machine API REST methods. Public methods wrap
@@ -7,7 +8,6 @@ The batch scale path uses the private ``BatchPutMachine`` header contract.
 import json
 import logging
 import math
-import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
@@ -18,7 +18,16 @@ import requests
 from requests.adapters import HTTPAdapter
 
 from clients.aks_client import AKSClient
+from clients.arm_lro import ArmLroTracker, wait_for_arm_lro
+from clients.arm_throttle import (
+    BATCH_WRITES,
+    bind_throttle_usage,
+    classify_method,
+    parse_retry_after,
+)
+from clients.credential_broker import ARM_SCOPE
 from utils.logger_config import get_logger, setup_logging
+from utils.readiness_timeline import ReadinessTimeline
 
 # Configure logging.
 setup_logging()
@@ -30,10 +39,8 @@ get_logger("azure.core.pipeline").setLevel(logging.ERROR)
 get_logger("msal").setLevel(logging.ERROR)
 
 _ARM_BASE = "https://management.azure.com"
-_ARM_SCOPE = "https://management.azure.com/.default"
 _AGENTPOOL_API_VERSION = "2024-06-02-preview"
 _MACHINE_API_VERSION = "2025-06-02-preview"
-_POLL_INTERVAL_SECONDS = 10
 # Per-request HTTP timeout is capped so that a single slow PUT/GET cannot
 # consume the caller's whole ``timeout`` budget before the polling loop starts.
 # The remaining budget is reserved for ``_wait_for_agentpool_provisioning``.
@@ -98,9 +105,6 @@ class AKSMachineClient(AKSClient):
         super().__init__(*args, **kwargs)
         if self.k8s_client is None:
             raise RuntimeError("k8s_client is required by AKSMachineClient")
-        self._token_cache_value: Optional[str] = None
-        self._token_cache_expiry: float = 0.0  # unix epoch seconds
-        self._token_lock = threading.Lock()
         # Pool TCP/TLS across calls. ``requests.Session`` is thread-safe for
         # sending requests (each request creates its own urllib3 connection
         # from the shared pool), so this is safe for the parallel scale path.
@@ -119,15 +123,9 @@ class AKSMachineClient(AKSClient):
 
     # ---- auth + REST plumbing ----
     def _get_access_token(self) -> str:
-        """Cached token fetch. Re-uses token across worker threads with a 60s safety margin
-        before expiry. Avoids forking `az account get-access-token` per worker."""
-        with self._token_lock:
-            if self._token_cache_value and time.time() < self._token_cache_expiry - 60:
-                return self._token_cache_value
-            tok = self.credential.get_token(_ARM_SCOPE)
-            self._token_cache_value = tok.token
-            self._token_cache_expiry = float(tok.expires_on)
-            return self._token_cache_value
+        """ARM token from the process-wide credential broker. Reads are lock-free and the
+        broker refreshes the token in the background, so worker threads never block on it."""
+        return self.credential.token(ARM_SCOPE)
 
     def make_request(
         self,
@@ -144,15 +142,21 @@ class AKSMachineClient(AKSClient):
         Location header that callers must follow.
 
         Uses ``self._session`` for connection pooling so TCP/TLS handshakes
-        are reused across polls and parallel scale-path workers.
+        are reused across polls and parallel scale-path workers. Each request
+        first waits on the shared ARM throttle governor (reads for GET, writes
+        otherwise) and feeds the response's rate-limit headers back into it.
         """
+        op_class = classify_method(method)
+        self.arm_throttle.acquire(op_class)
         headers = {
             "Authorization": f"Bearer {self._get_access_token()}",
             "Content-Type": "application/json",
         }
-        return self._session.request(
+        resp = self._session.request(
             method, url, headers=headers, json=data, timeout=timeout
         )
+        self.arm_throttle.observe(op_class, resp.status_code, resp.headers)
+        return resp
 
     # ---- Machine API: agent pool provisioning ----
     def create_machine_agentpool(
@@ -192,7 +196,7 @@ class AKSMachineClient(AKSClient):
         }
         with self._get_operation_context()(
             "create_machine_agentpool", "azure", metadata, result_dir=self.result_dir
-        ) as op:
+        ) as op, self.arm_throttle.track(op):
             try:
                 sub = self.subscription_id
                 url = (
@@ -212,7 +216,9 @@ class AKSMachineClient(AKSClient):
                         f"create_machine_agentpool PUT failed: "
                         f"{resp.status_code} {resp.text[:500]}"
                     )
-                if not self._wait_for_agentpool_provisioning(url, timeout):
+                if not self._wait_for_agentpool_provisioning(
+                    url, timeout, initial_response=resp, op=op
+                ):
                     raise RuntimeError(
                         f"agentpool {agent_pool_name} did not reach Succeeded within {timeout}s"
                     )
@@ -223,51 +229,51 @@ class AKSMachineClient(AKSClient):
                 logger.error(f"Failed to create machine agentpool {agent_pool_name}: {e}")
                 raise
 
-    def _wait_for_agentpool_provisioning(self, url: str, timeout: int) -> bool:
-        """Poll the agentpool URL until provisioningState is terminal.
-
-        Polls every ``_POLL_INTERVAL_SECONDS`` (10s) using a 30s per-request HTTP
-        timeout. Returns True on 'Succeeded'. Returns False on 'Failed' or when
-        ``timeout`` seconds have elapsed since invocation. 4xx GETs are raised
-        immediately (e.g. 404 'agentpool not found', 401/403) since retrying
-        won't change the outcome; 5xx and other transient failures are logged
-        and retried until the deadline. By AKS contract a 200 GET on the
-        agentpool always includes ``properties.provisioningState``; if it is
-        absent on a 200 response, that is a Failed signal and we stop
-        immediately rather than waiting out the timeout.
+    def _wait_for_agentpool_provisioning(
+        self,
+        url: str,
+        timeout: int,
+        initial_response: Optional[requests.Response] = None,
+        op=None,
+    ) -> bool:
+        """Wait until the agentpool operation reaches a terminal state.
+
+        Follows the ``Azure-AsyncOperation``/``Location`` header of
+        ``initial_response`` when present, otherwise polls the agentpool's
+        ``provisioningState`` at ``url`` (see ``clients.arm_lro``). Polls are
+        adaptive: tight around the completion time expected from earlier
+        operations on this agentpool, backed off (honoring ``Retry-After``)
+        otherwise. Returns True on 'Succeeded'. Returns False on 'Failed'/
+        'Canceled' or when ``timeout`` seconds have elapsed since invocation.
+        4xx GETs are raised immediately (e.g. 404 'agentpool not found',
+        401/403) since retrying won't change the outcome; 5xx and 429 are
+        retried until the deadline, as are 200s whose body does not parse. By
+        AKS contract a 200 GET on the agentpool always includes
+        ``properties.provisioningState``; if a parsed body lacks it, that is a
+        Failed signal and we stop immediately rather than waiting out the
+        timeout. If ``op`` is given, the server-reported end time and detection
+        lag are added to its metadata as ``arm_lro``.
         """
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            r = self.make_request("GET", url, timeout=30)
-            if r.status_code != 200:
-                if 400 <= r.status_code < 500:
-                    raise RuntimeError(
-                        f"agentpool GET {url} -> {r.status_code} {r.text[:500]}"
-                    )
-                logger.warning(f"agentpool GET {url} -> {r.status_code}")
-                time.sleep(_POLL_INTERVAL_SECONDS)
-                continue
-            try:
-                body = r.json()
-            except (ValueError, TypeError) as exc:
-                logger.warning(f"agentpool poll JSON parse failed: {exc}")
-                time.sleep(_POLL_INTERVAL_SECONDS)
-                continue
-            state = body.get("properties", {}).get("provisioningState")
-            if state == "Succeeded":
-                return True
-            if state == "Failed":
-                logger.error(f"agentpool provisioning failed: {body}")
-                return False
-            if state is None:
-                logger.error(
-                    f"agentpool 200 GET returned without provisioningState; "
-                    f"treating as Failed. body={body}"
-                )
-                return False
-            time.sleep(_POLL_INTERVAL_SECONDS)
-        logger.error(f"agentpool provisioning timed out after {timeout}s")
-        return False
+        agent_pool_name = url.split("?", 1)[0].rsplit("/", 1)[-1]
+        tracker = ArmLroTracker(
+            kind=f"agentpool_put:{agent_pool_name}",
+            label=f"agentpool {agent_pool_name} ",
+        )
+        try:
+            wait_for_arm_lro(
+                lambda status_url: self.make_request("GET", status_url, timeout=30),
+                url,
+                timeout,
+                initial_response=initial_response,
+                tracker=tracker,
+            )
+        except TimeoutError:
+            logger.error(f"agentpool provisioning timed out after {timeout}s")
+            return False
+        finally:
+            if op is not None:
+                op.add_metadata("arm_lro", tracker.summary())
+        return tracker.status == "Succeeded"
 
     def _wait_for_machine_node_readiness(
         self,
@@ -328,63 +334,69 @@ class AKSMachineClient(AKSClient):
             f"targets {targets}, baseline={baseline_count}, expected={expected_count}, "
             f"timeout {timeout}s"
         )
-        while time.time() < deadline and len(readiness_times) < len(targets):
-            should_check_machines = (
-                next_machine_failure_check_at is not None
-                and time.time() >= next_machine_failure_check_at
-            )
-            failed_machines_result: List[Dict[str, Any]] = []
-            if should_check_machines and cluster_name and expected_machine_names:
-                with ThreadPoolExecutor(max_workers=2) as ex:
-                    ready_nodes = ex.submit(self._get_ready_node_count, label_selector)
-                    failed_machines = ex.submit(
-                        self._get_terminal_machine_provisioning_failures,
-                        cluster_name=cluster_name,
-                        agent_pool_name=agent_pool_name,
-                        expected_names=expected_machine_names,
+        # Serve the ListNodes polls below from a shared node watch instead of LIST calls
+        self.k8s_client.start_informers(("nodes",))
+        try:
+            while time.time() < deadline and len(readiness_times) < len(targets):
+                should_check_machines = (
+                    next_machine_failure_check_at is not None
+                    and time.time() >= next_machine_failure_check_at
+                )
+                failed_machines_result: List[Dict[str, Any]] = []
+                if should_check_machines and cluster_name and expected_machine_names:
+                    with ThreadPoolExecutor(max_workers=2) as ex:
+                        ready_nodes = ex.submit(self._get_ready_node_count, label_selector)
+                        failed_machines = ex.submit(
+                            bind_throttle_usage(self._get_terminal_machine_provisioning_failures),
+                            cluster_name=cluster_name,
+                            agent_pool_name=agent_pool_name,
+                            expected_names=expected_machine_names,
+                        )
+                        ready = ready_nodes.result()
+                    try:
+                        failed_machines_result = failed_machines.result()
+                    except Exception as e:
+                        logger.warning(
+                            "get_machine_provisioning_failures failed; "
+                            f"retrying on next cadence: {e}"
+                        )
+                    next_machine_failure_check_at = (
+                        time.time() + _MACHINE_FAILURE_CHECK_INTERVAL_SECONDS
                     )
-                    ready = ready_nodes.result()
-                try:
-                    failed_machines_result = failed_machines.result()
-                except Exception as e:
-                    logger.warning(
-                        "get_machine_provisioning_failures failed; "
-                        f"retrying on next cadence: {e}"
+                else:
+                    ready = self._get_ready_node_count(label_selector)
+                # Once all expected Machines are terminal, no more requested nodes
+                # can join. Preserve lower-percentile timings before failing.
+                if failed_machines_result:
+                    raise MachineProvisioningFailed(
+                        agent_pool_name=agent_pool_name,
+                        failed_machines=failed_machines_result,
+                        readiness_envelope=self._build_readiness_envelope(targets, readiness_times),
                     )
-                next_machine_failure_check_at = (
-                    time.time() + _MACHINE_FAILURE_CHECK_INTERVAL_SECONDS
-                )
-            else:
-                ready = self._get_ready_node_count(label_selector)
-            # Once all expected Machines are terminal, no more requested nodes
-            # can join. Preserve lower-percentile timings before failing.
-            if failed_machines_result:
-                raise MachineProvisioningFailed(
-                    agent_pool_name=agent_pool_name,
-                    failed_machines=failed_machines_result,
-                    readiness_envelope=self._build_readiness_envelope(targets, readiness_times),
-                )
-            now_elapsed = time.time() - start
-            for p, target in targets.items():
-                if p not in readiness_times and ready >= target:
-                    readiness_times[p] = now_elapsed
-                    logger.info(
-                        f"P{p} hit: {ready}/{target_total} ready "
-                        f"(target={target}, baseline={baseline_count}) at {now_elapsed:.2f}s"
+                now_elapsed = time.time() - start
+                for p, target in targets.items():
+                    if p not in readiness_times and ready >= target:
+                        readiness_times[p] = now_elapsed
+                        logger.info(
+                            f"P{p} hit: {ready}/{target_total} ready "
+                            f"(target={target}, baseline={baseline_count}) at {now_elapsed:.2f}s"
+                        )
+                if len(readiness_times) < len(targets):
+                    now = time.time()
+                    # Wake for the next node poll, next ListMachines check, or
+                    # overall timeout, whichever comes first.
+                    next_wake_at = min(
+                        now + _NODE_READINESS_POLL_INTERVAL_SECONDS,
+                        deadline,
                     )
-            if len(readiness_times) < len(targets):
-                now = time.time()
-                # Wake for the next node poll, next ListMachines check, or
-                # overall timeout, whichever comes first.
-                next_wake_at = min(
-                    now + _NODE_READINESS_POLL_INTERVAL_SECONDS,
-                    deadline,
-                )
-                if next_machine_failure_check_at is not None:
-                    next_wake_at = min(next_wake_at, next_machine_failure_check_at)
-                sleep_seconds = max(0.0, next_wake_at - now)
-                if sleep_seconds > 0:
-                    time.sleep(sleep_seconds)
+                    if next_machine_failure_check_at is not None:
+                        next_wake_at = min(next_wake_at, next_machine_failure_check_at)
+                    sleep_seconds = max(0.0, next_wake_at - now)
+                    if sleep_seconds > 0:
+                        time.sleep(sleep_seconds)
+        finally:
+            # Stop the watch thread even if the wait raises, or it keeps the process alive
+            self.k8s_client.stop_informers()
         result = self._build_readiness_envelope(targets, readiness_times)
         if not readiness_times:
             logger.warning(
@@ -435,10 +447,31 @@ class AKSMachineClient(AKSClient):
             for p in (50, 70, 90, 99, 100)
         }
 
+    def _add_readiness_timeline(
+        self, op, agent_pool_name: str, start_time: float, expected_count: int
+    ) -> None:
+        """Add ``timeline_node_readiness_times`` built from each new node's Ready
+        ``lastTransitionTime``. The poll-sampled envelope is kept alongside it;
+        a failed node listing only skips the timeline."""
+        try:
+            timeline = ReadinessTimeline(start_time)
+            timeline.record_all(
+                self.k8s_client.get_ready_nodes(
+                    label_selector=f"agentpool={agent_pool_name}", lightweight=True
+                )
+            )
+            timeline.add_to_operation(
+                op, "timeline_node_readiness_times", total=expected_count
+            )
+        except Exception as e:
+            logger.warning(f"readiness timeline for agentpool {agent_pool_name} skipped: {e}")
+
     def _get_ready_node_count(self, label_selector: str) -> int:
         """Return Ready node count for the pool, treating transient list failures as 0."""
         try:
-            ready_nodes = self.k8s_client.get_ready_nodes(label_selector=label_selector)
+            ready_nodes = self.k8s_client.get_ready_nodes(
+                label_selector=label_selector, lightweight=True
+            )
         except Exception as e:
             logger.warning(f"get_ready_nodes({label_selector}) failed; treating as 0 ready: {e}")
             return 0
@@ -456,6 +489,7 @@ class AKSMachineClient(AKSClient):
         timeout: int = 600,
         readiness_wait_timeout: int = 1200,
         tags: Optional[Dict[str, str]] = None,  # pylint: disable=unused-argument
+        batch_concurrency: Optional[int] = None,
     ) -> None:
         """Scale a Machine-mode agentpool by creating ``scale_machine_count`` machines.
 
@@ -468,9 +502,11 @@ class AKSMachineClient(AKSClient):
           1. Snapshot the current Ready+labeled node count in the agentpool
              (``baseline_count``) so the readiness watcher counts only NEW nodes.
           2. Submit machine PUTs -- individually by default, or sharded into
-             ``machine_workers`` chunks where each chunk is sent as a single
-             ``BatchPutMachine``-headered PUT when ``use_batch_api=True`` (per-
-             machine ARM polling is intentionally NOT performed in either path).
+             ``BatchPutMachine``-headered PUTs of at most
+             ``_BATCH_MAX_MACHINES_PER_REQUEST`` machines when
+             ``use_batch_api=True``, with at most ``batch_concurrency``
+             (default ``machine_workers``) shards in flight (per-machine ARM
+             polling is intentionally NOT performed in either path).
           3. Wait ONCE on the agentpool-level provisioningState.
           4. Wait for nodes labeled ``agentpool=<pool>`` to surpass
              ``baseline_count`` by enough to satisfy P50/P70/P90/P99/P100 targets.
@@ -494,6 +530,7 @@ class AKSMachineClient(AKSClient):
             "scale_machine_count": scale_machine_count,
             "use_batch_api": use_batch_api,
             "machine_workers": machine_workers,
+            "batch_concurrency": batch_concurrency,
         }
         # Bundle into a SimpleNamespace so the helpers retain the
         # ``request.foo`` shape without exposing yet another module-level data class.
@@ -503,12 +540,13 @@ class AKSMachineClient(AKSClient):
             resource_group=self.resource_group,
             vm_size=vm_size,
             machine_workers=machine_workers,
+            batch_concurrency=batch_concurrency,
             timeout=timeout,
             batch_command_execution_times={},
         )
         with self._get_operation_context()(
             "scale_machine", "azure", metadata, result_dir=self.result_dir
-        ) as op:
+        ) as op, self.arm_throttle.track(op):
             try:
                 # Snapshot baseline BEFORE any PUTs so the readiness watcher
                 # counts only NEW nodes.
@@ -516,7 +554,8 @@ class AKSMachineClient(AKSClient):
                 try:
                     baseline_count = len(
                         self.k8s_client.get_ready_nodes(
-                            label_selector=f"agentpool={agent_pool_name}"
+                            label_selector=f"agentpool={agent_pool_name}",
+                            lightweight=True,
                         )
                     )
                     logger.info(
@@ -543,6 +582,7 @@ class AKSMachineClient(AKSClient):
                         dict(request.batch_command_execution_times),
                     )
                 op.add_metadata("successful_machines", len(successful))
+                op.add_metadata("token_acquisition", self.credential.summary())
 
                 # Fail fast on partial landing BEFORE waiting on the agentpool
                 # or readiness against a reduced count -- otherwise the recorded
@@ -561,7 +601,7 @@ class AKSMachineClient(AKSClient):
                     f"{agent_pool_name}?api-version={_AGENTPOOL_API_VERSION}"
                 )
                 agentpool_ok = self._wait_for_agentpool_provisioning(
-                    agentpool_url, timeout
+                    agentpool_url, timeout, op=op
                 )
                 logger.info(
                     f"agentpool {agent_pool_name} provisioning "
@@ -583,6 +623,7 @@ class AKSMachineClient(AKSClient):
                     percentile_envelope = exc.readiness_envelope
                     op.add_metadata("failed_machines", exc.failed_machines)
                 op.add_metadata("percentile_node_readiness_times", percentile_envelope)
+                self._add_readiness_timeline(op, agent_pool_name, command_t0, len(successful))
                 p100 = percentile_envelope.get("P100", {})
                 op.add_metadata(
                     "node_readiness_time", p100.get("elapsed_time_seconds") or 0.0
@@ -638,7 +679,8 @@ class AKSMachineClient(AKSClient):
         # Clamp workers to >=1 so a misconfigured request (0 or negative) cannot
         # crash ThreadPoolExecutor with ValueError.
         with ThreadPoolExecutor(max_workers=max(1, request.machine_workers)) as ex:
-            futures = {ex.submit(self._create_single_machine, n, request): n for n in names}
+            create_single_machine = bind_throttle_usage(self._create_single_machine)
+            futures = {ex.submit(create_single_machine, n, request): n for n in names}
             for fut in as_completed(futures):
                 n = futures[fut]
                 try:
@@ -773,64 +815,60 @@ class AKSMachineClient(AKSClient):
         }
 
     # ---- Machine API: batch scale path ----
+    @staticmethod
+    def _shard_machine_names(names: List[str], machine_workers: int) -> List[List[str]]:
+        """Split ``names`` into contiguous ``BatchPutMachine`` shards.
+
+        The shard size is ``ceil(len(names) / machine_workers)`` capped at
+        ``_BATCH_MAX_MACHINES_PER_REQUEST``; the last shard carries the
+        remainder, so any machine count is accepted. E.g. 4 names over 3
+        workers -> [2, 2]; 1000 names over 10 workers -> 20 shards of 50;
+        120 names over 1 worker -> [50, 50, 20].
+        """
+        if machine_workers <= 0:
+            raise ValueError(f"machine_workers must be positive (got {machine_workers})")
+        if not names:
+            return []
+        shard_size = min(
+            _BATCH_MAX_MACHINES_PER_REQUEST, math.ceil(len(names) / machine_workers)
+        )
+        return [names[i:i + shard_size] for i in range(0, len(names), shard_size)]
+
     def _scale_machine_batch(
         self,
         request: SimpleNamespace,
         names: List[str],
     ) -> List[str]:
-        """Dispatch ``names`` across ``machine_workers`` worker slices via the Batch API.
+        """Submit ``names`` as concurrent ``BatchPutMachine`` shards.
 
-        Each worker submits exactly one ``BatchPutMachine``-headered PUT carrying
-        a contiguous slice of ``names``. Slices are computed by arithmetic from
-        the ``worker_id``.
+        ``names`` is split by ``_shard_machine_names``; each shard is one
+        ``BatchPutMachine``-headered PUT. At most ``request.batch_concurrency``
+        shards (default ``request.machine_workers``) are in flight at once,
+        sharing ``self._session`` (pooled TLS connections) and the cached ARM
+        token.
 
-        ``scale_machine_count`` MUST be an exact multiple of ``machine_workers``
-        and the resulting per-worker batch size MUST be no larger than
-        ``_BATCH_MAX_MACHINES_PER_REQUEST``. ``ValueError`` is raised otherwise
-        so the failure surfaces before any partial batch submission reaches ARM.
-
-        Per-worker exceptions are caught and logged; failed slices are excluded
+        Per-shard exceptions are caught and logged; failed shards are excluded
         from ``successful`` and batch timings are recorded on ``request``.
         """
-        n = len(names)
-        workers = request.machine_workers
-        if workers <= 0:
-            raise ValueError(f"machine_workers must be positive (got {workers})")
-        if n % workers != 0:
-            raise ValueError(
-                f"scale_machine_count ({n}) must be an exact multiple of "
-                f"machine_workers ({workers}) when use_batch_api=True; "
-                f"got remainder {n % workers}"
-            )
-        per_worker = n // workers
-        if per_worker > _BATCH_MAX_MACHINES_PER_REQUEST:
-            raise ValueError(
-                f"calculated batch size ({per_worker}) exceeds "
-                f"BatchPutMachine limit ({_BATCH_MAX_MACHINES_PER_REQUEST}); "
-                f"increase machine_workers for scale_machine_count ({n})"
-            )
-        successful: List[str] = []
+        shards = self._shard_machine_names(names, request.machine_workers)
+        concurrency = getattr(request, "batch_concurrency", None) or request.machine_workers
+        if concurrency <= 0:
+            raise ValueError(f"batch_concurrency must be positive (got {concurrency})")
+        logger.info(
+            f"submitting {len(names)} machines as {len(shards)} BatchPutMachine "
+            f"shard(s) of <= {len(shards[0]) if shards else 0} with concurrency {concurrency}"
+        )
 
-        def run_worker(worker_id: int) -> List[str]:
-            start = worker_id * per_worker
-            chunk = names[start:start + per_worker]
+        def run_shard(shard_idx: int, chunk: List[str]) -> List[str]:
             try:
-                return self._create_batch_machines(request, chunk, worker_id)
+                return self._create_batch_machines(request, chunk, shard_idx)
             except Exception:
-                logger.exception(f"batch worker {worker_id} failed")
+                logger.exception(f"batch shard {shard_idx} failed")
                 return []
 
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futures = [ex.submit(run_worker, w) for w in range(workers)]
-            for fut in as_completed(futures):
-                try:
-                    created = fut.result()
-                except Exception:
-                    # run_worker already swallows; this is belt-and-suspenders.
-                    logger.exception("unexpected error retrieving batch worker result")
-                    continue
-                successful.extend(created)
-        return successful
+        with ThreadPoolExecutor(max_workers=concurrency) as ex:
+            results = list(ex.map(bind_throttle_usage(run_shard), range(len(shards)), shards))
+        return [name for created in results for name in created]
 
     def _create_batch_machines(
         self,
@@ -899,19 +937,26 @@ class AKSMachineClient(AKSClient):
         # and backoff handling can still extend the overall elapsed time.
         put_timeout = min(request.timeout, _PER_REQUEST_TIMEOUT_CAP)
         start_time = datetime.now(timezone.utc)
+        submit_t0 = time.perf_counter()
         self._make_batch_request(
             "PUT", url, body, put_timeout,
             batch_header_value=batch_header_value,
             chunk_idx=chunk_idx,
             first_machine_name=first_machine_name,
         )
+        execution_time_seconds = time.perf_counter() - submit_t0
         end_time = datetime.now(timezone.utc)
-        execution_time_seconds = (end_time - start_time).total_seconds()
+        # ``start_time``/``end_time`` keep the second-resolution format the
+        # dashboards key on; ``submit_time``/``ack_time`` carry milliseconds
+        # so concurrently submitted shards can be ordered.
         request.batch_command_execution_times[first_machine_name] = {
             "start_time": start_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
             "end_time": end_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "submit_time": start_time.isoformat(timespec="milliseconds"),
+            "ack_time": end_time.isoformat(timespec="milliseconds"),
             "execution_time_seconds": execution_time_seconds,
             "total_machines_in_batch": len(chunk),
+            "shard_index": chunk_idx,
         }
         logger.info(
             f"chunk {chunk_idx}: BatchPutMachine PUT completed for {len(chunk)} "
@@ -949,6 +994,7 @@ class AKSMachineClient(AKSClient):
         backoff = _BATCH_429_INITIAL_BACKOFF_SECONDS
         last_resp: Optional[requests.Response] = None
         for attempt in range(_BATCH_429_MAX_RETRIES):
+            self.arm_throttle.acquire(BATCH_WRITES)
             headers = {
                 "Authorization": f"Bearer {self._get_access_token()}",
                 "Content-Type": "application/json",
@@ -962,6 +1008,7 @@ class AKSMachineClient(AKSClient):
                 method, url, headers=headers, json=data, timeout=timeout,
             )
             last_resp = resp
+            self.arm_throttle.observe(BATCH_WRITES, resp.status_code, resp.headers)
             if resp.status_code in (200, 201, 202, 204):
                 return
             if resp.status_code != 429:
@@ -971,6 +1018,15 @@ class AKSMachineClient(AKSClient):
                 )
             if attempt == _BATCH_429_MAX_RETRIES - 1:
                 break
+            retry_after = parse_retry_after(resp.headers)
+            if retry_after is not None:
+                # The governor blocks the next ``acquire`` until Retry-After
+                # has elapsed, for this and every other batch worker.
+                logger.warning(
+                    f"batch request 429 [{ctx}]; retrying after Retry-After={retry_after:.1f}s "
+                    f"(attempt {attempt + 1}/{_BATCH_429_MAX_RETRIES})"
+                )
+                continue
             logger.warning(
                 f"batch request 429 [{ctx}]; retrying in {backoff:.1f}s "
                 f"(attempt {attempt + 1}/{_BATCH_429_MAX_RETRIES})"
@@ -0,0 +1,338 @@
+"""
+ARM LRO Module
+
+Completion detection for ARM long-running operations (agent pool PUT/DELETE,
+Machine API agent pool PUTs). ARM accepts these with 201/202 and points at an
+``Azure-AsyncOperation`` status resource (``{"status": ..., "startTime": ...,
+"endTime": ...}``) or a ``Location`` URL that answers 202 until the operation
+is done. Polling those on a fixed 10-30s interval quantizes the measured
+``command_execution_time`` by up to the interval; instead:
+
+- The interval starts short and backs off while the operation is far from its
+  expected duration (learned from earlier operations of the same kind, or
+  extrapolated from ``percentComplete``), honoring ``Retry-After`` there.
+- Around the expected completion time the poller switches to a tight interval.
+- The server-reported ``endTime`` (or the ``Date`` of the first terminal
+  response) is recorded next to the time the client noticed completion.
+
+``AdaptiveArmPolling`` plugs this into the Azure SDK (``polling=`` argument of
+``begin_*``); ``wait_for_arm_lro`` does the same for raw REST responses. Both
+feed an ``ArmLroTracker`` whose ``summary()`` goes into ``Operation`` metadata.
+"""
+
+import email.utils
+import json
+import re
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from azure.mgmt.core.polling.arm_polling import ARMPolling
+
+from utils.logger_config import get_logger, setup_logging
+from .arm_throttle import bind_throttle_usage, parse_retry_after
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+TERMINAL_STATES = {"Succeeded", "Failed", "Canceled"}
+FAILED_STATES = {"Failed", "Canceled"}
+DEFAULT_MIN_INTERVAL_SECONDS = 0.5
+DEFAULT_MAX_INTERVAL_SECONDS = 10.0
+# Polling is tight from this fraction of the expected duration before it until
+# the same fraction after it.
+_COMPLETION_WINDOW_FRACTION = 0.2
+_INTERVAL_MULTIPLIER = 1.5
+_PROGRESS_LOG_INTERVAL_SECONDS = 30
+_MAX_DURATION_SAMPLES = 20
+
+_durations: Dict[str, deque] = {}
+_durations_lock = threading.Lock()
+_FRACTION_PATTERN = re.compile(r"(\.\d{6})\d+")
+
+
+def record_lro_duration(kind: str, seconds: float) -> None:
+    """Remember how long an operation of ``kind`` took, for later ``expected_lro_duration`` calls."""
+    if not kind or seconds <= 0:
+        return
+    with _durations_lock:
+        _durations.setdefault(kind, deque(maxlen=_MAX_DURATION_SAMPLES)).append(seconds)
+
+
+def expected_lro_duration(kind: str) -> Optional[float]:
+    """Median duration of earlier operations of ``kind`` in this process, or None."""
+    with _durations_lock:
+        samples = list(_durations.get(kind, ()))
+    return statistics.median(samples) if samples else None
+
+
+def parse_arm_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse an ARM timestamp (ISO 8601, e.g. ``2024-05-01T10:00:05.1234567Z``) or an HTTP date.
+
+    Returns:
+        A timezone-aware datetime, or None if ``value`` is not a timestamp.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        # Python 3.10 accepts neither the Z suffix nor 7 fractional digits.
+        parsed = datetime.fromisoformat(_FRACTION_PATTERN.sub(r"\1", value.replace("Z", "+00:00")))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    except ValueError:
+        pass
+    try:
+        return email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _header(headers: Optional[Mapping[str, Any]], name: str) -> Optional[str]:
+    value = headers.get(name) if headers is not None else None
+    return value if isinstance(value, str) and value else None
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat(timespec="milliseconds") if value else None
+
+
+class ArmLroTracker:
+    """
+    Poll schedule and timing record of one ARM long-running operation.
+
+    Times are wall-clock; comparing the server-reported ``endTime`` with the
+    local start and detection times assumes NTP-synchronized clocks.
+    """
+
+    def __init__(self, kind: str = "", expected_duration: Optional[float] = None,
+                 min_interval: float = DEFAULT_MIN_INTERVAL_SECONDS,
+                 max_interval: float = DEFAULT_MAX_INTERVAL_SECONDS, label: str = ""):
+        """
+        Args:
+            kind: Operation kind (e.g. ``agentpool_put:pool1``) whose past durations
+                  predict this one's; the duration is recorded under it on completion.
+            expected_duration: Expected duration in seconds. Defaults to the median of
+                               earlier operations of ``kind``.
+            min_interval: Poll interval around the expected completion time.
+            max_interval: Upper bound of the backed-off interval (without Retry-After).
+            label: Prefix for log messages.
+        """
+        self.kind = kind
+        self.expected_duration = expected_duration or expected_lro_duration(kind)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.label = label
+        self.start_time = time.time()
+        self.interval = min_interval
+        self.polls = 0
+        self.status = None
+        self.server_start_time = None
+        self.server_end_time = None
+        self.end_time_source = None
+        self.detected_time = None
+        self._last_progress_log = self.start_time
+
+    def elapsed(self) -> float:
+        return time.time() - self.start_time
+
+    def next_delay(self, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the next status poll."""
+        elapsed = self.elapsed()
+        if self.expected_duration:
+            window = self.expected_duration * _COMPLETION_WINDOW_FRACTION
+            window_start = self.expected_duration - window
+            if elapsed < window_start:
+                delay = retry_after or self._backoff()
+                return max(self.min_interval, min(delay, window_start - elapsed))
+            if elapsed <= self.expected_duration + window:
+                self.interval = self.min_interval
+                return self.min_interval
+        return max(self.min_interval, retry_after or self._backoff())
+
+    def _backoff(self) -> float:
+        delay = self.interval
+        self.interval = min(self.interval * _INTERVAL_MULTIPLIER, self.max_interval)
+        return delay
+
+    def observe(self, status: Optional[str], headers: Optional[Mapping[str, Any]] = None,
+                body: Optional[Dict[str, Any]] = None) -> None:
+        """Record one status poll: the LRO status and the status response's headers and body."""
+        self.polls += 1
+        body = body if isinstance(body, dict) else {}
+        now = time.time()
+        self.server_start_time = self.server_start_time or parse_arm_timestamp(body.get("startTime"))
+        percent = body.get("percentComplete")
+        if (isinstance(percent, (int, float)) and 0 < percent < 100
+                and not expected_lro_duration(self.kind)):
+            self.expected_duration = (now - self.start_time) * 100 / percent
+
+        if status != self.status:
+            logger.info(f"{self.label}ARM operation status: {status} ({now - self.start_time:.1f}s elapsed)")
+            self.status = status
+        elif now - self._last_progress_log >= _PROGRESS_LOG_INTERVAL_SECONDS:
+            logger.info(f"{self.label}waiting for ARM operation ({now - self.start_time:.0f}s elapsed)...")
+            self._last_progress_log = now
+
+        if status in TERMINAL_STATES and self.detected_time is None:
+            self.detected_time = now
+            end_time = parse_arm_timestamp(body.get("endTime"))
+            self.end_time_source = "endTime"
+            if end_time is None:
+                end_time = parse_arm_timestamp(_header(headers, "Date"))
+                self.end_time_source = "date_header" if end_time else None
+            self.server_end_time = end_time
+            if status == "Succeeded":
+                record_lro_duration(self.kind, self._server_duration() or now - self.start_time)
+
+    def _server_duration(self) -> Optional[float]:
+        if self.server_end_time is None:
+            return None
+        start = self.server_start_time.timestamp() if self.server_start_time else self.start_time
+        return self.server_end_time.timestamp() - start
+
+    def summary(self) -> Dict[str, Any]:
+        """Timing of the operation for ``Operation`` metadata."""
+        def from_epoch(value):
+            return datetime.fromtimestamp(value, timezone.utc) if value else None
+
+        server_end = self.server_end_time.timestamp() if self.server_end_time else None
+        return {
+            "kind": self.kind,
+            "status": self.status,
+            "polls": self.polls,
+            "expected_duration_seconds": self.expected_duration,
+            "client_start_time": _isoformat(from_epoch(self.start_time)),
+            "server_start_time": _isoformat(self.server_start_time),
+            "server_end_time": _isoformat(self.server_end_time),
+            "end_time_source": self.end_time_source,
+            "detected_time": _isoformat(from_epoch(self.detected_time)),
+            "server_execution_time": round(self._server_duration(), 3) if server_end else None,
+            "detection_lag_seconds": (
+                round(self.detected_time - server_end, 3) if server_end and self.detected_time else None
+            ),
+        }
+
+
+class AdaptiveArmPolling(ARMPolling):
+    """
+    Azure SDK LRO polling method driven by an ``ArmLroTracker``.
+
+    ``ARMPolling`` already follows ``Azure-AsyncOperation``/``Location``; only
+    the delay between polls and the completion record change. Pass it as
+    ``polling=AdaptiveArmPolling(tracker)`` to any ``begin_*`` SDK call.
+    The status polls run on the SDK's poller thread and count toward the ARM
+    throttle usage of the operation tracked where the polling was created.
+    """
+
+    def __init__(self, tracker: ArmLroTracker, **kwargs):
+        super().__init__(timeout=tracker.max_interval, **kwargs)
+        self.tracker = tracker
+        self._run = bind_throttle_usage(super().run)
+
+    def run(self) -> None:
+        self._run()
+
+    def _extract_delay(self) -> float:
+        headers = self._pipeline_response.http_response.headers if self._pipeline_response else None
+        return self.tracker.next_delay(parse_retry_after(headers))
+
+    def update_status(self) -> None:
+        super().update_status()
+        http_response = self._pipeline_response.http_response
+        try:
+            body = json.loads(http_response.text() or "{}")
+        except (ValueError, TypeError):
+            body = {}
+        self.tracker.observe(self.status(), http_response.headers, body)
+
+
+def _lro_status(mode: str, status_code: int, body: Dict[str, Any]) -> Optional[str]:
+    if mode == "async_operation":
+        return body.get("status")
+    if mode == "location":
+        return "InProgress" if status_code == 202 else "Succeeded"
+    state = body.get("properties", {}).get("provisioningState")
+    # By AKS contract a 200 GET on the resource always carries provisioningState.
+    return state if state is not None else "Failed"
+
+
+def _json_body(response) -> Optional[Dict[str, Any]]:
+    """JSON object of a status response, ``{}`` for any other JSON value, or None if it does not parse."""
+    try:
+        body = response.json()
+    except (ValueError, TypeError):
+        return None
+    return body if isinstance(body, dict) else {}
+
+
+def wait_for_arm_lro(
+    send_get: Callable[[str], Any],
+    resource_url: str,
+    timeout_seconds: float,
+    initial_response=None,
+    tracker: Optional[ArmLroTracker] = None,
+) -> ArmLroTracker:
+    """
+    Wait for an ARM long-running operation started with a raw REST call.
+
+    Follows ``Azure-AsyncOperation`` if the initial response has it, else
+    ``Location``, else polls ``resource_url`` for ``properties.provisioningState``.
+
+    Args:
+        send_get: ``send_get(url)`` performs an authenticated GET and returns a
+                  ``requests.Response``-like object.
+        resource_url: URL of the resource being provisioned.
+        timeout_seconds: Budget measured from the tracker's start.
+        initial_response: Response of the PUT/DELETE that started the operation, if any.
+        tracker: Tracker to drive; a new one is created if omitted.
+
+    Returns:
+        The tracker; ``tracker.status`` is the terminal status.
+
+    Raises:
+        TimeoutError: If no terminal status is observed within ``timeout_seconds``.
+        RuntimeError: If a status GET fails with a non-retryable 4xx.
+    """
+    tracker = tracker or ArmLroTracker()
+    headers = initial_response.headers if initial_response is not None else None
+    mode, status_url = "resource", resource_url
+    if _header(headers, "Azure-AsyncOperation"):
+        mode, status_url = "async_operation", _header(headers, "Azure-AsyncOperation")
+    elif _header(headers, "Location"):
+        mode, status_url = "location", _header(headers, "Location")
+    retry_after = parse_retry_after(headers)
+    deadline = tracker.start_time + timeout_seconds
+
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise TimeoutError(f"{tracker.label}ARM operation did not complete within {timeout_seconds}s")
+        time.sleep(min(tracker.next_delay(retry_after), remaining))
+        response = send_get(status_url)
+        retry_after = parse_retry_after(response.headers)
+        if response.status_code == 429 or response.status_code >= 500:
+            logger.warning(f"{tracker.label}ARM status GET {status_url} -> {response.status_code}")
+            continue
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"ARM status GET {status_url} -> {response.status_code} {response.text[:500]}"
+            )
+        body = _json_body(response)
+        if body is None:
+            if mode != "location":
+                # A truncated or non-JSON body says nothing about the operation; poll again.
+                logger.warning(
+                    f"{tracker.label}ARM status GET {status_url} returned an unparseable body, "
+                    f"retrying: {response.text[:200]}"
+                )
+                continue
+            body = {}
+        tracker.observe(_lro_status(mode, response.status_code, body), response.headers, body)
+        if tracker.status in TERMINAL_STATES:
+            if tracker.status in FAILED_STATES:
+                logger.error(f"{tracker.label}ARM operation {tracker.status}: {body}")
+            return tracker
@@ -0,0 +1,378 @@
+"""
+ARM Throttle Module
+
+Process-wide token-bucket governor for Azure Resource Manager requests. ARM
+throttles each subscription with token buckets for reads and writes and
+reports the remaining quota in ``x-ms-ratelimit-remaining-subscription-*``
+response headers; the AKS RP additionally throttles ``BatchPutMachine``
+requests on their own. Instead of every caller retrying 429s on its own, all
+ARM traffic of the process (raw REST calls and the Azure SDK pipeline) draws
+from one set of buckets per operation class:
+
+- The local bucket never holds more tokens than ARM reports as remaining.
+- The refill rate is cut in half on a 429 and recovers additively on success.
+- ``Retry-After`` on a 429 blocks the whole class until it has elapsed.
+
+Callers therefore wait before sending instead of spending retries on 429s.
+The time spent waiting and the remaining-quota samples are exported into
+``Operation`` metadata via ``track``. Requests are attributed to the tracked
+operation of the calling context, so operations running concurrently in one
+process (matrix pools, pipelined steps) each report only their own traffic;
+work handed to other threads is attributed with ``bind_throttle_usage``.
+"""
+
+import contextvars
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+READS = "reads"
+WRITES = "writes"
+BATCH_WRITES = "batch_writes"
+
+# (refill rate per second, bucket capacity). Reads and writes follow ARM's
+# per-subscription bucket sizes; BatchPutMachine is throttled by the AKS RP
+# well below the ARM write limit, so it starts with a much smaller bucket.
+DEFAULT_BUCKETS = {
+    READS: (25.0, 250),
+    WRITES: (10.0, 200),
+    BATCH_WRITES: (1.0, 10),
+}
+_REMAINING_HEADERS = {
+    READS: "x-ms-ratelimit-remaining-subscription-reads",
+    WRITES: "x-ms-ratelimit-remaining-subscription-writes",
+    BATCH_WRITES: "x-ms-ratelimit-remaining-subscription-writes",
+}
+_DELETE_REMAINING_HEADER = "x-ms-ratelimit-remaining-subscription-deletes"
+# Lower bound of the adaptive refill rate, as a fraction of the base rate.
+_MIN_RATE_FACTOR = 0.05
+# Additive recovery per successful response, as a fraction of the base rate.
+_RATE_RECOVERY_FACTOR = 0.05
+_MAX_QUOTA_SAMPLES = 100
+
+
+def classify_method(method: str) -> str:
+    """Map an HTTP method to the ARM operation class it is throttled under."""
+    return READS if method.upper() in ("GET", "HEAD") else WRITES
+
+
+def parse_retry_after(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Return the ``Retry-After`` delay in seconds, or None if absent or not numeric."""
+    return _header_number(headers, "Retry-After")
+
+
+def _header_number(headers: Optional[Mapping[str, Any]], name: str) -> Optional[float]:
+    if headers is None:
+        return None
+    value = headers.get(name)
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    """Token bucket with an adaptive refill rate and a Retry-After block."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return 0, or return the seconds until one is available."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def observe_remaining(self, remaining: float, now: float) -> None:
+        self._refill(now)
+        self.tokens = min(self.tokens, remaining)
+        # Slow the refill down as ARM's own bucket drains so we converge on
+        # its rate instead of running into it.
+        fraction = remaining / self.capacity if self.capacity else 1.0
+        if fraction < 0.5:
+            self.rate = max(self.base_rate * _MIN_RATE_FACTOR, self.base_rate * 2 * fraction)
+
+    def on_success(self) -> None:
+        self.rate = min(self.base_rate, self.rate + self.base_rate * _RATE_RECOVERY_FACTOR)
+
+    def on_throttled(self, retry_after: Optional[float], now: float) -> None:
+        self.rate = max(self.base_rate * _MIN_RATE_FACTOR, self.rate / 2)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        "requests": 0,
+        "throttled_requests": 0,
+        "throttle_wait_seconds": 0.0,
+        "throttled_responses": 0,
+        "samples": 0,
+    }
+
+
+class _ThrottleUsage:
+    """Throttle counters and quota samples of one tracked operation and the ones nested in it."""
+
+    def __init__(self, parent: Optional["_ThrottleUsage"] = None):
+        self.parent = parent
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.samples: Dict[str, deque] = {}
+
+    def add(self, op_class: str, key: str, amount: float = 1) -> None:
+        usage = self
+        while usage is not None:
+            stats = usage.stats.setdefault(op_class, _empty_stats())
+            stats[key] += amount
+            usage = usage.parent
+
+    def add_sample(self, op_class: str, sample: Dict[str, Any]) -> None:
+        usage = self
+        while usage is not None:
+            usage.samples.setdefault(op_class, deque(maxlen=_MAX_QUOTA_SAMPLES)).append(sample)
+            usage = usage.parent
+
+
+_current_usage: contextvars.ContextVar = contextvars.ContextVar("arm_throttle_usage", default=None)
+
+
+def bind_throttle_usage(func: Callable) -> Callable:
+    """
+    Attribute the ARM requests ``func`` makes to the operation tracked in the calling context.
+
+    Context variables do not follow work into thread pools or SDK poller threads;
+    wrap callables submitted to them from inside ``track``.
+    """
+    usage = _current_usage.get()
+    if usage is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _current_usage.set(usage)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current_usage.reset(token)
+    return wrapper
+
+
+class ArmThrottleGovernor:
+    """
+    Shared rate governor for ARM requests.
+
+    Typical use::
+
+        governor = get_arm_throttle_governor()
+        governor.acquire(READS)
+        response = session.get(url)
+        governor.observe(READS, response.status_code, response.headers)
+    """
+
+    def __init__(self, buckets: Optional[Dict[str, tuple]] = None):
+        """
+        Args:
+            buckets: Map of operation class to ``(refill_rate_per_second, capacity)``.
+                     Defaults to ``DEFAULT_BUCKETS``.
+        """
+        self._lock = threading.Lock()
+        self._buckets = {
+            op_class: _TokenBucket(rate, capacity)
+            for op_class, (rate, capacity) in (buckets or DEFAULT_BUCKETS).items()
+        }
+        self._stats = {op_class: _empty_stats() for op_class in self._buckets}
+        self._samples = {op_class: deque(maxlen=_MAX_QUOTA_SAMPLES) for op_class in self._buckets}
+
+    def _add(self, op_class: str, key: str, amount: float = 1) -> None:
+        """Count into the process-wide stats and the calling context's tracked operation."""
+        self._stats[op_class][key] += amount
+        usage = _current_usage.get()
+        if usage is not None:
+            usage.add(op_class, key, amount)
+
+    def acquire(self, op_class: str) -> float:
+        """
+        Block until a request of ``op_class`` may be sent.
+
+        The wait is counted toward the operation tracked in the calling context.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self._buckets[op_class].reserve(time.monotonic())
+                if delay <= 0:
+                    self._add(op_class, "requests")
+                    if waited:
+                        self._add(op_class, "throttled_requests")
+                        self._add(op_class, "throttle_wait_seconds", waited)
+                    return waited
+            if not waited:
+                logger.debug(f"ARM {op_class} throttled locally; waiting {delay:.2f}s")
+            time.sleep(delay)
+            waited += delay
+
+    def observe(self, op_class: str, status_code: Optional[int],
+                headers: Optional[Mapping[str, Any]]) -> None:
+        """Feed a response's status code and rate-limit headers back into the governor."""
+        remaining = _header_number(headers, _REMAINING_HEADERS[op_class])
+        if remaining is None and op_class == WRITES:
+            remaining = _header_number(headers, _DELETE_REMAINING_HEADER)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets[op_class]
+            if remaining is not None:
+                bucket.observe_remaining(remaining, now)
+                sample = {
+                    "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                    "remaining": int(remaining),
+                }
+                self._add(op_class, "samples")
+                self._samples[op_class].append(sample)
+                usage = _current_usage.get()
+                if usage is not None:
+                    usage.add_sample(op_class, sample)
+            if status_code == 429:
+                retry_after = parse_retry_after(headers)
+                bucket.on_throttled(retry_after, now)
+                self._add(op_class, "throttled_responses")
+                logger.warning(
+                    f"ARM {op_class} request throttled (429); retry_after={retry_after}, "
+                    f"refill rate now {bucket.rate:.2f}/s"
+                )
+            elif status_code is not None and status_code < 400:
+                bucket.on_success()
+
+    def checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot the process-wide counters so ``summary`` can report only what happened after it."""
+        with self._lock:
+            return {op_class: dict(stats) for op_class, stats in self._stats.items()}
+
+    def _class_summary(self, op_class: str, delta: Dict[str, Any], samples) -> Dict[str, Any]:
+        return {
+            "requests": delta["requests"],
+            "throttled_requests": delta["throttled_requests"],
+            "throttle_wait_seconds": round(delta["throttle_wait_seconds"], 3),
+            "throttled_responses": delta["throttled_responses"],
+            "current_rate": round(self._buckets[op_class].rate, 3),
+            "min_remaining": min((s["remaining"] for s in samples), default=None),
+            "quota_samples": samples,
+        }
+
+    def summary(self, since: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Process-wide per operation class counters, optionally relative to a ``checkpoint``.
+
+        Returns:
+            ``{op_class: {requests, throttled_requests, throttle_wait_seconds,
+            throttled_responses, current_rate, min_remaining, quota_samples}}``
+            for every class that saw traffic.
+        """
+        result = {}
+        with self._lock:
+            for op_class, stats in self._stats.items():
+                base = (since or {}).get(op_class) or _empty_stats()
+                delta = {key: stats[key] - base[key] for key in stats}
+                if not delta["requests"] and not delta["samples"]:
+                    continue
+                new_samples = min(delta["samples"], len(self._samples[op_class]))
+                samples = list(self._samples[op_class])[len(self._samples[op_class]) - new_samples:]
+                result[op_class] = self._class_summary(op_class, delta, samples)
+        return result
+
+    def usage_summary(self, usage: _ThrottleUsage) -> Dict[str, Dict[str, Any]]:
+        """Same shape as ``summary``, for the requests attributed to one tracked operation."""
+        with self._lock:
+            return {
+                op_class: self._class_summary(op_class, dict(stats), list(usage.samples.get(op_class, ())))
+                for op_class, stats in usage.stats.items()
+            }
+
+    def add_to_operation(self, op, usage: _ThrottleUsage, key: str = "arm_throttle") -> None:
+        """Add the operation's throttle summary and its total throttled wall time to ``op``'s metadata."""
+        summary = self.usage_summary(usage)
+        op.add_metadata(key, summary)
+        op.add_metadata(
+            "arm_throttle_wait_seconds",
+            round(sum(stats["throttle_wait_seconds"] for stats in summary.values()), 3),
+        )
+
+    @contextmanager
+    def track(self, op):
+        """
+        Record the ARM throttling of the requests made inside the block into ``op``'s metadata.
+
+        Only requests made from the calling context (and callables wrapped with
+        ``bind_throttle_usage`` in it) count; a nested ``track`` also counts
+        toward the enclosing one.
+        """
+        usage = _ThrottleUsage(parent=_current_usage.get())
+        token = _current_usage.set(usage)
+        try:
+            yield self
+        finally:
+            _current_usage.reset(token)
+            try:
+                self.add_to_operation(op, usage)
+            except Exception as e:
+                logger.warning(f"Failed to record ARM throttle metadata: {e}")
+
+
+class ArmThrottlePolicy(SansIOHTTPPolicy):
+    """Azure SDK pipeline policy that routes every SDK request attempt through the governor."""
+
+    def __init__(self, governor: Optional[ArmThrottleGovernor] = None):
+        super().__init__()
+        self._governor = governor or get_arm_throttle_governor()
+
+    def on_request(self, request):
+        self._governor.acquire(classify_method(request.http_request.method))
+
+    def on_response(self, request, response):
+        self._governor.observe(
+            classify_method(request.http_request.method),
+            response.http_response.status_code,
+            response.http_response.headers,
+        )
+
+
+_governor: Optional[ArmThrottleGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_arm_throttle_governor() -> ArmThrottleGovernor:
+    """Return the process-wide governor, creating it on first use."""
+    global _governor  # pylint: disable=global-statement
+    with _governor_lock:
+        if _governor is None:
+            _governor = ArmThrottleGovernor()
+        return _governor
@@ -0,0 +1,228 @@
+"""
+Credential Broker Module
+
+Process-wide owner of the Azure credential and its access tokens.
+``DefaultAzureCredential`` probes several credential sources on creation and
+on every first token request, and every client used to build its own. The
+broker resolves the credential once per process (per credential
+configuration) and hands out cached tokens for any number of scopes (ARM,
+the AKS AAD server application for the Kubernetes API, ...):
+
+- Reads are lock-free while the cached token is valid; only the very first
+  request for a scope (or one after a failed refresh let the token expire)
+  blocks on the credential.
+- A daemon thread refreshes each token ``refresh_margin_seconds`` before it
+  expires, so worker threads never stall on a refresh mid-scale.
+- Acquisition latency is recorded per scope and exported via ``summary``.
+
+The broker implements the ``TokenCredential`` protocol, so it can be passed
+as ``credential`` to Azure SDK clients directly.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+ARM_SCOPE = "https://management.azure.com/.default"
+# Well-known application ID of the AKS AAD server (the audience of kubelogin tokens).
+AKS_AAD_SCOPE = "6dae42f8-4368-4678-94ff-3960e28e3630/.default"
+
+DEFAULT_REFRESH_MARGIN_SECONDS = 300
+# A cached token is served while it is valid for at least this long; below
+# that the caller fetches a new one itself.
+_MIN_VALIDITY_SECONDS = 30
+_RETRY_INTERVAL_SECONDS = 30
+_MAX_REFRESHER_SLEEP_SECONDS = 300
+
+
+class CredentialBroker:
+    """
+    Shared token cache with background refresh in front of an Azure credential.
+
+    Typical use::
+
+        broker = get_credential_broker("default", DefaultAzureCredential)
+        client = ContainerServiceClient(credential=broker, subscription_id=sub)
+        headers = {"Authorization": f"Bearer {broker.token(ARM_SCOPE)}"}
+    """
+
+    def __init__(self, credential, refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS):
+        """
+        Args:
+            credential: The underlying ``TokenCredential``.
+            refresh_margin_seconds: How long before expiry a token is refreshed in the background.
+        """
+        self.credential = credential
+        self.refresh_margin_seconds = refresh_margin_seconds
+        # Scope key -> AccessToken. Entries are only ever replaced as a whole,
+        # so readers can use them without taking a lock.
+        self._tokens: Dict[str, Any] = {}
+        self._scopes: Dict[str, tuple] = {}
+        self._next_retry: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._scope_locks: Dict[str, threading.Lock] = {}
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None,
+                  tenant_id: Optional[str] = None, **kwargs):
+        """
+        ``TokenCredential.get_token``: return a cached token for ``scopes``, fetching it if needed.
+
+        Requests with ``claims`` or ``tenant_id`` (e.g. a CAE challenge) bypass the cache.
+        """
+        if claims or tenant_id or kwargs:
+            return self.credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+        key = " ".join(scopes)
+        token = self._tokens.get(key)
+        if token is not None and self._valid_for(token) > _MIN_VALIDITY_SECONDS:
+            return token
+        return self._acquire(key, scopes)
+
+    def token(self, scope: str = ARM_SCOPE) -> str:
+        """Return the bearer token string for a single scope."""
+        return self.get_token(scope).token
+
+    @staticmethod
+    def _valid_for(token) -> float:
+        try:
+            return float(token.expires_on) - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _scope_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._scope_locks.setdefault(key, threading.Lock())
+
+    def _acquire(self, key: str, scopes: tuple):
+        with self._scope_lock(key):
+            # Another thread may have fetched it while we waited for the lock.
+            token = self._tokens.get(key)
+            if token is not None and self._valid_for(token) > _MIN_VALIDITY_SECONDS:
+                return token
+            token = self._fetch(key, scopes, background=False)
+        self._ensure_refresher()
+        return token
+
+    def _fetch(self, key: str, scopes: tuple, background: bool):
+        start = time.perf_counter()
+        try:
+            token = self.credential.get_token(*scopes)
+        except Exception:
+            self._record(key, time.perf_counter() - start, background, failed=True)
+            raise
+        latency = time.perf_counter() - start
+        with self._lock:
+            self._tokens[key] = token
+            self._scopes[key] = scopes
+            self._next_retry.pop(key, None)
+        self._record(key, latency, background)
+        logger.info(
+            f"Acquired token for {key} in {latency:.3f}s "
+            f"({'background refresh' if background else 'blocking'}), "
+            f"valid for {self._valid_for(token):.0f}s"
+        )
+        return token
+
+    def _record(self, key: str, latency: float, background: bool, failed: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(key, {
+                "blocking_acquisitions": 0,
+                "background_refreshes": 0,
+                "failures": 0,
+                "total_latency_seconds": 0.0,
+                "max_latency_seconds": 0.0,
+                "last_latency_seconds": 0.0,
+            })
+            if failed:
+                stats["failures"] += 1
+                return
+            stats["background_refreshes" if background else "blocking_acquisitions"] += 1
+            stats["total_latency_seconds"] += latency
+            stats["max_latency_seconds"] = max(stats["max_latency_seconds"], latency)
+            stats["last_latency_seconds"] = latency
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per scope acquisition counters and latencies (seconds)."""
+        with self._lock:
+            result = {}
+            for key, stats in self._stats.items():
+                acquisitions = stats["blocking_acquisitions"] + stats["background_refreshes"]
+                result[key] = {
+                    **{name: round(value, 3) if isinstance(value, float) else value
+                       for name, value in stats.items()},
+                    "mean_latency_seconds": (
+                        round(stats["total_latency_seconds"] / acquisitions, 3) if acquisitions else None
+                    ),
+                }
+            return result
+
+    def _ensure_refresher(self) -> None:
+        with self._lock:
+            if self._refresher is None or not self._refresher.is_alive():
+                self._refresher = threading.Thread(
+                    target=self._refresh_loop, name="credential-broker-refresh", daemon=True
+                )
+                self._refresher.start()
+                return
+        # Let the running refresher reschedule around the new token.
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop the background refresher; cached tokens stay usable until they expire."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._refresher is not None:
+            self._refresher.join()
+
+    def _refresh_loop(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            now = time.time()
+            with self._lock:
+                entries = [(key, self._scopes[key], token) for key, token in self._tokens.items()]
+            next_wake = now + _MAX_REFRESHER_SLEEP_SECONDS
+            for key, scopes, token in entries:
+                refresh_at = max(
+                    now + self._valid_for(token) - self.refresh_margin_seconds,
+                    self._next_retry.get(key, 0.0),
+                )
+                if refresh_at > now:
+                    next_wake = min(next_wake, refresh_at)
+                    continue
+                try:
+                    with self._scope_lock(key):
+                        self._fetch(key, scopes, background=True)
+                except Exception as e:
+                    logger.warning(f"Background token refresh for {key} failed, retrying: {e}")
+                    self._next_retry[key] = now + _RETRY_INTERVAL_SECONDS
+                    next_wake = min(next_wake, self._next_retry[key])
+            self._wakeup.wait(max(1.0, next_wake - time.time()))
+
+
+_brokers: Dict[Hashable, CredentialBroker] = {}
+_brokers_lock = threading.Lock()
+
+
+def get_credential_broker(key: Hashable, credential_factory: Callable[[], Any]) -> CredentialBroker:
+    """
+    Return the process-wide broker for a credential configuration, creating it on first use.
+
+    Args:
+        key: Identifies the credential configuration (e.g. managed identity client ID).
+        credential_factory: Zero-arg callable building the credential; only called once per key.
+    """
+    with _brokers_lock:
+        broker = _brokers.get(key)
+        if broker is None:
+            broker = CredentialBroker(credential_factory())
+            _brokers[key] = broker
+        return broker
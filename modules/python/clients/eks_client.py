@@ -12,6 +12,7 @@ and troubleshooting.
 
 import base64
 import logging
+import math
 import os
 import sys
 import time
@@ -27,6 +28,14 @@ import semver
 # Local imports
 from utils.logger_config import get_logger, setup_logging
 from utils.common import get_env_vars
+from utils.lookup_cache import LookupCache
+from utils.operation_limiter import ClusterOperationLimiter
+from utils.polling import AdaptivePoller
+from utils.provisioning_instrumentation import (
+    ReadyNodeTracker,
+    instrument_provisioning,
+    run_pipelined_steps,
+)
 from utils.retries import execute_with_retries
 from .kubernetes_client import KubernetesClient
 
@@ -38,6 +47,18 @@ logger = get_logger(__name__)
 get_logger("boto3").setLevel(logging.WARNING)
 get_logger("botocore").setLevel(logging.WARNING)
 
+# Node group status is polled every few seconds instead of the waiter's default
+# 30s so that ACTIVE is detected close to when it happens and
+# command_execution_time stays comparable with the AKS numbers.
+NODEGROUP_ACTIVE_WAITER_DELAY_SECONDS = 5
+NODEGROUP_POLL_INITIAL_INTERVAL_SECONDS = 2
+NODEGROUP_POLL_MAX_INTERVAL_SECONDS = 5
+# Pre-flight lookups are cached per run under <result_dir>/cache/. Capacity
+# reservation availability changes quickly, so it is only reused briefly.
+EKS_LOOKUP_CACHE_FILE = "eks_lookups.json"
+INSTANCE_TYPE_CACHE_TTL_SECONDS = 24 * 3600
+CAPACITY_RESERVATION_CACHE_TTL_SECONDS = 300
+
 
 class EKSClient:
     """
@@ -99,6 +120,14 @@ class EKSClient:
         self.vm_size = None
         self.launch_template_id = None
         self.k8s_version = None
+        # Bounds concurrent node group create/update/delete calls per cluster when
+        # one client is shared by several node groups; unlimited by default.
+        self.operation_limiter = ClusterOperationLimiter()
+        # Cluster, subnet, node role, instance type and launch template lookups are
+        # shared by the create/scale/delete invocations of a run (see invalidate_lookups).
+        self.lookup_cache = LookupCache(
+            os.path.join(result_dir, "cache", EKS_LOOKUP_CACHE_FILE) if result_dir else None
+        )
 
         # Initialize Kubernetes client if provided or if kubeconfig is available
         try:
@@ -129,6 +158,21 @@ class EKSClient:
             logger.error("Initialization failed: %s", e)
             raise
 
+    def invalidate_lookups(self, kind: Optional[str] = None) -> int:
+        """
+        Drop cached pre-flight lookups of this region, e.g. after changing resources out of band.
+
+        Args:
+            kind: Lookup kind to drop ("cluster", "subnets", "node_role_arn", "access_entry",
+                  "instance_type", "capacity_reservation", "launch_template"), or None for all.
+
+        Returns:
+            Number of cache entries dropped.
+        """
+        if kind is None:
+            return self.lookup_cache.invalidate()
+        return self.lookup_cache.invalidate(kind, self.region)
+
     def _get_cluster_name_by_run_id(self, run_id: str) -> Optional[str]:
         """
         Find the EKS cluster tagged with a specific run_id.
@@ -139,6 +183,16 @@ class EKSClient:
         Returns:
             Optional[str]: The name of the matching cluster or None.
         """
+        cached_cluster = self.lookup_cache.get(("cluster", self.region, run_id))
+        if cached_cluster:
+            self.k8s_version = cached_cluster["version"]
+            logger.info(
+                "Using cached cluster %s (Kubernetes %s) for run_id: %s",
+                cached_cluster["name"],
+                self.k8s_version,
+                run_id,
+            )
+            return cached_cluster["name"]
         try:
             all_clusters = self.eks.list_clusters()["clusters"]
             logger.info(
@@ -160,6 +214,10 @@ class EKSClient:
                         cluster_name,
                         self.k8s_version,
                     )
+                    self.lookup_cache.set(
+                        ("cluster", self.region, run_id),
+                        {"name": cluster_name, "version": self.k8s_version},
+                    )
                     return cluster_name
             raise Exception("No EKS cluster found with run_id: " + run_id)
         except Exception as e:
@@ -173,20 +231,26 @@ class EKSClient:
         Raises:
             Exception: If no subnets are found with the given run ID.
         """
-        response = self.ec2.describe_subnets(
-            Filters=[
-                {"Name": "tag:run_id", "Values": [self.run_id]},
+        def describe_subnets():
+            response = self.ec2.describe_subnets(
+                Filters=[
+                    {"Name": "tag:run_id", "Values": [self.run_id]},
+                ]
+            )
+            logger.debug(response["Subnets"])
+            return [
+                {
+                    "SubnetId": subnet["SubnetId"],
+                    "AvailabilityZone": subnet["AvailabilityZone"],
+                    "publicSubnet": subnet.get("MapPublicIpOnLaunch", False),
+                }
+                for subnet in response["Subnets"]
             ]
+
+        self.subnet_map = self.lookup_cache.get_or_load(
+            ("subnets", self.region, self.run_id), describe_subnets, cache_if=bool
         )
-        logger.debug(response["Subnets"])
-        self.subnet_map = []
-        for subnet in response["Subnets"]:
-            self.subnet_map.append({
-                "SubnetId": subnet["SubnetId"],
-                "AvailabilityZone": subnet["AvailabilityZone"],
-                "publicSubnet": subnet.get("MapPublicIpOnLaunch", False),
-            })
-        self.subnet_azs = list({subnet["AvailabilityZone"] for subnet in response["Subnets"]})
+        self.subnet_azs = list({subnet["AvailabilityZone"] for subnet in self.subnet_map})
         logger.info("Subnets: %s", self.subnet_map)
         if not self.subnet_map:
             raise Exception("No subnets found for run_id: " + self.run_id)
@@ -226,6 +290,13 @@ class EKSClient:
         Raises:
             Exception: If role creation fails or no existing role is found to duplicate
         """
+        cache_key = ("node_role_arn", self.region, self.cluster_name)
+        cached_role_arn = self.lookup_cache.get(cache_key)
+        if cached_role_arn:
+            logger.info("Using cached node role: %s", cached_role_arn)
+            self.node_role_arn = cached_role_arn
+            return
+
         existing_role_arn = self._load_node_role_arn()
         existing_role_name = existing_role_arn.split("/")[-1]
 
@@ -262,6 +333,7 @@ class EKSClient:
                 response = self.iam.get_role(RoleName=new_role_name)
                 logger.info("Role already exists: %s", response["Role"]["Arn"])
                 self.node_role_arn = response["Role"]["Arn"]
+                self.lookup_cache.set(cache_key, self.node_role_arn)
                 return
             except self.iam.exceptions.NoSuchEntityException:
                 pass
@@ -308,6 +380,7 @@ class EKSClient:
                 len(attached_policies),
                 len(inline_policies),
             )
+            self.lookup_cache.set(cache_key, self.node_role_arn)
 
         except Exception as e:
             raise Exception(f"Failed to create duplicate IAM role for EKS node groups: {str(e)}") from e
@@ -320,6 +393,11 @@ class EKSClient:
         Raises:
             ClientError: If the AWS API request fails
         """
+        cache_key = ("access_entry", self.region, self.cluster_name, self.node_role_arn)
+        cached_entry = self.lookup_cache.get(cache_key)
+        if cached_entry:
+            logger.info("Using cached access entry: %s", cached_entry.get("accessEntryArn"))
+            return cached_entry
         try:
             existing_role_name = self.node_role_arn.split("/")[-1]
             execute_with_retries(
@@ -337,7 +415,9 @@ class EKSClient:
                     principalArn=self.node_role_arn
                 )
                 logger.info("Access entry already exists: %s", response['accessEntry']['accessEntryArn'])
-                return self._serialize_aws_response(response["accessEntry"])
+                access_entry = self._serialize_aws_response(response["accessEntry"])
+                self.lookup_cache.set(cache_key, access_entry)
+                return access_entry
             except self.eks.exceptions.ResourceNotFoundException:
                 pass
 
@@ -347,7 +427,9 @@ class EKSClient:
                 **create_params
             )
             logger.info("Successfully created access entry: %s", response['accessEntry']['accessEntryArn'])
-            return self._serialize_aws_response(response["accessEntry"])
+            access_entry = self._serialize_aws_response(response["accessEntry"])
+            self.lookup_cache.set(cache_key, access_entry)
+            return access_entry
         except ClientError as e:
             logger.error("Failed to create access entry for %s: %s", self.node_role_arn, str(e))
             raise
@@ -588,22 +670,22 @@ class EKSClient:
                         f"Failed to create launch template: {str(e)}"
                     ) from e
 
-                # Create the node group with the parameters
-                response = self.eks.create_nodegroup(**create_params)
-
-                self._wait_for_node_group_active(node_group_name, self.cluster_name)
+                # Create the node group with the parameters; the clock starts once
+                # the cluster's operation slot is held, so queueing is not timed
+                with self.operation_limiter.slot(self.cluster_name) as slot_wait:
+                    op.add_metadata("operation_slot_wait_seconds", round(slot_wait, 3))
+                    start_time = time.time()
+                    response = self.eks.create_nodegroup(**create_params)
                 node_group = response["nodegroup"]
 
                 logger.info(
                     "Node group creation initiated. Status: %s", node_group["status"]
                 )
-                label_selector = f"nodegroup-name={node_group_name}"
 
-                # Wait for nodes to be ready
-                ready_nodes = self.k8s_client.wait_for_nodes_ready(
-                    node_count=node_count,
-                    operation_timeout_in_minutes=self.operation_timeout_minutes,
-                    label_selector=label_selector,
+                # Wait for the node group to become ACTIVE and for the nodes to
+                # be ready concurrently, both timed from the create call
+                ready_nodes = self._instrument_node_group_provisioning(
+                    node_group_name, self.cluster_name, node_count, op, start_time
                 )
 
                 logger.info(
@@ -614,13 +696,17 @@ class EKSClient:
 
                 # Verify NVIDIA drivers if this is a GPU node pool
                 pod_logs = None
+                gpu_timings = {}
                 if gpu_node_group and node_count > 0:
                     logger.info(
                         "Verifying NVIDIA drivers for GPU node pool '%s'",
                         node_group_name,
                     )
-                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
+                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                        ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                    )
                     op.add_metadata("nvidia_driver_logs", pod_logs)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
 
                 # Add additional metadata
                 op.add_metadata("ready_nodes", len(ready_nodes) if ready_nodes else 0)
@@ -652,6 +738,7 @@ class EKSClient:
         gpu_node_group: bool = False,
         progressive: bool = False,
         scale_step_size: int = 1,
+        pipelined: bool = False,
     ) -> Dict:
         """
         Scale a node group to the specified node count.
@@ -664,6 +751,9 @@ class EKSClient:
             gpu_node_group: Whether this is a GPU-enabled node group (default: False)
             progressive: Whether to scale progressively in steps (default: False)
             scale_step_size: Number of nodes to add/remove in each step if progressive (default: 1)
+            pipelined: Whether progressive steps are pipelined, i.e. the next step is
+                       submitted as soon as the previous step's nodegroup update
+                       completes (default: False)
 
         Returns:
             The scaled node group object
@@ -712,6 +802,7 @@ class EKSClient:
                 scale_step_size,
                 cluster_name,
                 gpu_node_group,
+                pipelined=pipelined,
             )
 
         with self._get_operation_context()(
@@ -735,9 +826,12 @@ class EKSClient:
                     "scalingConfig": scaling_config,
                 }
 
-                # Update the node group
+                # Update the node group, timed from when the operation slot is held
                 try:
-                    self.eks.update_nodegroup_config(**update_config)
+                    with self.operation_limiter.slot(cluster_name) as slot_wait:
+                        op.add_metadata("operation_slot_wait_seconds", round(slot_wait, 3))
+                        start_time = time.time()
+                        response = self.eks.update_nodegroup_config(**update_config)
                 except ClientError as e:
                     if e.response["Error"]["Code"] == "ResourceNotFoundException":
                         logger.error(
@@ -755,13 +849,12 @@ class EKSClient:
                     "Scaling operation initiated for node group '%s'", node_group_name
                 )
 
-                # Wait for the scaling operation to complete
-                self._wait_for_node_group_active(node_group_name, cluster_name)
-                label_selector = f"nodegroup-name={node_group_name}"
-                ready_nodes = self.k8s_client.wait_for_nodes_ready(
-                    node_count=node_count,
-                    operation_timeout_in_minutes=self.operation_timeout_minutes,
-                    label_selector=label_selector,
+                # Wait for the scaling update to complete and for the nodes to be
+                # ready concurrently, both timed from the update call
+                update_id = (response or {}).get("update", {}).get("id")
+                ready_nodes = self._instrument_node_group_provisioning(
+                    node_group_name, cluster_name, node_count, op, start_time,
+                    update_id=update_id,
                 )
 
                 op.add_metadata("ready_nodes", len(ready_nodes) if ready_nodes else 0)
@@ -781,6 +874,7 @@ class EKSClient:
                 )
 
                 pod_logs = None
+                gpu_timings = {}
                 # Verify NVIDIA drivers only for GPU node pools during scale-up operations
                 # and only when reaching the final target (not intermediate steps)
                 if gpu_node_group and operation_type == "scale_up" and node_count > 0 and node_count == target_count:
@@ -788,8 +882,11 @@ class EKSClient:
                         "Verifying NVIDIA drivers for GPU node pool '%s' after reaching final target",
                         node_group_name,
                     )
-                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(ready_nodes)
+                    pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                        ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                    )
                     op.add_metadata("nvidia_driver_logs", pod_logs)
+                    op.add_metadata("gpu_verification_timings", gpu_timings)
 
                 return True
 
@@ -862,9 +959,11 @@ class EKSClient:
                     )
                     self._delete_launch_template()
 
-                self.eks.delete_nodegroup(
-                    clusterName=cluster_name, nodegroupName=node_group_name
-                )
+                with self.operation_limiter.slot(cluster_name) as slot_wait:
+                    op.add_metadata("operation_slot_wait_seconds", round(slot_wait, 3))
+                    self.eks.delete_nodegroup(
+                        clusterName=cluster_name, nodegroupName=node_group_name
+                    )
 
                 logger.info("Deletion initiated for node group '%s'", node_group_name)
 
@@ -886,6 +985,7 @@ class EKSClient:
         step_size: int,
         cluster_name: str,
         gpu_node_group: bool = False,
+        pipelined: bool = False,
     ) -> Dict:
         """
         Progressively scale a node group in steps.
@@ -897,6 +997,9 @@ class EKSClient:
             step_size: Number of nodes to add/remove in each step
             cluster_name: The name of the EKS cluster
             gpu_node_group: Whether this is a GPU-enabled node group
+            pipelined: Submit each step as soon as the previous step's update completes
+                       instead of waiting for its nodes (default: False).
+                       See ``_pipelined_progressive_scale``.
 
         Returns:
             The final node group object
@@ -933,6 +1036,11 @@ class EKSClient:
                 " -> ".join(map(str, steps)),
             )
 
+            if pipelined:
+                return self._pipelined_progressive_scale(
+                    node_group_name, current_count, steps, step_size, cluster_name, gpu_node_group
+                )
+
             current_node_group = None
             for i, step_count in enumerate(steps):
                 logger.info(
@@ -963,6 +1071,230 @@ class EKSClient:
             logger.error("Progressive scaling failed: %s", e)
             raise
 
+    def _pipelined_progressive_scale(
+        self,
+        node_group_name: str,
+        current_count: int,
+        steps: List[int],
+        step_size: int,
+        cluster_name: str,
+        gpu_node_group: bool = False,
+    ) -> bool:
+        """
+        Progressive scaling where step N+1 is submitted as soon as step N's nodegroup update completes.
+
+        Node readiness of every step keeps being tracked in the background by a
+        single ``ReadyNodeTracker``, and each step is still recorded as its own
+        operation with ``command_execution_time`` and ``node_readiness_time``
+        measured from that step's update call. The node group and cluster are
+        described once per run instead of for every step; each step records
+        the node group snapshot with its own ``desiredSize``.
+
+        Returns:
+            True on successful completion
+        """
+        target_count = steps[-1]
+        operation_type = "scale_up" if target_count > current_count else "scale_down"
+        node_group = self.get_node_group(node_group_name, cluster_name)
+        cluster_info = self.get_cluster_data(cluster_name)
+        base_scaling_config = node_group["scalingConfig"]
+        label_selector = f"nodegroup-name={node_group_name}"
+
+        def run_step(step_index, step, control_plane_done):
+            previous_count = current_count if step_index == 0 else steps[step_index - 1]
+            metadata = {
+                "cluster_name": cluster_name,
+                "node_count": step,
+                "gpu_node_group": gpu_node_group,
+                "progressive_scaling": True,
+                "scale_step_size": step_size,
+                "pipelined": True,
+            }
+            with self._get_operation_context()(
+                operation_type, "aws", metadata, result_dir=self.result_dir
+            ) as op:
+                try:
+                    logger.info(
+                        "Pipelined step %s/%s: scaling node group '%s' from %s to %s nodes",
+                        step_index + 1,
+                        len(steps),
+                        node_group_name,
+                        previous_count,
+                        step,
+                    )
+                    scaling_config = {
+                        **base_scaling_config,
+                        "desiredSize": step,
+                        "maxSize": max(base_scaling_config["maxSize"], step),
+                    }
+                    op.add_metadata("vm_size", self.vm_size)
+                    op.add_metadata("current_count", previous_count)
+                    op.add_metadata("node_pool_name", node_group_name)
+                    op.add_metadata(
+                        "nodepool_info", {**node_group, "scalingConfig": scaling_config}
+                    )
+                    op.add_metadata("cluster_info", cluster_info)
+
+                    try:
+                        with self.operation_limiter.slot(cluster_name) as slot_wait:
+                            op.add_metadata("operation_slot_wait_seconds", round(slot_wait, 3))
+                            start_time = time.time()
+                            response = self.eks.update_nodegroup_config(
+                                clusterName=cluster_name,
+                                nodegroupName=node_group_name,
+                                scalingConfig=scaling_config,
+                            )
+                    except Exception:
+                        control_plane_done.set()
+                        raise
+                    ready_nodes = self._instrument_node_group_provisioning(
+                        node_group_name, cluster_name, step, op, start_time,
+                        update_id=(response or {}).get("update", {}).get("id"),
+                        k8s_wait_callable=lambda: tracker.wait_for(
+                            step, self.operation_timeout_minutes * 60
+                        ),
+                        control_plane_done=control_plane_done,
+                    )
+                    op.add_metadata("ready_nodes", len(ready_nodes))
+
+                    if gpu_node_group and operation_type == "scale_up" and step > 0 and step == target_count:
+                        logger.info(
+                            "Verifying NVIDIA drivers for GPU node pool '%s' after reaching final target",
+                            node_group_name,
+                        )
+                        gpu_timings = {}
+                        pod_logs = self.k8s_client.verify_nvidia_smi_on_node(
+                            ready_nodes, timings=gpu_timings.setdefault("nvidia_smi", {})
+                        )
+                        op.add_metadata("nvidia_driver_logs", pod_logs)
+                        op.add_metadata("gpu_verification_timings", gpu_timings)
+                except Exception as e:
+                    logger.error(
+                        "Error scaling node pool %s to %s: %s", node_group_name, step, e
+                    )
+                    raise
+
+        with ReadyNodeTracker(
+            lambda: self.k8s_client.get_ready_nodes(label_selector=label_selector, lightweight=True),
+            scaling_up=operation_type == "scale_up",
+        ) as tracker:
+            run_pipelined_steps(steps, run_step, label=f"[{node_group_name}] ")
+
+        logger.info("Pipelined progressive scaling completed. Final count: %s", target_count)
+        return True
+
+    def _instrument_node_group_provisioning(
+        self,
+        node_group_name: str,
+        cluster_name: str,
+        node_count: int,
+        op,
+        start_time: float,
+        update_id: Optional[str] = None,
+        k8s_wait_callable=None,
+        control_plane_done=None,
+    ) -> List:
+        """
+        Wait for the node group operation and node readiness concurrently.
+
+        Records ``command_execution_time`` (node group ACTIVE, or the update
+        finished) and ``node_readiness_time`` separately on ``op``, measured
+        from ``start_time`` like ``AKSClient`` does for ARM operations.
+
+        Args:
+            node_group_name: The name of the node group
+            cluster_name: The name of the EKS cluster
+            node_count: The number of nodes expected to be ready
+            op: Operation context for recording timing metadata
+            start_time: ``time.time()`` the create/update call was issued at
+            update_id: ID of the nodegroup update to wait for, if any
+            k8s_wait_callable: Zero-arg callable replacing the default
+                               ``wait_for_nodes_ready`` readiness wait
+            control_plane_done: Optional ``threading.Event`` set once the node
+                                group operation has finished (or failed)
+
+        Returns:
+            List of ready nodes
+        """
+        def control_plane_callable():
+            try:
+                if update_id:
+                    self._wait_for_node_group_update(node_group_name, cluster_name, update_id)
+                self._wait_for_node_group_active(node_group_name, cluster_name)
+            finally:
+                if control_plane_done is not None:
+                    control_plane_done.set()
+            return False
+
+        node_ready_times = None
+        if k8s_wait_callable is None:
+            node_ready_times = {}
+
+            def k8s_wait_callable():
+                return self.k8s_client.wait_for_nodes_ready(
+                    node_count=node_count,
+                    operation_timeout_in_minutes=self.operation_timeout_minutes,
+                    label_selector=f"nodegroup-name={node_group_name}",
+                    ready_timestamps=node_ready_times,
+                )
+
+        return instrument_provisioning(
+            node_pool_name=node_group_name,
+            op=op,
+            control_plane_callable=control_plane_callable,
+            k8s_wait_callable=k8s_wait_callable,
+            control_plane="EKS",
+            start_time=start_time,
+            ready_timestamps=node_ready_times,
+        )
+
+    def _wait_for_node_group_update(
+        self, node_group_name: str, cluster_name: str, update_id: str
+    ):
+        """
+        Wait for a node group update to finish.
+
+        Right after ``update_nodegroup_config`` the node group can still report
+        ACTIVE, so the update itself is polled until it is no longer InProgress.
+
+        Args:
+            node_group_name: The name of the node group
+            cluster_name: The name of the EKS cluster
+            update_id: The update ID returned by ``update_nodegroup_config``
+
+        Raises:
+            Exception: If the update failed or was cancelled
+            TimeoutError: If the update did not finish within the operation timeout
+        """
+        logger.info(
+            "Waiting for update '%s' of node group '%s' to finish...",
+            update_id,
+            node_group_name,
+        )
+        poller = AdaptivePoller(
+            timeout_seconds=self.operation_timeout_minutes * 60,
+            initial_interval=NODEGROUP_POLL_INITIAL_INTERVAL_SECONDS,
+            max_interval=NODEGROUP_POLL_MAX_INTERVAL_SECONDS,
+        )
+        while True:
+            update = self.eks.describe_update(
+                name=cluster_name, nodegroupName=node_group_name, updateId=update_id
+            )["update"]
+            status = update.get("status")
+            if status == "Successful":
+                logger.info("Update '%s' of node group '%s' succeeded", update_id, node_group_name)
+                return
+            if status in ("Failed", "Cancelled"):
+                raise Exception(
+                    f"Update {update_id} of node group {node_group_name} {status.lower()}: "
+                    f"{update.get('errors')}"
+                )
+            if not poller.sleep(state=status):
+                raise TimeoutError(
+                    f"Update {update_id} of node group {node_group_name} did not finish "
+                    f"within {self.operation_timeout_minutes} minutes (status: {status})"
+                )
+
     def _wait_for_node_group_active(self, node_group_name: str, cluster_name: str):
         """
         Wait for a node group to become active.
@@ -982,10 +1314,10 @@ class EKSClient:
                 clusterName=cluster_name,
                 nodegroupName=node_group_name,
                 WaiterConfig={
-                    "Delay": 30,  # Check every 30 seconds
-                    "MaxAttempts": int(
-                        self.operation_timeout_minutes * 2
-                    ),  # 2 attempts per minute
+                    "Delay": NODEGROUP_ACTIVE_WAITER_DELAY_SECONDS,
+                    "MaxAttempts": math.ceil(
+                        self.operation_timeout_minutes * 60 / NODEGROUP_ACTIVE_WAITER_DELAY_SECONDS
+                    ),
                 },
             )
             logger.info("Node group '%s' is now active", node_group_name)
@@ -1045,6 +1377,14 @@ class EKSClient:
         Returns:
             Dictionary with reservation_id and availability_zone, or None if not found
         """
+        cache_key = (
+            "capacity_reservation", self.region, self.cluster_name, instance_type,
+            ",".join(sorted(availability_zones)), target_count,
+        )
+        cached_reservation = self.lookup_cache.get(cache_key)
+        if cached_reservation:
+            logger.info("Using cached capacity reservation: %s", cached_reservation)
+            return cached_reservation
         try:
             # First, try to find a reservation with our run_id tag
             logger.info(
@@ -1085,10 +1425,14 @@ class EKSClient:
                     )
                     continue
 
-                return {
+                reservation_info = {
                     "reservation_id": reservation_id,
                     "availability_zone": reservation_az,
                 }
+                self.lookup_cache.set(
+                    cache_key, reservation_info, CAPACITY_RESERVATION_CACHE_TTL_SECONDS
+                )
+                return reservation_info
 
             # No existing reservation found
             logger.error(
@@ -1112,6 +1456,13 @@ class EKSClient:
         Returns:
             Launch template ID if it exists, None otherwise
         """
+        cache_key = ("launch_template", self.region, template_name)
+        cached_template_id = self.lookup_cache.get(cache_key)
+        if cached_template_id:
+            logger.info(
+                "Using cached launch template '%s' with ID: %s", template_name, cached_template_id
+            )
+            return cached_template_id
         try:
             response = self.ec2.describe_launch_templates(
                 LaunchTemplateNames=[template_name]
@@ -1124,6 +1475,7 @@ class EKSClient:
                     template_name,
                     template_id,
                 )
+                self.lookup_cache.set(cache_key, template_id)
                 return template_id
             return None
         except ClientError as e:
@@ -1321,6 +1673,7 @@ spec:
                 node_group_name,
             )
             self.launch_template_id = launch_template_id
+            self.lookup_cache.set(("launch_template", self.region, name), launch_template_id)
             return launch_template_id
 
         except Exception as e:
@@ -1396,6 +1749,7 @@ spec:
         try:
             logger.info("Deleting launch template %s", self.launch_template_id)
             self.ec2.delete_launch_template(LaunchTemplateId=self.launch_template_id)
+            self.lookup_cache.invalidate("launch_template", self.region, value=self.launch_template_id)
             logger.info(
                 "Launch template %s deleted successfully", self.launch_template_id
             )
@@ -1483,9 +1837,21 @@ spec:
         Returns:
             List of dictionaries with instance type details
         """
+        cached = [self.lookup_cache.get(("instance_type", self.region, name)) for name in instance_types]
+        missing = [name for name, details in zip(instance_types, cached) if details is None]
+        if not missing:
+            return cached
         try:
-            response = self.ec2.describe_instance_types(InstanceTypes=instance_types)
-            return response.get("InstanceTypes", [])
+            response = self.ec2.describe_instance_types(InstanceTypes=missing)
+            fetched = response.get("InstanceTypes", [])
+            for details in fetched:
+                if details.get("InstanceType"):
+                    self.lookup_cache.set(
+                        ("instance_type", self.region, details["InstanceType"]),
+                        self._serialize_aws_response(details),
+                        INSTANCE_TYPE_CACHE_TTL_SECONDS,
+                    )
+            return [details for details in cached if details is not None] + fetched
         except ClientError as e:
             logger.error("Failed to describe instance types: %s", str(e))
             raise
@@ -0,0 +1,310 @@
+"""Shared informer cache for ``KubernetesClient``.
+
+An ``Informer`` runs one background list+watch per resource type and feeds an
+``IndexedStore``. The store is indexed by namespace, label and
+``spec.nodeName`` so the common ``get_*`` helpers can answer label/field
+selector queries from memory instead of issuing a LIST against the apiserver.
+
+Only the selector forms listed in ``parse_label_selector`` and
+``parse_field_selector`` are evaluated locally; anything else returns None
+so the caller falls back to the API.
+"""
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from kubernetes import client, watch
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+HTTP_STATUS_GONE = 410
+# Server-side watch timeout. The watch is re-established from the last
+# resourceVersion when it ends, and ``stop()`` takes effect at the latest
+# after this many seconds.
+_WATCH_TIMEOUT_SECONDS = 60
+_RELIST_BACKOFF_SECONDS = 5
+
+_SET_REQUIREMENT = re.compile(r"^\s*([^\s!=<>,()]+)\s+(in|notin)\s+\(([^)]*)\)\s*$")
+_EQUALITY_REQUIREMENT = re.compile(r"^\s*([^\s!=<>,()]+)\s*(==|=|!=)\s*([^\s!=<>,()]*)\s*$")
+_EXISTS_REQUIREMENT = re.compile(r"^\s*(!?)\s*([^\s!=<>,()]+)\s*$")
+
+# Field selector path -> accessor on the OpenAPI model object.
+_FIELD_ACCESSORS: Dict[str, Callable] = {
+    "metadata.name": lambda obj: obj.metadata.name,
+    "metadata.namespace": lambda obj: obj.metadata.namespace,
+    "spec.nodeName": lambda obj: getattr(obj.spec, "node_name", None),
+    "status.phase": lambda obj: getattr(obj.status, "phase", None),
+}
+
+
+def _split_selector(selector: str) -> List[str]:
+    """Split a selector on commas that are not inside parentheses."""
+    parts, depth, current = [], 0, []
+    for char in selector:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return [part for part in parts if part.strip()]
+
+
+def parse_label_selector(selector: Optional[str]) -> Optional[List[Tuple[str, str, Set[str]]]]:
+    """
+    Parse a label selector into (key, operator, values) requirements.
+
+    Supports ``k=v``, ``k==v``, ``k!=v``, ``k``, ``!k``, ``k in (a,b)`` and
+    ``k notin (a,b)``. Returns an empty list for an empty selector and None
+    if the selector cannot be evaluated locally.
+    """
+    if not selector:
+        return []
+    requirements = []
+    for part in _split_selector(selector):
+        match = _SET_REQUIREMENT.match(part)
+        if match:
+            values = {value.strip() for value in match.group(3).split(",") if value.strip()}
+            requirements.append((match.group(1), match.group(2), values))
+            continue
+        match = _EQUALITY_REQUIREMENT.match(part)
+        if match:
+            operator = "!=" if match.group(2) == "!=" else "="
+            requirements.append((match.group(1), operator, {match.group(3)}))
+            continue
+        match = _EXISTS_REQUIREMENT.match(part)
+        if match:
+            requirements.append((match.group(2), "!" if match.group(1) else "exists", set()))
+            continue
+        return None
+    return requirements
+
+
+def parse_field_selector(selector: Optional[str]) -> Optional[List[Tuple[str, str, str]]]:
+    """
+    Parse a field selector into (path, operator, value) requirements.
+
+    Only the paths in ``_FIELD_ACCESSORS`` are supported. Returns None if the
+    selector cannot be evaluated locally.
+    """
+    if not selector:
+        return []
+    requirements = []
+    for part in _split_selector(selector):
+        match = _EQUALITY_REQUIREMENT.match(part)
+        if not match or match.group(1) not in _FIELD_ACCESSORS:
+            return None
+        operator = "!=" if match.group(2) == "!=" else "="
+        requirements.append((match.group(1), operator, match.group(3)))
+    return requirements
+
+
+def _matches_labels(labels: Dict[str, str], requirements) -> bool:
+    for key, operator, values in requirements:
+        present = key in labels
+        if operator == "=" and (not present or labels[key] not in values):
+            return False
+        if operator == "!=" and present and labels[key] in values:
+            return False
+        if operator == "in" and (not present or labels[key] not in values):
+            return False
+        if operator == "notin" and present and labels[key] in values:
+            return False
+        if operator == "exists" and not present:
+            return False
+        if operator == "!" and present:
+            return False
+    return True
+
+
+def _matches_fields(obj, requirements) -> bool:
+    for path, operator, value in requirements:
+        actual = _FIELD_ACCESSORS[path](obj)
+        actual = "" if actual is None else str(actual)
+        if (operator == "=") != (actual == value):
+            return False
+    return True
+
+
+class IndexedStore:
+    """Thread-safe object store indexed by namespace, label and ``spec.nodeName``."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._objects: Dict[Tuple[str, str], object] = {}
+        self._by_namespace: Dict[str, Set[Tuple[str, str]]] = {}
+        self._by_node: Dict[str, Set[Tuple[str, str]]] = {}
+        self._by_label: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+
+    @staticmethod
+    def _key(obj) -> Tuple[str, str]:
+        return (obj.metadata.namespace or "", obj.metadata.name)
+
+    @staticmethod
+    def _index_values(obj):
+        node_name = getattr(obj.spec, "node_name", None) if obj.spec is not None else None
+        labels = (obj.metadata.labels or {}).items()
+        return obj.metadata.namespace or "", node_name, labels
+
+    def _unindex(self, key):
+        obj = self._objects.pop(key, None)
+        if obj is None:
+            return
+        namespace, node_name, labels = self._index_values(obj)
+        self._by_namespace.get(namespace, set()).discard(key)
+        if node_name:
+            self._by_node.get(node_name, set()).discard(key)
+        for label in labels:
+            self._by_label.get(label, set()).discard(key)
+
+    def _index(self, key, obj):
+        self._objects[key] = obj
+        namespace, node_name, labels = self._index_values(obj)
+        self._by_namespace.setdefault(namespace, set()).add(key)
+        if node_name:
+            self._by_node.setdefault(node_name, set()).add(key)
+        for label in labels:
+            self._by_label.setdefault(label, set()).add(key)
+
+    def upsert(self, obj):
+        key = self._key(obj)
+        with self._lock:
+            self._unindex(key)
+            self._index(key, obj)
+
+    def delete(self, obj):
+        with self._lock:
+            self._unindex(self._key(obj))
+
+    def replace(self, objects):
+        """Replace the whole store content, e.g. after a (re-)list."""
+        with self._lock:
+            self._objects.clear()
+            self._by_namespace.clear()
+            self._by_node.clear()
+            self._by_label.clear()
+            for obj in objects:
+                self._index(self._key(obj), obj)
+
+    def get(self, name: str, namespace: Optional[str] = None):
+        with self._lock:
+            return self._objects.get((namespace or "", name))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._objects)
+
+    def list(self, namespace: Optional[str] = None, label_selector: Optional[str] = None,
+             field_selector: Optional[str] = None) -> Optional[List]:
+        """
+        Return the stored objects matching the given namespace and selectors.
+
+        :return: List of objects, or None if a selector cannot be evaluated locally.
+        """
+        label_requirements = parse_label_selector(label_selector)
+        field_requirements = parse_field_selector(field_selector)
+        if label_requirements is None or field_requirements is None:
+            return None
+
+        with self._lock:
+            candidates = None
+            if namespace is not None:
+                candidates = set(self._by_namespace.get(namespace, set()))
+            for path, operator, value in field_requirements:
+                if path == "spec.nodeName" and operator == "=":
+                    keys = self._by_node.get(value, set())
+                    candidates = set(keys) if candidates is None else candidates & keys
+            for key, operator, values in label_requirements:
+                if operator == "=" and len(values) == 1:
+                    keys = self._by_label.get((key, next(iter(values))), set())
+                    candidates = set(keys) if candidates is None else candidates & keys
+            if candidates is None:
+                candidates = self._objects.keys()
+            objects = [self._objects[key] for key in sorted(candidates)]
+
+        return [
+            obj for obj in objects
+            if _matches_labels(obj.metadata.labels or {}, label_requirements)
+            and _matches_fields(obj, field_requirements)
+        ]
+
+
+class Informer:
+    """
+    Background list+watch loop feeding an ``IndexedStore``.
+
+    :param name: Resource name used in log messages (e.g. "nodes").
+    :param list_func: Cluster-wide Kubernetes API list function
+                      (e.g. ``CoreV1Api.list_pod_for_all_namespaces``).
+    """
+
+    def __init__(self, name: str, list_func: Callable):
+        self.name = name
+        self.list_func = list_func
+        self.store = IndexedStore()
+        self.resource_version = None
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout_seconds: float) -> bool:
+        return self._synced.wait(timeout_seconds)
+
+    def _list(self):
+        result = self.list_func()
+        self.store.replace(result.items)
+        self.resource_version = result.metadata.resource_version
+        self._synced.set()
+        logger.info(f"Informer '{self.name}' synced {len(result.items)} objects "
+                    f"at resourceVersion {self.resource_version}")
+
+    def _apply(self, event):
+        obj = event["object"]
+        if event["type"] == "DELETED":
+            self.store.delete(obj)
+        else:
+            self.store.upsert(obj)
+        self.resource_version = obj.metadata.resource_version
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self._list()
+                while not self._stopped.is_set():
+                    self._watch = watch.Watch()
+                    for event in self._watch.stream(self.list_func,
+                                                    resource_version=self.resource_version,
+                                                    timeout_seconds=_WATCH_TIMEOUT_SECONDS):
+                        self._apply(event)
+            except client.rest.ApiException as e:
+                if e.status == HTTP_STATUS_GONE:
+                    logger.info(f"Informer '{self.name}' watch expired, re-listing")
+                    continue
+                logger.warning(f"Informer '{self.name}' watch failed: {e}. Re-listing in {_RELIST_BACKOFF_SECONDS}s")
+                time.sleep(_RELIST_BACKOFF_SECONDS)
+            except Exception as e:
+                logger.warning(f"Informer '{self.name}' failed: {e}. Re-listing in {_RELIST_BACKOFF_SECONDS}s")
+                time.sleep(_RELIST_BACKOFF_SECONDS)
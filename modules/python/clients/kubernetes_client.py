@@ -1,5 +1,9 @@
 """Kubernetes client for managing cluster operations and resources."""  # pylint: disable=too-many-lines
+import copy
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import os
 import uuid
@@ -7,11 +11,16 @@ import glob
 import yaml
 import requests
 
-from kubernetes import client, config
+from kubernetes import client, config, dynamic, watch
 from kubernetes.stream import stream
+from clients.informer import Informer
+from clients.list_projection import project_node, project_pod, project_volume_attachment
+from clients.readiness_watcher import HTTP_STATUS_GONE, ReadinessWatcher, WatchExpiredError
 from utils.logger_config import get_logger, setup_logging
 from utils.common import save_info_to_file
 from utils.constants import UrlConstants
+from utils.output_sink import DEFAULT_BUFFER_SIZE, OutputSink
+from utils.polling import AdaptivePoller
 
 # https://kubernetes.io/docs/concepts/scheduling-eviction/taint-and-toleration/#taint-based-evictions
 # https://kubernetes.io/docs/reference/labels-annotations-taints/
@@ -28,6 +37,22 @@ builtin_taints_keys = [
 	"node.cloudprovider.kubernetes.io/shutdown",
 ]
 
+# Dependency tiers for bulk manifest apply. Objects in a tier only depend on objects
+# in earlier tiers, so each tier is applied concurrently and tiers run in order.
+# Kinds not listed here (workloads, Services, custom resources) go in the last tier.
+MANIFEST_APPLY_TIERS = [
+    ["Namespace", "CustomResourceDefinition", "FlowSchema"],
+    ["ServiceAccount", "ClusterRole", "ClusterRoleBinding", "Role", "RoleBinding",
+     "ConfigMap", "Secret", "DeviceClass"],
+]
+DEFAULT_MANIFEST_APPLY_WORKERS = 8
+# Field manager recorded in managedFields for server-side apply
+SERVER_SIDE_APPLY_FIELD_MANAGER = "telescope"
+# Maximum number of GPU nodes verified at the same time
+DEFAULT_GPU_VERIFY_WORKERS = 16
+# Page size for paginated LIST calls (limit/continue)
+DEFAULT_LIST_PAGE_SIZE = 500
+
 # Configure logging
 setup_logging()
 logger = get_logger(__name__)
@@ -39,16 +64,168 @@ class KubernetesClient:
         self.config_file = config_file
         config.load_kube_config(config_file=config_file)
         self._setup_clients()
-
-    def _setup_clients(self):
+        self._informers = {}
+        # See set_token_provider
+        self._token_provider = None
+        self._token_contexts = frozenset()
+        # Context name -> ApiClient. Each ApiClient owns its Configuration and
+        # urllib3 connection pool, so switching back to a context reuses the
+        # parsed kubeconfig and warm TLS connections.
+        self._context_api_clients = {}
+        self._context_lock = threading.Lock()
+        self.current_context = None
+
+    def _setup_clients(self, api_client=None):
         """
         Initialize or reinitialize all Kubernetes API clients.
         This method is used by both __init__ and set_context to create client instances.
+
+        :param api_client: ApiClient to bind the API clients to. Defaults to a new
+                           ApiClient using the global default configuration.
+        """
+        self.api_client = api_client or client.ApiClient()
+        self.api = client.CoreV1Api(self.api_client)
+        self.app = client.AppsV1Api(self.api_client)
+        self.storage = client.StorageV1Api(self.api_client)
+        self.batch = client.BatchV1Api(self.api_client)
+        # API class -> instance bound to self.api_client, see _get_api
+        self._api_instances = {}
+
+    def _get_api(self, api_class):
+        """
+        Return a cached instance of ``api_class`` (e.g. client.RbacAuthorizationV1Api) bound to
+        the current ApiClient, so applying or deleting many RBAC/CRD/custom objects does not
+        build a new API object per manifest.
+        """
+        api = self._api_instances.get(api_class)
+        if api is None:
+            api = self._api_instances.setdefault(api_class, api_class(self.api_client))
+        return api
+
+    def _get_context_api_client(self, context_name):
+        """Return the pooled ApiClient for a context, loading the kubeconfig on first use only."""
+        with self._context_lock:
+            api_client = self._context_api_clients.get(context_name)
+            if api_client is None:
+                api_client = config.new_client_from_config(config_file=self.config_file, context=context_name)
+                if context_name in self._token_contexts:
+                    self._apply_token_provider(api_client)
+                self._context_api_clients[context_name] = api_client
+                logger.info(f"Created API client for context: {context_name}")
+            return api_client
+
+    def set_token_provider(self, token_provider, exec_command="kubelogin"):
+        """
+        Authenticate with bearer tokens from ``token_provider`` instead of running the kubeconfig
+        exec plugin. Only contexts whose user runs ``exec_command`` (AKS AAD clusters use kubelogin)
+        are switched; certificate and static token users are left alone. The provider is called
+        before each request, so it has to be cheap (e.g. CredentialBroker.token).
+
+        :param token_provider: Zero-arg callable returning an access token string.
+        :param exec_command: Exec plugin command whose users get the token provider.
+        :return: True if the current context uses the token provider.
+        """
+        kubeconfig_path = os.path.expanduser(self.config_file or config.KUBE_CONFIG_DEFAULT_LOCATION)
+        with open(kubeconfig_path, "r", encoding="utf-8") as f:
+            kubeconfig = yaml.safe_load(f) or {}
+        exec_users = {
+            user.get("name")
+            for user in kubeconfig.get("users") or []
+            if os.path.basename(((user.get("user") or {}).get("exec") or {}).get("command") or "") == exec_command
+        }
+        token_contexts = frozenset(
+            context.get("name")
+            for context in kubeconfig.get("contexts") or []
+            if (context.get("context") or {}).get("user") in exec_users
+        )
+        with self._context_lock:
+            self._token_provider = token_provider
+            self._token_contexts = token_contexts
+            for context_name, api_client in self._context_api_clients.items():
+                if context_name in token_contexts:
+                    self._apply_token_provider(api_client)
+        current_context = self.current_context or kubeconfig.get("current-context")
+        if current_context not in token_contexts:
+            return False
+        self._apply_token_provider(self.api_client)
+        logger.info(f"Using token provider instead of {exec_command} for context: {current_context}")
+        return True
+
+    def _apply_token_provider(self, api_client):
+        token_provider = self._token_provider
+
+        def refresh_api_key(configuration):
+            configuration.api_key["authorization"] = f"Bearer {token_provider()}"
+
+        configuration = api_client.configuration
+        configuration.api_key_prefix.pop("authorization", None)
+        configuration.refresh_api_key_hook = refresh_api_key
+
+    def for_context(self, context_name):
         """
-        self.api = client.CoreV1Api()
-        self.app = client.AppsV1Api()
-        self.storage = client.StorageV1Api()
-        self.batch = client.BatchV1Api()
+        Return a KubernetesClient bound to the given context that shares this client's
+        per-context ApiClient pool. Unlike set_context it does not change this client,
+        so different contexts can be used at the same time from different threads.
+
+        :param context_name: Name of the Kubernetes context
+        :return: KubernetesClient bound to context_name
+        """
+        try:
+            context_client = copy.copy(self)
+            context_client._informers = {}  # pylint: disable=protected-access
+            context_client._setup_clients(self._get_context_api_client(context_name))  # pylint: disable=protected-access
+            context_client.current_context = context_name
+            return context_client
+        except Exception as e:
+            raise Exception(f"Failed to create client for context {context_name}: {e}") from e
+
+    def _informer_list_funcs(self):
+        """Cluster-wide list functions backing each informer resource type."""
+        return {
+            "nodes": self.api.list_node,
+            "pods": self.api.list_pod_for_all_namespaces,
+            "persistentvolumeclaims": self.api.list_persistent_volume_claim_for_all_namespaces,
+            "volumeattachments": self.storage.list_volume_attachment,
+        }
+
+    def start_informers(self, resources=("nodes", "pods", "volumeattachments"), sync_timeout_seconds=60):
+        """
+        Opt in to the shared informer cache. One background watch per resource type feeds an
+        in-memory store, and get_nodes, get_ready_nodes, get_pods_by_namespace,
+        get_persistent_volume_claims_by_namespace, get_volume_attachments and describe_node
+        read from it instead of the apiserver. Queries fall back to the API until the
+        informer has synced, or when a selector cannot be evaluated locally.
+
+        :param resources: Resource types to cache. Supported: nodes, pods,
+                          persistentvolumeclaims, volumeattachments.
+        :param sync_timeout_seconds: Time to wait for the initial list of each informer.
+        :return: None
+        """
+        list_funcs = self._informer_list_funcs()
+        for resource in resources:
+            if resource not in list_funcs:
+                raise ValueError(f"Unsupported informer resource '{resource}'. Supported: {', '.join(list_funcs)}")
+            if resource not in self._informers:
+                self._informers[resource] = Informer(resource, list_funcs[resource])
+                self._informers[resource].start()
+        for resource in resources:
+            if not self._informers[resource].wait_for_sync(sync_timeout_seconds):
+                logger.warning(f"Informer '{resource}' did not sync within {sync_timeout_seconds}s, "
+                               "falling back to the API until it does")
+
+    def stop_informers(self):
+        """Stop all informers and go back to reading from the apiserver."""
+        for informer in self._informers.values():
+            informer.stop()
+        self._informers = {}
+
+    def _list_from_informer(self, resource, namespace=None, label_selector=None, field_selector=None):
+        """Return objects from the informer cache, or None if the cache cannot answer the query."""
+        informer = self._informers.get(resource)
+        if informer is None or not informer.has_synced():
+            return None
+        return informer.store.list(namespace=namespace, label_selector=label_selector,
+                                   field_selector=field_selector)
 
     def get_app_client(self):
         """Get the AppsV1Api client."""
@@ -60,22 +237,112 @@ class KubernetesClient:
 
     def describe_node(self, node_name):
         """Get detailed information about a specific node."""
+        informer = self._informers.get("nodes")
+        if informer is not None and informer.has_synced():
+            node = informer.store.get(node_name)
+            if node is not None:
+                return node
         return self.api.read_node(node_name)
 
+    def list_paginated(self, list_func, page_size=DEFAULT_LIST_PAGE_SIZE, projection=None, **kwargs):
+        """
+        Yield the items of a LIST call page by page using limit/continue, so large
+        collections are never held in a single response.
+
+        :param list_func: Kubernetes API list function (e.g. CoreV1Api.list_node)
+        :param page_size: Maximum number of items per request
+        :param projection: Optional callable applied to each raw JSON item. When given, the
+                           response is not deserialized into OpenAPI models
+                           (_preload_content=False) and the projected items are yielded instead.
+        :param kwargs: Additional arguments for list_func (namespace, label_selector, ...)
+        """
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+        continue_token = None
+        pages = 0
+        while True:
+            if continue_token:
+                kwargs["_continue"] = continue_token
+            if projection is None:
+                result = list_func(limit=page_size, **kwargs)
+                yield from result.items
+                continue_token = result.metadata._continue if result.metadata else None  # pylint: disable=protected-access
+            else:
+                response = list_func(limit=page_size, _preload_content=False, **kwargs)
+                body = json.loads(response.data)
+                for item in body.get("items") or []:
+                    yield projection(item)
+                continue_token = (body.get("metadata") or {}).get("continue")
+            pages += 1
+            if not continue_token:
+                break
+        logger.debug(f"Listed {pages} page(s) with {getattr(list_func, '__name__', 'list function')}")
+
+    def iter_nodes(self, label_selector=None, field_selector=None, page_size=DEFAULT_LIST_PAGE_SIZE,
+                   lightweight=False):
+        """
+        Yield nodes matching the given selectors using a paginated LIST.
+
+        :param lightweight: If True, yield projections with only metadata, spec.unschedulable/taints
+                            and status.conditions instead of V1Node objects.
+        """
+        return self.list_paginated(self.api.list_node, page_size=page_size,
+                                   projection=project_node if lightweight else None,
+                                   label_selector=label_selector, field_selector=field_selector)
+
+    def iter_pods(self, namespace=None, label_selector=None, field_selector=None,
+                  page_size=DEFAULT_LIST_PAGE_SIZE, lightweight=False):
+        """
+        Yield pods matching the given selectors using a paginated LIST, across all
+        namespaces if namespace is None.
+
+        :param lightweight: If True, yield projections with only metadata, spec.node_name and
+                            status.phase/conditions instead of V1Pod objects.
+        """
+        projection = project_pod if lightweight else None
+        if namespace is None:
+            return self.list_paginated(self.api.list_pod_for_all_namespaces, page_size=page_size,
+                                       projection=projection, label_selector=label_selector,
+                                       field_selector=field_selector)
+        return self.list_paginated(self.api.list_namespaced_pod, page_size=page_size, projection=projection,
+                                   namespace=namespace, label_selector=label_selector,
+                                   field_selector=field_selector)
+
+    def iter_volume_attachments(self, page_size=DEFAULT_LIST_PAGE_SIZE, lightweight=False):
+        """
+        Yield all volume attachments using a paginated LIST.
+
+        :param lightweight: If True, yield projections with only metadata, spec.node_name/source
+                            and status.attached instead of V1VolumeAttachment objects.
+        """
+        return self.list_paginated(self.storage.list_volume_attachment, page_size=page_size,
+                                   projection=project_volume_attachment if lightweight else None)
+
     def get_nodes(self, label_selector=None, field_selector=None):
         """Get a list of nodes matching the given selectors."""
+        nodes = self._list_from_informer("nodes", label_selector=label_selector, field_selector=field_selector)
+        if nodes is not None:
+            return nodes
         return self.api.list_node(label_selector=label_selector,
                                  field_selector=field_selector).items
 
-    def get_ready_nodes(self, label_selector=None, field_selector=None):
+    def get_ready_nodes(self, label_selector=None, field_selector=None, lightweight=False):
         """
         Get a list of nodes that are ready to be scheduled. Should apply all conditions:
         - 'Ready' condition status is True
         - 'NetworkUnavailable' condition status is not present or is False
         - Spec unschedulable is False
         - Spec taints do not have any builtin taints keys with effect 'NoSchedule' or 'NoExecute'
+
+        If lightweight is True and the informer cache is not in use, nodes are listed page by
+        page and returned as projections (see iter_nodes) for readiness counting on large clusters.
         """
-        nodes = self.get_nodes(label_selector=label_selector, field_selector=field_selector)
+        nodes = self._list_from_informer("nodes", label_selector=label_selector, field_selector=field_selector)
+        if nodes is None:
+            if lightweight:
+                nodes = self.iter_nodes(label_selector=label_selector, field_selector=field_selector,
+                                        lightweight=True)
+            else:
+                nodes = self.get_nodes(label_selector=label_selector, field_selector=field_selector)
         return [
             node for node in nodes
             if self._is_node_schedulable(node) and self._is_node_untainted(node)
@@ -118,19 +385,39 @@ class KubernetesClient:
 
     def get_pods_by_namespace(self, namespace, label_selector=None, field_selector=None):
         """Get pods in a specific namespace matching the given selectors."""
+        pods = self._list_from_informer("pods", namespace=namespace, label_selector=label_selector,
+                                        field_selector=field_selector)
+        if pods is not None:
+            return pods
         return self.api.list_namespaced_pod(namespace=namespace,
                                            label_selector=label_selector,
                                            field_selector=field_selector).items
 
-    def get_ready_pods_by_namespace(self, namespace=None, label_selector=None, field_selector=None):
-        """Get pods that are running and ready in a specific namespace."""
-        pods = self.get_pods_by_namespace(namespace=namespace,
-                                         label_selector=label_selector,
-                                         field_selector=field_selector)
+    def get_ready_pods_by_namespace(self, namespace=None, label_selector=None, field_selector=None, lightweight=False):
+        """
+        Get pods that are running and ready in a specific namespace.
+
+        If lightweight is True and the informer cache is not in use, pods are listed page by
+        page and returned as projections (see iter_pods).
+        """
+        pods = None
+        if lightweight:
+            pods = self._list_from_informer("pods", namespace=namespace, label_selector=label_selector,
+                                            field_selector=field_selector)
+            if pods is None:
+                pods = self.iter_pods(namespace=namespace, label_selector=label_selector,
+                                      field_selector=field_selector, lightweight=True)
+        if pods is None:
+            pods = self.get_pods_by_namespace(namespace=namespace,
+                                             label_selector=label_selector,
+                                             field_selector=field_selector)
         return [pod for pod in pods if pod.status.phase == "Running" and self._is_ready_pod(pod)]
 
     def get_persistent_volume_claims_by_namespace(self, namespace):
         """Get all persistent volume claims in a namespace."""
+        claims = self._list_from_informer("persistentvolumeclaims", namespace=namespace)
+        if claims is not None:
+            return claims
         return self.api.list_namespaced_persistent_volume_claim(namespace=namespace).items
 
     def get_bound_persistent_volume_claims_by_namespace(self, namespace):
@@ -150,11 +437,25 @@ class KubernetesClient:
 
     def get_volume_attachments(self):
         """Get all volume attachments in the cluster."""
+        attachments = self._list_from_informer("volumeattachments")
+        if attachments is not None:
+            return attachments
         return self.storage.list_volume_attachment().items
 
-    def get_attached_volume_attachments(self):
-        """Get all attached volume attachments in the cluster."""
-        volume_attachments = self.get_volume_attachments()
+    def get_attached_volume_attachments(self, lightweight=False):
+        """
+        Get all attached volume attachments in the cluster.
+
+        If lightweight is True and the informer cache is not in use, attachments are listed page
+        by page and returned as projections (see iter_volume_attachments).
+        """
+        volume_attachments = None
+        if lightweight:
+            volume_attachments = self._list_from_informer("volumeattachments")
+            if volume_attachments is None:
+                volume_attachments = self.iter_volume_attachments(lightweight=True)
+        if volume_attachments is None:
+            volume_attachments = self.get_volume_attachments()
         return [attachment for attachment in volume_attachments if attachment.status.attached]
 
     def create_namespace(self, namespace):
@@ -237,7 +538,8 @@ class KubernetesClient:
             else:
                 raise Exception(f"Error deleting Node '{node_name}': {str(e)}") from e
 
-    def wait_for_nodes_ready(self, node_count, operation_timeout_in_minutes, label_selector=None):
+    def wait_for_nodes_ready(self, node_count, operation_timeout_in_minutes, label_selector=None,
+                             use_watch=True, ready_timestamps=None):
         """
         Waits for a specific number of nodes with a given label to be ready within a specified timeout.
         Raises an exception if the expected number of nodes are not ready within the timeout.
@@ -245,23 +547,52 @@ class KubernetesClient:
         :param node_count: The expected number of nodes to be ready.
         :param operation_timeout_in_minutes: The timeout in minutes to wait for the nodes to be ready.
         :param label_selector: The label to filter nodes.
+        :param use_watch: List once and follow watch events (default). Re-listing on an adaptive
+                          poll is only the fallback when the watch expires (410 Gone), or when False.
+        :param ready_timestamps: Optional dict filled with node name -> epoch seconds at which
+                                 each node was first observed ready.
         :return: List of ready nodes.
         """
         ready_nodes = []
         ready_node_count = 0
         timeout = time.time() + (operation_timeout_in_minutes * 60)
         logger.info(f"Validating {node_count} nodes with label {label_selector} are ready.")
-        while time.time() < timeout:
+        if use_watch:
+            watcher = ReadinessWatcher(
+                self.api.list_node,
+                lambda node: self._is_node_schedulable(node) and self._is_node_untainted(node),
+                label_selector=label_selector,
+            )
+            try:
+                reached = watcher.wait(node_count, timeout - time.time())
+                self._record_ready_timestamps(ready_timestamps, watcher.ready_times.items())
+                if reached:
+                    return watcher.ready_objects()
+                raise Exception(f"Only {len(watcher.ready)} nodes are ready, expected {node_count} nodes!")
+            except WatchExpiredError as e:
+                self._record_ready_timestamps(ready_timestamps, watcher.ready_times.items())
+                logger.warning(f"{e}. Falling back to polling for node readiness.")
+        poller = AdaptivePoller(deadline=timeout, initial_interval=2, max_interval=10)
+        while not poller.expired():
             ready_nodes = self.get_ready_nodes(label_selector=label_selector)
             ready_node_count = len(ready_nodes)
+            self._record_ready_timestamps(ready_timestamps, ((node.metadata.name, time.time()) for node in ready_nodes))
             logger.info(f"Currently {ready_node_count} nodes are ready.")
             if ready_node_count == node_count:
                 return ready_nodes
             logger.info(f"Waiting for {node_count} nodes to be ready.")
-            time.sleep(10)
+            poller.sleep(state=ready_node_count)
         raise Exception(f"Only {ready_node_count} nodes are ready, expected {node_count} nodes!")
 
-    def wait_for_pods_ready(self, operation_timeout_in_minutes, namespace="default", pod_count=None, label_selector=None):
+    def _record_ready_timestamps(self, ready_timestamps, observed):
+        """Merge (name, timestamp) pairs into the caller-supplied dict, keeping the first observation."""
+        if ready_timestamps is None:
+            return
+        for name, timestamp in observed:
+            ready_timestamps.setdefault(name, timestamp)
+
+    def wait_for_pods_ready(self, operation_timeout_in_minutes, namespace="default", pod_count=None, label_selector=None,
+                            use_watch=True, ready_timestamps=None, timeline=None):
         """
         Waits for a specific number of pods with a given label to be ready within a specified timeout.
         Raises an exception if the expected number of pods are not ready within the timeout.
@@ -270,6 +601,12 @@ class KubernetesClient:
         :param operation_timeout_in_minutes: The timeout in minutes to wait for the pods to be ready.
         :param pod_count: The expected number of pods to be ready. If not provided, it will dynamically fetch the count of pods with the specified label on each iteration.
         :param namespace: The namespace to filter pods.
+        :param use_watch: List once and follow watch events (default). Re-listing on an adaptive
+                          poll is only the fallback when the watch expires (410 Gone), or when False.
+        :param ready_timestamps: Optional dict filled with pod name -> epoch seconds at which
+                                 each pod was first observed ready.
+        :param timeline: Optional ReadinessTimeline the Ready lastTransitionTime of each ready
+                         pod is recorded into before returning.
         :return: List of ready pods
         """
         pods = []
@@ -281,7 +618,32 @@ class KubernetesClient:
         else:
             logger.info(f"Validating all pods with label {label_selector} are ready (dynamic count).")
 
-        while time.time() < timeout:
+        if use_watch:
+            watcher = ReadinessWatcher(
+                self.api.list_namespaced_pod,
+                lambda pod: pod.status.phase == "Running" and self._is_ready_pod(pod),
+                namespace=namespace,
+                label_selector=label_selector,
+            )
+            try:
+                watcher.list()
+                if pod_count is None and not watcher.objects:
+                    raise Exception(f"No pods found with selector '{label_selector}' in namespace '{namespace}'")
+                reached = watcher.wait(pod_count, timeout - time.time(), skip_list=True)
+                self._record_ready_timestamps(ready_timestamps, watcher.ready_times.items())
+                if reached:
+                    pods = watcher.ready_objects()
+                    if timeline is not None:
+                        timeline.record_all(pods)
+                    return pods
+                expected_count = pod_count if pod_count is not None else len(watcher.objects)
+                raise Exception(f"Only {len(watcher.ready)} pods are ready, expected {expected_count} pods!")
+            except WatchExpiredError as e:
+                self._record_ready_timestamps(ready_timestamps, watcher.ready_times.items())
+                logger.warning(f"{e}. Falling back to polling for pod readiness.")
+
+        poller = AdaptivePoller(deadline=timeout, initial_interval=2, max_interval=10)
+        while not poller.expired():
             # Get current expected pod count
             current_pod_count = pod_count
             if current_pod_count is None:
@@ -293,10 +655,13 @@ class KubernetesClient:
                     raise Exception(f"No pods found with selector '{label_selector}' in namespace '{namespace}'")
 
             pods = self.get_ready_pods_by_namespace(namespace=namespace, label_selector=label_selector)
+            self._record_ready_timestamps(ready_timestamps, ((pod.metadata.name, time.time()) for pod in pods))
             if len(pods) == current_pod_count:
+                if timeline is not None:
+                    timeline.record_all(pods)
                 return pods
             logger.info(f"Waiting for {current_pod_count} pods to be ready. Currently {len(pods)} pods are ready.")
-            time.sleep(10)
+            poller.sleep(state=len(pods))
 
         # Final count for error message
         final_expected_count = pod_count
@@ -345,8 +710,8 @@ class KubernetesClient:
             logger.info(f"Waiting for {pod_count} pod(s) with label {label_selector}in namespace '{namespace}' to complete")
         else:
             logger.info(f"Waiting for pods with label '{label_selector}' in namespace '{namespace}' to complete")
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        poller = AdaptivePoller(timeout_seconds=timeout, initial_interval=2, max_interval=10)
+        while not poller.expired():
             pods = self.get_pods_by_namespace(
                     namespace=namespace, label_selector=label_selector
                 )
@@ -362,9 +727,9 @@ class KubernetesClient:
                     completed_pods.append(pod)
                 if len(completed_pods) == current_pod_count:
                     return completed_pods
-            sleep_time = 10
-            logger.info(f"Waiting for {sleep_time} seconds before checking pod status again.")
-            time.sleep(sleep_time)
+            logger.info(f"Waiting for {current_pod_count} pod(s) to complete. "
+                        f"Currently {len(completed_pods)} pod(s) have completed.")
+            poller.sleep(state=len(completed_pods))
         raise Exception(
             f"Pods with label '{label_selector}' in namespace '{namespace}' did not complete within {timeout} seconds."
         )
@@ -379,8 +744,8 @@ class KubernetesClient:
         :param timeout: The timeout in seconds to wait for the job to complete (default: 300 seconds).
         :return: The job name if completed successfully.
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        poller = AdaptivePoller(timeout_seconds=timeout, initial_interval=2, max_interval=30)
+        while not poller.expired():
             try:
                 job = self.batch.read_namespaced_job(name=job_name, namespace=namespace)
                 if self._is_job_condition_met(job, "complete"):
@@ -401,11 +766,10 @@ class KubernetesClient:
                         f"Job '{job_name}' not found in namespace '{namespace}'."
                     ) from e
                 raise e
-            sleep_time = 30
             logger.info(
-                f"Waiting {sleep_time} seconds before checking job status again."
+                f"Waiting {poller.interval:.0f} seconds before checking job status again."
             )
-            time.sleep(sleep_time)
+            poller.sleep(state=(job.status.active, job.status.succeeded, job.status.failed))
         raise Exception(
             f"Job '{job_name}' in namespace '{namespace}' did not complete within {timeout} seconds."
         )
@@ -431,7 +795,40 @@ class KubernetesClient:
         except client.rest.ApiException as e:
             raise Exception(f"Error getting logs for pod '{pod_name}' in namespace '{namespace}': {str(e)}") from e
 
-    def run_pod_exec_command(self, pod_name: str, command: str, container_name: str = "", dest_path: str = "", namespace: str = "default") -> str:
+    def stream_pod_logs(self, pod_name, namespace="default", container=None, dest=None, line_callback=None,
+                        chunk_size=DEFAULT_BUFFER_SIZE) -> int:
+        """
+        Stream logs from a pod to a file or sink without loading the whole body into memory.
+
+        :param pod_name: Name of the pod
+        :param namespace: Namespace where the pod is located (default: "default")
+        :param container: Container name if pod has multiple containers (optional)
+        :param dest: File path, binary file-like object or callable receiving the log bytes (optional)
+        :param line_callback: Callable invoked with each log line for incremental parsing (optional)
+        :param chunk_size: Number of bytes read from the response at a time
+        :return: Number of bytes streamed
+        """
+        try:
+            resp = self.api.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=namespace,
+                container=container,
+                _preload_content=False
+            )
+        except client.rest.ApiException as e:
+            raise Exception(f"Error getting logs for pod '{pod_name}' in namespace '{namespace}': {str(e)}") from e
+
+        try:
+            with OutputSink(dest, line_callback=line_callback, buffer_size=chunk_size) as sink:
+                for chunk in resp.stream(chunk_size):
+                    sink.write(chunk)
+        finally:
+            resp.release_conn()
+        logger.info(f"Streamed {sink.bytes_written} bytes of logs from pod '{pod_name}' in namespace '{namespace}'")
+        return sink.bytes_written
+
+    def run_pod_exec_command(self, pod_name: str, command: str, container_name: str = "", dest_path: str = "", namespace: str = "default",
+                             stream_output: bool = False, sink=None, line_callback=None) -> str:
         """
         Executes a command in a specified container within a Kubernetes pod and optionally saves the output to a file.
         Args:
@@ -440,8 +837,14 @@ class KubernetesClient:
             command (str): The command to be executed in the container.
             dest_path (str, optional): The file path where the command output will be saved. Defaults to "".
             namespace (str, optional): The Kubernetes namespace where the pod is located. Defaults to "default".
+            stream_output (bool, optional): If True, write stdout through a bounded buffer to sink or dest_path
+                instead of accumulating it and logging every chunk, so memory stays constant. Defaults to False.
+            sink (optional): Binary file-like object or callable receiving stdout bytes in streaming mode.
+                Takes precedence over dest_path.
+            line_callback (callable, optional): Called with each stdout line in streaming mode.
         Returns:
-            str: The combined standard output of the executed command.
+            str: The combined standard output of the executed command. In streaming mode only the last
+                few KiB of output are returned.
         Raises:
             Exception: If an error occurs while executing the command in the pod.
         """
@@ -467,6 +870,9 @@ class KubernetesClient:
 
         resp = stream(self.api.connect_get_namespaced_pod_exec, **stream_kwargs)
 
+        if stream_output:
+            return self._stream_exec_output(resp, sink or dest_path or None, line_callback)
+
         res = []
         file = None
         if dest_path:
@@ -491,6 +897,24 @@ class KubernetesClient:
                 file.close()
         return ''.join(res)
 
+    @staticmethod
+    def _stream_exec_output(resp, dest, line_callback) -> str:
+        """Write exec stdout to an OutputSink as it arrives. Returns the tail of the output."""
+        try:
+            with OutputSink(dest, line_callback=line_callback) as output_sink:
+                while resp.is_open():
+                    resp.update(timeout=1)
+                    if resp.peek_stdout():
+                        output_sink.write(resp.read_stdout())
+                    if resp.peek_stderr():
+                        error_msg = resp.read_stderr()
+                        raise Exception(f"Error occurred while executing command in pod: {error_msg}")
+        finally:
+            resp.close()
+        dest_info = f" to {dest}" if isinstance(dest, str) else ""
+        logger.info(f"Streamed {output_sink.bytes_written} bytes of command output{dest_info}")
+        return output_sink.tail
+
     def get_daemonsets_pods_allocated_resources(self, namespace, node_name):
         """Get CPU and memory resources allocated by DaemonSet pods on a specific node."""
         pods = self.get_pods_by_namespace(namespace=namespace, field_selector=f"spec.nodeName={node_name}")
@@ -519,7 +943,8 @@ class KubernetesClient:
 
     def set_context(self, context_name):
         """
-        Switch to the specified Kubernetes context and reinitialize all API clients.
+        Switch to the specified Kubernetes context. API clients are pooled per context,
+        so the kubeconfig is only parsed the first time a context is used.
         Args:
             context_name (str): Name of the Kubernetes context to switch to
         Returns:
@@ -528,9 +953,11 @@ class KubernetesClient:
             Exception: If the context switch fails
         """
         try:
-            config.load_kube_config(
-                config_file=self.config_file, context=context_name)
-            self._setup_clients()
+            self._setup_clients(self._get_context_api_client(context_name))
+            if self._informers and context_name != self.current_context:
+                logger.info("Stopping informers bound to the previous context")
+                self.stop_informers()
+            self.current_context = context_name
             logger.info(f"Successfully switched to context: {context_name}")
         except Exception as e:
             raise Exception(f"Failed to switch to context {context_name}: {e}") from e
@@ -608,7 +1035,7 @@ class KubernetesClient:
         """
         Get detailed info about a node
         """
-        node = self.api.read_node(node_name)
+        node = self.describe_node(node_name)
         if not node:
             raise Exception(f"Node '{node_name}' not found.")
         labels = node.metadata.labels
@@ -666,136 +1093,199 @@ class KubernetesClient:
             f"Inside collect_pod_and_node_info, The file_name details are: {file_name}")
         save_info_to_file(pods_and_nodes, file_name)
 
-    def verify_nvidia_smi_on_node(self, nodes, namespace="default"):
+    def _wait_for_pod_completion(self, pod_name, namespace, timeout_seconds=120):
         """
-        Create a pod on the specific node and run nvidia-smi to verify GPU access
-        Args:
-            nodes: List of nodes to verify
-            namespace: Namespace to create the pod in (default: "default")
-        Returns:
-            True if nvidia-smi command succeeds, False otherwise
+        Wait for a pod to reach the Succeeded or Failed phase using a watch on the pod
+        instead of polling it. Falls back to polling if the watch expires (HTTP 410).
+
+        :param pod_name: Name of the pod
+        :param namespace: Namespace of the pod
+        :param timeout_seconds: Maximum time to wait
+        :return: The completed pod, or None if it did not complete within the timeout
         """
+        terminal_phases = ("Succeeded", "Failed")
+        deadline = time.time() + timeout_seconds
+        pod = self.api.read_namespaced_pod(name=pod_name, namespace=namespace)
+        if pod.status.phase in terminal_phases:
+            return pod
+
         try:
-            all_pod_logs = {}
-            for node in nodes:
-                pod_name = f"gpu-verify-{uuid.uuid4()}"
-                node_name = node.metadata.name
-                logger.info(f"Verifying NVIDIA drivers on node {node_name}")
-                node = self.describe_node(node_name)
-
-                # Wait for the node to advertise a POSITIVE GPU/MIG count. The device
-                # plugin can register nvidia.com/gpu with value "0" before MIG instances
-                # are published, so a MIG-single node briefly looks GPU-less. Waiting on
-                # key presence (rather than a positive count) would race in during that
-                # window and skip the node; wait on the count instead.
-                start_time = time.time()
-                gpu_count = 0
-                while time.time() < start_time + 600:
-                    allocatable = node.status.allocatable or {}
-                    gpu_count = int(allocatable.get("nvidia.com/gpu", "0"))
-                    mig_count = sum(
-                        int(v) for k, v in allocatable.items()
-                        if k.startswith("nvidia.com/mig-")
+            pod_watch = watch.Watch()
+            for event in pod_watch.stream(self.api.list_namespaced_pod, namespace=namespace,
+                                          field_selector=f"metadata.name={pod_name}",
+                                          resource_version=pod.metadata.resource_version,
+                                          timeout_seconds=max(1, int(deadline - time.time()))):
+                if event["object"].status.phase in terminal_phases:
+                    pod_watch.stop()
+                    return event["object"]
+            return None
+        except client.rest.ApiException as e:
+            if e.status != HTTP_STATUS_GONE:
+                raise
+            logger.info(f"Watch on pod {pod_name} expired, falling back to polling")
+
+        poller = AdaptivePoller(deadline=deadline, initial_interval=1, max_interval=5)
+        while not poller.expired():
+            pod = self.api.read_namespaced_pod(name=pod_name, namespace=namespace)
+            if pod.status.phase in terminal_phases:
+                return pod
+            poller.sleep(state=pod.status.phase)
+        return None
+
+    def _verify_nvidia_smi_single_node(self, node_name, namespace, timings):
+        """
+        Verify nvidia-smi on one node, see verify_nvidia_smi_on_node.
+
+        :return: Result dict for the node, or None if the node has no GPUs
+        """
+        pod_name = f"gpu-verify-{uuid.uuid4()}"
+        logger.info(f"Verifying NVIDIA drivers on node {node_name}")
+        node_start_time = time.time()
+        node = self.describe_node(node_name)
+
+        # Wait for the node to advertise a POSITIVE GPU/MIG count. The device
+        # plugin can register nvidia.com/gpu with value "0" before MIG instances
+        # are published, so a MIG-single node briefly looks GPU-less. Waiting on
+        # key presence (rather than a positive count) would race in during that
+        # window and skip the node; wait on the count instead.
+        start_time = time.time()
+        gpu_count = 0
+        poller = AdaptivePoller(deadline=start_time + 600, initial_interval=1, max_interval=5)
+        while not poller.expired():
+            allocatable = node.status.allocatable or {}
+            gpu_count = int(allocatable.get("nvidia.com/gpu", "0"))
+            mig_count = sum(
+                int(v) for k, v in allocatable.items()
+                if k.startswith("nvidia.com/mig-")
+            )
+            if gpu_count > 0 or mig_count > 0:
+                break
+            logger.info(
+                f"Waiting for GPUs to be allocated on node {node_name}... "
+                f"(allocatable: {allocatable})"
+            )
+            poller.sleep(state=dict(allocatable))
+            node = self.describe_node(node_name)
+        has_mig = any(k.startswith("nvidia.com/mig-") for k in (node.status.allocatable or {}))
+        gpu_wait_seconds = time.time() - start_time
+
+        logger.info(f"Node {node_name} has {gpu_count} GPUs, requesting all for validation")
+
+        # Skip nodes with no GPUs (MIG nodes expose slices instead of whole GPUs)
+        if gpu_count == 0 and not has_mig:
+            logger.warning(f"Skipping node {node_name} as it has no GPUs")
+            return None
+
+        # MIG mixed: request one slice; MIG single or regular: request 1 whole GPU
+        if has_mig:
+            mig_resource = next(k for k in node.status.allocatable if k.startswith("nvidia.com/mig-"))
+            gpu_resource_limits = {mig_resource: "1"}
+        else:
+            gpu_resource_limits = {"nvidia.com/gpu": "1"}
+
+        # Create pod spec with node selector
+        pod = client.V1Pod(
+            metadata=client.V1ObjectMeta(name=pod_name),
+            spec=client.V1PodSpec(
+                containers=[
+                    client.V1Container(
+                        name="nvidia-test",
+                        image="nvidia/cuda:12.2.0-base-ubuntu20.04",
+                        command=["/bin/bash", "-c", "nvidia-smi"],
+                        resources=client.V1ResourceRequirements(
+                            limits=gpu_resource_limits
+                        ),
                     )
-                    if gpu_count > 0 or mig_count > 0:
-                        break
-                    logger.info(
-                        f"Waiting for GPUs to be allocated on node {node_name}... "
-                        f"(allocatable: {allocatable})"
+                ],
+                node_selector={"kubernetes.io/hostname": node_name},
+                restart_policy="Never",
+                tolerations=[
+                    client.V1Toleration(
+                        key="nvidia.com/gpu",
+                        operator="Exists",
+                        effect="NoSchedule",
                     )
-                    time.sleep(1)
-                    node = self.describe_node(node_name)
-                has_mig = any(k.startswith("nvidia.com/mig-") for k in (node.status.allocatable or {}))
-
-                logger.info(f"Node {node_name} has {gpu_count} GPUs, requesting all for validation")
+                ],
+            ),
+        )
 
-                # Skip nodes with no GPUs (MIG nodes expose slices instead of whole GPUs)
-                if gpu_count == 0 and not has_mig:
-                    logger.warning(f"Skipping node {node_name} as it has no GPUs")
-                    continue
+        # Create the pod
+        logger.info(f"Creating test pod {pod_name} on node {node_name}")
+        self.api.create_namespaced_pod(namespace=namespace, body=pod)
 
-                # MIG mixed: request one slice; MIG single or regular: request 1 whole GPU
-                if has_mig:
-                    mig_resource = next(k for k in node.status.allocatable if k.startswith("nvidia.com/mig-"))
-                    gpu_resource_limits = {mig_resource: "1"}
-                else:
-                    gpu_resource_limits = {"nvidia.com/gpu": "1"}
-
-                # Create pod spec with node selector
-                pod = client.V1Pod(
-                    metadata=client.V1ObjectMeta(name=pod_name),
-                    spec=client.V1PodSpec(
-                        containers=[
-                            client.V1Container(
-                                name="nvidia-test",
-                                image="nvidia/cuda:12.2.0-base-ubuntu20.04",
-                                command=["/bin/bash", "-c", "nvidia-smi"],
-                                resources=client.V1ResourceRequirements(
-                                    limits=gpu_resource_limits
-                                ),
-                            )
-                        ],
-                        node_selector={"kubernetes.io/hostname": node_name},
-                        restart_policy="Never",
-                        tolerations=[
-                            client.V1Toleration(
-                                key="nvidia.com/gpu",
-                                operator="Exists",
-                                effect="NoSchedule",
-                            )
-                        ],
-                    ),
-                )
+        # Wait for pod to complete
+        pod_start_time = time.time()
+        self._wait_for_pod_completion(pod_name, namespace, timeout_seconds=120)
+        pod_completion_seconds = time.time() - pod_start_time
 
-                # Create the pod
-                logger.info(f"Creating test pod {pod_name} on node {node_name}")
-                self.api.create_namespaced_pod(namespace=namespace, body=pod)
+        # Get pod logs
+        pod_logs = self.get_pod_logs(pod_name=pod_name, namespace=namespace)
+        if isinstance(pod_logs, bytes):
+            pod_logs_str = pod_logs.decode('utf-8')
+        else:
+            pod_logs_str = str(pod_logs)
 
-                # Wait for pod to complete
-                timeout = time.time() + 120  # 2 minutes timeout
-                while time.time() < timeout:
-                    pod_status = self.api.read_namespaced_pod(
-                        name=pod_name, namespace=namespace
-                    )
-                    if pod_status.status.phase in ["Succeeded", "Failed"]:
-                        break
-                    time.sleep(2)
-
-                # Get pod logs
-                pod_logs = self.get_pod_logs(pod_name=pod_name, namespace=namespace)
-                if isinstance(pod_logs, bytes):
-                    pod_logs_str = pod_logs.decode('utf-8')
-                else:
-                    pod_logs_str = str(pod_logs)
+        logger.info(f"nvidia-smi output: {pod_logs_str}")
 
-                logger.info(f"nvidia-smi output: {pod_logs_str}")
+        # Check if output contains expected NVIDIA information
+        if "NVIDIA-SMI" in pod_logs_str and "GPU" in pod_logs_str:
+            logger.info(f"NVIDIA drivers verified on node {node_name}")
+            verification_successful = True
+        else:
+            logger.warning(
+                f"nvidia-smi output does not contain expected NVIDIA information on node {node_name}"
+            )
+            verification_successful = False
+        # Clean up the test pod
+        try:
+            logger.info(f"Deleting test pod {pod_name}")
+            self.api.delete_namespaced_pod(
+                name=pod_name,
+                namespace=namespace,
+                body=client.V1DeleteOptions(),
+            )
+        except Exception as e:
+            logger.warning(f"Error deleting test pod {pod_name}: {str(e)}")
 
-                # Check if output contains expected NVIDIA information
-                if "NVIDIA-SMI" in pod_logs_str and "GPU" in pod_logs_str:
-                    logger.info(f"NVIDIA drivers verified on node {node_name}")
-                    verification_successful = True
-                else:
-                    logger.warning(
-                        f"nvidia-smi output does not contain expected NVIDIA information on node {node_name}"
-                    )
-                    verification_successful = False
-                all_pod_logs[node_name] = {
-                    "pod_name": pod_name,
-                    "logs": pod_logs_str,
-                    "device_status": verification_successful,
-                }
-                # Clean up the test pod
-                try:
-                    logger.info(f"Deleting test pod {pod_name}")
-                    self.api.delete_namespaced_pod(
-                        name=pod_name,
-                        namespace=namespace,
-                        body=client.V1DeleteOptions(),
-                    )
-                except Exception as e:
-                    logger.warning(f"Error deleting test pod {pod_name}: {str(e)}")
+        timings[node_name] = {
+            "gpu_allocatable_wait_seconds": round(gpu_wait_seconds, 3),
+            "pod_completion_seconds": round(pod_completion_seconds, 3),
+            "total_seconds": round(time.time() - node_start_time, 3),
+        }
+        logger.info(f"nvidia-smi verification timings for node {node_name}: {timings[node_name]}")
+        return {
+            "pod_name": pod_name,
+            "logs": pod_logs_str,
+            "device_status": verification_successful,
+        }
 
-            return all_pod_logs
+    def verify_nvidia_smi_on_node(self, nodes, namespace="default", max_workers=DEFAULT_GPU_VERIFY_WORKERS,
+                                  timings=None):
+        """
+        Create a pod on the specific node and run nvidia-smi to verify GPU access.
+        Nodes are verified concurrently, up to max_workers at a time.
+        Args:
+            nodes: List of nodes to verify
+            namespace: Namespace to create the pod in (default: "default")
+            max_workers: Maximum number of nodes verified at the same time
+            timings: Optional dict filled with per-node timings (GPU allocatable wait,
+                     pod completion and total seconds) keyed by node name
+        Returns:
+            Dict of per-node results keyed by node name, or False if verification failed
+        """
+        timings = {} if timings is None else timings
+        try:
+            node_names = [node.metadata.name for node in nodes]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(node_names) or 1))) as executor:
+                results = list(executor.map(
+                    lambda node_name: self._verify_nvidia_smi_single_node(node_name, namespace, timings),
+                    node_names))
+
+            return {
+                node_name: result
+                for node_name, result in zip(node_names, results)
+                if result is not None
+            }
 
         except Exception as e:
             logger.error(
@@ -803,88 +1293,94 @@ class KubernetesClient:
             )
             return False
 
-    def verify_managed_gpu_systemd_services(self, nodes, namespace="default"):
+    def _verify_managed_gpu_systemd_services_single_node(self, node_name, namespace, timings):
+        """Verify the managed GPU systemd services on one node, see verify_managed_gpu_systemd_services."""
+        pod_name = f"gpu-svc-verify-{uuid.uuid4()}"
+        logger.info(f"Verifying managed GPU systemd services on node {node_name}")
+        node_start_time = time.time()
+
+        pod = client.V1Pod(
+            metadata=client.V1ObjectMeta(name=pod_name),
+            spec=client.V1PodSpec(
+                host_pid=True,
+                containers=[
+                    client.V1Container(
+                        name="svc-check",
+                        image="mcr.microsoft.com/cbl-mariner/busybox:2.0",
+                        command=[
+                            "chroot", "/host", "sh", "-c",
+                            "for svc in nvidia-dcgm nvidia-dcgm-exporter nvidia-device-plugin; do "
+                            "echo \"$svc: $(systemctl is-active $svc)\"; done"
+                        ],
+                        security_context=client.V1SecurityContext(privileged=True),
+                        volume_mounts=[
+                            client.V1VolumeMount(name="host-root", mount_path="/host")
+                        ],
+                    )
+                ],
+                volumes=[
+                    client.V1Volume(
+                        name="host-root",
+                        host_path=client.V1HostPathVolumeSource(path="/"),
+                    )
+                ],
+                node_selector={"kubernetes.io/hostname": node_name},
+                restart_policy="Never",
+                tolerations=[client.V1Toleration(operator="Exists")],
+            ),
+        )
+
+        self.api.create_namespaced_pod(namespace=namespace, body=pod)
+
+        if self._wait_for_pod_completion(pod_name, namespace, timeout_seconds=120) is None:
+            raise TimeoutError(f"Verification pod {pod_name} did not complete within 120s")
+
+        pod_logs = self.get_pod_logs(pod_name=pod_name, namespace=namespace)
+        pod_logs_str = pod_logs.decode("utf-8") if isinstance(pod_logs, bytes) else str(pod_logs)
+
+        services = ["nvidia-dcgm", "nvidia-dcgm-exporter", "nvidia-device-plugin"]
+        statuses = {svc: ("active" if f"{svc}: active" in pod_logs_str else "inactive") for svc in services}
+        all_active = all(s == "active" for s in statuses.values())
+        status_summary = ", ".join(f"{svc}={state}" for svc, state in statuses.items())
+        result_label = "all active" if all_active else "SOME INACTIVE"
+        log_fn = logger.info if all_active else logger.warning
+        log_fn(f"{node_name}: {status_summary} ({result_label})")
+
+        try:
+            self.api.delete_namespaced_pod(
+                name=pod_name, namespace=namespace, body=client.V1DeleteOptions()
+            )
+        except Exception as e:
+            logger.warning(f"Error deleting verification pod {pod_name}: {str(e)}")
+
+        timings[node_name] = {"total_seconds": round(time.time() - node_start_time, 3)}
+        return {
+            "pod_name": pod_name,
+            "logs": pod_logs_str,
+            "all_services_active": all_active,
+        }
+
+    def verify_managed_gpu_systemd_services(self, nodes, namespace="default", max_workers=DEFAULT_GPU_VERIFY_WORKERS,
+                                            timings=None):
         """
         Verify that fully managed GPU systemd services are running on each node by
         creating a privileged pod with host filesystem access and checking:
           - nvidia-dcgm
           - nvidia-dcgm-exporter
           - nvidia-device-plugin
+        Nodes are verified concurrently, up to max_workers at a time. If timings is
+        given, it is filled with the per-node verification time keyed by node name.
         """
-        all_results = {}
+        timings = {} if timings is None else timings
         try:
-            for node in nodes:
-                node_name = node.metadata.name
-                pod_name = f"gpu-svc-verify-{uuid.uuid4()}"
-                logger.info(f"Verifying managed GPU systemd services on node {node_name}")
-
-                pod = client.V1Pod(
-                    metadata=client.V1ObjectMeta(name=pod_name),
-                    spec=client.V1PodSpec(
-                        host_pid=True,
-                        containers=[
-                            client.V1Container(
-                                name="svc-check",
-                                image="mcr.microsoft.com/cbl-mariner/busybox:2.0",
-                                command=[
-                                    "chroot", "/host", "sh", "-c",
-                                    "for svc in nvidia-dcgm nvidia-dcgm-exporter nvidia-device-plugin; do "
-                                    "echo \"$svc: $(systemctl is-active $svc)\"; done"
-                                ],
-                                security_context=client.V1SecurityContext(privileged=True),
-                                volume_mounts=[
-                                    client.V1VolumeMount(name="host-root", mount_path="/host")
-                                ],
-                            )
-                        ],
-                        volumes=[
-                            client.V1Volume(
-                                name="host-root",
-                                host_path=client.V1HostPathVolumeSource(path="/"),
-                            )
-                        ],
-                        node_selector={"kubernetes.io/hostname": node_name},
-                        restart_policy="Never",
-                        tolerations=[client.V1Toleration(operator="Exists")],
-                    ),
-                )
-
-                self.api.create_namespaced_pod(namespace=namespace, body=pod)
+            node_names = [node.metadata.name for node in nodes]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(node_names) or 1))) as executor:
+                results = list(executor.map(
+                    lambda node_name: self._verify_managed_gpu_systemd_services_single_node(
+                        node_name, namespace, timings),
+                    node_names))
 
-                deadline = time.time() + 120
-                while time.time() < deadline:
-                    pod_status = self.api.read_namespaced_pod(name=pod_name, namespace=namespace)
-                    if pod_status.status.phase in ["Succeeded", "Failed"]:
-                        break
-                    time.sleep(2)
-                else:
-                    raise TimeoutError(f"Verification pod {pod_name} did not complete within 120s")
-
-                pod_logs = self.get_pod_logs(pod_name=pod_name, namespace=namespace)
-                pod_logs_str = pod_logs.decode("utf-8") if isinstance(pod_logs, bytes) else str(pod_logs)
-
-                services = ["nvidia-dcgm", "nvidia-dcgm-exporter", "nvidia-device-plugin"]
-                statuses = {svc: ("active" if f"{svc}: active" in pod_logs_str else "inactive") for svc in services}
-                all_active = all(s == "active" for s in statuses.values())
-                status_summary = ", ".join(f"{svc}={state}" for svc, state in statuses.items())
-                result_label = "all active" if all_active else "SOME INACTIVE"
-                log_fn = logger.info if all_active else logger.warning
-                log_fn(f"{node_name}: {status_summary} ({result_label})")
-
-                all_results[node_name] = {
-                    "pod_name": pod_name,
-                    "logs": pod_logs_str,
-                    "all_services_active": all_active,
-                }
-
-                try:
-                    self.api.delete_namespaced_pod(
-                        name=pod_name, namespace=namespace, body=client.V1DeleteOptions()
-                    )
-                except Exception as e:
-                    logger.warning(f"Error deleting verification pod {pod_name}: {str(e)}")
-
-            return all_results
+            return dict(zip(node_names, results))
 
         except Exception as e:
             logger.error(f"Error verifying managed GPU systemd services: {str(e)}")
@@ -919,12 +1415,16 @@ class KubernetesClient:
             results[node_name] = mig_resources
         return results
 
-    def apply_manifest_from_url(self, manifest_url, namespace: Optional[str] = None):
+    def apply_manifest_from_url(self, manifest_url, namespace: Optional[str] = None, parallel: bool = False,
+                                max_workers: int = DEFAULT_MANIFEST_APPLY_WORKERS, server_side: bool = False):
         """
         Apply a Kubernetes manifest from a URL using Kubernetes Python client API.
 
         :param manifest_url: URL of the manifest to apply
         :param namespace: Optional namespace to override the manifest namespace
+        :param parallel: If True, apply the objects concurrently in dependency tiers (see apply_manifests_bulk)
+        :param max_workers: Maximum number of concurrent requests when parallel is True
+        :param server_side: If True, use server-side apply (see server_side_apply_manifest)
         :return: None
         """
         try:
@@ -938,14 +1438,19 @@ class KubernetesClient:
             # Validate and expand manifests (handles List kind and non-dict manifests)
             expanded_manifests = self._expand_and_validate_manifests(manifests)
 
-            for manifest in expanded_manifests:
-                self._apply_single_manifest(manifest, namespace=namespace)
+            if parallel:
+                self.apply_manifests_bulk(expanded_manifests, namespace=namespace, max_workers=max_workers,
+                                          server_side=server_side)
+            else:
+                for manifest in expanded_manifests:
+                    self._apply_manifest(manifest, namespace=namespace, server_side=server_side)
 
             logger.info("Successfully applied manifest from %s", manifest_url)
         except Exception as e:
             raise Exception(f"Error applying manifest from {manifest_url}: {str(e)}") from e
 
-    def delete_manifest_from_url(self, manifest_url, ignore_not_found: bool = True, namespace: Optional[str] = None):
+    def delete_manifest_from_url(self, manifest_url, ignore_not_found: bool = True, namespace: Optional[str] = None,
+                                 parallel: bool = False, max_workers: int = DEFAULT_MANIFEST_APPLY_WORKERS):
         """
         Delete a Kubernetes manifest from a URL using Kubernetes Python client API.
         Equivalent to 'kubectl delete -f <url>'
@@ -953,6 +1458,8 @@ class KubernetesClient:
         :param manifest_url: URL of the manifest to delete
         :param ignore_not_found: If True, don't raise error if resource doesn't exist (equivalent to --ignore-not-found)
         :param namespace: Optional namespace to override the manifest namespace
+        :param parallel: If True, delete the objects concurrently in reverse dependency tiers
+        :param max_workers: Maximum number of concurrent requests when parallel is True
         :return: None
         """
         try:
@@ -966,11 +1473,15 @@ class KubernetesClient:
             # Validate and expand manifests (handles List kind and non-dict manifests)
             expanded_manifests = self._expand_and_validate_manifests(manifests)
 
-            # Delete manifests in reverse order (to handle dependencies)
-            expanded_manifests.reverse()
+            if parallel:
+                self.delete_manifests_bulk(expanded_manifests, ignore_not_found=ignore_not_found,
+                                           namespace=namespace, max_workers=max_workers)
+            else:
+                # Delete manifests in reverse order (to handle dependencies)
+                expanded_manifests.reverse()
 
-            for manifest in expanded_manifests:
-                self._delete_single_manifest(manifest, ignore_not_found=ignore_not_found, namespace=namespace)
+                for manifest in expanded_manifests:
+                    self._delete_single_manifest(manifest, ignore_not_found=ignore_not_found, namespace=namespace)
 
             logger.info("Successfully deleted manifest from %s", manifest_url)
         except Exception as e:
@@ -1031,13 +1542,18 @@ class KubernetesClient:
 
         return manifests, sources
 
-    def apply_manifest_from_file(self, manifest_path: str = None, manifest_dict: dict = None, namespace: Optional[str] = None):
+    def apply_manifest_from_file(self, manifest_path: str = None, manifest_dict: dict = None, namespace: Optional[str] = None,
+                                 parallel: bool = False, max_workers: int = DEFAULT_MANIFEST_APPLY_WORKERS,
+                                 server_side: bool = False):
         """
         Apply Kubernetes manifest(s) from file path, folder path, or dictionary.
 
         :param manifest_path: Path to YAML manifest file or folder containing manifest files
         :param manifest_dict: Dictionary containing the manifest
         :param namespace: Optional namespace to override the manifest namespace
+        :param parallel: If True, apply the objects concurrently in dependency tiers (see apply_manifests_bulk)
+        :param max_workers: Maximum number of concurrent requests when parallel is True
+        :param server_side: If True, use server-side apply (see server_side_apply_manifest)
         :return: None
         """
         try:
@@ -1051,9 +1567,13 @@ class KubernetesClient:
             namespace_info = f" in namespace '{namespace}'" if namespace else ""
             logger.info(f"Applying {len(manifests_to_apply)} manifest(s) from: {', '.join(applied_sources)}{namespace_info}")
 
-            for i, manifest in enumerate(manifests_to_apply):
-                logger.info(f"Applying manifest {i+1}/{len(manifests_to_apply)}: {manifest.get('kind', 'Unknown')}/{manifest.get('metadata', {}).get('name', 'Unknown')}")
-                self._apply_single_manifest(manifest=manifest, namespace=namespace)
+            if parallel:
+                self.apply_manifests_bulk(manifests_to_apply, namespace=namespace, max_workers=max_workers,
+                                          server_side=server_side)
+            else:
+                for i, manifest in enumerate(manifests_to_apply):
+                    logger.info(f"Applying manifest {i+1}/{len(manifests_to_apply)}: {manifest.get('kind', 'Unknown')}/{manifest.get('metadata', {}).get('name', 'Unknown')}")
+                    self._apply_manifest(manifest, namespace=namespace, server_side=server_side)
 
             logger.info(f"Successfully applied {len(manifests_to_apply)} manifest(s)")
 
@@ -1061,7 +1581,8 @@ class KubernetesClient:
             logger.error(f"Error applying manifest(s): {str(e)}")
             raise e
 
-    def delete_manifest_from_file(self, manifest_path: str = None, manifest_dict: dict = None, ignore_not_found: bool = True, namespace: Optional[str] = None):
+    def delete_manifest_from_file(self, manifest_path: str = None, manifest_dict: dict = None, ignore_not_found: bool = True, namespace: Optional[str] = None,
+                                  parallel: bool = False, max_workers: int = DEFAULT_MANIFEST_APPLY_WORKERS):
         """
         Delete Kubernetes manifest(s) from file path, folder path, or dictionary.
         Equivalent to 'kubectl delete -f <file/folder>'
@@ -1070,6 +1591,8 @@ class KubernetesClient:
         :param manifest_dict: Dictionary containing the manifest
         :param ignore_not_found: If True, don't raise error if resource doesn't exist (equivalent to --ignore-not-found)
         :param namespace: Optional namespace to override the manifest namespace
+        :param parallel: If True, delete the objects concurrently in reverse dependency tiers
+        :param max_workers: Maximum number of concurrent requests when parallel is True
         :return: None
         """
         try:
@@ -1084,9 +1607,13 @@ class KubernetesClient:
             namespace_info = f" in namespace '{namespace}'" if namespace else ""
             logger.info(f"Deleting {len(manifests_to_delete)} manifest(s) from: {', '.join(deleted_sources)}{namespace_info}")
 
-            for i, manifest in enumerate(manifests_to_delete):
-                logger.info(f"Deleting manifest {i+1}/{len(manifests_to_delete)}: {manifest.get('kind', 'Unknown')}/{manifest.get('metadata', {}).get('name', 'Unknown')}")
-                self._delete_single_manifest(manifest=manifest, ignore_not_found=ignore_not_found, namespace=namespace)
+            if parallel:
+                self.delete_manifests_bulk(manifests_to_delete, ignore_not_found=ignore_not_found,
+                                           namespace=namespace, max_workers=max_workers)
+            else:
+                for i, manifest in enumerate(manifests_to_delete):
+                    logger.info(f"Deleting manifest {i+1}/{len(manifests_to_delete)}: {manifest.get('kind', 'Unknown')}/{manifest.get('metadata', {}).get('name', 'Unknown')}")
+                    self._delete_single_manifest(manifest=manifest, ignore_not_found=ignore_not_found, namespace=namespace)
 
             logger.info(f"Successfully deleted {len(manifests_to_delete)} manifest(s)")
 
@@ -1094,6 +1621,101 @@ class KubernetesClient:
             logger.error(f"Error deleting manifest(s): {str(e)}")
             raise e
 
+    @staticmethod
+    def _group_manifests_by_tier(manifests):
+        """
+        Group manifests into the dependency tiers of MANIFEST_APPLY_TIERS, keeping the
+        original order within each tier.
+
+        :param manifests: List of manifest dictionaries
+        :return: List of tiers, each a list of manifests; empty tiers are omitted
+        """
+        tier_of_kind = {kind: index for index, kinds in enumerate(MANIFEST_APPLY_TIERS) for kind in kinds}
+        tiers = [[] for _ in range(len(MANIFEST_APPLY_TIERS) + 1)]
+        for manifest in manifests:
+            tiers[tier_of_kind.get(manifest.get("kind"), len(MANIFEST_APPLY_TIERS))].append(manifest)
+        return [tier for tier in tiers if tier]
+
+    def _run_manifest_tiers(self, action, tiers, operation, max_workers):
+        """
+        Run ``action`` on every manifest, one tier at a time, with up to ``max_workers``
+        concurrent requests inside a tier. Later tiers are skipped if a tier has failures.
+
+        :return: List of per-object results with kind, name, namespace, tier, latency_seconds and error
+        """
+        def run(tier_index, manifest):
+            metadata = manifest.get("metadata", {})
+            result = {
+                "kind": manifest.get("kind"),
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "tier": tier_index,
+                "error": None,
+            }
+            start = time.perf_counter()
+            try:
+                action(manifest)
+            except Exception as e:
+                result["error"] = str(e)
+            result["latency_seconds"] = round(time.perf_counter() - start, 3)
+            return result
+
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for tier_index, tier in enumerate(tiers):
+                tier_start = time.perf_counter()
+                tier_results = list(executor.map(lambda manifest, index=tier_index: run(index, manifest), tier))
+                results.extend(tier_results)
+                for result in tier_results:
+                    error_info = f": {result['error']}" if result["error"] else ""
+                    logger.info(f"{operation} {result['kind']}/{result['name']} (tier {tier_index}) took "
+                                f"{result['latency_seconds']}s{error_info}")
+                logger.info(f"{operation} tier {tier_index}: {len(tier)} object(s) in "
+                            f"{time.perf_counter() - tier_start:.3f}s")
+                failures = [result for result in tier_results if result["error"]]
+                if failures:
+                    details = "; ".join(f"{f['kind']}/{f['name']}: {f['error']}" for f in failures)
+                    raise Exception(f"{operation} failed for {len(failures)} object(s) in tier {tier_index}: {details}")
+        return results
+
+    def apply_manifests_bulk(self, manifests, namespace: Optional[str] = None,
+                             max_workers: int = DEFAULT_MANIFEST_APPLY_WORKERS, server_side: bool = False):
+        """
+        Apply manifests concurrently in dependency tiers: Namespaces/CRDs first, then
+        RBAC/ConfigMaps/Secrets, then workloads and everything else. Objects within a
+        tier are applied by a bounded worker pool sharing this client's API instances.
+
+        :param manifests: List of expanded manifest dictionaries
+        :param namespace: Optional namespace to override the manifest namespace
+        :param max_workers: Maximum number of concurrent requests
+        :param server_side: If True, use server-side apply (see server_side_apply_manifest)
+        :return: List of per-object results with kind, name, namespace, tier, latency_seconds and error
+        """
+        tiers = self._group_manifests_by_tier(manifests)
+        logger.info(f"Applying {len(manifests)} manifest(s) in {len(tiers)} tier(s) with up to {max_workers} workers")
+        return self._run_manifest_tiers(
+            lambda manifest: self._apply_manifest(manifest, namespace=namespace, server_side=server_side),
+            tiers, "Applying", max_workers)
+
+    def delete_manifests_bulk(self, manifests, ignore_not_found: bool = True, namespace: Optional[str] = None,
+                              max_workers: int = DEFAULT_MANIFEST_APPLY_WORKERS):
+        """
+        Delete manifests concurrently in reverse dependency tiers, so workloads go before
+        the RBAC objects, CRDs and Namespaces they depend on.
+
+        :param manifests: List of expanded manifest dictionaries
+        :param ignore_not_found: If True, don't raise error if resource doesn't exist
+        :param namespace: Optional namespace to override the manifest namespace
+        :param max_workers: Maximum number of concurrent requests
+        :return: List of per-object results with kind, name, namespace, tier, latency_seconds and error
+        """
+        tiers = list(reversed(self._group_manifests_by_tier(manifests)))
+        logger.info(f"Deleting {len(manifests)} manifest(s) in {len(tiers)} tier(s) with up to {max_workers} workers")
+        return self._run_manifest_tiers(
+            lambda manifest: self._delete_single_manifest(manifest, ignore_not_found=ignore_not_found,
+                                                          namespace=namespace),
+            tiers, "Deleting", max_workers)
+
     def wait_for_condition(self, resource_type: str, wait_condition_type: str, namespace: str = "default",
                           timeout_seconds: int = 300, resource_name: str = None, wait_all: bool = False):
         """
@@ -1150,18 +1772,19 @@ class KubernetesClient:
 
             logger.info(f"Waiting for {resource_desc} with condition '{wait_condition_type}' in namespace '{namespace}' (timeout: {timeout_seconds}s)")
 
-            while time.time() < timeout:
+            poller = AdaptivePoller(deadline=timeout, initial_interval=1, max_interval=10)
+            while not poller.expired():
                 try:
                     if self._check_resource_condition(resource_type, resource_name, wait_condition_lower, namespace, wait_all):
                         elapsed_time = time.time() - start_time
                         logger.info(f"Condition '{wait_condition_type}' met for {resource_desc} after {elapsed_time:.2f} seconds")
                         return True
 
-                    time.sleep(5)  # Check every 5 seconds
+                    poller.sleep()
 
                 except Exception as e:
                     logger.warning(f"Error checking condition for {resource_desc}: {str(e)}")
-                    time.sleep(5)
+                    poller.sleep()
 
             # Timeout reached
             elapsed_time = time.time() - start_time
@@ -1354,6 +1977,56 @@ class KubernetesClient:
 
         return expanded
 
+    def _apply_manifest(self, manifest, namespace=None, server_side=False):
+        """Apply a manifest with server-side apply or with the create/update fallback."""
+        if server_side:
+            self.server_side_apply_manifest(manifest, namespace=namespace)
+        else:
+            self._apply_single_manifest(manifest, namespace=namespace)
+
+    def server_side_apply_manifest(self, manifest, namespace=None,
+                                   field_manager: str = SERVER_SIDE_APPLY_FIELD_MANAGER,
+                                   force_conflicts: bool = True):
+        """
+        Apply a single manifest with server-side apply through the dynamic client.
+        Equivalent to 'kubectl apply --server-side --force-conflicts -f <manifest>'
+
+        This is one PATCH (application/apply-patch+yaml) whether or not the object exists,
+        and the resource is resolved through API discovery, so any kind the cluster serves,
+        including arbitrary CRDs, can be applied without code changes.
+
+        :param manifest: Dictionary representing a Kubernetes resource
+        :param namespace: Optional namespace to override the manifest namespace.
+                         Defaults to 'default' for namespaced resources if not specified.
+        :param field_manager: Field manager name recorded for the applied fields
+        :param force_conflicts: If True, take ownership of fields owned by other managers
+        :return: The applied object as returned by the API server
+        """
+        kind = manifest.get("kind")
+        metadata = manifest.get("metadata", {})
+        name = metadata.get("name")
+        try:
+            if kind == "FlowSchema" and \
+                    manifest.get("spec", {}).get("priorityLevelConfiguration", {}).get("name") == "exempt":
+                logger.warning("Skipping FlowSchema %s that references exempt PriorityLevelConfiguration", name)
+                return None
+
+            # The dynamic client is cached per ApiClient, so discovery runs once per context
+            dynamic_client = self._get_api(dynamic.DynamicClient)
+            resource = dynamic_client.resources.get(api_version=manifest.get("apiVersion"), kind=kind)
+            body = manifest
+            if resource.namespaced:
+                namespace = namespace or metadata.get("namespace") or "default"
+                body = {**manifest, "metadata": {**metadata, "namespace": namespace}}
+            else:
+                namespace = None
+            logger.info("Server-side applying %s %s%s", kind, name, f" in namespace {namespace}" if namespace else "")
+            return dynamic_client.server_side_apply(
+                resource, body=body, name=name, namespace=namespace,
+                field_manager=field_manager, force_conflicts=force_conflicts)
+        except Exception as e:
+            raise Exception(f"Error applying {kind} {name}: {str(e)}") from e
+
     def _apply_single_manifest(self, manifest, namespace=None):
         """
         Apply a single Kubernetes manifest using the appropriate API client.
@@ -1388,24 +2061,24 @@ class KubernetesClient:
                 self.api.create_namespaced_service_account(namespace=namespace, body=manifest)
             elif kind == "ClusterRole":
                 # ClusterRole is cluster-scoped
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.create_cluster_role(body=manifest)
             elif kind == "ClusterRoleBinding":
                 # ClusterRoleBinding is cluster-scoped
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.create_cluster_role_binding(body=manifest)
             elif kind == "Role":
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.create_namespaced_role(namespace=namespace, body=manifest)
             elif kind == "RoleBinding":
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.create_namespaced_role_binding(namespace=namespace, body=manifest)
             elif kind == "Namespace":
                 # Namespace is cluster-scoped
                 self.api.create_namespace(body=manifest)
             elif kind == "CustomResourceDefinition":
                 # CustomResourceDefinition is cluster-scoped
-                apiextensions_api = client.ApiextensionsV1Api()
+                apiextensions_api = self._get_api(client.ApiextensionsV1Api)
                 apiextensions_api.create_custom_resource_definition(body=manifest)
             elif kind == "FlowSchema":
                 # FlowSchema is cluster-scoped (part of flow control API)
@@ -1418,13 +2091,13 @@ class KubernetesClient:
                         name
                     )
                     return
-                flowcontrol_api = client.FlowcontrolApiserverV1Api()
+                flowcontrol_api = self._get_api(client.FlowcontrolApiserverV1Api)
                 flowcontrol_api.create_flow_schema(body=manifest)
             elif kind == "Stage":
                 # Stage is a custom resource from KWOK, handle as custom resource
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.create_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1435,7 +2108,7 @@ class KubernetesClient:
                 # MPIJob is a custom resource from Kubeflow MPI Operator
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.create_namespaced_custom_object(
                     group=group,
                     version=version,
@@ -1447,7 +2120,7 @@ class KubernetesClient:
                 # NodeFeatureRule is a custom resource from Node Feature Discovery (NFD)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 # NodeFeatureRule is cluster-scoped
                 custom_api.create_cluster_custom_object(
                     group=group,
@@ -1459,7 +2132,7 @@ class KubernetesClient:
                 # NicClusterPolicy is a custom resource from NVIDIA Network Operator
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 # NicClusterPolicy is cluster-scoped
                 custom_api.create_cluster_custom_object(
                     group=group,
@@ -1471,7 +2144,7 @@ class KubernetesClient:
                 # ResourceSlice is a cluster-scoped resource for Dynamic Resource Allocation (DRA)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.create_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1482,7 +2155,7 @@ class KubernetesClient:
                 # DeviceClass is a cluster-scoped resource for Dynamic Resource Allocation (DRA)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.create_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1559,21 +2232,21 @@ class KubernetesClient:
                     raise ValueError("ServiceAccount requires a namespace")
             elif kind == "ClusterRole":
                 # ClusterRole is cluster-scoped
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.patch_cluster_role(name=name, body=manifest)
             elif kind == "ClusterRoleBinding":
                 # ClusterRoleBinding is cluster-scoped
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.patch_cluster_role_binding(name=name, body=manifest)
             elif kind == "Role":
                 if namespace:
-                    rbac_api = client.RbacAuthorizationV1Api()
+                    rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                     rbac_api.patch_namespaced_role(name=name, namespace=namespace, body=manifest)
                 else:
                     raise ValueError("Role requires a namespace")
             elif kind == "RoleBinding":
                 if namespace:
-                    rbac_api = client.RbacAuthorizationV1Api()
+                    rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                     rbac_api.patch_namespaced_role_binding(name=name, namespace=namespace, body=manifest)
                 else:
                     raise ValueError("RoleBinding requires a namespace")
@@ -1582,7 +2255,7 @@ class KubernetesClient:
                 self.api.patch_namespace(name=name, body=manifest)
             elif kind == "CustomResourceDefinition":
                 # CustomResourceDefinition is cluster-scoped
-                apiextensions_api = client.ApiextensionsV1Api()
+                apiextensions_api = self._get_api(client.ApiextensionsV1Api)
                 apiextensions_api.patch_custom_resource_definition(name=name, body=manifest)
             elif kind == "FlowSchema":
                 # FlowSchema is cluster-scoped (part of flow control API)
@@ -1594,13 +2267,13 @@ class KubernetesClient:
                         name
                     )
                     return
-                flowcontrol_api = client.FlowcontrolApiserverV1Api()
+                flowcontrol_api = self._get_api(client.FlowcontrolApiserverV1Api)
                 flowcontrol_api.patch_flow_schema(name=name, body=manifest)
             elif kind == "Stage":
                 # Stage is a custom resource from KWOK, handle as custom resource
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.patch_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1612,7 +2285,7 @@ class KubernetesClient:
                 # MPIJob is a custom resource from Kubeflow MPI Operator
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 if namespace:
                     custom_api.patch_namespaced_custom_object(
                         group=group,
@@ -1628,7 +2301,7 @@ class KubernetesClient:
                 # NodeFeatureRule is a custom resource from Node Feature Discovery (NFD)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 # NodeFeatureRule is cluster-scoped
                 custom_api.patch_cluster_custom_object(
                     group=group,
@@ -1641,7 +2314,7 @@ class KubernetesClient:
                 # NicClusterPolicy is a custom resource from NVIDIA Network Operator
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 # NicClusterPolicy is cluster-scoped
                 custom_api.patch_cluster_custom_object(
                     group=group,
@@ -1654,7 +2327,7 @@ class KubernetesClient:
                 # ResourceSlice is a cluster-scoped resource for Dynamic Resource Allocation (DRA)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.patch_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1666,7 +2339,7 @@ class KubernetesClient:
                 # DeviceClass is a cluster-scoped resource for Dynamic Resource Allocation (DRA)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.patch_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1745,21 +2418,21 @@ class KubernetesClient:
                     raise ValueError("ServiceAccount requires a namespace")
             elif kind == "ClusterRole":
                 # ClusterRole is cluster-scoped
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.delete_cluster_role(name=resource_name, body=delete_options)
             elif kind == "ClusterRoleBinding":
                 # ClusterRoleBinding is cluster-scoped
-                rbac_api = client.RbacAuthorizationV1Api()
+                rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                 rbac_api.delete_cluster_role_binding(name=resource_name, body=delete_options)
             elif kind == "Role":
                 if namespace:
-                    rbac_api = client.RbacAuthorizationV1Api()
+                    rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                     rbac_api.delete_namespaced_role(name=resource_name, namespace=namespace, body=delete_options)
                 else:
                     raise ValueError("Role requires a namespace")
             elif kind == "RoleBinding":
                 if namespace:
-                    rbac_api = client.RbacAuthorizationV1Api()
+                    rbac_api = self._get_api(client.RbacAuthorizationV1Api)
                     rbac_api.delete_namespaced_role_binding(name=resource_name, namespace=namespace, body=delete_options)
                 else:
                     raise ValueError("RoleBinding requires a namespace")
@@ -1768,7 +2441,7 @@ class KubernetesClient:
                 self.api.delete_namespace(name=resource_name, body=delete_options)
             elif kind == "CustomResourceDefinition":
                 # CustomResourceDefinition is cluster-scoped
-                apiextensions_api = client.ApiextensionsV1Api()
+                apiextensions_api = self._get_api(client.ApiextensionsV1Api)
                 apiextensions_api.delete_custom_resource_definition(name=resource_name, body=delete_options)
             elif kind == "FlowSchema":
                 # FlowSchema is cluster-scoped (part of flow control API)
@@ -1781,13 +2454,13 @@ class KubernetesClient:
                         resource_name
                     )
                     return
-                flowcontrol_api = client.FlowcontrolApiserverV1Api()
+                flowcontrol_api = self._get_api(client.FlowcontrolApiserverV1Api)
                 flowcontrol_api.delete_flow_schema(name=resource_name, body=delete_options)
             elif kind == "Stage":
                 # Stage is a custom resource from KWOK, handle as custom resource
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.delete_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1799,7 +2472,7 @@ class KubernetesClient:
                 # MPIJob is a custom resource from Kubeflow MPI Operator
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 if namespace:
                     custom_api.delete_namespaced_custom_object(
                         group=group,
@@ -1815,7 +2488,7 @@ class KubernetesClient:
                 # NodeFeatureRule is a custom resource from Node Feature Discovery (NFD)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 # NodeFeatureRule is cluster-scoped
                 custom_api.delete_cluster_custom_object(
                     group=group,
@@ -1828,7 +2501,7 @@ class KubernetesClient:
                 # NicClusterPolicy is a custom resource from NVIDIA Network Operator
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 # NicClusterPolicy is cluster-scoped
                 custom_api.delete_cluster_custom_object(
                     group=group,
@@ -1841,7 +2514,7 @@ class KubernetesClient:
                 # ResourceSlice is a cluster-scoped resource for Dynamic Resource Allocation (DRA)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.delete_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1853,7 +2526,7 @@ class KubernetesClient:
                 # DeviceClass is a cluster-scoped resource for Dynamic Resource Allocation (DRA)
                 api_version = manifest.get("apiVersion", "")
                 group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-                custom_api = client.CustomObjectsApi()
+                custom_api = self._get_api(client.CustomObjectsApi)
                 custom_api.delete_cluster_custom_object(
                     group=group,
                     version=version,
@@ -1892,7 +2565,7 @@ class KubernetesClient:
 
             api_version = resource_slice_obj.get("apiVersion", "")
             group, version = api_version.split("/") if "/" in api_version else ("", api_version)
-            custom_api = client.CustomObjectsApi()
+            custom_api = self._get_api(client.CustomObjectsApi)
 
             response = custom_api.create_cluster_custom_object(
                 group=group,
@@ -1919,7 +2592,7 @@ class KubernetesClient:
         :return: None
         """
         try:
-            custom_api = client.CustomObjectsApi()
+            custom_api = self._get_api(client.CustomObjectsApi)
             delete_options = client.V1DeleteOptions()
 
             custom_api.delete_cluster_custom_object(
@@ -1971,8 +2644,8 @@ class KubernetesClient:
         This checks if the DaemonSet is available and all pods are running.
         """
         logger.info("Verifying NVIDIA GPU device plugin...")
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        poller = AdaptivePoller(timeout_seconds=timeout, initial_interval=1, max_interval=5)
+        while not poller.expired():
             try:
                 daemonset = self.app.read_namespaced_daemon_set(
                     name="nvidia-device-plugin-daemonset", namespace=namespace
@@ -1986,7 +2659,7 @@ class KubernetesClient:
             except client.rest.ApiException as e:
                 logger.error(f"Error verifying NVIDIA GPU device plugin: {str(e)}")
                 raise e
-            time.sleep(1)
+            poller.sleep(state=ready)
         logger.error("NVIDIA GPU device plugin verification timed out.")
         return False
 
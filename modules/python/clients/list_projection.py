@@ -0,0 +1,84 @@
+"""Lightweight projections of raw LIST responses for ``KubernetesClient``.
+
+Deserializing a LIST of thousands of nodes or tens of thousands of pods into
+OpenAPI model objects dominates the cost of readiness checks on large
+clusters. These helpers turn the raw JSON items of a ``_preload_content=False``
+response into small attribute trees that carry only the fields the readiness
+checks read (names, labels, conditions, taints, phase and nodeName), with the
+same snake_case attribute names as the OpenAPI models so the same predicates
+work on both.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _project_metadata(item: dict) -> SimpleNamespace:
+    metadata = item.get("metadata") or {}
+    return SimpleNamespace(
+        name=metadata.get("name"),
+        namespace=metadata.get("namespace"),
+        labels=metadata.get("labels"),
+        resource_version=metadata.get("resourceVersion"),
+    )
+
+
+def _project_conditions(status: dict) -> list:
+    return [
+        SimpleNamespace(
+            type=condition.get("type"),
+            status=condition.get("status"),
+            last_transition_time=_parse_time(condition.get("lastTransitionTime")),
+        )
+        for condition in status.get("conditions") or []
+    ]
+
+
+def project_node(item: dict) -> SimpleNamespace:
+    """Project a raw node into metadata, spec.unschedulable/taints and status.conditions."""
+    spec = item.get("spec") or {}
+    status = item.get("status") or {}
+    taints = spec.get("taints")
+    return SimpleNamespace(
+        metadata=_project_metadata(item),
+        spec=SimpleNamespace(
+            unschedulable=spec.get("unschedulable"),
+            taints=[
+                SimpleNamespace(key=taint.get("key"), value=taint.get("value"), effect=taint.get("effect"))
+                for taint in taints
+            ] if taints else None,
+        ),
+        status=SimpleNamespace(conditions=_project_conditions(status)),
+    )
+
+
+def project_pod(item: dict) -> SimpleNamespace:
+    """Project a raw pod into metadata, spec.node_name and status.phase/conditions."""
+    spec = item.get("spec") or {}
+    status = item.get("status") or {}
+    return SimpleNamespace(
+        metadata=_project_metadata(item),
+        spec=SimpleNamespace(node_name=spec.get("nodeName")),
+        status=SimpleNamespace(phase=status.get("phase"), conditions=_project_conditions(status)),
+    )
+
+
+def project_volume_attachment(item: dict) -> SimpleNamespace:
+    """Project a raw VolumeAttachment into metadata, spec.node_name/source and status.attached."""
+    spec = item.get("spec") or {}
+    status = item.get("status") or {}
+    source = spec.get("source") or {}
+    return SimpleNamespace(
+        metadata=_project_metadata(item),
+        spec=SimpleNamespace(
+            node_name=spec.get("nodeName"),
+            source=SimpleNamespace(persistent_volume_name=source.get("persistentVolumeName")),
+        ),
+        status=SimpleNamespace(attached=status.get("attached", False)),
+    )
@@ -111,6 +111,8 @@ class PodRoleCommand:
 
         self.k8s_client.set_context(context_name)
 
+        # Output saved to a result file (iperf3, netstat, ...) is streamed to it;
+        # callers reading the returned output instead (validate, lspci) get all of it
         return execute_with_retries(
             self.k8s_client.run_pod_exec_command,
             pod_name=pod["name"],
@@ -118,6 +120,7 @@ class PodRoleCommand:
             container_name=container_name,
             dest_path=result_file,
             namespace=self.namespace,
+            stream_output=bool(result_file),
         )
 
     def validate(self):
@@ -0,0 +1,122 @@
+"""Watch-driven readiness tracking for Kubernetes collections.
+
+``ReadinessWatcher`` lists a collection once and then follows watch events
+from the returned ``resourceVersion``, keeping an in-memory ready set. It is
+used by ``KubernetesClient.wait_for_nodes_ready`` / ``wait_for_pods_ready``
+so large clusters are not re-listed on every poll and readiness is detected
+as soon as the apiserver reports it.
+"""
+import time
+from typing import Callable, Dict, List, Optional
+
+from kubernetes import client, watch
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+HTTP_STATUS_GONE = 410
+
+
+class WatchExpiredError(Exception):
+    """The watch resourceVersion is too old (HTTP 410 Gone); callers should re-list or poll."""
+
+
+class ReadinessWatcher:
+    """
+    Track readiness of the objects returned by a ``list_*`` API function.
+
+    :param list_func: Kubernetes API list function (e.g. ``CoreV1Api.list_node``).
+    :param is_ready: Predicate returning True when an object counts as ready.
+    :param list_kwargs: Keyword arguments passed to ``list_func`` for both the
+                        initial list and the watch (selectors, namespace, ...).
+                        ``None`` values are dropped.
+    """
+    def __init__(self, list_func: Callable, is_ready: Callable, **list_kwargs):
+        self.list_func = list_func
+        self.is_ready = is_ready
+        self.list_kwargs = {k: v for k, v in list_kwargs.items() if v is not None}
+        self.resource_version = None
+        self.objects = {}
+        self.ready = set()
+        # Object name -> epoch seconds at which it was first observed Ready.
+        self.ready_times: Dict[str, float] = {}
+
+    def _observe(self, obj, event_type: str = "ADDED"):
+        name = obj.metadata.name
+        if event_type == "DELETED":
+            self.objects.pop(name, None)
+            self.ready.discard(name)
+            return
+
+        self.objects[name] = obj
+        if self.is_ready(obj):
+            if name not in self.ready:
+                self.ready.add(name)
+                self.ready_times.setdefault(name, time.time())
+        else:
+            self.ready.discard(name)
+
+    def list(self):
+        """List the collection and reset the in-memory state from the result."""
+        result = self.list_func(**self.list_kwargs)
+        self.objects.clear()
+        self.ready.clear()
+        for item in result.items:
+            self._observe(item)
+        self.resource_version = result.metadata.resource_version
+
+    def ready_objects(self) -> List:
+        """Return the currently ready objects."""
+        return [obj for name, obj in self.objects.items() if name in self.ready]
+
+    def is_target_reached(self, target_count: Optional[int] = None) -> bool:
+        """
+        Check whether the ready set matches the target.
+
+        :param target_count: Expected number of ready objects. If None, every
+                             tracked object must be ready (and at least one tracked).
+        """
+        if target_count is None:
+            return bool(self.objects) and len(self.ready) == len(self.objects)
+        return len(self.ready) == target_count
+
+    def wait(self, target_count: Optional[int], timeout_seconds: float, skip_list: bool = False) -> bool:
+        """
+        List once, then follow watch events until the target is reached or the timeout expires.
+
+        :param target_count: Expected number of ready objects (see ``is_target_reached``).
+        :param timeout_seconds: Maximum time to wait in seconds.
+        :param skip_list: Reuse the state of a previous ``list()`` call instead of listing again.
+        :return: True if the target was reached, False on timeout.
+        :raises WatchExpiredError: If the watch resourceVersion expired (410 Gone).
+        """
+        deadline = time.time() + timeout_seconds
+        if not skip_list:
+            self.list()
+
+        while not self.is_target_reached(target_count):
+            remaining = int(deadline - time.time())
+            if remaining <= 0:
+                return False
+            logger.info(f"Watching for readiness: {len(self.ready)}/{target_count if target_count is not None else len(self.objects)} "
+                        f"ready, resourceVersion {self.resource_version}")
+            watcher = watch.Watch()
+            try:
+                for event in watcher.stream(self.list_func,
+                                            resource_version=self.resource_version,
+                                            timeout_seconds=remaining,
+                                            **self.list_kwargs):
+                    obj = event["object"]
+                    self._observe(obj, event["type"])
+                    self.resource_version = obj.metadata.resource_version
+                    if self.is_target_reached(target_count):
+                        watcher.stop()
+                        break
+            except client.rest.ApiException as e:
+                if e.status == HTTP_STATUS_GONE:
+                    raise WatchExpiredError(
+                        f"Watch expired at resourceVersion {self.resource_version}: {e.reason}") from e
+                raise
+        return True
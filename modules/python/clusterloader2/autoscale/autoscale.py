@@ -1,11 +1,10 @@
-import json
 import os
 import argparse
 import re
 import subprocess
 
 from datetime import datetime, timezone
-from clusterloader2.utils import parse_xml_to_json, run_cl2_command, process_cl2_reports
+from clusterloader2.utils import iter_junit_testcases, run_cl2_command, write_cl2_reports, write_ndjson
 from clients.kubernetes_client import KubernetesClient
 from utils.common import str2bool
 from utils.logger_config import get_logger, setup_logging
@@ -57,7 +56,7 @@ def _build_report_template(
 
 
 def _process_test_results(
-    testsuites,
+    testcases,
     index_pattern,
     cpu_per_node,
     capacity_type,
@@ -70,7 +69,7 @@ def _process_test_results(
     pod_cpu_request=0,
     pod_memory_request="",
 ):
-    """Process test results and generate JSON content"""
+    """Summarize the testcases of each loop into one result record per autoscale direction"""
     summary = {}
 
     # Define which metrics to include in data based on config type
@@ -106,7 +105,7 @@ def _process_test_results(
         }
 
     # Process each loop
-    for testcase in testsuites[0]["testcases"]:
+    for testcase in testcases:
         name = testcase["name"]
         index = -1
         match = index_pattern.search(name)
@@ -126,8 +125,8 @@ def _process_test_results(
                 summary[index][category]["failures"] += 1 if failure else 0
                 break  # Exit loop once matched
 
-    content = ""
-    for index, inner_dict in summary.items():
+    records = []
+    for inner_dict in summary.values():
         for key, value in inner_dict.items():
             # Build data dict dynamically based on available metrics
             data = {metric: value.get(metric) for metric in data_metrics}
@@ -150,9 +149,9 @@ def _process_test_results(
                 pod_cpu_request=pod_cpu_request,
                 pod_memory_request=pod_memory_request,
             )
-            content += json.dumps(result) + "\n"
+            records.append(result)
 
-    return content
+    return records
 
 
 def warmup_deployment_for_karpeneter(
@@ -337,31 +336,25 @@ def collect_clusterloader2(
     pod_memory_request="",
 ):
     index_pattern = re.compile(r"(\d+)$")
-    raw_data = parse_xml_to_json(os.path.join(cl2_report_dir, "junit.xml"), indent=2)
-
-    json_data = json.loads(raw_data)
-    testsuites = json_data["testsuites"]
-
     is_complex_config = cl2_config_file == "ms_complex_config.yaml"
 
-    if testsuites:
-        content = _process_test_results(
-            testsuites,
-            index_pattern,
-            cpu_per_node,
-            capacity_type,
-            node_count,
-            pod_count,
-            cloud_info,
-            run_id,
-            run_url,
-            is_complex_config,
-            pod_cpu_request,
-            pod_memory_request,
-        )
+    # Testcases are summarized as they are parsed; raises if the report has no testsuite
+    records = _process_test_results(
+        iter_junit_testcases(os.path.join(cl2_report_dir, "junit.xml")),
+        index_pattern,
+        cpu_per_node,
+        capacity_type,
+        node_count,
+        pod_count,
+        cloud_info,
+        run_id,
+        run_url,
+        is_complex_config,
+        pod_cpu_request,
+        pod_memory_request,
+    )
 
-    else:
-        raise Exception(f"No testsuites found in the report! Raw data: {raw_data}")
+    write_ndjson(records, result_file, schema="cl2")
 
     # if complex test case collect cl2 report
     if is_complex_config:
@@ -376,12 +369,7 @@ def collect_clusterloader2(
             pod_cpu_request=pod_cpu_request,
             pod_memory_request=pod_memory_request,
         )
-        cl2_result = process_cl2_reports(cl2_report_dir, cl2_measurement)
-        logger.info(f"Result, category up: {cl2_result}")
-        content += cl2_result
-    os.makedirs(os.path.dirname(result_file), exist_ok=True)
-    with open(result_file, "w", encoding="utf-8") as file:
-        file.write(content)
+        write_cl2_reports(cl2_report_dir, cl2_measurement, result_file, mode="a")
 
 
 def main():
@@ -4,7 +4,7 @@ import argparse
 import math
 
 from datetime import datetime, timezone
-from clusterloader2.utils import parse_xml_to_json, run_cl2_command, get_measurement
+from clusterloader2.utils import parse_junit_xml, run_cl2_command, iter_cl2_reports, write_ndjson
 from clients.kubernetes_client import KubernetesClient, client as k8s_client
 from utils.logger_config import get_logger, setup_logging
 from utils.common import str2bool
@@ -157,6 +157,24 @@ def verify_measurement():
         except k8s_client.ApiException as e:
             logger.error(f"Error fetching metrics: {e}")
 
+def _iter_cri_records(reports, template):
+    """Yield result records of the CL2 reports, one per percentile item of ResourceUsageSummary"""
+    for file_path, measurement, group_name, data in reports:
+        if measurement == "ResourceUsageSummary":
+            for percentile, items in data.items():
+                for item in items:
+                    yield {**template, "measurement": measurement, "group": group_name,
+                           "percentile": percentile, "data": item}
+        elif "dataItems" in data:
+            items = data["dataItems"]
+            if not items:
+                logger.info(f"No data items found in {file_path}")
+                logger.info(f"Data:\n{data}")
+                continue
+            for item in items:
+                yield {**template, "measurement": measurement, "group": group_name,
+                       "percentile": "dataItems", "data": item}
+
 def collect_clusterloader2(
     node_count,
     max_pods,
@@ -179,14 +197,13 @@ def collect_clusterloader2(
             "registry": json.loads(registry_info),
         })
 
-    details = parse_xml_to_json(os.path.join(cl2_report_dir, "junit.xml"), indent = 2)
-    json_data = json.loads(details)
+    json_data = parse_junit_xml(os.path.join(cl2_report_dir, "junit.xml"))
     testsuites = json_data["testsuites"]
 
     if testsuites:
         status = "success" if testsuites[0]["failures"] == 0 else "failure"
     else:
-        raise Exception(f"No testsuites found in the report! Raw data: {details}")
+        raise Exception(f"No testsuites found in the report! Raw data: {json_data}")
 
     template = {
         "timestamp": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
@@ -204,40 +221,7 @@ def collect_clusterloader2(
         "run_url": run_url
     }
 
-    content = ""
-    for f in os.listdir(cl2_report_dir):
-        file_path = os.path.join(cl2_report_dir, f)
-        with open(file_path, 'r', encoding='utf-8') as file:
-            measurement, group_name = get_measurement(file_path)
-            if not measurement:
-                continue
-            logger.info(f"Processing measurement: {measurement}, group: {group_name}")
-            data = json.loads(file.read())
-
-            if measurement == "ResourceUsageSummary":
-                for percentile, items in data.items():
-                    template["measurement"] = measurement
-                    template["group"] = group_name
-                    template["percentile"] = percentile
-                    for item in items:
-                        template["data"] = item
-                        content += json.dumps(template) + "\n"
-            elif "dataItems" in data:
-                items = data["dataItems"]
-                if not items:
-                    logger.info(f"No data items found in {file_path}")
-                    logger.info(f"Data:\n{data}")
-                    continue
-                for item in items:
-                    template["measurement"] = measurement
-                    template["group"] = group_name
-                    template["percentile"] = "dataItems"
-                    template["data"] = item
-                    content += json.dumps(template) + "\n"
-
-    os.makedirs(os.path.dirname(result_file), exist_ok=True)
-    with open(result_file, 'w', encoding='utf-8') as file:
-        file.write(content)
+    write_ndjson(_iter_cri_records(iter_cl2_reports(cl2_report_dir), template), result_file, schema="cl2")
 
 def main():
     parser = argparse.ArgumentParser(description="CRI Kubernetes resources.")
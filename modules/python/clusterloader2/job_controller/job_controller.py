@@ -1,19 +1,19 @@
 import json
 import os
 import subprocess
-import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from clients.kubernetes_client import KubernetesClient
 from clusterloader2.base import ClusterLoader2Base
 from clusterloader2.utils import (
-    parse_xml_to_json,
-    process_cl2_reports,
+    parse_junit_xml,
     run_cl2_command,
+    write_cl2_reports,
 )
 from utils.logger_config import get_logger, setup_logging
 from utils.common import str2bool
+from utils.polling import AdaptivePoller
 
 setup_logging()
 logger = get_logger(__name__)
@@ -103,17 +103,14 @@ class JobController(ClusterLoader2Base):
 
     def collect_clusterloader2(self) -> None:
 
-        details = parse_xml_to_json(
-            os.path.join(self.cl2_report_dir, "junit.xml"), indent=2
-        )
-        json_data = json.loads(details)
+        json_data = parse_junit_xml(os.path.join(self.cl2_report_dir, "junit.xml"))
         testsuites = json_data["testsuites"]
         provider = json.loads(self.cloud_info)["cloud"]
 
         if testsuites:
             status = "success" if testsuites[0]["failures"] == 0 else "failure"
         else:
-            raise Exception(f"No testsuites found in the report! Raw data: {details}")
+            raise Exception(f"No testsuites found in the report! Raw data: {json_data}")
 
         template = {
             "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -135,13 +132,8 @@ class JobController(ClusterLoader2Base):
             "provider": provider,
         }
 
-        # Process CL2 report files
-        content = process_cl2_reports(self.cl2_report_dir, template)
-
-        # Write results to the result file
-        os.makedirs(os.path.dirname(self.result_file), exist_ok=True)
-        with open(self.result_file, "w", encoding="utf-8") as file:
-            file.write(content)
+        # Stream CL2 report records to the result file
+        write_cl2_reports(self.cl2_report_dir, template, self.result_file)
 
     def install_ray_dependencies(self):
         """Install Ray test dependencies and supporting resources.
@@ -258,12 +250,11 @@ class JobController(ClusterLoader2Base):
                 if pods:
                     logger.info("Found %d pods in namespace %s, waiting for all to be ready", len(pods), ns)
                     ready_pods = kube_client.get_ready_pods_by_namespace(namespace=ns)
-                    timeout_start = time.time()
-                    timeout_duration = 600  # 10 minutes timeout
+                    poller = AdaptivePoller(timeout_seconds=600, initial_interval=2, max_interval=10)  # 10 minutes timeout
 
-                    while len(ready_pods) < len(pods) and (time.time() - timeout_start) < timeout_duration:
+                    while len(ready_pods) < len(pods) and not poller.expired():
                         logger.info("Namespace %s: %d/%d pods ready, waiting...", ns, len(ready_pods), len(pods))
-                        time.sleep(10)
+                        poller.sleep(state=len(ready_pods))
                         pods = kube_client.get_pods_by_namespace(namespace=ns)
                         ready_pods = kube_client.get_ready_pods_by_namespace(namespace=ns)
 
@@ -1,12 +1,11 @@
-import json
 import os
 import argparse
-import time
 
 from datetime import datetime, timezone
-from clusterloader2.utils import parse_xml_to_json, run_cl2_command, get_measurement
+from clusterloader2.utils import parse_junit_xml, run_cl2_command, write_cl2_reports
 from clients.kubernetes_client import KubernetesClient
 from utils.common import str2bool
+from utils.polling import AdaptivePoller
 
 DEFAULT_NODES_PER_NAMESPACE = 100
 CPU_REQUEST_LIMIT_MILLI = 1
@@ -88,20 +87,20 @@ def configure_clusterloader2(
 def validate_clusterloader2(node_count, operation_timeout_in_minutes=10):
     kube_client = KubernetesClient()
     ready_node_count = 0
-    timeout = time.time() + (operation_timeout_in_minutes * 60)
-    while time.time() < timeout:
+    poller = AdaptivePoller(timeout_seconds=operation_timeout_in_minutes * 60, initial_interval=2, max_interval=10)
+    while not poller.expired():
         try:
-            ready_nodes = kube_client.get_ready_nodes()
+            ready_nodes = kube_client.get_ready_nodes(lightweight=True)
         except Exception as e:
             print(f"Transient error querying nodes, will retry: {e}")
-            time.sleep(10)
+            poller.sleep()
             continue
         ready_node_count = len(ready_nodes)
         print(f"Currently {ready_node_count} nodes are ready.")
         if ready_node_count == node_count:
             break
         print(f"Waiting for {node_count} nodes to be ready.")
-        time.sleep(10)
+        poller.sleep(state=ready_node_count)
     if ready_node_count != node_count:
         raise Exception(f"Only {ready_node_count} nodes are ready, expected {node_count} nodes!")
 
@@ -129,14 +128,13 @@ def collect_clusterloader2(
     run_url,
     result_file,
 ):
-    details = parse_xml_to_json(os.path.join(cl2_report_dir, "junit.xml"), indent = 2)
-    json_data = json.loads(details)
+    json_data = parse_junit_xml(os.path.join(cl2_report_dir, "junit.xml"))
     testsuites = json_data["testsuites"]
 
     if testsuites:
         status = "success" if testsuites[0]["failures"] == 0 else "failure"
     else:
-        raise Exception(f"No testsuites found in the report! Raw data: {details}")
+        raise Exception(f"No testsuites found in the report! Raw data: {json_data}")
 
     pod_count = node_count * pods_per_node
 
@@ -156,39 +154,7 @@ def collect_clusterloader2(
         "run_id": run_id,
         "run_url": run_url,
     }
-    content = ""
-    for f in os.listdir(cl2_report_dir):
-        file_path = os.path.join(cl2_report_dir, f)
-        with open(file_path, 'r', encoding='utf-8') as file:
-            print(f"Processing {file_path}")
-            measurement, group_name = get_measurement(file_path)
-            if not measurement:
-                continue
-            print(measurement, group_name)
-            data = json.loads(file.read())
-
-            if "dataItems" in data:
-                items = data["dataItems"]
-                if not items:
-                    print(f"No data items found in {file_path}")
-                    print(f"Data:\n{data}")
-                    continue
-                for item in items:
-                    result = template.copy()
-                    result["group"] = group_name
-                    result["measurement"] = measurement
-                    result["result"] = item
-                    content += json.dumps(result) + "\n"
-            else:
-                result = template.copy()
-                result["group"] = group_name
-                result["measurement"] = measurement
-                result["result"] = data
-                content += json.dumps(result) + "\n"
-
-    os.makedirs(os.path.dirname(result_file), exist_ok=True)
-    with open(result_file, 'w', encoding='utf-8') as file:
-        file.write(content)
+    write_cl2_reports(cl2_report_dir, template, result_file)
 
 def main():
     parser = argparse.ArgumentParser(description="SLO Kubernetes resources.")
@@ -1,9 +1,8 @@
-import json
 import os
 import argparse
 
 from datetime import datetime, timezone
-from clusterloader2.utils import parse_xml_to_json, run_cl2_command, get_measurement
+from clusterloader2.utils import parse_junit_xml, run_cl2_command, write_cl2_reports
 from utils.common import str2bool
 
 DEFAULT_NODES_PER_NAMESPACE = 100
@@ -111,15 +110,14 @@ def collect_clusterloader2(
     apply_fqdn_cnp,
     test_type="default_config"
 ):
-    details = parse_xml_to_json(os.path.join(cl2_report_dir, "junit.xml"), indent = 2)
-    json_data = json.loads(details)
+    json_data = parse_junit_xml(os.path.join(cl2_report_dir, "junit.xml"))
     testsuites = json_data["testsuites"]
 
     # FIXME this is not working. always failure
     if testsuites:
         status = "success" if testsuites[0]["failures"] == 0 else "failure"
     else:
-        raise Exception(f"No testsuites found in the report! Raw data: {details}")
+        raise Exception(f"No testsuites found in the report! Raw data: {json_data}")
 
     template = {
         "timestamp": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
@@ -144,39 +142,7 @@ def collect_clusterloader2(
         "fortio_deployments_per_namespace": fortio_deployments_per_namespace,
         "apply_fqdn_cnp": apply_fqdn_cnp,
     }
-    content = ""
-    for f in os.listdir(cl2_report_dir):
-        file_path = os.path.join(cl2_report_dir, f)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            print(f"Processing {file_path}")
-            measurement, group_name = get_measurement(file_path)
-            if not measurement:
-                continue
-            print(measurement, group_name)
-            data = json.loads(f.read())
-
-            if "dataItems" in data:
-                items = data["dataItems"]
-                if not items:
-                    print(f"No data items found in {file_path}")
-                    print(f"Data:\n{data}")
-                    continue
-                for item in items:
-                    result = template.copy()
-                    result["group"] = group_name
-                    result["measurement"] = measurement
-                    result["result"] = item
-                    content += json.dumps(result) + "\n"
-            else:
-                result = template.copy()
-                result["group"] = group_name
-                result["measurement"] = measurement
-                result["result"] = data
-                content += json.dumps(result) + "\n"
-
-    os.makedirs(os.path.dirname(result_file), exist_ok=True)
-    with open(result_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_cl2_reports(cl2_report_dir, template, result_file)
 
 def main():
     parser = argparse.ArgumentParser(description="network-load test")
@@ -1,9 +1,8 @@
-import json
 import os
 import argparse
 
 from datetime import datetime, timezone
-from clusterloader2.utils import parse_xml_to_json, run_cl2_command, process_cl2_reports
+from clusterloader2.utils import parse_junit_xml, run_cl2_command, write_cl2_reports
 from utils.common import str2bool
 
 def configure_clusterloader2(
@@ -84,14 +83,13 @@ def collect_clusterloader2(
     label_traffic_pods=False,
     trigger_reason="",
 ):
-    details = parse_xml_to_json(os.path.join(cl2_report_dir, "junit.xml"), indent = 2)
-    json_data = json.loads(details)
+    json_data = parse_junit_xml(os.path.join(cl2_report_dir, "junit.xml"))
     testsuites = json_data["testsuites"]
 
     if testsuites:
         status = "success" if testsuites[0]["failures"] == 0 else "failure"
     else:
-        raise Exception(f"No testsuites found in the report! Raw data: {details}")
+        raise Exception(f"No testsuites found in the report! Raw data: {json_data}")
 
     # TODO: Expose optional parameter to include test details
     template = {
@@ -132,11 +130,7 @@ def collect_clusterloader2(
         "fortio_namespaces": fortio_namespaces,
         "fortio_deployments_per_namespace": fortio_deployments_per_namespace,
     }
-    content = process_cl2_reports(cl2_report_dir, template)
-
-    os.makedirs(os.path.dirname(result_file), exist_ok=True)
-    with open(result_file, 'w', encoding='utf-8') as file:
-        file.write(content)
+    write_cl2_reports(cl2_report_dir, template, result_file)
 
 def main():
     parser = argparse.ArgumentParser(description="SLO Kubernetes resources.")
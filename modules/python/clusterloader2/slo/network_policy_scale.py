@@ -3,7 +3,7 @@ import os
 import argparse
 
 from datetime import datetime, timezone
-from clusterloader2.utils import parse_xml_to_json, get_measurement,run_cl2_command
+from clusterloader2.utils import parse_junit_xml, run_cl2_command, write_cl2_reports
 from utils.common import str2bool
 
 def configure_clusterloader2(
@@ -95,15 +95,14 @@ def collect_clusterloader2(
     result_file,
     test_type,
 ):
-    details = parse_xml_to_json(os.path.join(cl2_report_dir, "junit.xml"), indent=2)
-    json_data = json.loads(details)
+    json_data = parse_junit_xml(os.path.join(cl2_report_dir, "junit.xml"))
     testsuites = json_data["testsuites"]
     provider = json.loads(cloud_info)["cloud"]
 
     if testsuites:
         status = "success" if testsuites[0]["failures"] == 0 else "failure"
     else:
-        raise Exception(f"No testsuites found in the report! Raw data: {details}")
+        raise Exception(f"No testsuites found in the report! Raw data: {json_data}")
 
     # TODO: Expose optional parameter to include test details
     template = {
@@ -119,40 +118,7 @@ def collect_clusterloader2(
         "run_url": run_url,
         "test_type": test_type,
     }
-    content = ""
-    for f in os.listdir(cl2_report_dir):
-        file_path = os.path.join(cl2_report_dir, f)
-        with open(file_path, "r", encoding="utf-8") as file:
-            print(f"Processing {file_path}")
-            measurement, group_name = get_measurement(file_path)
-            if not measurement:
-                continue
-            print(measurement, group_name)
-            data = json.loads(file.read())
-
-            if "dataItems" in data:
-                items = data["dataItems"]
-                if not items:
-                    print(f"No data items found in {file_path}")
-                    print(f"Data:\n{data}")
-                    continue
-                for item in items:
-                    result = template.copy()
-                    result["group"] = group_name
-                    result["measurement"] = measurement
-                    result["result"] = item
-                    content += json.dumps(result) + "\n"
-            else:
-                result = template.copy()
-                result["group"] = group_name
-                result["measurement"] = measurement
-                result["result"] = data
-                content += json.dumps(result) + "\n"
-
-    os.makedirs(os.path.dirname(result_file), exist_ok=True)
-    # os.chmod(os.path.dirname(result_file), 0o755)  # Ensure the directory is writable
-    with open(result_file, "w", encoding="utf-8") as file:
-        file.write(content)
+    write_cl2_reports(cl2_report_dir, template, result_file)
 
 
 def main():
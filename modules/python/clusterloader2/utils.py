@@ -1,9 +1,14 @@
-from xml.dom import minidom
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from xml.etree import ElementTree
 import json
 import os
+import re
 import docker
 from clients.docker_client import DockerClient
 from utils.logger_config import get_logger, setup_logging
+from utils.result_schema import export_parquet
 
 setup_logging()
 logger = get_logger(__name__)
@@ -79,140 +84,267 @@ def run_cl2_command(kubeconfig, cl2_image, cl2_config_dir, cl2_report_dir, provi
             f"Container exited with a non-zero status code: {e.exit_status}\n{e.stderr.decode('utf-8')}")
 
 
-def get_measurement(file_path):
-    file_name = os.path.basename(file_path)
-    for file_prefix, measurement in POD_STARTUP_LATENCY_FILE_PREFIX_MEASUREMENT_MAP.items():
-        if file_name.startswith(file_prefix):
-            group_name = file_name.split("_")[2]
-            return measurement, group_name
-    for file_prefix in NETWORK_METRIC_PREFIXES:
-        if file_name.startswith(file_prefix):
-            group_name = file_name.split("_")[1]
-            return file_prefix, group_name
-    if file_name.startswith(PROM_QUERY_PREFIX):
-        # Remove "GenericPrometheusQuery " or "GenericPrometheusQuery_" prefix
-        if file_name.startswith(PROM_QUERY_PREFIX + " "):
-            remainder = file_name[len(PROM_QUERY_PREFIX) + 1:]
-        elif file_name.startswith(PROM_QUERY_PREFIX + "_"):
-            remainder = file_name[len(PROM_QUERY_PREFIX) + 1:]
-        else:
-            return None, None
-
-        # Format: <measurement>_<group>_<timestamp>.json
-        # Split on underscore to extract parts
-        parts = remainder.split("_")
-        if len(parts) >= 2:
-            # Find where the group starts (it's the part before the timestamp)
-            # Timestamp format: 2026-02-25T13:51:31Z.json (contains 'T' and 'Z')
-            for i in range(len(parts) - 1, 0, -1):
-                if 'T' in parts[i]:
-                    # Found timestamp, group is parts[i-1]
-                    group_name = parts[i - 1]
-                    # Measurement is everything before the group
-                    measurement_name = "_".join(parts[:i - 1]).rstrip("_")
-                    return measurement_name, group_name
+ReportInfo = namedtuple("ReportInfo", ["measurement", "group_name", "timestamp"])
+
+# Measurement prefixes whose group is the second "_"-separated part of the file name.
+_SECOND_PART_GROUP_PREFIXES = NETWORK_METRIC_PREFIXES + [
+    JOB_LIFECYCLE_LATENCY_PREFIX,
+    RESOURCE_USAGE_SUMMARY_PREFIX,
+    NETWORK_POLICY_SOAK_MEASUREMENT_PREFIX,
+    SCHEDULING_THROUGHPUT_PROMETHEUS_PREFIX,
+    SCHEDULING_THROUGHPUT_PREFIX,
+]
+# Longest prefix first, so e.g. SchedulingThroughputPrometheus wins over SchedulingThroughput.
+_REPORT_PREFIX_PATTERN = re.compile("|".join(
+    re.escape(prefix) for prefix in sorted(
+        [*POD_STARTUP_LATENCY_FILE_PREFIX_MEASUREMENT_MAP, *_SECOND_PART_GROUP_PREFIXES, PROM_QUERY_PREFIX],
+        key=len, reverse=True,
+    )
+))
+_SECOND_PART_GROUP_PATTERN = re.compile(r"[^_]*_([^_]*)")
+_POD_STARTUP_GROUP_PATTERN = re.compile(r"[^_]*")
+_REPORT_TIMESTAMP_PATTERN = re.compile(r".*_(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z)")
+
+PARALLEL_INGEST_MIN_REPORTS = 64
+
+
+def classify_report(file_name):
+    """
+    Classify a CL2 report file name with a single compiled prefix match.
+
+    Report names look like ``<measurement>_<group>_<timestamp>.json``.
+
+    Returns:
+        ReportInfo(measurement, group_name, timestamp), or None if the file is not a
+        known measurement report. ``timestamp`` is None if the name has none.
+    """
+    match = _REPORT_PREFIX_PATTERN.match(file_name)
+    if not match:
+        return None
+    prefix = match.group()
+    timestamp_match = _REPORT_TIMESTAMP_PATTERN.match(file_name)
+    timestamp = timestamp_match.group(1) if timestamp_match else None
+
+    if prefix in POD_STARTUP_LATENCY_FILE_PREFIX_MEASUREMENT_MAP:
+        group_name = _POD_STARTUP_GROUP_PATTERN.match(file_name, match.end()).group()
+        return ReportInfo(POD_STARTUP_LATENCY_FILE_PREFIX_MEASUREMENT_MAP[prefix], group_name, timestamp)
+    if prefix != PROM_QUERY_PREFIX:
+        group_match = _SECOND_PART_GROUP_PATTERN.match(file_name, match.end())
+        return ReportInfo(prefix, group_match.group(1), timestamp) if group_match else None
+
+    # Remove "GenericPrometheusQuery " or "GenericPrometheusQuery_" prefix
+    if file_name[match.end():match.end() + 1] not in (" ", "_"):
+        return None
+    # Format: <measurement>_<group>_<timestamp>.json
+    # Split on underscore to extract parts
+    parts = file_name[match.end() + 1:].split("_")
+    # Find where the group starts (it's the part before the timestamp)
+    # Timestamp format: 2026-02-25T13:51:31Z.json (contains 'T' and 'Z')
+    for i in range(len(parts) - 1, 0, -1):
+        if 'T' in parts[i]:
+            # Measurement is everything before the group
+            measurement_name = "_".join(parts[:i - 1]).rstrip("_")
+            return ReportInfo(measurement_name, parts[i - 1], timestamp)
+    return None
+
 
+def get_measurement(file_path):
+    info = classify_report(os.path.basename(file_path))
+    if not info:
         return None, None
-    if file_name.startswith(JOB_LIFECYCLE_LATENCY_PREFIX):
-        group_name = file_name.split("_")[1]
-        return JOB_LIFECYCLE_LATENCY_PREFIX, group_name
-    if file_name.startswith(RESOURCE_USAGE_SUMMARY_PREFIX):
-        group_name = file_name.split("_")[1]
-        return RESOURCE_USAGE_SUMMARY_PREFIX, group_name
-    if file_name.startswith(NETWORK_POLICY_SOAK_MEASUREMENT_PREFIX):
-        group_name = file_name.split("_")[1]
-        return NETWORK_POLICY_SOAK_MEASUREMENT_PREFIX, group_name
-    if file_name.startswith(SCHEDULING_THROUGHPUT_PROMETHEUS_PREFIX):
-        group_name = file_name.split("_")[1]
-        return SCHEDULING_THROUGHPUT_PROMETHEUS_PREFIX, group_name
-    if file_name.startswith(SCHEDULING_THROUGHPUT_PREFIX):
-        group_name = file_name.split("_")[1]
-        return SCHEDULING_THROUGHPUT_PREFIX, group_name
-    return None, None
+    return info.measurement, info.group_name
 
-def process_cl2_reports(cl2_report_dir, template):
-    content = ""
-    for f in os.listdir(cl2_report_dir):
+def iter_cl2_reports(cl2_report_dir, max_workers=None):
+    """
+    Yield (file_path, measurement, group_name, data) for every CL2 measurement report.
+
+    Files are classified and listed when this is called rather than on first
+    iteration, so a result file written next to the reports is never picked up
+    as a report. Reports are yielded in file name order; when there are at least
+    PARALLEL_INGEST_MIN_REPORTS of them they are parsed in a process pool.
+
+    Args:
+        cl2_report_dir: CL2 report directory.
+        max_workers: Parser processes, defaults to the CPU count; 1 parses serially.
+    """
+    reports = []
+    for f in sorted(os.listdir(cl2_report_dir)):
         file_path = os.path.join(cl2_report_dir, f)
-        with open(file_path, "r", encoding="utf-8") as file:
-            logger.info(f"Processing {file_path}")
-            measurement, group_name = get_measurement(file_path)
-            if not measurement:
+        measurement, group_name = get_measurement(file_path)
+        if measurement:
+            reports.append((file_path, measurement, group_name))
+    return _read_cl2_reports(reports, max_workers or os.cpu_count() or 1)
+
+
+def _load_report(file_path):
+    with open(file_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _load_reports_parallel(file_paths, max_workers):
+    # Keep a bounded window of reports in flight so parsed data does not pile up
+    # in memory when the consumer writes slower than the pool parses.
+    paths = iter(file_paths)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(executor.submit(_load_report, path) for path in islice(paths, 2 * max_workers))
+        while pending:
+            data = pending.popleft().result()
+            for path in islice(paths, 1):
+                pending.append(executor.submit(_load_report, path))
+            yield data
+
+
+def _read_cl2_reports(reports, max_workers):
+    file_paths = [file_path for file_path, _, _ in reports]
+    if max_workers > 1 and len(reports) >= PARALLEL_INGEST_MIN_REPORTS:
+        logger.info(f"Parsing {len(reports)} CL2 reports with {max_workers} processes")
+        loaded = _load_reports_parallel(file_paths, max_workers)
+    else:
+        loaded = map(_load_report, file_paths)
+    for (file_path, measurement, group_name), data in zip(reports, loaded):
+        logger.info(f"Processing {file_path}")
+        logger.info(f"Measurement: {measurement}, Group Name: {group_name}")
+        yield file_path, measurement, group_name, data
+
+
+def iter_cl2_records(cl2_report_dir, template, max_workers=None):
+    """
+    Yield one result record per data item of every CL2 measurement report.
+
+    Each record is a copy of ``template`` with ``group``, ``measurement`` and
+    ``result`` filled in; reports without ``dataItems`` become a single record.
+    """
+    return _cl2_records(iter_cl2_reports(cl2_report_dir, max_workers), template)
+
+
+def _cl2_records(reports, template):
+    for file_path, measurement, group_name, data in reports:
+        if "dataItems" in data:
+            items = data["dataItems"]
+            if not items:
+                logger.info(f"No data items found in {file_path}")
+                logger.info(f"Data:\n{data}")
                 continue
-            logger.info(f"Measurement: {measurement}, Group Name: {group_name}")
-            data = json.loads(file.read())
-
-            if "dataItems" in data:
-                items = data["dataItems"]
-                if not items:
-                    logger.info(f"No data items found in {file_path}")
-                    logger.info(f"Data:\n{data}")
-                    continue
-                for item in items:
-                    result = template.copy()
-                    result["group"] = group_name
-                    result["measurement"] = measurement
-                    result["result"] = item
-                    content += json.dumps(result) + "\n"
-            else:
+            for item in items:
                 result = template.copy()
                 result["group"] = group_name
                 result["measurement"] = measurement
-                result["result"] = data
-                content += json.dumps(result) + "\n"
-    return content
+                result["result"] = item
+                yield result
+        else:
+            result = template.copy()
+            result["group"] = group_name
+            result["measurement"] = measurement
+            result["result"] = data
+            yield result
 
 
-def parse_xml_to_json(file_path, indent=0):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        xml_content = file.read()
+def write_ndjson(records, result_file, mode="w", schema=None):
+    """
+    Write records to ``result_file`` as newline-delimited JSON, one record at a time.
 
-    dom = minidom.parseString(xml_content)
+    Args:
+        records: Iterable of JSON serializable records.
+        result_file: Path of the result file; its directory is created if needed.
+        mode: "w" to overwrite the file, "a" to append to it.
+        schema: Result schema name; if given, a typed Parquet copy of the whole
+                file is written next to it (see utils.result_schema).
+
+    Returns:
+        Number of records written.
+    """
+    os.makedirs(os.path.dirname(result_file) or ".", exist_ok=True)
+    count = 0
+    with open(result_file, mode, encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record))
+            file.write("\n")
+            count += 1
+    if schema:
+        export_parquet(result_file, schema)
+    return count
+
+
+def write_cl2_reports(cl2_report_dir, template, result_file, mode="w", max_workers=None):
+    """Stream the records of every CL2 measurement report to ``result_file`` as NDJSON."""
+    count = write_ndjson(iter_cl2_records(cl2_report_dir, template, max_workers), result_file, mode, schema="cl2")
+    logger.info(f"Wrote {count} CL2 records to {result_file}")
+    return count
 
-    result = {
-        "testsuites": []
-    }
 
-    # Extract test suites
-    testsuites = dom.getElementsByTagName("testsuite")
-    for testsuite in testsuites:
-        suite_name = testsuite.getAttribute("name")
-        suite_tests = int(testsuite.getAttribute("tests"))
-        suite_failures = int(testsuite.getAttribute("failures"))
-        suite_errors = int(testsuite.getAttribute("errors"))
-
-        suite_result = {
-            "name": suite_name,
-            "tests": suite_tests,
-            "failures": suite_failures,
-            "errors": suite_errors,
-            "testcases": []
-        }
-
-        # Extract test cases
-        testcases = testsuite.getElementsByTagName("testcase")
-        for testcase in testcases:
-            case_name = testcase.getAttribute("name")
-            case_classname = testcase.getAttribute("classname")
-            case_time = testcase.getAttribute("time")
-
-            case_result = {
-                "name": case_name,
-                "classname": case_classname,
-                "time": case_time,
-                "failure": None
+def process_cl2_reports(cl2_report_dir, template):
+    return "".join(json.dumps(record) + "\n" for record in iter_cl2_records(cl2_report_dir, template))
+
+
+def _iter_junit_elements(file_path):
+    """
+    Stream a JUnit report with iterparse, yielding (suite, None) when a testsuite
+    starts and (suite, testcase) when one of its testcases ends.
+
+    Testcase elements are cleared once read, so memory stays flat however many
+    loops the report holds.
+    """
+    suites = []
+    for event, elem in ElementTree.iterparse(file_path, events=("start", "end")):
+        if elem.tag == "testsuite":
+            if event == "start":
+                suites.append({
+                    "name": elem.get("name", ""),
+                    "tests": int(elem.get("tests")),
+                    "failures": int(elem.get("failures")),
+                    "errors": int(elem.get("errors")),
+                    "testcases": [],
+                })
+                yield suites[-1], None
+            else:
+                suites.pop()
+                elem.clear()
+        elif elem.tag == "testcase" and event == "end":
+            failure = elem.find(".//failure")
+            yield suites[-1], {
+                "name": elem.get("name", ""),
+                "classname": elem.get("classname", ""),
+                "time": elem.get("time", ""),
+                "failure": None if failure is None else (failure.text or failure.get("message") or "failure"),
             }
+            elem.clear()
 
-            # Check for failure
-            failure = testcase.getElementsByTagName("failure")
-            if failure:
-                failure_message = failure[0].firstChild.nodeValue
-                case_result["failure"] = failure_message
 
-            suite_result["testcases"].append(case_result)
+def parse_junit_xml(file_path):
+    """
+    Parse a JUnit report into ``{"testsuites": [{name, tests, failures, errors, testcases}]}``.
 
-        result["testsuites"].append(suite_result)
+    Each testcase is ``{name, classname, time, failure}``, ``failure`` being the
+    failure message or None.
+    """
+    result = {"testsuites": []}
+    for suite, testcase in _iter_junit_elements(file_path):
+        if testcase is None:
+            result["testsuites"].append(suite)
+        else:
+            suite["testcases"].append(testcase)
+    return result
 
-    # Convert the result dictionary to JSON
-    json_result = json.dumps(result, indent=indent)
-    return json_result
+
+def iter_junit_testcases(file_path, suite_index=0):
+    """
+    Yield the testcases of one testsuite of a JUnit report as they are parsed.
+
+    Raises:
+        Exception: If the report has no testsuite at ``suite_index``.
+    """
+    suite_count = 0
+    selected = None
+    for suite, testcase in _iter_junit_elements(file_path):
+        if testcase is None:
+            if suite_count == suite_index:
+                selected = suite
+            suite_count += 1
+        elif suite is selected:
+            yield testcase
+    if selected is None:
+        raise Exception(f"No testsuites found in the report! Found {suite_count} testsuites in {file_path}")
+
+
+def parse_xml_to_json(file_path, indent=0):
+    return json.dumps(parse_junit_xml(file_path), indent=indent)
@@ -11,6 +11,7 @@ import time
 
 from clients.eks_client import EKSClient
 from utils.logger_config import get_logger, setup_logging
+from utils.teardown_queue import get_teardown_queue
 
 # Configure logging
 setup_logging()
@@ -89,6 +90,7 @@ class NodePoolCRUD:
         node_count,
         progressive=False,
         scale_step_size=1,
+        pipelined=False,
         gpu_node_pool=False,
         enable_managed_gpu=False,  # pylint: disable=unused-argument
     ):
@@ -100,6 +102,7 @@ class NodePoolCRUD:
             node_count: Desired node count
             progressive: Whether to scale progressively in steps (default: False)
             scale_step_size: Number of nodes to add/remove in each step if progressive (default: 1)
+            pipelined: Whether progressive steps are pipelined (default: False)
             gpu_node_pool: Whether this is a GPU-enabled node group (default: False)
 
         Returns:
@@ -117,6 +120,7 @@ class NodePoolCRUD:
                 gpu_node_group=gpu_node_pool,
                 progressive=progressive,
                 scale_step_size=scale_step_size,
+                pipelined=pipelined,
             )
 
             if result is not None:
@@ -158,6 +162,8 @@ class NodePoolCRUD:
         target_count=None,
         progressive=False,
         scale_step_size=1,
+        pipelined=False,
+        background_delete=False,
         gpu_node_pool=False,
         enable_managed_gpu=False,  # pylint: disable=unused-argument
         step_wait_time=30,
@@ -173,6 +179,9 @@ class NodePoolCRUD:
             target_count: Target node count for scaling operations
             progressive: Whether to scale progressively in steps (default: False)
             scale_step_size: Number of nodes to add/remove in each step if progressive (default: 1)
+            pipelined: Whether progressive steps are pipelined (default: False)
+            background_delete: Queue the delete on the process-wide teardown queue instead of
+                waiting for it; the caller drains the queue (default: False)
             gpu_node_pool: Whether this is a GPU-enabled node group (default: False)
             step_wait_time: Time to wait between operations (default: 30 seconds)
 
@@ -217,6 +226,7 @@ class NodePoolCRUD:
                 node_count=target_count,
                 progressive=progressive,
                 scale_step_size=scale_step_size,
+                pipelined=pipelined,
                 gpu_node_pool=gpu_node_pool,
             )
             results["scale_up"] = scale_up_result
@@ -238,6 +248,7 @@ class NodePoolCRUD:
                 node_count=node_count,
                 progressive=progressive,
                 scale_step_size=scale_step_size,
+                pipelined=pipelined,
                 gpu_node_pool=gpu_node_pool,
             )
             results["scale_down"] = scale_down_result
@@ -252,8 +263,18 @@ class NodePoolCRUD:
             time.sleep(step_wait_time)
 
             # 4. Delete node group
-            logger.info(f"Deleting node group '{node_pool_name}'")
-            delete_result = self.delete_node_pool(node_pool_name=node_pool_name)
+            if background_delete:
+                logger.info(f"Queueing deletion of node group '{node_pool_name}'")
+                get_teardown_queue().submit(
+                    f"delete node group {node_pool_name}",
+                    self.delete_node_pool,
+                    kwargs={"node_pool_name": node_pool_name},
+                )
+                # The outcome is reported when the teardown queue is drained
+                delete_result = True
+            else:
+                logger.info(f"Deleting node group '{node_pool_name}'")
+                delete_result = self.delete_node_pool(node_pool_name=node_pool_name)
             results["delete"] = delete_result
 
             if delete_result is False:
@@ -61,7 +61,8 @@ class MachineCRUD:
 
     def scale_machine(self, agent_pool_name, vm_size, scale_machine_count,
                       use_batch_api=False, machine_workers=1,
-                      readiness_wait_timeout=1200, tags=None):
+                      readiness_wait_timeout=1200, tags=None,
+                      batch_concurrency=None):
         """Scale a machine-mode agent pool by ``scale_machine_count`` machines.
 
         Returns True on success, False on failure. All timing and percentile
@@ -79,6 +80,7 @@ class MachineCRUD:
                 timeout=self.step_timeout,
                 readiness_wait_timeout=readiness_wait_timeout,
                 tags=tags,
+                batch_concurrency=batch_concurrency,
             )
             return True
         except Exception as e:
@@ -12,7 +12,10 @@ import time
 import yaml
 
 from clients.aks_client import AKSClient
+from crud.operation import OperationContext
 from utils.logger_config import get_logger, setup_logging
+from utils.readiness_timeline import ReadinessTimeline
+from utils.teardown_queue import get_teardown_queue
 
 # Configure logging
 setup_logging()
@@ -71,6 +74,7 @@ class NodePoolCRUD:
         # Get the cluster name when initializing
         self.cluster_name = self.aks_client.get_cluster_name()
         self.step_timeout = step_timeout
+        self.result_dir = result_dir
 
     def create_node_pool(
         self, node_pool_name, vm_size, node_count=1, gpu_node_pool=False, enable_managed_gpu=False,
@@ -115,6 +119,7 @@ class NodePoolCRUD:
         node_count,
         progressive=False,
         scale_step_size=1,
+        pipelined=False,
         gpu_node_pool=False,
         enable_managed_gpu=False,
         gpu_instance_profile=None,
@@ -128,6 +133,7 @@ class NodePoolCRUD:
             node_count: Desired node count
             progressive: Whether to scale progressively in steps (default: False)
             scale_step_size: Number of nodes to add/remove in each step if progressive (default: 1)
+            pipelined: Whether progressive steps are pipelined (default: False)
             gpu_node_pool: Whether this is a GPU-enabled node pool (default: False)
 
         Returns:
@@ -145,6 +151,7 @@ class NodePoolCRUD:
                 enable_managed_gpu=enable_managed_gpu,
                 progressive=progressive,
                 scale_step_size=scale_step_size,
+                pipelined=pipelined,
                 gpu_instance_profile=gpu_instance_profile,
                 gpu_mig_strategy=gpu_mig_strategy,
             )
@@ -188,6 +195,8 @@ class NodePoolCRUD:
         target_count=None,
         progressive=False,
         scale_step_size=1,
+        pipelined=False,
+        background_delete=False,
         gpu_node_pool=False,
         enable_managed_gpu=False,
         step_wait_time=30,
@@ -205,6 +214,9 @@ class NodePoolCRUD:
             target_count: Target node count for scaling operations
             progressive: Whether to scale progressively in steps (default: False)
             scale_step_size: Number of nodes to add/remove in each step if progressive (default: 1)
+            pipelined: Whether progressive steps are pipelined (default: False)
+            background_delete: Queue the delete on the process-wide teardown queue instead of
+                waiting for it; the caller drains the queue (default: False)
             gpu_node_pool: Whether this is a GPU-enabled node pool (default: False)
             enable_managed_gpu: Whether to enable fully managed GPU mode (default: False)
             step_wait_time: Time to wait between operations (default: 30 seconds)
@@ -252,6 +264,7 @@ class NodePoolCRUD:
                 node_count=target_count,
                 progressive=progressive,
                 scale_step_size=scale_step_size,
+                pipelined=pipelined,
                 gpu_node_pool=gpu_node_pool,
                 enable_managed_gpu=enable_managed_gpu,
                 gpu_instance_profile=gpu_instance_profile,
@@ -277,6 +290,7 @@ class NodePoolCRUD:
                 node_count=node_count,
                 progressive=progressive,
                 scale_step_size=scale_step_size,
+                pipelined=pipelined,
                 gpu_node_pool=gpu_node_pool,
                 enable_managed_gpu=enable_managed_gpu,
                 gpu_instance_profile=gpu_instance_profile,
@@ -294,8 +308,18 @@ class NodePoolCRUD:
             time.sleep(step_wait_time)
 
             # 4. Delete node pool
-            logger.info(f"Deleting node pool '{node_pool_name}'")
-            delete_result = self.delete_node_pool(node_pool_name=node_pool_name)
+            if background_delete:
+                logger.info(f"Queueing deletion of node pool '{node_pool_name}'")
+                get_teardown_queue().submit(
+                    f"delete node pool {node_pool_name}",
+                    self.delete_node_pool,
+                    kwargs={"node_pool_name": node_pool_name},
+                )
+                # The outcome is reported when the teardown queue is drained
+                delete_result = True
+            else:
+                logger.info(f"Deleting node pool '{node_pool_name}'")
+                delete_result = self.delete_node_pool(node_pool_name=node_pool_name)
             results["delete"] = delete_result
 
             if delete_result is False:
@@ -458,17 +482,27 @@ class NodePoolCRUD:
         successes = 0
         for index in range(1, number_of_workloads + 1):
             logger.info("Creating %s %d/%d", workload_type, index, number_of_workloads)
+            metadata = {
+                "node_pool_name": node_pool_name,
+                "workload_index": index,
+                "count": count,
+                "namespace": namespace,
+            }
             try:
-                self._apply_workload(
-                    k8s_client=k8s_client,
-                    workload_type=workload_type,
-                    node_pool_name=node_pool_name,
-                    index=index,
-                    count=count,
-                    manifest_dir=manifest_dir,
-                    label_selector=label_selector,
-                    namespace=namespace
-                )
+                with OperationContext(
+                    f"create_{workload_type}", "azure", metadata, result_dir=self.result_dir
+                ) as op:
+                    self._apply_workload(
+                        k8s_client=k8s_client,
+                        workload_type=workload_type,
+                        node_pool_name=node_pool_name,
+                        index=index,
+                        count=count,
+                        manifest_dir=manifest_dir,
+                        label_selector=label_selector,
+                        namespace=namespace,
+                        op=op,
+                    )
                 successes += 1
             except Exception as e:
                 logger.error("Failed to create %s %d: %s", workload_type, index, e)
@@ -489,7 +523,8 @@ class NodePoolCRUD:
         count,
         manifest_dir,
         label_selector,
-        namespace
+        namespace,
+        op
     ):
         """Unified helper to apply and verify a single workload instance.
 
@@ -502,6 +537,7 @@ class NodePoolCRUD:
             manifest_dir: Optional custom manifest directory
             label_selector: Base label selector (e.g., "app=nginx-container")
             namespace: Kubernetes namespace
+            op: Operation the pod readiness percentiles are recorded in
 
         Raises:
             ValueError: If workload_type is not in WORKLOAD_CONFIG
@@ -550,6 +586,7 @@ class NodePoolCRUD:
                 pass
 
         # Apply each document in the rendered multi-doc template
+        apply_start_time = time.time()
         for doc in yaml.safe_load_all(rendered_template):
             if doc:
                 k8s_client.apply_manifest_from_file(manifest_dict=doc, namespace=namespace)
@@ -579,11 +616,14 @@ class NodePoolCRUD:
         # Wait for pods if configured (skipped for Jobs)
         if config["verify_pods_ready"]:
             logger.info("Waiting for pods of %s %s to be ready...", workload_type, resource_name)
+            timeline = ReadinessTimeline(apply_start_time)
             k8s_client.wait_for_pods_ready(
                 operation_timeout_in_minutes=5,
                 namespace=namespace,
                 pod_count=count,
-                label_selector=f"app={workload_label}"
+                label_selector=f"app={workload_label}",
+                timeline=timeline,
             )
+            timeline.add_to_operation(op, "pod_readiness_times", total=count)
 
         logger.info("Successfully created and verified %s %d", workload_type, index)
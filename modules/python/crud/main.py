@@ -6,22 +6,32 @@ into a consolidated results file. It handles cluster data and operation informat
 from Kubernetes benchmark runs and formats them for further analysis.
 
 It also provides command-line interface functions for handling node pool operations
-such as create, scale, and delete operations.
+such as create, scale, and delete operations, and a ``matrix`` command that runs
+the full lifecycle of many node pools concurrently against one cluster.
 """
+# pylint: disable=too-many-lines
 
 import argparse
+import copy
 import glob
 import json
 import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+
+import yaml
+
 from crud.azure.node_pool_crud import NodePoolCRUD as AzureNodePoolCRUD
 from crud.azure.machine_crud import MachineCRUD as AzureMachineCRUD
 from crud.aws.node_pool_crud import NodePoolCRUD as AWSNodePoolCRUD
 from crud.operation import OperationContext
+from crud.snapshot_store import get_snapshot_store
 from utils.common import get_env_vars
 from utils.logger_config import get_logger, setup_logging
+from utils.result_schema import export_parquet
+from utils.teardown_queue import get_teardown_queue
 
 # Configure logging
 setup_logging()
@@ -70,8 +80,14 @@ def get_machine_crud_class(cloud_provider):
     )
 
 
-def collect_benchmark_results():
-    """Main function to process Cluster Crud benchmark results."""
+def collect_benchmark_results(expand_snapshots: bool = False):
+    """
+    Main function to process Cluster Crud benchmark results.
+
+    Args:
+        expand_snapshots: Replace the compacted cluster/node pool snapshot references
+                          in the operation metadata by the full snapshots.
+    """
     result_dir = get_env_vars("RESULT_DIR")
     run_url = get_env_vars("RUN_URL")
     run_id = get_env_vars("RUN_ID")
@@ -86,6 +102,11 @@ def collect_benchmark_results():
         logger.info("Processing file: `%s`", filepath)
         with open(filepath, "r", encoding="utf-8") as file:
             content = json.load(file)
+        operation_info = content.get("operation_info")
+        if expand_snapshots and isinstance(operation_info, dict) and operation_info.get("metadata"):
+            operation_info["metadata"] = get_snapshot_store(result_dir).expand_metadata(
+                operation_info["metadata"]
+            )
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         result = {
             "timestamp": timestamp,
@@ -99,6 +120,8 @@ def collect_benchmark_results():
         with open(f"{result_dir}/results.json", "a", encoding="utf-8") as file:
             file.write(result_json + "\n")
         logger.info("Result written to: `%s/results.json`", result_dir)
+    if os.path.exists(f"{result_dir}/results.json"):
+        export_parquet(f"{result_dir}/results.json", "crud")
     return 0
 
 
@@ -138,6 +161,7 @@ def handle_node_pool_operation(node_pool_crud, args):
                 "node_count": args.target_count,
                 "progressive": check_for_progressive_scaling(args),
                 "scale_step_size": args.scale_step_size,
+                "pipelined": args.pipelined,
                 "gpu_node_pool": args.gpu_node_pool,
                 "enable_managed_gpu": args.enable_managed_gpu,
                 **azure_gpu_kwargs,
@@ -157,6 +181,8 @@ def handle_node_pool_operation(node_pool_crud, args):
                 "target_count": args.target_count,
                 "progressive": check_for_progressive_scaling(args),
                 "scale_step_size": args.scale_step_size,
+                "pipelined": args.pipelined,
+                "background_delete": args.background_delete,
                 "gpu_node_pool": args.gpu_node_pool,
                 "enable_managed_gpu": args.enable_managed_gpu,
                 "step_wait_time": args.step_wait_time,
@@ -177,6 +203,145 @@ def handle_node_pool_operation(node_pool_crud, args):
         logger.error(f"Error during '{command}' operation: {str(e)}")
         return 1
 
+def load_matrix_spec(spec_path, args):
+    """
+    Load the node pools of a ``matrix`` run.
+
+    The spec is a YAML (or JSON) file holding either a list of pools or a mapping
+    with a ``pools`` list. Every pool needs ``node_pool_name`` and ``vm_size``;
+    the other keys default to the matching command-line arguments::
+
+        pools:
+          - node_pool_name: d4pool
+            vm_size: Standard_D4s_v3
+            target_count: 10
+            scale_step_size: 5
+          - node_pool_name: h100pool
+            vm_size: Standard_NC40ads_H100_v5
+            target_count: 2
+            gpu_node_pool: true
+
+    Returns:
+        list: One keyword-argument dict per pool, ready for ``NodePoolCRUD.all``
+        (``progressive`` excluded).
+
+    Raises:
+        ValueError: If the spec is empty, a pool is incomplete, has unknown keys,
+            or a node pool name is used twice.
+    """
+    with open(spec_path, "r", encoding="utf-8") as file:
+        spec = yaml.safe_load(file)
+
+    pools = spec.get("pools") if isinstance(spec, dict) else spec
+    if not isinstance(pools, list) or not pools:
+        raise ValueError(f"Matrix spec {spec_path} does not define any pools")
+
+    defaults = {
+        "node_count": args.node_count,
+        "target_count": args.target_count,
+        "scale_step_size": args.scale_step_size,
+        "step_wait_time": args.step_wait_time,
+        "pipelined": args.pipelined,
+        "background_delete": args.background_delete,
+        "gpu_node_pool": args.gpu_node_pool,
+        "enable_managed_gpu": args.enable_managed_gpu,
+    }
+    if args.cloud == "azure":
+        defaults["gpu_instance_profile"] = args.gpu_instance_profile
+        defaults["gpu_mig_strategy"] = args.gpu_mig_strategy
+    allowed_keys = set(defaults) | {"node_pool_name", "vm_size"}
+
+    result = []
+    seen = set()
+    for index, entry in enumerate(pools):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Matrix pool #{index} must be a mapping, got: {entry!r}")
+        unknown = sorted(set(entry) - allowed_keys)
+        if unknown:
+            raise ValueError(f"Matrix pool #{index} has unsupported keys: {', '.join(unknown)}")
+        pool = {**defaults, **entry}
+        missing = [key for key in ("node_pool_name", "vm_size", "target_count") if pool.get(key) is None]
+        if missing:
+            raise ValueError(f"Matrix pool #{index} is missing: {', '.join(missing)}")
+        if pool["node_pool_name"] in seen:
+            raise ValueError(f"Node pool '{pool['node_pool_name']}' appears more than once in the matrix spec")
+        seen.add(pool["node_pool_name"])
+        result.append(pool)
+    return result
+
+
+def _get_cloud_client(node_pool_crud):
+    """Return the AKSClient/EKSClient wrapped by a NodePoolCRUD instance."""
+    if hasattr(node_pool_crud, "aks_client"):
+        return node_pool_crud.aks_client
+    return node_pool_crud.eks_client
+
+
+def _pool_scoped_crud(node_pool_crud):
+    """
+    Shallow copy of a NodePoolCRUD (and its cloud client) for one pool of a matrix run.
+
+    The copies share the SDK clients, credentials, Kubernetes client, ARM
+    throttle governor and operation limiter, while per-pool state the clients
+    keep on themselves (``vm_size``, EKS ``launch_template_id``) stays separate.
+    """
+    pool_crud = copy.copy(node_pool_crud)
+    if hasattr(node_pool_crud, "aks_client"):
+        pool_crud.aks_client = copy.copy(node_pool_crud.aks_client)
+    else:
+        pool_crud.eks_client = copy.copy(node_pool_crud.eks_client)
+    return pool_crud
+
+
+def handle_node_pool_matrix(node_pool_crud, args):
+    """
+    Run the create -> scale up -> scale down -> delete lifecycle of every pool in the spec concurrently.
+
+    All pools share one NodePoolCRUD (and so one AKSClient/EKSClient, credential
+    and cluster lookup). Control-plane operations on the cluster are bounded by
+    ``--max-concurrent-operations``; each pool still writes its own operation
+    result files.
+    """
+    try:
+        pools = load_matrix_spec(args.spec, args)
+        _get_cloud_client(node_pool_crud).operation_limiter.set_limit(
+            args.max_concurrent_operations
+        )
+        max_workers = min(args.max_concurrent_pools or len(pools), len(pools))
+        logger.info(
+            f"Running {len(pools)} node pools with up to {max_workers} in parallel: "
+            f"{', '.join(pool['node_pool_name'] for pool in pools)}"
+        )
+
+        def run_pool(pool):
+            return _pool_scoped_crud(node_pool_crud).all(
+                progressive=pool["scale_step_size"] != pool["target_count"],
+                **pool,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {pool["node_pool_name"]: executor.submit(run_pool, pool) for pool in pools}
+
+        failed = []
+        for node_pool_name, future in futures.items():
+            try:
+                success = future.result()
+            except Exception as e:
+                logger.error(f"Lifecycle of node pool '{node_pool_name}' raised: {str(e)}")
+                success = False
+            if not success:
+                failed.append(node_pool_name)
+
+        if failed:
+            logger.error(f"Matrix run failed for node pools: {', '.join(failed)}")
+            return 1
+        logger.info(f"Matrix run completed successfully for {len(pools)} node pools")
+        return 0
+    except Exception as e:
+        logger.error(f"Error during matrix operation: {str(e)}")
+        return 1
+
+
 def handle_workload_operations(node_pool_crud, args):
     """Handle workload operations (deployment, statefulset, job) based on the command"""
     command = args.command
@@ -299,6 +464,7 @@ def handle_machine_operation(machine_crud, args):
                 "machine_workers": args.machine_workers,
                 "readiness_wait_timeout": args.readiness_wait_timeout,
                 "tags": tags,
+                "batch_concurrency": getattr(args, "batch_concurrency", None),
             }
 
             result = machine_crud.scale_machine(**scale_kwargs)
@@ -372,6 +538,12 @@ def _add_scale_machine_subparser(subparsers, common_parser):
         action="store_true",
         help="Use the BatchPutMachine API (chunked, single PUT per chunk)",
     )
+    scale_machine_parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=None,
+        help="Maximum BatchPutMachine requests in flight (defaults to --machine-workers)",
+    )
     scale_machine_parser.add_argument(
         "--readiness-wait-timeout",
         type=int,
@@ -386,6 +558,80 @@ def _add_scale_machine_subparser(subparsers, common_parser):
     scale_machine_parser.set_defaults(func=handle_machine_operation)
 
 
+def _add_matrix_subparser(subparsers, common_parser):
+    """Register the `matrix` subcommand on the given subparsers group."""
+    matrix_parser = subparsers.add_parser(
+        "matrix",
+        parents=[common_parser],
+        help="Run the full lifecycle of several node pools concurrently from a spec file",
+    )
+    matrix_parser.add_argument(
+        "--spec",
+        required=True,
+        help="YAML/JSON file listing the node pools (node_pool_name, vm_size and optional overrides)",
+    )
+    matrix_parser.add_argument(
+        "--node-count",
+        type=int,
+        default=0,
+        help="Default initial number of nodes for pools that do not set node_count",
+    )
+    matrix_parser.add_argument(
+        "--target-count",
+        type=int,
+        default=None,
+        help="Default scale-up target for pools that do not set target_count",
+    )
+    matrix_parser.add_argument(
+        "--scale-step-size",
+        type=int,
+        default=1,
+        help="Default number of nodes to add/remove in each step (for progressive scaling)",
+    )
+    matrix_parser.add_argument(
+        "--step-wait-time",
+        type=int,
+        default=30,
+        help="Wait time between the lifecycle operations of a pool in seconds",
+    )
+    matrix_parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Pipeline progressive scaling steps of every pool (see the scale command)",
+    )
+    matrix_parser.add_argument(
+        "--background-delete",
+        action="store_true",
+        help="Free a pool's slot as soon as its deletion is queued instead of when it finishes "
+        "(with --max-concurrent-pools); all deletions are awaited before exiting",
+    )
+    matrix_parser.add_argument(
+        "--max-concurrent-pools",
+        type=int,
+        default=None,
+        help="Maximum node pool lifecycles running at the same time (default: all pools)",
+    )
+    matrix_parser.add_argument(
+        "--max-concurrent-operations",
+        type=int,
+        default=2,
+        help="Maximum control-plane node pool operations in flight per cluster",
+    )
+    matrix_parser.set_defaults(func=handle_node_pool_matrix)
+
+
+def _needs_gpu_device_plugin(args):
+    """Whether any requested pool is a GPU pool that relies on the device plugin DaemonSet."""
+    if args.command != "matrix":
+        return args.gpu_node_pool and not args.enable_managed_gpu
+    try:
+        pools = load_matrix_spec(args.spec, args)
+    except Exception:
+        # The matrix handler reports an invalid spec.
+        return False
+    return any(pool["gpu_node_pool"] and not pool["enable_managed_gpu"] for pool in pools)
+
+
 def main():
     """
     Main entry point that determines whether to run benchmark collection or node pool operations.
@@ -400,6 +646,11 @@ def main():
         "collect",
         help="Collect and process benchmark results from JSON files in the result directory",
     )
+    collect_parser.add_argument(
+        "--expand-snapshots",
+        action="store_true",
+        help="Write full cluster/node pool snapshots instead of references to the run's first snapshot",
+    )
     collect_parser.set_defaults(func=collect_benchmark_results)
 
     # Common arguments for all commands
@@ -486,6 +737,12 @@ def main():
         default=30,
         help="Wait time in seconds between scaling steps",
     )
+    scale_parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Submit each progressive scaling step as soon as the previous step's "
+        "control-plane operation completes, tracking node readiness in the background",
+    )
     scale_parser.set_defaults(func=handle_node_pool_operation)
 
     # Delete command
@@ -534,6 +791,17 @@ def main():
         default=30,
         help="Wait time between scaling steps in seconds (for progressive scaling)",
     )
+    all_parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Submit each progressive scaling step as soon as the previous step's "
+        "control-plane operation completes, tracking node readiness in the background",
+    )
+    all_parser.add_argument(
+        "--background-delete",
+        action="store_true",
+        help="Queue the node pool deletion in the background and wait for it only before exiting",
+    )
     all_parser.set_defaults(func=handle_node_pool_operation)
 
     # Common arguments shared across all workload subcommands (deployment, statefulset, jobs)
@@ -598,6 +866,9 @@ def main():
     # Scale-machine command (AKS Machine API)
     _add_scale_machine_subparser(subparsers, common_parser)
 
+    # Matrix command (many node pool lifecycles in parallel)
+    _add_matrix_subparser(subparsers, common_parser)
+
     # Arguments provided, run node pool operations and collect benchmark results
     try:
         args = parser.parse_args()
@@ -609,7 +880,7 @@ def main():
 
         # Handle collect command separately since it doesn't need node pool operations
         if args.command == "collect":
-            exit_code = args.func()
+            exit_code = args.func(expand_snapshots=args.expand_snapshots)
             if exit_code == 0:
                 logger.info("Collect operation completed successfully")
             else:
@@ -689,7 +960,7 @@ def main():
 
         # Install GPU device plugin for managed (driver bootstrap) and AWS GPU pools.
         # Fully managed GPU skips this — AKS installs nvidia-device-plugin as a systemd service.
-        if args.gpu_node_pool and args.cloud in ["azure", "aws"] and not args.enable_managed_gpu:
+        if args.cloud in ["azure", "aws"] and _needs_gpu_device_plugin(args):
             logger.info("GPU node pool is enabled")
             with OperationContext(
                 "install_gpu_plugin", args.cloud, {}, result_dir=args.result_dir
@@ -737,6 +1008,11 @@ def main():
             # Return the explicit exit code
             exit_code = operation_result
 
+        # Wait for deletions queued in the background (--background-delete)
+        if not get_teardown_queue().drain():
+            logger.error("One or more background deletions failed")
+            exit_code = exit_code or 1
+
         if exit_code == 0:
             logger.info("Operation completed successfully")
         else:
@@ -8,15 +8,20 @@ metadata for operations performed in the Telescope project.
 
 import json
 import os
+import threading
 import traceback
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
+from crud.snapshot_store import SnapshotStore, get_snapshot_store
 from utils.logger_config import get_logger, setup_logging
 # Configure logging
 setup_logging()
 logger = get_logger(__name__)
 
+# Serializes picking a free result file name across concurrently finishing operations.
+_RESULT_FILE_LOCK = threading.Lock()
+
 
 class Operation:
     """
@@ -133,12 +138,14 @@ class Operation:
         """
         return json.dumps(self.to_dict(), indent=indent)
 
-    def save_to_file(self, file_path: str) -> None:
+    def save_to_file(self, file_path: str, snapshot_store: Optional[SnapshotStore] = None) -> None:
         """
         Save the operation data to a JSON file.
 
         Args:
             file_path: The path to the file where the operation data should be saved.
+            snapshot_store: Optional store replacing repeated cluster/node pool
+                            snapshots in the metadata by references.
         """
         directory = os.path.dirname(file_path)
         if directory and not os.path.exists(directory):
@@ -148,6 +155,8 @@ class Operation:
             operation_info = {
                 "operation_info": self.to_dict(),
             }
+            if snapshot_store is not None:
+                operation_info["operation_info"]["metadata"] = snapshot_store.compact_metadata(self.metadata)
             f.write(json.dumps(operation_info))
 
     def __str__(self) -> str:
@@ -230,11 +239,22 @@ class OperationContext:
                     .replace("\\", "_")
                     .replace(":", "_")
                 )
-                filename = f"{self.cloud}_{clean_op_name}_{timestamp}.json"
-                file_path = os.path.join(self.result_dir, filename)
-
-                # Save the operation data
-                self.operation.save_to_file(file_path)
+                # Operations of concurrent node pools can finish within the
+                # same second, so include the pool and never overwrite a file.
+                node_pool_name = self.operation.metadata.get("node_pool_name")
+                if isinstance(node_pool_name, str) and node_pool_name:
+                    clean_op_name = f"{clean_op_name}_{node_pool_name}"
+                base_name = f"{self.cloud}_{clean_op_name}_{timestamp}"
+
+                with _RESULT_FILE_LOCK:
+                    file_path = os.path.join(self.result_dir, f"{base_name}.json")
+                    suffix = 1
+                    while os.path.exists(file_path):
+                        file_path = os.path.join(self.result_dir, f"{base_name}_{suffix}.json")
+                        suffix += 1
+
+                    # Save the operation data
+                    self.operation.save_to_file(file_path, get_snapshot_store(self.result_dir))
             except Exception as e:
                 # Log the error but don't raise it
                 logger.warning(f"Failed to save operation data: {str(e)}")
@@ -0,0 +1,199 @@
+"""
+Snapshot Store Module.
+
+Every create/scale step records the full cluster and node pool descriptions
+(``get_cluster_data()``, ``get_node_pool().as_dict()``, the EKS node group)
+in the operation metadata, so a progressive run writes the same multi-KB
+documents dozens of times into the result files, ``results.json`` and Kusto.
+
+The store keeps the first full snapshot of each object per run (result
+directory) under ``<result_dir>/snapshots/`` and the first operation that sees
+it still carries it inline. Later operations record a reference instead:
+
+- ``{"snapshot_ref": ..., "snapshot_hash": ...}`` when nothing changed, or
+- the same plus ``"diff"``, a list of ``set``/``remove`` changes against the
+  first snapshot, when something did (e.g. the node count).
+
+``expand_metadata`` rebuilds the full view of a compacted metadata dict.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+# Metadata keys holding full cluster / node pool descriptions.
+SNAPSHOT_METADATA_KEYS = ("cluster_info", "nodepool_info", "agentpool_info")
+SNAPSHOT_DIR_NAME = "snapshots"
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip through JSON, the form the snapshot ends up in on disk."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def snapshot_hash(snapshot: Any) -> str:
+    """Content hash of a snapshot, independent of key order."""
+    encoded = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def diff_snapshots(base: Any, current: Any, path: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Structural diff turning ``base`` into ``current``.
+
+    Dicts are compared key by key; any other value (including lists) is replaced as a whole.
+
+    Returns:
+        A list of ``{"op": "set", "path": [...], "value": ...}`` and ``{"op": "remove", "path": [...]}``.
+    """
+    path = path or []
+    if isinstance(base, dict) and isinstance(current, dict):
+        changes = []
+        for key, value in current.items():
+            if key not in base:
+                changes.append({"op": "set", "path": path + [key], "value": value})
+            elif base[key] != value:
+                changes.extend(diff_snapshots(base[key], value, path + [key]))
+        for key in base:
+            if key not in current:
+                changes.append({"op": "remove", "path": path + [key]})
+        return changes
+    if base == current:
+        return []
+    return [{"op": "set", "path": path, "value": current}]
+
+
+def apply_diff(base: Any, changes: List[Dict[str, Any]]) -> Any:
+    """Apply a ``diff_snapshots`` result to a copy of ``base``."""
+    result = copy.deepcopy(base)
+    for change in changes:
+        path = change["path"]
+        if not path:
+            result = copy.deepcopy(change.get("value"))
+            continue
+        parent = result
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        if change["op"] == "remove":
+            parent.pop(path[-1], None)
+        else:
+            parent[path[-1]] = copy.deepcopy(change["value"])
+    return result
+
+
+def is_snapshot_ref(value: Any) -> bool:
+    """Whether a metadata value is a compacted snapshot reference."""
+    return isinstance(value, dict) and "snapshot_ref" in value and "snapshot_hash" in value
+
+
+class SnapshotStore:
+    """
+    Per-run store of first snapshots, shared by all operations writing to one result directory.
+
+    The first snapshots are files, so separate ``create``/``scale``/``delete``
+    invocations of the same run compact against the same base.
+    """
+
+    def __init__(self, result_dir: str):
+        self.directory = os.path.join(result_dir, SNAPSHOT_DIR_NAME)
+        self._bases: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def snapshot_id(kind: str, snapshot: Any) -> str:
+        """Identify the described object, e.g. ``nodepool_info/userpool1``."""
+        name = None
+        if isinstance(snapshot, dict):
+            name = snapshot.get("name") or snapshot.get("nodegroupName") or snapshot.get("clusterName")
+        return f"{kind}/{name or 'default'}"
+
+    def _path(self, ref: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9_.-]", "_", ref) + ".json")
+
+    def _load_base(self, ref: str) -> Optional[Dict[str, Any]]:
+        base = self._bases.get(ref)
+        if base is None and os.path.exists(self._path(ref)):
+            with open(self._path(ref), "r", encoding="utf-8") as f:
+                base = json.load(f)
+            self._bases[ref] = base
+        return base
+
+    def record(self, kind: str, snapshot: Any) -> Any:
+        """
+        Return what to store in the metadata for ``snapshot``.
+
+        Args:
+            kind: Metadata key, e.g. ``cluster_info``.
+            snapshot: The full snapshot.
+
+        Returns:
+            The full snapshot the first time the object is seen in this run, otherwise a reference.
+        """
+        snapshot = _normalize(snapshot)
+        ref = self.snapshot_id(kind, snapshot)
+        digest = snapshot_hash(snapshot)
+        with self._lock:
+            base = self._load_base(ref)
+            if base is None:
+                base = {"snapshot_ref": ref, "snapshot_hash": digest, "snapshot": snapshot}
+                os.makedirs(self.directory, exist_ok=True)
+                try:
+                    # Exclusive create: another process of the same run may have won the race.
+                    with open(self._path(ref), "x", encoding="utf-8") as f:
+                        json.dump(base, f)
+                    self._bases[ref] = base
+                    return snapshot
+                except FileExistsError:
+                    base = self._load_base(ref)
+        compact = {"snapshot_ref": ref, "snapshot_hash": digest}
+        if digest != base["snapshot_hash"]:
+            compact["diff"] = diff_snapshots(base["snapshot"], snapshot)
+        return compact
+
+    def resolve(self, value: Any) -> Any:
+        """Rebuild the full snapshot for a reference; other values are returned unchanged."""
+        if not is_snapshot_ref(value):
+            return value
+        with self._lock:
+            base = self._load_base(value["snapshot_ref"])
+        if base is None:
+            raise ValueError(f"Snapshot {value['snapshot_ref']} not found in {self.directory}")
+        return apply_diff(base["snapshot"], value.get("diff", []))
+
+    def compact_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of ``metadata`` with the snapshot keys replaced by references where possible."""
+        compacted = dict(metadata)
+        for key in SNAPSHOT_METADATA_KEYS:
+            if isinstance(compacted.get(key), dict):
+                try:
+                    compacted[key] = self.record(key, compacted[key])
+                except Exception as e:
+                    logger.warning(f"Keeping full {key}, snapshot store failed: {str(e)}")
+        return compacted
+
+    def expand_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of ``metadata`` with every snapshot reference replaced by the full snapshot."""
+        return {key: self.resolve(value) for key, value in metadata.items()}
+
+
+_stores: Dict[str, SnapshotStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_snapshot_store(result_dir: str) -> SnapshotStore:
+    """Return the store of a result directory, shared by every operation of this process."""
+    key = os.path.abspath(result_dir)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = SnapshotStore(result_dir)
+        return _stores[key]
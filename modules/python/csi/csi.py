@@ -5,6 +5,9 @@ import json
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from clients.kubernetes_client import KubernetesClient, client
+from utils.polling import AdaptivePoller
+from utils.readiness_timeline import ReadinessTimeline
+from utils.teardown_queue import get_teardown_queue
 
 KUBERNETERS_CLIENT=KubernetesClient()
 
@@ -12,16 +15,16 @@ KUBERNETERS_CLIENT=KubernetesClient()
 def validate_node_count(node_label, node_count, operation_timeout_in_minutes):
     kube_client = KubernetesClient()
     ready_node_count = 0
-    timeout = time.time() + (operation_timeout_in_minutes * 60)
+    poller = AdaptivePoller(timeout_seconds=operation_timeout_in_minutes * 60, initial_interval=2, max_interval=10)
     print(f"Validating {node_count} nodes with label {node_label} are ready.")
-    while time.time() < timeout:
-        ready_nodes = kube_client.get_ready_nodes(label_selector=node_label)
+    while not poller.expired():
+        ready_nodes = kube_client.get_ready_nodes(label_selector=node_label, lightweight=True)
         ready_node_count = len(ready_nodes)
         print(f"Currently {ready_node_count} nodes are ready.")
         if ready_node_count == node_count:
             break
         print(f"Waiting for {node_count} nodes to be ready.")
-        time.sleep(10)
+        poller.sleep(state=ready_node_count)
     if ready_node_count != node_count:
         raise Exception(f"Only {ready_node_count} nodes are ready, expected {node_count} nodes!")
 
@@ -96,6 +99,8 @@ def wait_for_condition(check_function, target, comparison="gte", interval=1):
     Wait for a condition using a given check function.
     The check function should return a list of items.
     The condition is satisfied when the length of the list meets the target.
+    Polls at a fixed `interval`: monitor_thresholds times each threshold from the
+    moment this returns, so backing off would delay the measured crossing.
     """
     while True:
         current_list = check_function()
@@ -111,6 +116,18 @@ def monitor_thresholds(description, monitor_function, thresholds, comparison, st
         wait_for_condition(monitor_function, target, comparison)
         log_duration(f"{description} {threshold_desc}", start_time, log_file)
 
+def log_ready_transition_percentiles(description, pods, thresholds, start_time, log_file):
+    """Log percentiles computed from each pod's Ready lastTransitionTime rather than the 1s poll."""
+    timeline = ReadinessTimeline(start_time.timestamp())
+    timeline.record_all(pods)
+    elapsed_times = timeline.elapsed_times()
+    with open(log_file, 'a', encoding='utf-8') as file:
+        for target, threshold_desc in thresholds:
+            if 0 < target <= len(elapsed_times):
+                duration = int(elapsed_times[target - 1])
+                file.write(f"{description} {threshold_desc}: {duration}\n")
+                print(f"{description} {threshold_desc}: {duration}s")
+
 def execute_attach_detach(disk_number, storage_class, wait_time, result_dir):
     """Execute the attach detach test."""
     print(f"Starting running test with {disk_number} disks and {storage_class} storage class")
@@ -131,67 +148,84 @@ def execute_attach_detach(disk_number, storage_class, wait_time, result_dir):
     namespace_obj = KUBERNETERS_CLIENT.create_namespace(namespace)
     print(f"Created namespace {namespace_obj.metadata.name}")
 
-    # Start the timer
-    creation_start_time = datetime.now()
-
-    # Create StatefulSet
-    statefulset = create_statefulset(namespace, disk_number, storage_class)
-    print(f"Created StatefulSet {statefulset.metadata.name}")
-
-    # Measure PVC creation and attachment
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        futures = []
-        futures.append(
-            executor.submit(
-                monitor_thresholds,
-                "PV creation",
-                lambda: KUBERNETERS_CLIENT.get_bound_persistent_volume_claims_by_namespace(namespace),
-                attach_thresholds,
-                "gte",
-                creation_start_time,
-                log_file
+    # Serve the 1s monitoring loops below from a shared watch cache instead of LIST calls
+    KUBERNETERS_CLIENT.start_informers(("pods", "persistentvolumeclaims", "volumeattachments"))
+    try:
+        # Start the timer
+        creation_start_time = datetime.now()
+
+        # Create StatefulSet
+        statefulset = create_statefulset(namespace, disk_number, storage_class)
+        print(f"Created StatefulSet {statefulset.metadata.name}")
+
+        # Measure PVC creation and attachment
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+            futures.append(
+                executor.submit(
+                    monitor_thresholds,
+                    "PV creation",
+                    lambda: KUBERNETERS_CLIENT.get_bound_persistent_volume_claims_by_namespace(namespace),
+                    attach_thresholds,
+                    "gte",
+                    creation_start_time,
+                    log_file
+                )
             )
-        )
-        futures.append(
-            executor.submit(
-                monitor_thresholds,
-                "PV attachment",
-                lambda: KUBERNETERS_CLIENT.get_ready_pods_by_namespace(namespace),
-                attach_thresholds,
-                "gte",
-                creation_start_time,
-                log_file
+            futures.append(
+                executor.submit(
+                    monitor_thresholds,
+                    "PV attachment",
+                    lambda: KUBERNETERS_CLIENT.get_ready_pods_by_namespace(namespace, lightweight=True),
+                    attach_thresholds,
+                    "gte",
+                    creation_start_time,
+                    log_file
+                )
             )
-        )
 
-        # Wait for all threads to complete
-        for future in as_completed(futures):
-            future.result() # Blocks until the thread finishes execution
-
-    print(f"Measuring creation and attachment of PVCs completed! Waiting for {wait_time} seconds before starting deletion.")
-    time.sleep(wait_time)
-
-    # Start the timer
-    deletion_start_time = datetime.now()
-
-    # Delete StatefulSet
-    KUBERNETERS_CLIENT.app.delete_namespaced_stateful_set(statefulset.metadata.name, namespace)
-    KUBERNETERS_CLIENT.delete_persistent_volume_claim_by_namespace(namespace)
-
-    # Measure PVC detachment
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        future = executor.submit(
-            monitor_thresholds,
-            "PV detachment",
-            lambda: KUBERNETERS_CLIENT.get_attached_volume_attachments(),
-            detach_thresholds,
-            "lte",
-            deletion_start_time,
+            # Wait for all threads to complete
+            for future in as_completed(futures):
+                future.result() # Blocks until the thread finishes execution
+
+        log_ready_transition_percentiles(
+            "PV attachment ready transition",
+            KUBERNETERS_CLIENT.get_ready_pods_by_namespace(namespace, lightweight=True),
+            attach_thresholds,
+            creation_start_time,
             log_file
         )
-        future.result()
 
-    KUBERNETERS_CLIENT.delete_namespace(namespace)
+        print(f"Measuring creation and attachment of PVCs completed! Waiting for {wait_time} seconds before starting deletion.")
+        time.sleep(wait_time)
+
+        # Start the timer
+        deletion_start_time = datetime.now()
+
+        # Delete StatefulSet
+        KUBERNETERS_CLIENT.app.delete_namespaced_stateful_set(statefulset.metadata.name, namespace)
+        KUBERNETERS_CLIENT.delete_persistent_volume_claim_by_namespace(namespace)
+
+        # Measure PVC detachment
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future = executor.submit(
+                monitor_thresholds,
+                "PV detachment",
+                lambda: KUBERNETERS_CLIENT.get_attached_volume_attachments(lightweight=True),
+                detach_thresholds,
+                "lte",
+                deletion_start_time,
+                log_file
+            )
+            future.result()
+    finally:
+        # Stop the watch threads even if a step fails, or they keep the process alive
+        KUBERNETERS_CLIENT.stop_informers()
+
+    # Namespace deletion is not measured; main drains the queue before exiting.
+    get_teardown_queue().submit(
+        f"delete namespace {namespace}", KUBERNETERS_CLIENT.delete_namespace, args=(namespace,)
+    )
     print("Measuring detachment of PVCs completed.")
 
 def collect_attach_detach(case_name, node_number, disk_number, storage_class, cloud_info, run_id, run_url, result_dir):
@@ -261,6 +295,8 @@ def main():
         validate_node_count(args.node_label, args.node_count, args.operation_timeout)
     elif args.command == "execute":
         execute_attach_detach(args.disk_number, args.storage_class, args.wait_time, args.result_dir)
+        if not get_teardown_queue().drain():
+            raise Exception("Failed to clean up attach detach test resources")
     elif args.command == "collect":
         collect_attach_detach(args.case_name, args.node_number, args.disk_number, args.storage_class,
                               args.cloud_info, args.run_id, args.run_url, args.result_dir)
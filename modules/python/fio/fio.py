@@ -2,10 +2,12 @@ import argparse
 import json
 import os
 import subprocess
+import tempfile
 from datetime import datetime, timezone
 import yaml
 from clients.kubernetes_client import KubernetesClient
 from utils.logger_config import get_logger, setup_logging
+from utils.result_schema import export_parquet
 
 setup_logging()
 logger = get_logger(__name__)
@@ -142,10 +144,12 @@ def execute(block_size, iodepth, method, runtime, numjobs, file_size, storage_na
         pod = pods[0]
         pod_name = pod.metadata.name
 
-        # Get pod logs and process results
-        logs = KUBERNETES_CLIENT.get_pod_logs(pod_name)
-        parsed_logs = json.loads(logs)
-        logger.info(f"Checking logs for pod {pod_name} on node {node_name}:\n{parsed_logs}")
+        # Stream pod logs to a temporary file and parse the fio JSON report from it
+        with tempfile.TemporaryFile() as log_file:
+            log_bytes = KUBERNETES_CLIENT.stream_pod_logs(pod_name, dest=log_file)
+            log_file.seek(0)
+            parsed_logs = json.load(log_file)
+        logger.info(f"Parsed {log_bytes} bytes of fio results for pod {pod_name} on node {node_name}")
 
         with open(result_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(parsed_logs) + "\n")
@@ -235,6 +239,7 @@ def collect(vm_size, block_size, iodepth, method, numjobs, file_size, result_dir
             logger.error(f"Error processing entry {i+1}: {str(e)}")
 
     logger.info(f"All results collected and saved to {result_path}")
+    export_parquet(result_path, "fio")
 
 def main():
     parser = argparse.ArgumentParser(description="Fio Benchmark.")
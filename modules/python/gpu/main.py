@@ -7,6 +7,7 @@ import yaml
 
 from utils.common import str2bool
 from utils.logger_config import get_logger, setup_logging
+from utils.result_schema import export_records
 from utils.retries import execute_with_retries
 from clients.kubernetes_client import KubernetesClient
 from gpu.pkg.net import install_network_operator
@@ -150,12 +151,14 @@ def execute(
         namespace="mpi-operator",
     )
     pod_name = pods[0].metadata.name
-    raw_logs = KUBERNETES_CLIENT.get_pod_logs(pod_name, namespace="mpi-operator")
-    logs = raw_logs.decode("utf-8")
-    logger.info(f"Getting logs for pod {pod_name}:\n{logs}")
     result_path = f"{result_dir}/raw.log"
-    with open(result_path, "w", encoding="utf-8") as f:
-        f.write(logs)
+    logger.info(f"Getting logs for pod {pod_name}")
+    KUBERNETES_CLIENT.stream_pod_logs(
+        pod_name,
+        namespace="mpi-operator",
+        dest=result_path,
+        line_callback=logger.info,
+    )
     logger.info(f"Results saved to {result_path}")
 
 
@@ -191,6 +194,7 @@ def collect(result_dir: str, run_id: str, run_url: str, cloud_info: str, nccl_te
             json.dump(result, f, indent=2)
 
         logger.info(f"NCCL test results saved to {output_file}")
+        export_records([result], f"{result_dir}/results.parquet", "nccl")
 
     except Exception as e:
         logger.error(f"Error collecting NCCL results: {str(e)}")
@@ -10,6 +10,7 @@ from utils.common import extract_parameter
 from utils.retries import execute_with_retries
 from utils.constants import CommandConstants
 from utils.logger_config import get_logger, setup_logging
+from utils.result_schema import export_parquet
 from iperf3.parser import parse_tcp_output, parse_udp_output
 
 command_constants = CommandConstants()
@@ -245,6 +246,7 @@ class Iperf3Pod(PodRoleCommand):
             file.write(f"{content}\n")
             logger.info(f"Final data:\n{json.dumps(data, indent=2)}")
             file.close()
+        export_parquet(result_file, "iperf3")
 
 
 def parse_args(args):
@@ -1,76 +1,179 @@
+import argparse
 import json
-import sys
+import re
 import base64
 
 from dateutil.parser import isoparse
 
-def infer_type(value):
-    # Check if it's a boolean
-    if isinstance(value, str) and value.lower() in ['true', 'false']:
-        return "bool"
+from utils.result_schema import get_schema
 
-    # Check if it's an integer
-    try:
-        int(value)
-        return "real"
-    except (ValueError, TypeError):
-        pass
+# Rows sampled from the results file for type inference; 0 reads the whole file
+DEFAULT_SAMPLE_ROWS = 1000
 
-    # Check if it's a float
-    try:
-        float(value)
-        return "real"
-    except (ValueError, TypeError):
-        pass
+_NUMBER_PATTERN = re.compile(r"[+-]?(?:(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?|nan|inf(?:inity)?)", re.IGNORECASE)
+_DATETIME_PATTERN = re.compile(r"\d{4}-?\d{2}-?\d{2}(?:[T ]\d{2}(?::?\d{2}(?::?\d{2}(?:[.,]\d+)?)?)?)?(?:Z|[+-]\d{2}(?::?\d{2})?)?")
 
-    # Check if it's dynamic
+
+def infer_value_type(value):
+    """
+    Infer the Kusto type of a single value, or None for null.
+
+    Values are classified by their Python type first; only strings go through
+    precompiled patterns, and only pattern matches are confirmed by parsing.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "real"
     if isinstance(value, (dict, list)):
         return "dynamic"
+    value = str(value)
+    if value.lower() in ("true", "false"):
+        return "bool"
+    stripped = value.strip()
+    if _NUMBER_PATTERN.fullmatch(stripped):
+        return "real"
+    if stripped[:1] in ("{", "["):
+        try:
+            if isinstance(json.loads(stripped), (dict, list)):
+                return "dynamic"
+        except ValueError:
+            pass
+    if _DATETIME_PATTERN.fullmatch(value):
+        try:
+            isoparse(value)
+            return "datetime"
+        except ValueError:
+            pass
+    return "string"
+
+
+def infer_type(value):
+    return infer_value_type(value) or "dynamic"
+
+
+def unify_types(left, right):
+    """
+    Join two column types in the lattice null < bool, real, datetime < string < dynamic.
 
-    # Attempt to load the string as JSON
-    try:
-        parsed_json = json.loads(str(value))
-        if isinstance(parsed_json, (dict, list)):
-            return "dynamic"
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    # Check if it's a datetime
-    try:
-        isoparse(value)
-        return "datetime"
-    except ValueError:
-        pass
-
-    # If none of the above, take it as string
+    Mixing two different scalar types gives string; anything mixed with dynamic
+    stays dynamic, since a dynamic column holds any JSON value.
+    """
+    if left is None:
+        return right
+    if right is None or left == right:
+        return left
+    if "dynamic" in (left, right):
+        return "dynamic"
     return "string"
 
-def generate_kusto_commands(data, table_name):
-    # Create table command
-    table_command = f".create table ['{table_name}'] ("
 
-    for key, value in data.items():
-        infered_type = infer_type(value)
-        table_command += f"['{key}']:{infered_type}, "
+class SchemaInferrer:
+    """Infer column types over many result rows, unifying the type of each value seen."""
+
+    def __init__(self, schema_name=None):
+        # Column types of a registered result schema take precedence over inference
+        self.schema_types = dict(get_schema(schema_name).kusto_columns()) if schema_name else {}
+        self.column_types = {}
+        self.rows = 0
+
+    def update(self, row):
+        for key, value in row.items():
+            current = self.column_types.get(key)
+            if current == "dynamic" or key in self.schema_types:
+                self.column_types.setdefault(key, current)
+                continue
+            self.column_types[key] = unify_types(current, infer_value_type(value))
+        self.rows += 1
+
+    def infer_file(self, file_path, sample_rows=DEFAULT_SAMPLE_ROWS):
+        """Update the column types from the first ``sample_rows`` NDJSON rows of a file (all if 0)."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                self.update(json.loads(line))
+                if sample_rows and self.rows >= sample_rows:
+                    break
+        return self
+
+    def columns(self):
+        """(name, type) of every column in first-seen order; columns only ever null become dynamic."""
+        return [
+            (key, self.schema_types.get(key) or column_type or "dynamic")
+            for key, column_type in self.column_types.items()
+        ]
+
+
+def parse_csl_schema(csl_schema):
+    """Parse a ``.show table T cslschema`` schema (``a:string, b:real``) into (name, type) pairs."""
+    columns = []
+    for column in csl_schema.split(","):
+        if column.strip():
+            name, column_type = column.rsplit(":", 1)
+            columns.append((name.strip().strip("[]'\""), column_type.strip()))
+    return columns
+
 
-    table_command = table_command.rstrip(", ") + ")"
+def _column_list(columns):
+    return ", ".join(f"['{name}']:{column_type}" for name, column_type in columns)
 
-    # Create table ingestion json mapping command
-    mapping_command = f".create table ['{table_name}'] ingestion json mapping '{table_name}_mapping' '["
-    for key in data.keys():
+
+def _mapping_command(table_name, column_names, verb=".create"):
+    mapping_command = f"{verb} table ['{table_name}'] ingestion json mapping '{table_name}_mapping' '["
+    for key in column_names:
         mapping_command += f"{{\"column\":\"{key}\", \"Properties\":{{\"Path\":\"$[\\'{key}\\']\"}}}},"
-    mapping_command = mapping_command.rstrip(", ") + "]'"
+    return mapping_command.rstrip(", ") + "]'"
+
+
+def generate_table_commands(columns, table_name, existing_columns=None):
+    """
+    Generate the table and ingestion mapping commands for the inferred columns.
+
+    Args:
+        columns: Inferred (name, type) pairs.
+        table_name: Kusto table name.
+        existing_columns: (name, type) pairs of the table if it already exists. Only
+                          new columns are then added, with ``.alter-merge table``,
+                          and the mapping is replaced with ``.create-or-alter``.
+    """
+    if existing_columns is None:
+        return f".create table ['{table_name}'] ({_column_list(columns)})\n\n{_mapping_command(table_name, [name for name, _ in columns])}"
+
+    existing = dict(existing_columns)
+    new_columns = [(name, column_type) for name, column_type in columns if name not in existing]
+    mapped = list(existing) + [name for name, _ in new_columns]
+    commands = []
+    if new_columns:
+        commands.append(f".alter-merge table ['{table_name}'] ({_column_list(new_columns)})")
+    commands.append(_mapping_command(table_name, mapped, verb=".create-or-alter"))
+    return "\n\n".join(commands)
+
+
+def generate_kusto_commands(data, table_name, schema_name=None, existing_columns=None):
+    inferrer = SchemaInferrer(schema_name)
+    inferrer.update(data)
+    return generate_table_commands(inferrer.columns(), table_name, existing_columns)
 
-    kusto_commands = f"{table_command}\n\n{mapping_command}"
-    return kusto_commands
 
 def main():
-    table_name = sys.argv[1]
-    schema_path = sys.argv[2]
-    with open(schema_path, 'r', encoding='utf-8') as schema_file:
-        json_data = schema_file.readline()
-    json_object = json.loads(json_data)
-    kusto_commands = base64.b64encode(generate_kusto_commands(json_object, table_name).encode("utf-8"))
+    parser = argparse.ArgumentParser(description="Generate Kusto table and mapping commands for a results file.")
+    parser.add_argument("table_name", type=str, help="Kusto table name")
+    parser.add_argument("schema_path", type=str, help="NDJSON results file to infer the columns from")
+    parser.add_argument("schema_name", type=str, nargs="?", default=None,
+                        help="Registered result schema whose column types override inference")
+    parser.add_argument("--sample-rows", type=int, default=DEFAULT_SAMPLE_ROWS,
+                        help="Rows to infer the column types from, 0 for the whole file")
+    parser.add_argument("--existing-schema", type=str, default=None,
+                        help="cslschema of the existing table (a:string, b:real); new columns are added with .alter-merge")
+    args = parser.parse_args()
+
+    inferrer = SchemaInferrer(args.schema_name).infer_file(args.schema_path, args.sample_rows)
+    existing_columns = parse_csl_schema(args.existing_schema) if args.existing_schema is not None else None
+    commands = generate_table_commands(inferrer.columns(), args.table_name, existing_columns)
+    kusto_commands = base64.b64encode(commands.encode("utf-8"))
     print(kusto_commands.decode("utf-8"))
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import requests
 
 from clients.kubernetes_client import KubernetesClient
 from utils.retries import execute_with_retries
+from utils.teardown_queue import TeardownQueue
 
 
 @dataclass
@@ -254,25 +255,33 @@ class Node(KWOK):
         return f"{a}.{b}.{c}.{d}"
 
     def tear_down(self):
+        # Nodes are independent, so delete them concurrently instead of one by one.
+        teardown = TeardownQueue()
+        node_deletes = []
         for i in range(self.node_count):
             node_name = f"kwok-node-{i}"
             print(f"Deleting node: {node_name}")
-            execute_with_retries(
-                self.k8s_client.delete_node,
-                node_name
-            )
+            node_deletes.append(teardown.submit(
+                f"delete node {node_name}", self.k8s_client.delete_node, args=(node_name,)
+            ))
 
             # Delete resource slice for each node if DRA was enabled
             if self.enable_dra:
                 resource_slice_name = f"kwok-resource-slice-{i}"
                 print(f"Deleting resource slice: {resource_slice_name}")
-                try:
-                    execute_with_retries(
-                        self.k8s_client.delete_resource_slice,
-                        resource_slice_name
-                    )
-                except Exception as e:
-                    print(f"Warning: Could not delete resource slice {resource_slice_name}: {e}")
+                teardown.submit(
+                    f"delete resource slice {resource_slice_name}",
+                    self.k8s_client.delete_resource_slice,
+                    args=(resource_slice_name,),
+                )
+
+        teardown.drain()
+        for record in teardown.results():
+            if not record["success"] and record["name"].startswith("delete resource slice"):
+                print(f"Warning: Could not {record['name']}: {record['error']}")
+        failed_nodes = [future.result()["name"] for future in node_deletes if not future.result()["success"]]
+        if failed_nodes:
+            raise Exception(f"Failed to {', '.join(failed_nodes)}")
 
         print(f"Successfully deleted {self.node_count} nodes.")
 
@@ -4,6 +4,7 @@ Unit tests for AKSClient class
 """
 
 import os
+import threading
 import unittest
 from unittest import mock
 
@@ -180,14 +181,30 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
         start_time = 100
         arm_done_time = 150
         nodes_ready_time = 130
-        mock_instr_time.time.side_effect = [start_time, arm_done_time, nodes_ready_time]
+        timestamps = iter([start_time, arm_done_time, nodes_ready_time])
+        # Both instrumented threads read the clock; hold the K8s side until ARM has
+        # taken its timestamp so each gets the value meant for it
+        arm_stamped = threading.Event()
+
+        def fake_time():
+            value = next(timestamps)
+            if value == arm_done_time:
+                arm_stamped.set()
+            return value
+
+        mock_instr_time.time.side_effect = fake_time
         mock_instr_time.sleep = mock.MagicMock()
 
         mock_operation = mock.MagicMock()
         self.mock_agent_pools.begin_create_or_update.return_value = mock_operation
 
         ready_nodes = [mock.MagicMock(), mock.MagicMock()]
-        self.mock_k8s.wait_for_nodes_ready.return_value = ready_nodes
+
+        def wait_for_nodes_ready(**_kwargs):
+            arm_stamped.wait(timeout=5)
+            return ready_nodes
+
+        self.mock_k8s.wait_for_nodes_ready.side_effect = wait_for_nodes_ready
 
         # Mock the node pool that will be retrieved after creation
         mock_created_node_pool = mock.MagicMock()
@@ -224,6 +241,7 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             node_count=node_count,
             operation_timeout_in_minutes=10,
             label_selector=f"agentpool={node_pool_name}",
+            ready_timestamps={},
         )
 
         # Verify timing measurements are calculated and stored correctly
@@ -232,6 +250,32 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
         self.mock_operation.add_metadata.assert_any_call("node_readiness_time", 30)
         self.mock_operation.add_metadata.assert_any_call("command_execution_time", 50)
 
+    def _metadata_value(self, key):
+        return next(c.args[1] for c in self.mock_operation.add_metadata.call_args_list if c.args[0] == key)
+
+    def test_create_node_pool_slot_wait_is_not_timed(self):
+        """Waiting for the cluster's operation slot is recorded separately, not as provisioning time"""
+        self.aks_client.operation_limiter.set_limit(1)
+        self.aks_client.get_node_pool = mock.MagicMock()
+        self.mock_k8s.wait_for_nodes_ready.return_value = [mock.MagicMock()]
+        held_slot = self.aks_client.operation_limiter.acquire("fake-cluster")
+
+        create = threading.Thread(target=self.aks_client.create_node_pool, kwargs={
+            "node_pool_name": "test-pool", "vm_size": "Standard_DS2_v2", "node_count": 1,
+        })
+        create.start()
+        create.join(timeout=0.3)
+        # Neither the ARM call nor the readiness wait starts while queued for the slot.
+        self.mock_agent_pools.begin_create_or_update.assert_not_called()
+        self.mock_k8s.wait_for_nodes_ready.assert_not_called()
+        held_slot.release()
+        create.join()
+
+        self.mock_agent_pools.begin_create_or_update.assert_called_once()
+        self.assertGreaterEqual(self._metadata_value("operation_slot_wait_seconds"), 0.3)
+        self.assertLess(self._metadata_value("command_execution_time"), 0.3)
+        self.assertLess(self._metadata_value("node_readiness_time"), 0.3)
+
     @mock.patch("utils.provisioning_instrumentation.time")
     @mock.patch("clients.aks_client.time")
     def test_create_node_pool_retry_occurred_metadata(self, _mock_time, mock_instr_time):
@@ -302,9 +346,13 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
         self.mock_k8s.wait_for_nodes_ready.return_value = ready_nodes
 
         # Add nvidia-smi verification mock
-        self.mock_k8s.verify_nvidia_smi_on_node = mock.MagicMock(
-            return_value="GPU 0: Tesla V100"
-        )
+        node_timings = {"gpu_allocatable_wait_seconds": 1.0, "pod_completion_seconds": 4.0, "total_seconds": 6.0}
+
+        def verify_nvidia_smi(_nodes, timings):
+            timings["gpu-node-0"] = node_timings
+            return "GPU 0: Tesla V100"
+
+        self.mock_k8s.verify_nvidia_smi_on_node = mock.MagicMock(side_effect=verify_nvidia_smi)
 
         # Mock the node pool that will be retrieved after creation
         mock_created_node_pool = mock.MagicMock()
@@ -341,10 +389,14 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             node_count=node_count,
             operation_timeout_in_minutes=10,
             label_selector=f"agentpool={node_pool_name}",
+            ready_timestamps={},
         )
 
-        # Check that NVIDIA verification was performed
-        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(ready_nodes)
+        # Check that NVIDIA verification was performed and its per-node timings recorded
+        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(ready_nodes, timings=mock.ANY)
+        self.mock_operation.add_metadata.assert_any_call(
+            "gpu_verification_timings", {"nvidia_smi": {"gpu-node-0": node_timings}}
+        )
 
     @mock.patch("clients.aks_client.subprocess.run")
     @mock.patch("clients.aks_client.time")
@@ -385,8 +437,8 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
         self.assertIn("--enable-managed-gpu", nodepool_cmd)
         self.assertIn("true", nodepool_cmd)
         # systemd check and nvidia-smi should both run for fully managed GPU
-        self.mock_k8s.verify_managed_gpu_systemd_services.assert_called_once_with(ready_nodes)
-        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(ready_nodes)
+        self.mock_k8s.verify_managed_gpu_systemd_services.assert_called_once_with(ready_nodes, timings={})
+        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(ready_nodes, timings={})
 
     @mock.patch("utils.provisioning_instrumentation.time")
     @mock.patch("clients.aks_client.time")
@@ -436,6 +488,7 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             node_count=node_count,
             operation_timeout_in_minutes=10,
             label_selector=f"agentpool={node_pool_name}",
+            ready_timestamps={},
         )
         self.assertEqual(mock_node_pool.count, node_count)
 
@@ -491,6 +544,7 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             node_count=node_count,
             operation_timeout_in_minutes=10,
             label_selector=f"agentpool={node_pool_name}",
+            ready_timestamps={},
         )
         self.assertEqual(mock_node_pool.count, node_count)
 
@@ -525,6 +579,7 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             resource_group_name="fake-resource-group",
             resource_name="fake-cluster",
             agent_pool_name=node_pool_name,
+            polling=mock.ANY,
         )
         mock_operation.result.assert_called_once()
 
@@ -587,11 +642,12 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             node_count=node_count,
             operation_timeout_in_minutes=10,
             label_selector=f"agentpool={node_pool_name}",
+            ready_timestamps={},
         )
         self.assertEqual(mock_node_pool.count, node_count)
 
         # Check that NVIDIA verification was performed
-        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(ready_nodes)
+        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(ready_nodes, timings={})
 
     @mock.patch("clients.aks_client.time")
     def test_scale_gpu_node_pool_up_progressive_final_step(self, mock_time):
@@ -664,7 +720,38 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
 
         # Check that NVIDIA verification was performed only once (on the final step)
         self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(
-            ready_nodes2
+            ready_nodes2, timings={}
+        )
+
+    def test_scale_node_pool_pipelined(self):
+        """Pipelined progressive scaling records one operation per step and fetches metadata once"""
+        mock_node_pool = mock.MagicMock()
+        mock_node_pool.count = 1
+        mock_node_pool.as_dict.return_value = {"count": 1}
+        self.aks_client.get_node_pool = mock.MagicMock(return_value=mock_node_pool)
+        ready_nodes = [mock.MagicMock() for _ in range(3)]
+        self.mock_k8s.get_ready_nodes.return_value = ready_nodes
+
+        result = self.aks_client.scale_node_pool(
+            node_pool_name="pool1",
+            node_count=3,
+            progressive=True,
+            scale_step_size=1,
+            pipelined=True,
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_agent_pools.begin_create_or_update.call_count, 2)
+        self.assertEqual(self.mock_operation_context.call_count, 2)
+        step_metadata = [c.args[2] for c in self.mock_operation_context.call_args_list]
+        self.assertEqual([m["target_count"] for m in step_metadata], [2, 3])
+        self.assertTrue(all(m["pipelined"] for m in step_metadata))
+        # Cluster data is snapshotted once per run instead of once per step.
+        self.aks_client.get_cluster_data.assert_called_once()
+        self.mock_operation.add_metadata.assert_any_call("nodepool_info", {"count": 3})
+        self.mock_k8s.wait_for_nodes_ready.assert_not_called()
+        self.mock_k8s.get_ready_nodes.assert_called_with(
+            label_selector="agentpool=pool1", lightweight=True
         )
 
     @mock.patch("clients.aks_client.time")
@@ -718,6 +805,7 @@ class TestAKSClient(unittest.TestCase):  # pylint: disable=too-many-instance-att
             node_count=node_count,
             operation_timeout_in_minutes=10,
             label_selector=f"agentpool={node_pool_name}",
+            ready_timestamps={},
         )
         self.assertEqual(mock_node_pool.count, node_count)
 
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Unit tests for arm_lro module
+"""
+
+import itertools
+import json
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from clients.arm_lro import (
+    AdaptiveArmPolling,
+    ArmLroTracker,
+    expected_lro_duration,
+    parse_arm_timestamp,
+    record_lro_duration,
+    wait_for_arm_lro,
+)
+from clients.arm_throttle import READS, ArmThrottleGovernor
+
+
+def _response(status_code, body=None, headers=None):
+    return SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        text=json.dumps(body or {}),
+        json=lambda: body if body is not None else {},
+    )
+
+
+class TestParseArmTimestamp(unittest.TestCase):
+    """Tests for parse_arm_timestamp"""
+
+    def test_seven_fractional_digits_and_z_suffix(self):
+        parsed = parse_arm_timestamp("2024-05-01T10:00:05.1234567Z")
+        self.assertEqual(parsed.isoformat(), "2024-05-01T10:00:05.123456+00:00")
+
+    def test_http_date(self):
+        parsed = parse_arm_timestamp("Wed, 01 May 2024 10:00:07 GMT")
+        self.assertEqual(parsed.isoformat(), "2024-05-01T10:00:07+00:00")
+
+    def test_invalid(self):
+        self.assertIsNone(parse_arm_timestamp("soon"))
+        self.assertIsNone(parse_arm_timestamp(None))
+        self.assertIsNone(parse_arm_timestamp(mock.MagicMock()))
+
+
+class TestArmLroTracker(unittest.TestCase):
+    """Tests for ArmLroTracker scheduling and timing"""
+
+    @mock.patch("time.time", return_value=1000.0)
+    def test_backoff_without_expected_duration(self, _mock_time):
+        tracker = ArmLroTracker(kind="test-backoff", min_interval=1, max_interval=2)
+
+        self.assertEqual([tracker.next_delay() for _ in range(4)], [1, 1.5, 2, 2])
+        self.assertEqual(tracker.next_delay(retry_after=7), 7)
+
+    @mock.patch("time.time")
+    def test_tight_polling_around_expected_completion(self, mock_time):
+        mock_time.return_value = 1000.0
+        tracker = ArmLroTracker(expected_duration=100, min_interval=0.5, max_interval=10)
+
+        # Far from completion: Retry-After is honored, but never past the window start.
+        mock_time.return_value = 1010.0
+        self.assertEqual(tracker.next_delay(retry_after=30), 30)
+        mock_time.return_value = 1070.0
+        self.assertEqual(tracker.next_delay(retry_after=30), 10)
+        # Within 20% of the expected duration: tight interval despite Retry-After.
+        mock_time.return_value = 1095.0
+        self.assertEqual(tracker.next_delay(retry_after=30), 0.5)
+        # Well past it: back off again.
+        mock_time.return_value = 1200.0
+        self.assertEqual(tracker.next_delay(), 0.5)
+        self.assertEqual(tracker.next_delay(), 0.75)
+
+    def test_duration_history_median(self):
+        for seconds in (10, 30, 20):
+            record_lro_duration("test-history", seconds)
+
+        self.assertEqual(expected_lro_duration("test-history"), 20)
+        self.assertEqual(ArmLroTracker(kind="test-history").expected_duration, 20)
+        self.assertIsNone(expected_lro_duration("test-unknown"))
+
+
+class TestWaitForArmLro(unittest.TestCase):
+    """Tests for wait_for_arm_lro"""
+
+    def setUp(self):
+        self.sleep_patcher = mock.patch("time.sleep")
+        self.mock_sleep = self.sleep_patcher.start()
+
+    def tearDown(self):
+        self.sleep_patcher.stop()
+
+    def test_follows_azure_async_operation_and_records_end_time(self):
+        initial = _response(201, headers={
+            "Azure-AsyncOperation": "https://arm/operations/1",
+            "Location": "https://arm/location/1",
+            "Retry-After": "4",
+        })
+        send_get = mock.MagicMock(side_effect=[
+            _response(200, {"status": "InProgress", "startTime": "2024-05-01T10:00:00Z"}),
+            _response(200, {"status": "Succeeded", "startTime": "2024-05-01T10:00:00Z",
+                            "endTime": "2024-05-01T10:00:42.5Z"}),
+        ])
+
+        tracker = wait_for_arm_lro(
+            send_get, "https://arm/pool", 60, initial_response=initial,
+            tracker=ArmLroTracker(kind="test-async"),
+        )
+
+        self.assertEqual(tracker.status, "Succeeded")
+        send_get.assert_called_with("https://arm/operations/1")
+        self.assertEqual(self.mock_sleep.call_args_list[0].args[0], 4)
+        summary = tracker.summary()
+        self.assertEqual(summary["polls"], 2)
+        self.assertEqual(summary["end_time_source"], "endTime")
+        self.assertEqual(summary["server_end_time"], "2024-05-01T10:00:42.500+00:00")
+        self.assertEqual(summary["server_execution_time"], 42.5)
+        self.assertEqual(expected_lro_duration("test-async"), 42.5)
+
+    def test_location_polling_uses_date_header(self):
+        initial = _response(202, headers={"Location": "https://arm/location/1"})
+        send_get = mock.MagicMock(side_effect=[
+            _response(202),
+            _response(200, headers={"Date": "Wed, 01 May 2024 10:00:07 GMT"}),
+        ])
+
+        tracker = wait_for_arm_lro(send_get, "https://arm/pool", 60, initial_response=initial)
+
+        self.assertEqual(tracker.status, "Succeeded")
+        self.assertEqual(tracker.summary()["end_time_source"], "date_header")
+
+    def test_resource_polling_treats_missing_state_as_failed(self):
+        send_get = mock.MagicMock(side_effect=[
+            _response(503),
+            _response(200, {"properties": {"provisioningState": "Updating"}}),
+            _response(200, {"properties": {}}),
+        ])
+
+        tracker = wait_for_arm_lro(send_get, "https://arm/pool", 60)
+
+        self.assertEqual(tracker.status, "Failed")
+        send_get.assert_called_with("https://arm/pool")
+
+    def test_resource_polling_retries_unparseable_body(self):
+        def unparseable():
+            raise ValueError("Expecting value")
+
+        send_get = mock.MagicMock(side_effect=[
+            SimpleNamespace(status_code=200, headers={}, text="<html>", json=unparseable),
+            _response(200, {"properties": {"provisioningState": "Succeeded"}}),
+        ])
+
+        tracker = wait_for_arm_lro(send_get, "https://arm/pool", 60)
+
+        self.assertEqual(tracker.status, "Succeeded")
+        self.assertEqual(send_get.call_count, 2)
+        self.assertEqual(tracker.polls, 1)
+
+    def test_client_error_raises(self):
+        send_get = mock.MagicMock(return_value=_response(404, {"error": "NotFound"}))
+
+        with self.assertRaises(RuntimeError):
+            wait_for_arm_lro(send_get, "https://arm/pool", 60)
+
+    def test_timeout_raises(self):
+        send_get = mock.MagicMock(return_value=_response(200, {"properties": {"provisioningState": "Updating"}}))
+
+        with mock.patch("time.time", side_effect=itertools.chain([0, 0, 0], itertools.repeat(100))):
+            with self.assertRaises(TimeoutError):
+                wait_for_arm_lro(send_get, "https://arm/pool", 60)
+
+
+class TestAdaptiveArmPolling(unittest.TestCase):
+    """Tests for the Azure SDK polling method"""
+
+    def test_delay_and_status_come_from_tracker(self):
+        tracker = ArmLroTracker(kind="test-sdk", min_interval=0.5)
+        polling = AdaptiveArmPolling(tracker)
+        http_response = mock.MagicMock()
+        http_response.headers = {"Retry-After": "3"}
+        http_response.text.return_value = json.dumps(
+            {"status": "Succeeded", "endTime": "2024-05-01T10:00:42Z"}
+        )
+        polling._pipeline_response = SimpleNamespace(http_response=http_response)  # pylint: disable=protected-access
+        polling._status = "Succeeded"  # pylint: disable=protected-access
+        polling._operation = mock.MagicMock()  # pylint: disable=protected-access
+
+        self.assertEqual(polling._extract_delay(), 3)  # pylint: disable=protected-access
+        with mock.patch("azure.mgmt.core.polling.arm_polling.ARMPolling.update_status"):
+            polling.update_status()
+
+        self.assertEqual(tracker.status, "Succeeded")
+        self.assertEqual(tracker.summary()["server_end_time"], "2024-05-01T10:00:42.000+00:00")
+
+    def test_poller_thread_counts_toward_tracked_operation(self):
+        governor = ArmThrottleGovernor()
+        op = mock.MagicMock()
+
+        with mock.patch("azure.mgmt.core.polling.arm_polling.ARMPolling.run",
+                        lambda _polling: governor.acquire(READS)):
+            with governor.track(op):
+                polling = AdaptiveArmPolling(ArmLroTracker(kind="test-sdk-thread"))
+                # The SDK runs the polling loop on its own thread.
+                poller_thread = threading.Thread(target=polling.run)
+                poller_thread.start()
+                poller_thread.join()
+
+        summary = next(c.args[1] for c in op.add_metadata.call_args_list if c.args[0] == "arm_throttle")
+        self.assertEqual(summary[READS]["requests"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Unit tests for arm_throttle module
+"""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+from clients.arm_throttle import (
+    BATCH_WRITES,
+    READS,
+    WRITES,
+    ArmThrottleGovernor,
+    ArmThrottlePolicy,
+    bind_throttle_usage,
+    classify_method,
+    get_arm_throttle_governor,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only advances when sleep is called."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestArmThrottleGovernor(unittest.TestCase):
+    """Tests for ArmThrottleGovernor"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.monotonic_patcher = mock.patch("time.monotonic", side_effect=self.clock.monotonic)
+        self.sleep_patcher = mock.patch("time.sleep", side_effect=self.clock.sleep)
+        self.monotonic_patcher.start()
+        self.sleep_patcher.start()
+        self.governor = ArmThrottleGovernor({READS: (1.0, 2), WRITES: (1.0, 2), BATCH_WRITES: (1.0, 1)})
+
+    def tearDown(self):
+        self.monotonic_patcher.stop()
+        self.sleep_patcher.stop()
+
+    def test_acquire_waits_when_bucket_empty(self):
+        self.assertEqual(self.governor.acquire(READS), 0.0)
+        self.assertEqual(self.governor.acquire(READS), 0.0)
+        self.assertAlmostEqual(self.governor.acquire(READS), 1.0)
+
+        summary = self.governor.summary()[READS]
+        self.assertEqual(summary["requests"], 3)
+        self.assertEqual(summary["throttled_requests"], 1)
+        self.assertAlmostEqual(summary["throttle_wait_seconds"], 1.0)
+
+    def test_retry_after_blocks_class_and_halves_rate(self):
+        self.governor.observe(BATCH_WRITES, 429, {"Retry-After": "5"})
+
+        self.assertAlmostEqual(self.governor.acquire(BATCH_WRITES), 5.0)
+        summary = self.governor.summary()[BATCH_WRITES]
+        self.assertEqual(summary["throttled_responses"], 1)
+        self.assertEqual(summary["current_rate"], 0.5)
+        # Other classes are not blocked.
+        self.assertEqual(self.governor.acquire(READS), 0.0)
+
+    def test_remaining_quota_caps_tokens_and_is_sampled(self):
+        self.governor.observe(WRITES, 200, {"x-ms-ratelimit-remaining-subscription-writes": "0"})
+
+        self.assertGreater(self.governor.acquire(WRITES), 0)
+        summary = self.governor.summary()[WRITES]
+        self.assertEqual(summary["min_remaining"], 0)
+        self.assertEqual(len(summary["quota_samples"]), 1)
+        self.assertLess(summary["current_rate"], 1.0)
+
+    def test_summary_since_checkpoint_and_track(self):
+        self.governor.acquire(READS)
+        checkpoint = self.governor.checkpoint()
+        self.assertEqual(self.governor.summary(checkpoint), {})
+
+        op = mock.MagicMock()
+        with self.governor.track(op):
+            self.governor.acquire(WRITES)
+            self.governor.observe(WRITES, 200, {"x-ms-ratelimit-remaining-subscription-writes": "150"})
+
+        op.add_metadata.assert_any_call("arm_throttle_wait_seconds", 0.0)
+        summary = next(c.args[1] for c in op.add_metadata.call_args_list if c.args[0] == "arm_throttle")
+        self.assertEqual(set(summary), {WRITES})
+        self.assertEqual(summary[WRITES]["quota_samples"][0]["remaining"], 150)
+
+    @staticmethod
+    def _metadata(op, key):
+        return next(c.args[1] for c in op.add_metadata.call_args_list if c.args[0] == key)
+
+    def test_concurrent_tracks_only_count_their_own_waits(self):
+        throttled_op, other_op = mock.MagicMock(), mock.MagicMock()
+        tracked = threading.Barrier(2)
+
+        def run(op, waits):
+            with self.governor.track(op):
+                tracked.wait()
+                if waits:
+                    self.governor.observe(BATCH_WRITES, 429, {"Retry-After": "5"})
+                    self.governor.acquire(BATCH_WRITES)
+                else:
+                    self.governor.acquire(READS)
+                tracked.wait()
+
+        threads = [threading.Thread(target=run, args=(throttled_op, True)),
+                   threading.Thread(target=run, args=(other_op, False))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(set(self._metadata(throttled_op, "arm_throttle")), {BATCH_WRITES})
+        self.assertEqual(self._metadata(throttled_op, "arm_throttle_wait_seconds"), 5.0)
+        self.assertEqual(self._metadata(throttled_op, "arm_throttle")[BATCH_WRITES]["throttled_responses"], 1)
+        self.assertEqual(set(self._metadata(other_op, "arm_throttle")), {READS})
+        self.assertEqual(self._metadata(other_op, "arm_throttle_wait_seconds"), 0.0)
+        # The process-wide view still sees both.
+        self.assertEqual(set(self.governor.summary()), {READS, BATCH_WRITES})
+
+    def test_bound_worker_threads_and_nested_tracks_count_toward_operation(self):
+        outer, inner = mock.MagicMock(), mock.MagicMock()
+
+        with self.governor.track(outer):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(bind_throttle_usage(self.governor.acquire), [READS, READS]))
+                executor.submit(self.governor.acquire, WRITES).result()
+            with self.governor.track(inner):
+                self.governor.acquire(WRITES)
+
+        self.assertEqual(self._metadata(inner, "arm_throttle")[WRITES]["requests"], 1)
+        summary = self._metadata(outer, "arm_throttle")
+        self.assertEqual(summary[READS]["requests"], 2)
+        # The unbound submission is not attributed; the nested track is.
+        self.assertEqual(summary[WRITES]["requests"], 1)
+
+    def test_policy_routes_sdk_requests(self):
+        policy = ArmThrottlePolicy(self.governor)
+        request = SimpleNamespace(http_request=SimpleNamespace(method="PUT"))
+        response = SimpleNamespace(http_response=SimpleNamespace(
+            status_code=429, headers={"Retry-After": "3"}))
+
+        policy.on_request(request)
+        policy.on_response(request, response)
+
+        summary = self.governor.summary()[WRITES]
+        self.assertEqual(summary["requests"], 1)
+        self.assertEqual(summary["throttled_responses"], 1)
+
+
+class TestArmThrottleHelpers(unittest.TestCase):
+    """Tests for module-level helpers"""
+
+    def test_classify_method(self):
+        self.assertEqual(classify_method("get"), READS)
+        self.assertEqual(classify_method("PUT"), WRITES)
+        self.assertEqual(classify_method("DELETE"), WRITES)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after({"Retry-After": "7"}), 7.0)
+        self.assertIsNone(parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+        self.assertIsNone(parse_retry_after({}))
+        self.assertIsNone(parse_retry_after(mock.MagicMock()))
+
+    def test_governor_is_process_wide(self):
+        self.assertIs(get_arm_throttle_governor(), get_arm_throttle_governor())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for credential_broker module
+"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from azure.core.credentials import AccessToken
+
+from clients.credential_broker import (
+    AKS_AAD_SCOPE,
+    ARM_SCOPE,
+    CredentialBroker,
+    get_credential_broker,
+)
+
+
+class TestCredentialBroker(unittest.TestCase):
+    """Tests for CredentialBroker caching, refresh and stats"""
+
+    def setUp(self):
+        self.credential = mock.MagicMock()
+        self.credential.get_token.side_effect = lambda *scopes, **kwargs: AccessToken(
+            f"token-{self.credential.get_token.call_count}", int(time.time()) + 3600
+        )
+        self.broker = CredentialBroker(self.credential)
+
+    def tearDown(self):
+        self.broker.stop()
+
+    def test_token_is_cached_per_scope(self):
+        self.assertEqual(self.broker.token(ARM_SCOPE), "token-1")
+        self.assertEqual(self.broker.token(ARM_SCOPE), "token-1")
+        self.assertEqual(self.broker.token(AKS_AAD_SCOPE), "token-2")
+
+        self.assertEqual(self.credential.get_token.call_count, 2)
+        summary = self.broker.summary()
+        self.assertEqual(summary[ARM_SCOPE]["blocking_acquisitions"], 1)
+        self.assertIsNotNone(summary[AKS_AAD_SCOPE]["mean_latency_seconds"])
+
+    def test_expiring_token_is_fetched_again(self):
+        self.credential.get_token.side_effect = [
+            AccessToken("stale", int(time.time()) + 10),
+            AccessToken("fresh", int(time.time()) + 3600),
+        ]
+
+        self.assertEqual(self.broker.token(ARM_SCOPE), "stale")
+        self.assertEqual(self.broker.token(ARM_SCOPE), "fresh")
+
+    def test_claims_bypass_cache(self):
+        self.broker.get_token(ARM_SCOPE)
+        self.broker.get_token(ARM_SCOPE, claims="challenge")
+
+        self.assertEqual(self.credential.get_token.call_count, 2)
+        self.credential.get_token.assert_called_with(ARM_SCOPE, claims="challenge", tenant_id=None)
+
+    def test_concurrent_readers_fetch_once(self):
+        barrier = threading.Barrier(8)
+
+        def read():
+            barrier.wait()
+            return self.broker.token(ARM_SCOPE)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.credential.get_token.call_count, 1)
+
+    def test_background_refresh_before_expiry(self):
+        broker = CredentialBroker(self.credential, refresh_margin_seconds=3600)
+        self.addCleanup(broker.stop)
+        self.assertEqual(broker.token(ARM_SCOPE), "token-1")
+
+        deadline = time.time() + 5
+        while broker.summary()[ARM_SCOPE]["background_refreshes"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertGreaterEqual(broker.summary()[ARM_SCOPE]["background_refreshes"], 1)
+        self.assertNotEqual(broker.token(ARM_SCOPE), "token-1")
+
+    def test_failed_fetch_is_counted_and_raised(self):
+        self.credential.get_token.side_effect = Exception("no credential")
+
+        with self.assertRaises(Exception):
+            self.broker.token(ARM_SCOPE)
+
+        self.assertEqual(self.broker.summary()[ARM_SCOPE]["failures"], 1)
+
+
+class TestGetCredentialBroker(unittest.TestCase):
+    """Tests for the process-wide broker registry"""
+
+    def test_credential_is_built_once_per_key(self):
+        factory = mock.MagicMock()
+
+        first = get_credential_broker("test-key", factory)
+        second = get_credential_broker("test-key", factory)
+
+        self.assertIs(first, second)
+        self.assertIs(first.credential, factory.return_value)
+        factory.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,11 @@ Unit tests for EKS Client launch template functionality
 """
 # pylint: disable=too-many-lines,too-many-public-methods,protected-access
 
+import threading
 import unittest
 from unittest import mock
 import os
+import tempfile
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError, WaiterError
 from clients.eks_client import EKSClient
@@ -45,6 +47,10 @@ class TestEKSClient(unittest.TestCase):
             "cluster": {"tags": {"run_id": "test-run-123"}, "version": "1.29"}
         }
 
+        self.mock_eks.describe_update.return_value = {
+            "update": {"id": "update-123", "status": "Successful"}
+        }
+
         # Mock subnets response
         self.mock_eks.describe_subnets = mock.MagicMock()
 
@@ -910,7 +916,7 @@ class TestEKSClient(unittest.TestCase):
         self.assertEqual(call_args["amiType"], "AL2_x86_64_GPU")
 
         # Verify NVIDIA verification was called
-        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(["gpu-node1"])
+        self.mock_k8s.verify_nvidia_smi_on_node.assert_called_once_with(["gpu-node1"], timings={})
 
     def test_create_node_group_node_group_creation_failure(self):
         """Test node group creation when EKS create_nodegroup fails"""
@@ -994,6 +1000,84 @@ class TestEKSClient(unittest.TestCase):
         with self.assertRaises(WaiterError):
             eks_client.scale_node_group("test-ng", 4, 4)
 
+    def test_scale_node_group_waits_for_update_and_readiness_concurrently(self):
+        """Scaling polls the nodegroup update and records both timings"""
+        eks_client = EKSClient()
+        mock_op = mock.MagicMock()
+        eks_client._get_operation_context = mock.MagicMock()
+        eks_client._get_operation_context.return_value.return_value.__enter__.return_value = mock_op
+
+        self.mock_eks.describe_nodegroup.return_value = {
+            "nodegroup": {
+                "scalingConfig": {"desiredSize": 2, "maxSize": 5, "minSize": 1}
+            }
+        }
+        self.mock_eks.update_nodegroup_config.return_value = {
+            "update": {"id": "update-123", "status": "InProgress"}
+        }
+        self.mock_eks.describe_update.side_effect = [
+            {"update": {"id": "update-123", "status": "InProgress"}},
+            {"update": {"id": "update-123", "status": "Successful"}},
+        ]
+        self.mock_k8s.wait_for_nodes_ready.return_value = ["node1", "node2", "node3"]
+
+        with mock.patch("utils.polling.time.sleep") as mock_sleep:
+            self.assertTrue(eks_client.scale_node_group("test-ng", 3, 3))
+
+        self.assertEqual(self.mock_eks.describe_update.call_count, 2)
+        self.mock_eks.describe_update.assert_called_with(
+            name="test-cluster-123", nodegroupName="test-ng", updateId="update-123"
+        )
+        self.assertLessEqual(mock_sleep.call_args.args[0], 30)
+        waiter_config = self.mock_eks.get_waiter.return_value.wait.call_args.kwargs["WaiterConfig"]
+        self.assertLess(waiter_config["Delay"], 30)
+        metadata_keys = {c.args[0] for c in mock_op.add_metadata.call_args_list}
+        self.assertIn("command_execution_time", metadata_keys)
+        self.assertIn("node_readiness_time", metadata_keys)
+
+    def test_scale_node_group_slot_wait_is_not_timed(self):
+        """Waiting for the cluster's operation slot is recorded separately, not as provisioning time"""
+        eks_client = EKSClient()
+        mock_op = mock.MagicMock()
+        eks_client._get_operation_context = mock.MagicMock()
+        eks_client._get_operation_context.return_value.return_value.__enter__.return_value = mock_op
+        self.mock_eks.describe_nodegroup.return_value = {
+            "nodegroup": {"scalingConfig": {"desiredSize": 2, "maxSize": 5, "minSize": 1}}
+        }
+        self.mock_eks.update_nodegroup_config.return_value = {"update": {"id": "update-123"}}
+        self.mock_eks.describe_update.return_value = {"update": {"id": "update-123", "status": "Successful"}}
+        self.mock_k8s.wait_for_nodes_ready.return_value = ["node1", "node2", "node3"]
+        eks_client.operation_limiter.set_limit(1)
+        held_slot = eks_client.operation_limiter.acquire("test-cluster-123")
+        release = threading.Timer(0.3, held_slot.release)
+
+        release.start()
+        self.assertTrue(eks_client.scale_node_group("test-ng", 3, 3))
+
+        metadata = {c.args[0]: c.args[1] for c in mock_op.add_metadata.call_args_list}
+        self.assertGreaterEqual(metadata["operation_slot_wait_seconds"], 0.25)
+        self.assertLess(metadata["command_execution_time"], 0.25)
+        self.assertLess(metadata["node_readiness_time"], 0.25)
+
+    def test_scale_node_group_update_failed_raises(self):
+        """A failed nodegroup update fails the scale operation"""
+        eks_client = EKSClient()
+        self.mock_eks.describe_nodegroup.return_value = {
+            "nodegroup": {
+                "scalingConfig": {"desiredSize": 2, "maxSize": 5, "minSize": 1}
+            }
+        }
+        self.mock_eks.update_nodegroup_config.return_value = {
+            "update": {"id": "update-123", "status": "InProgress"}
+        }
+        self.mock_eks.describe_update.return_value = {
+            "update": {"id": "update-123", "status": "Failed", "errors": [{"errorCode": "Ec2LaunchTemplateNotFound"}]}
+        }
+        self.mock_k8s.wait_for_nodes_ready.return_value = ["node1", "node2", "node3"]
+
+        with self.assertRaisesRegex(Exception, "failed"):
+            eks_client.scale_node_group("test-ng", 3, 3)
+
     def test_delete_node_group_with_launch_template_deletion_failure(self):
         """Test node group deletion when launch template deletion fails"""
         # Setup
@@ -1192,6 +1276,33 @@ class TestEKSClient(unittest.TestCase):
         # Should call update_nodegroup_config multiple times for progressive scaling
         self.assertGreaterEqual(self.mock_eks.update_nodegroup_config.call_count, 2)
 
+    def test_scale_node_group_pipelined(self):
+        """Pipelined progressive scaling updates each step without waiting for the previous step's nodes"""
+        eks_client = EKSClient()
+        eks_client.get_node_group = mock.Mock(return_value={
+            "scalingConfig": {"desiredSize": 2, "minSize": 1, "maxSize": 4},
+            "status": "ACTIVE",
+        })
+        eks_client.get_cluster_data = mock.Mock(return_value={"cluster": {"status": "ACTIVE"}})
+        self.mock_eks.update_nodegroup_config.return_value = {"update": {"id": "update-1"}}
+        self.mock_k8s.get_ready_nodes.return_value = [{"metadata": {"name": f"node-{i}"}} for i in range(6)]
+
+        result = eks_client.scale_node_group(
+            node_group_name="test-ng", node_count=6, target_count=6,
+            progressive=True, scale_step_size=2, pipelined=True,
+        )
+
+        self.assertTrue(result)
+        sizes = [
+            (c.kwargs["scalingConfig"]["desiredSize"], c.kwargs["scalingConfig"]["maxSize"])
+            for c in self.mock_eks.update_nodegroup_config.call_args_list
+        ]
+        self.assertEqual(sizes, [(4, 4), (6, 6)])
+        # Node group and cluster are described once per run, not per step.
+        self.assertEqual(eks_client.get_node_group.call_count, 2)
+        eks_client.get_cluster_data.assert_called_once()
+        self.mock_k8s.wait_for_nodes_ready.assert_not_called()
+
     def test_delete_node_group_with_launch_template_cleanup_coverage(self):
         """Test delete_node_group to cover _delete_launch_template functionality"""
         # Setup
@@ -1991,6 +2102,45 @@ class TestEKSClient(unittest.TestCase):
         self.assertEqual(result[0]["InstanceType"], "t3.medium")
         self.assertEqual(result[0]["NetworkInfo"]["MaximumNetworkCards"], 3)
 
+    def test_lookup_cache_shared_across_clients_of_a_run(self):
+        """Test that a second client of the same run skips the pre-flight lookups"""
+        self.mock_eks.describe_access_entry.return_value = {
+            "accessEntry": {"accessEntryArn": "arn:aws:eks:us-west-2:123456789012:access-entry/test"}
+        }
+        with tempfile.TemporaryDirectory() as result_dir:
+            self.mock_ec2.describe_instance_types.return_value = {
+                "InstanceTypes": [{"InstanceType": "m5.large", "NetworkInfo": {"MaximumNetworkCards": 1}}]
+            }
+            first = EKSClient(result_dir=result_dir)
+            first.describe_instance_types(["m5.large"])
+
+            second = EKSClient(result_dir=result_dir)
+            details = second.describe_instance_types(["m5.large"])
+
+        self.assertEqual(second.cluster_name, "test-cluster-123")
+        self.assertEqual(second.k8s_version, "1.29")
+        self.assertEqual(second.subnet_map, first.subnet_map)
+        self.assertEqual(second.node_role_arn, first.node_role_arn)
+        self.assertEqual(details[0]["InstanceType"], "m5.large")
+        self.mock_eks.list_clusters.assert_called_once()
+        self.mock_ec2.describe_subnets.assert_called_once()
+        self.mock_eks.describe_access_entry.assert_called_once()
+        self.mock_ec2.describe_instance_types.assert_called_once()
+
+    def test_invalidate_lookups(self):
+        """Test explicit invalidation and launch template invalidation on delete"""
+        eks_client = EKSClient()
+        eks_client.lookup_cache.set(("launch_template", "us-west-2", "tpl"), "lt-123")
+        eks_client.launch_template_id = "lt-123"
+
+        eks_client._delete_launch_template()  # pylint: disable=protected-access
+
+        self.assertIsNone(eks_client.lookup_cache.get(("launch_template", "us-west-2", "tpl")))
+        self.assertIsNotNone(eks_client.lookup_cache.get(("subnets", "us-west-2", "test-run-123")))
+        self.assertEqual(eks_client.invalidate_lookups("subnets"), 1)
+        self.assertGreater(eks_client.invalidate_lookups(), 0)
+        self.assertIsNone(eks_client.lookup_cache.get(("cluster", "us-west-2", "test-run-123")))
+
     def test_describe_instance_types_multiple_instances(self):
         """Test describe_instance_types with multiple instance types"""
         # Setup
@@ -0,0 +1,168 @@
+"""
+Unit tests for the informer cache used by KubernetesClient
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.models import (
+    V1ListMeta, V1Node, V1NodeList, V1ObjectMeta, V1Pod, V1PodList, V1PodSpec, V1PodStatus
+)
+
+from clients.informer import IndexedStore, Informer, parse_field_selector, parse_label_selector
+from clients.kubernetes_client import KubernetesClient
+
+
+def _pod(name, namespace="default", labels=None, node_name=None, phase="Running", resource_version="1"):
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, namespace=namespace, labels=labels, resource_version=resource_version),
+        spec=V1PodSpec(containers=[], node_name=node_name),
+        status=V1PodStatus(phase=phase),
+    )
+
+
+class TestSelectorParsing(unittest.TestCase):
+    """Tests for label and field selector parsing."""
+
+    def test_parse_label_selector(self):
+        self.assertEqual(parse_label_selector(None), [])
+        self.assertEqual(
+            parse_label_selector("app=web,tier!=db, env in (a, b),gpu,!spot"),
+            [
+                ("app", "=", {"web"}),
+                ("tier", "!=", {"db"}),
+                ("env", "in", {"a", "b"}),
+                ("gpu", "exists", set()),
+                ("spot", "!", set()),
+            ],
+        )
+
+    def test_parse_label_selector_unsupported(self):
+        self.assertIsNone(parse_label_selector("app>1"))
+
+    def test_parse_field_selector(self):
+        self.assertEqual(parse_field_selector("spec.nodeName=n1"), [("spec.nodeName", "=", "n1")])
+        self.assertIsNone(parse_field_selector("spec.schedulerName=default"))
+
+
+class TestIndexedStore(unittest.TestCase):
+    """Tests for the indexed in-memory store."""
+
+    def setUp(self):
+        self.store = IndexedStore()
+        self.store.replace([
+            _pod("a", labels={"app": "web"}, node_name="n1"),
+            _pod("b", labels={"app": "web"}, node_name="n2"),
+            _pod("c", namespace="other", labels={"app": "db"}, node_name="n1"),
+        ])
+
+    def _names(self, objects):
+        return [obj.metadata.name for obj in objects]
+
+    def test_list_by_namespace_label_and_node(self):
+        self.assertEqual(self._names(self.store.list(namespace="default")), ["a", "b"])
+        self.assertEqual(self._names(self.store.list(label_selector="app=web")), ["a", "b"])
+        self.assertEqual(self._names(self.store.list(field_selector="spec.nodeName=n1")), ["a", "c"])
+        self.assertEqual(
+            self._names(self.store.list(namespace="default", label_selector="app in (web)",
+                                        field_selector="spec.nodeName=n1")),
+            ["a"],
+        )
+
+    def test_list_unsupported_selector_returns_none(self):
+        self.assertIsNone(self.store.list(field_selector="spec.schedulerName=x"))
+
+    def test_upsert_reindexes_and_delete_removes(self):
+        self.store.upsert(_pod("a", labels={"app": "db"}, node_name="n3"))
+        self.assertEqual(self._names(self.store.list(label_selector="app=web")), ["b"])
+        self.assertEqual(self._names(self.store.list(field_selector="spec.nodeName=n3")), ["a"])
+
+        self.store.delete(_pod("b"))
+        self.assertIsNone(self.store.get("b", "default"))
+        self.assertEqual(len(self.store), 2)
+
+
+class TestInformer(unittest.TestCase):
+    """Tests for the background list+watch loop."""
+
+    @patch("clients.informer.watch.Watch")
+    def test_run_lists_then_applies_watch_events(self, mock_watch):
+        list_func = MagicMock(return_value=V1PodList(
+            items=[_pod("a")], metadata=V1ListMeta(resource_version="10")))
+        informer = Informer("pods", list_func)
+
+        def stream(*_args, **kwargs):
+            self.assertEqual(kwargs["resource_version"], "10")
+            yield {"type": "ADDED", "object": _pod("b", resource_version="11")}
+            yield {"type": "DELETED", "object": _pod("a", resource_version="12")}
+            informer.stop()
+
+        mock_watch.return_value.stream.side_effect = stream
+        informer._run()  # pylint: disable=protected-access
+
+        self.assertTrue(informer.has_synced())
+        self.assertEqual([pod.metadata.name for pod in informer.store.list()], ["b"])
+        self.assertEqual(informer.resource_version, "12")
+
+
+class TestKubernetesClientInformers(unittest.TestCase):
+    """Tests for KubernetesClient reading from the informer cache."""
+
+    @patch('kubernetes.config.load_kube_config')
+    def setUp(self, _mock_load_kube_config):  # pylint: disable=arguments-differ
+        self.client = KubernetesClient()
+
+    def _synced_informer(self, objects):
+        informer = MagicMock()
+        informer.has_synced.return_value = True
+        informer.store = IndexedStore()
+        informer.store.replace(objects)
+        return informer
+
+    def test_get_pods_by_namespace_reads_from_cache(self):
+        self.client._informers["pods"] = self._synced_informer([  # pylint: disable=protected-access
+            _pod("a", labels={"app": "web"}), _pod("b", labels={"app": "db"})])
+        self.client.api = MagicMock()
+
+        pods = self.client.get_pods_by_namespace("default", label_selector="app=web")
+
+        self.assertEqual([pod.metadata.name for pod in pods], ["a"])
+        self.client.api.list_namespaced_pod.assert_not_called()
+
+    def test_describe_node_falls_back_to_api_when_not_cached(self):
+        self.client._informers["nodes"] = self._synced_informer([  # pylint: disable=protected-access
+            V1Node(metadata=V1ObjectMeta(name="n1"))])
+        self.client.api = MagicMock()
+
+        self.assertEqual(self.client.describe_node("n1").metadata.name, "n1")
+        self.client.api.read_node.assert_not_called()
+
+        self.client.describe_node("n2")
+        self.client.api.read_node.assert_called_once_with("n2")
+
+    def test_get_nodes_falls_back_to_api_before_sync(self):
+        informer = self._synced_informer([])
+        informer.has_synced.return_value = False
+        self.client._informers["nodes"] = informer  # pylint: disable=protected-access
+        self.client.api = MagicMock()
+        self.client.api.list_node.return_value = V1NodeList(items=["node"])
+
+        self.assertEqual(self.client.get_nodes(), ["node"])
+
+    @patch("clients.kubernetes_client.Informer")
+    def test_start_and_stop_informers(self, mock_informer_cls):
+        self.client.start_informers(("nodes",), sync_timeout_seconds=1)
+
+        mock_informer_cls.return_value.start.assert_called_once()
+        mock_informer_cls.return_value.wait_for_sync.assert_called_once_with(1)
+
+        self.client.stop_informers()
+        mock_informer_cls.return_value.stop.assert_called_once()
+        self.assertEqual(self.client._informers, {})  # pylint: disable=protected-access
+
+    def test_start_informers_rejects_unknown_resource(self):
+        with self.assertRaises(ValueError):
+            self.client.start_informers(("services",))
+
+
+if __name__ == "__main__":
+    unittest.main()
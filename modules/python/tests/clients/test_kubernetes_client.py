@@ -3,6 +3,8 @@
 Unit tests for KubernetesClient class
 """
 import itertools
+import json
+import threading
 import unittest
 from unittest import mock
 from unittest.mock import patch, mock_open, MagicMock
@@ -15,11 +17,12 @@ from kubernetes.client.models import (
     V1VolumeAttachment, V1VolumeAttachmentStatus, V1VolumeAttachmentSpec, V1VolumeAttachmentSource,
     V1PodStatus, V1Pod, V1PodSpec, V1Namespace, V1PodCondition,
     V1Service, V1ServiceStatus, V1LoadBalancerStatus, V1LoadBalancerIngress, V1NodeSystemInfo,
-    V1PodList, V1Deployment, V1DeploymentStatus, V1ConfigMap
+    V1PodList, V1Deployment, V1DeploymentStatus, V1ConfigMap, V1ListMeta, V1NodeList
 )
 from kubernetes.client.rest import ApiException
 
 from clients.kubernetes_client import KubernetesClient
+from clients.readiness_watcher import WatchExpiredError
 from utils.constants import UrlConstants
 from utils.logger_config import setup_logging, get_logger
 
@@ -235,6 +238,85 @@ class TestKubernetesClient(unittest.TestCase):
         self.assertEqual(result, mock_node)
         self.assertEqual(result.metadata.name, node_name)
 
+    def test_list_paginated_follows_continue_token(self):
+        """Test that list_paginated requests pages until no continue token is returned."""
+        list_func = MagicMock(side_effect=[
+            V1NodeList(items=["n1", "n2"], metadata=V1ListMeta(_continue="token-1")),
+            V1NodeList(items=["n3"], metadata=V1ListMeta()),
+        ])
+
+        items = list(self.client.list_paginated(list_func, page_size=2, label_selector="a=b", field_selector=None))
+
+        self.assertEqual(items, ["n1", "n2", "n3"])
+        self.assertEqual(list_func.call_args_list, [
+            mock.call(limit=2, label_selector="a=b"),
+            mock.call(limit=2, label_selector="a=b", _continue="token-1"),
+        ])
+
+    def test_list_paginated_with_projection_skips_deserialization(self):
+        """Test that a projection reads raw JSON pages with _preload_content=False."""
+        pages = [
+            {"metadata": {"continue": "next"}, "items": [{"metadata": {"name": "p1"}}]},
+            {"metadata": {}, "items": [{"metadata": {"name": "p2"}}]},
+        ]
+        list_func = MagicMock(side_effect=[MagicMock(data=json.dumps(page).encode()) for page in pages])
+
+        names = list(self.client.list_paginated(list_func, page_size=1,
+                                                projection=lambda item: item["metadata"]["name"]))
+
+        self.assertEqual(names, ["p1", "p2"])
+        list_func.assert_called_with(limit=1, _preload_content=False, _continue="next")
+
+    @patch('kubernetes.client.CoreV1Api.list_node')
+    def test_get_ready_nodes_lightweight(self, mock_list_node):
+        """Test readiness checks on projected nodes from a paginated raw LIST."""
+        ready = {"type": "Ready", "status": "True", "lastTransitionTime": "2026-01-01T00:00:05Z"}
+        body = {"metadata": {}, "items": [
+            {"metadata": {"name": "ready"}, "spec": {}, "status": {"conditions": [ready]}},
+            {"metadata": {"name": "tainted"},
+             "spec": {"taints": [{"key": "node.kubernetes.io/not-ready", "effect": "NoSchedule"}]},
+             "status": {"conditions": [ready]}},
+            {"metadata": {"name": "cordoned"}, "spec": {"unschedulable": True}, "status": {"conditions": [ready]}},
+            {"metadata": {"name": "not-ready"}, "spec": {},
+             "status": {"conditions": [{"type": "Ready", "status": "False"}]}},
+        ]}
+        mock_list_node.return_value = MagicMock(data=json.dumps(body).encode())
+
+        nodes = self.client.get_ready_nodes(label_selector="agentpool=a", lightweight=True)
+
+        self.assertEqual([node.metadata.name for node in nodes], ["ready"])
+        self.assertEqual(nodes[0].status.conditions[0].last_transition_time.isoformat(), "2026-01-01T00:00:05+00:00")
+        mock_list_node.assert_called_once_with(limit=500, _preload_content=False, label_selector="agentpool=a")
+
+    @patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_get_ready_pods_by_namespace_lightweight(self, mock_list_pod):
+        """Test ready pod filtering on projected pods."""
+        body = {"metadata": {}, "items": [
+            {"metadata": {"name": "a"}, "spec": {"nodeName": "n1"},
+             "status": {"phase": "Running", "conditions": [{"type": "Ready", "status": "True"}]}},
+            {"metadata": {"name": "b"}, "status": {"phase": "Pending"}},
+        ]}
+        mock_list_pod.return_value = MagicMock(data=json.dumps(body).encode())
+
+        pods = self.client.get_ready_pods_by_namespace("ns", lightweight=True)
+
+        self.assertEqual([(pod.metadata.name, pod.spec.node_name) for pod in pods], [("a", "n1")])
+
+    @patch('kubernetes.client.StorageV1Api.list_volume_attachment')
+    def test_get_attached_volume_attachments_lightweight(self, mock_list_va):
+        """Test attached volume filtering on projected volume attachments."""
+        body = {"metadata": {}, "items": [
+            {"metadata": {"name": "va1"}, "spec": {"source": {"persistentVolumeName": "pv1"}},
+             "status": {"attached": True}},
+            {"metadata": {"name": "va2"}, "status": {"attached": False}},
+        ]}
+        mock_list_va.return_value = MagicMock(data=json.dumps(body).encode())
+
+        attachments = self.client.get_attached_volume_attachments(lightweight=True)
+
+        self.assertEqual([(va.metadata.name, va.spec.source.persistent_volume_name) for va in attachments],
+                         [("va1", "pv1")])
+
     @patch('kubernetes.client.CoreV1Api.list_node')
     def test_get_nodes_with_label_selector(self, mock_list_node):
         """Test get_nodes method with label selector only."""
@@ -857,6 +939,70 @@ class TestKubernetesClient(unittest.TestCase):
                 namespace='default'
             )
 
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('clients.kubernetes_client.stream')
+    def test_run_pod_exec_command_streaming(self, mock_stream, mock_open_file):
+        """Test streaming exec output to a sink with line callbacks and no accumulation."""
+        mock_resp = MagicMock()
+        mock_resp.is_open.side_effect = [True, True, False]
+        mock_resp.peek_stdout.return_value = True
+        mock_resp.peek_stderr.return_value = False
+        mock_resp.read_stdout.side_effect = ['line one\nline ', 'two\n']
+        mock_stream.return_value = mock_resp
+        sink = MagicMock()
+        lines = []
+
+        result = self.client.run_pod_exec_command(
+            pod_name='test-pod',
+            command='iperf3 -c server',
+            dest_path='/tmp/result.txt',
+            stream_output=True,
+            sink=sink,
+            line_callback=lines.append,
+        )
+
+        self.assertEqual(lines, ['line one', 'line two'])
+        sink.write.assert_called_once_with(b'line one\nline two\n')
+        self.assertEqual(result, 'line one\nline two\n')
+        mock_open_file.assert_not_called()
+        mock_resp.close.assert_called_once()
+
+    @patch('clients.kubernetes_client.stream')
+    def test_run_pod_exec_command_streaming_error(self, mock_stream):
+        """Test that stderr output still raises in streaming mode."""
+        mock_resp = MagicMock()
+        mock_resp.is_open.return_value = True
+        mock_resp.peek_stdout.return_value = False
+        mock_resp.peek_stderr.return_value = True
+        mock_resp.read_stderr.return_value = 'boom'
+        mock_stream.return_value = mock_resp
+
+        with self.assertRaises(Exception) as context:
+            self.client.run_pod_exec_command(pod_name='test-pod', command='false', stream_output=True)
+
+        self.assertIn('boom', str(context.exception))
+        mock_resp.close.assert_called_once()
+
+    @patch('kubernetes.client.CoreV1Api.read_namespaced_pod_log')
+    def test_stream_pod_logs(self, mock_read_log):
+        """Test streaming pod logs chunk by chunk to a sink."""
+        mock_resp = MagicMock()
+        mock_resp.stream.return_value = iter([b'# nccl\n', b'#  size  time\n'])
+        mock_read_log.return_value = mock_resp
+        sink = MagicMock()
+        lines = []
+
+        streamed = self.client.stream_pod_logs('launcher', namespace='mpi-operator', dest=sink,
+                                               line_callback=lines.append, chunk_size=1024)
+
+        self.assertEqual(streamed, 21)
+        self.assertEqual(lines, ['# nccl', '#  size  time'])
+        sink.write.assert_called_once_with(b'# nccl\n#  size  time\n')
+        mock_resp.stream.assert_called_once_with(1024)
+        mock_resp.release_conn.assert_called_once()
+        mock_read_log.assert_called_once_with(name='launcher', namespace='mpi-operator', container=None,
+                                              _preload_content=False)
+
     @patch('clients.kubernetes_client.KubernetesClient.get_pod_logs')
     def test_get_pod_logs(self, mock_get_pod_logs):
         """Test getting pod logs."""
@@ -1181,7 +1327,7 @@ class TestKubernetesClient(unittest.TestCase):
         node_count = 2
         timeout = 0.01
 
-        nodes = self.client.wait_for_nodes_ready(node_count, timeout)
+        nodes = self.client.wait_for_nodes_ready(node_count, timeout, use_watch=False)
 
         self.assertEqual(mock_get_ready_nodes.call_count, 2)
         self.assertEqual(len(nodes), node_count)
@@ -1198,11 +1344,86 @@ class TestKubernetesClient(unittest.TestCase):
         timeout = 0.01
 
         with self.assertRaises(Exception) as context:
-            self.client.wait_for_nodes_ready(node_count, timeout)
+            self.client.wait_for_nodes_ready(node_count, timeout, use_watch=False)
 
         self.assertIn("Only 1 nodes are ready, expected 2 nodes!", str(context.exception))
         mock_sleep.assert_called()
 
+    @patch('clients.kubernetes_client.ReadinessWatcher')
+    def test_wait_for_nodes_ready_with_watch(self, mock_watcher_cls):
+        """Test that waiting for nodes uses the watch engine by default."""
+        watcher = mock_watcher_cls.return_value
+        watcher.wait.return_value = True
+        watcher.ready_objects.return_value = ["node1", "node2"]
+        watcher.ready_times = {"node1": 10.0, "node2": 12.0}
+        ready_timestamps = {}
+
+        nodes = self.client.wait_for_nodes_ready(2, 1, label_selector="pool=a",
+                                                 ready_timestamps=ready_timestamps)
+
+        self.assertEqual(nodes, ["node1", "node2"])
+        self.assertEqual(ready_timestamps, {"node1": 10.0, "node2": 12.0})
+        _, kwargs = mock_watcher_cls.call_args
+        self.assertEqual(kwargs, {"label_selector": "pool=a"})
+        self.assertEqual(watcher.wait.call_args[0][0], 2)
+
+    @patch('clients.kubernetes_client.KubernetesClient.get_ready_nodes')
+    @patch('clients.kubernetes_client.ReadinessWatcher')
+    @patch("time.sleep", return_value=None)
+    def test_wait_for_nodes_ready_watch_expired_falls_back_to_polling(
+        self, mock_sleep, mock_watcher_cls, mock_get_ready_nodes
+    ):
+        """Test that a 410 Gone watch falls back to the polling loop."""
+        watcher = mock_watcher_cls.return_value
+        watcher.wait.side_effect = WatchExpiredError("expired")
+        watcher.ready_times = {}
+        mock_get_ready_nodes.return_value = ["node1"]
+
+        nodes = self.client.wait_for_nodes_ready(1, 1, use_watch=True)
+
+        self.assertEqual(nodes, ["node1"])
+        mock_get_ready_nodes.assert_called_once_with(label_selector=None)
+        mock_sleep.assert_not_called()
+
+    @patch('clients.kubernetes_client.ReadinessWatcher')
+    def test_wait_for_nodes_ready_with_watch_timeout(self, mock_watcher_cls):
+        """Test that the watch engine raises when the target is not reached in time."""
+        watcher = mock_watcher_cls.return_value
+        watcher.wait.return_value = False
+        watcher.ready = {"node1"}
+        watcher.ready_times = {}
+
+        with self.assertRaises(Exception) as context:
+            self.client.wait_for_nodes_ready(2, 1, use_watch=True)
+
+        self.assertIn("Only 1 nodes are ready, expected 2 nodes!", str(context.exception))
+
+    @patch('clients.kubernetes_client.ReadinessWatcher')
+    def test_wait_for_pods_ready_with_watch_no_pods(self, mock_watcher_cls):
+        """Test that the watch engine raises when no pods match a dynamic count."""
+        mock_watcher_cls.return_value.objects = {}
+
+        with self.assertRaises(Exception) as context:
+            self.client.wait_for_pods_ready(1, namespace="ns", label_selector="app=x")
+
+        self.assertIn("No pods found with selector 'app=x' in namespace 'ns'", str(context.exception))
+
+    @patch('clients.kubernetes_client.ReadinessWatcher')
+    def test_wait_for_pods_ready_records_timeline(self, mock_watcher_cls):
+        """Test that the ready pods are recorded into a caller-supplied timeline."""
+        pods = [MagicMock(), MagicMock()]
+        watcher = mock_watcher_cls.return_value
+        watcher.objects = {"pod1": pods[0], "pod2": pods[1]}
+        watcher.wait.return_value = True
+        watcher.ready_objects.return_value = pods
+        watcher.ready_times = {}
+        timeline = MagicMock()
+
+        result = self.client.wait_for_pods_ready(1, namespace="ns", pod_count=2, timeline=timeline)
+
+        self.assertEqual(result, pods)
+        timeline.record_all.assert_called_once_with(pods)
+
     @patch('clients.kubernetes_client.KubernetesClient.get_pods_by_namespace')
     @patch('clients.kubernetes_client.KubernetesClient.get_ready_pods_by_namespace')
     @patch("time.sleep", return_value=None)
@@ -1218,6 +1439,7 @@ class TestKubernetesClient(unittest.TestCase):
             pod_count=pod_count,
             operation_timeout_in_minutes=timeout,
             namespace=namespace,
+            use_watch=False,
         )
 
         self.assertEqual(len(pods), pod_count)
@@ -1243,7 +1465,8 @@ class TestKubernetesClient(unittest.TestCase):
                 pod_count=pod_count,
                 operation_timeout_in_minutes=timeout_minutes,
                 namespace="default",
-                label_selector="app=test"
+                label_selector="app=test",
+                use_watch=False,
             )
 
         self.assertIn("Only 1 pods are ready, expected 2 pods!", str(context.exception))
@@ -1644,28 +1867,86 @@ class TestKubernetesClient(unittest.TestCase):
           field_selector="spec.nodeName=node-1"
         )
 
-    @patch('kubernetes.config.load_kube_config')
-    def test_set_context(self, mock_load_kube_config):
+    @patch('kubernetes.config.new_client_from_config')
+    def test_set_context(self, mock_new_client_from_config):
         """Test setting Kubernetes context."""
         context_name = "test-context"
         self.client.set_context(context_name)
-        mock_load_kube_config.assert_called_with(
+        mock_new_client_from_config.assert_called_with(
             config_file=None, context=context_name)
+        self.assertIs(self.client.api.api_client, mock_new_client_from_config.return_value)
+        self.assertEqual(self.client.current_context, context_name)
 
-    @patch('kubernetes.config.load_kube_config')
-    def test_set_context_failure(self, mock_load_kube_config):
+    @patch('kubernetes.config.new_client_from_config')
+    def test_set_context_reuses_pooled_client(self, mock_new_client_from_config):
+        """Test that switching back to a context does not reload the kubeconfig."""
+        client_ctx, server_ctx = MagicMock(), MagicMock()
+        mock_new_client_from_config.side_effect = [client_ctx, server_ctx]
+
+        self.client.set_context("client-context")
+        self.client.set_context("server-context")
+        self.client.set_context("client-context")
+
+        self.assertEqual(mock_new_client_from_config.call_count, 2)
+        self.assertIs(self.client.api.api_client, client_ctx)
+        self.assertIs(self.client.batch.api_client, client_ctx)
+
+    @patch('kubernetes.config.new_client_from_config')
+    def test_set_context_failure(self, mock_new_client_from_config):
         """Test setting Kubernetes context with failure."""
         context_name = "non-existent-context"
-        mock_load_kube_config.side_effect = Exception("Failed to load context")
+        mock_new_client_from_config.side_effect = Exception("Failed to load context")
 
         with self.assertRaises(Exception) as context:
             self.client.set_context(context_name)
 
         self.assertIn(
             f"Failed to switch to context {context_name}", str(context.exception))
-        mock_load_kube_config.assert_called_with(
+        mock_new_client_from_config.assert_called_with(
             config_file=None, context=context_name)
 
+    @patch('kubernetes.config.new_client_from_config')
+    def test_for_context_does_not_change_original_client(self, mock_new_client_from_config):
+        """Test that for_context returns an independent client sharing the context pool."""
+        original_api = self.client.api
+
+        server_client = self.client.for_context("server-context")
+        server_client_again = self.client.for_context("server-context")
+
+        self.assertIs(self.client.api, original_api)
+        self.assertIsNone(self.client.current_context)
+        self.assertEqual(server_client.current_context, "server-context")
+        self.assertIs(server_client.app.api_client, mock_new_client_from_config.return_value)
+        self.assertIs(server_client_again.api.api_client, server_client.api.api_client)
+        mock_new_client_from_config.assert_called_once_with(config_file=None, context="server-context")
+
+    @patch('kubernetes.config.new_client_from_config')
+    def test_set_token_provider_only_for_kubelogin_users(self, mock_new_client_from_config):
+        """Test that kubelogin users get bearer tokens from the provider and other users are untouched."""
+        kubeconfig = {
+            "current-context": "aad",
+            "contexts": [
+                {"name": "aad", "context": {"cluster": "c1", "user": "aad-user"}},
+                {"name": "cert", "context": {"cluster": "c2", "user": "cert-user"}},
+            ],
+            "users": [
+                {"name": "aad-user", "user": {"exec": {"command": "/usr/local/bin/kubelogin"}}},
+                {"name": "cert-user", "user": {"client-certificate-data": "abc"}},
+            ],
+        }
+        cert_client = client.ApiClient(client.Configuration())
+        mock_new_client_from_config.return_value = cert_client
+        tokens = iter(["token-1", "token-2"])
+
+        with patch("builtins.open", mock_open(read_data=json.dumps(kubeconfig))):
+            self.assertTrue(self.client.set_token_provider(lambda: next(tokens)))
+        self.client.for_context("cert")
+
+        configuration = self.client.api_client.configuration
+        self.assertEqual(configuration.get_api_key_with_prefix("authorization"), "Bearer token-1")
+        self.assertEqual(configuration.get_api_key_with_prefix("authorization"), "Bearer token-2")
+        self.assertIsNone(cert_client.configuration.refresh_api_key_hook)
+
     @patch('clients.kubernetes_client.KubernetesClient.get_pods_by_namespace')
     def test_get_pods_name_and_ip(self, mock_get_pods):
         """Test getting pod names and IPs."""
@@ -1951,7 +2232,7 @@ class TestKubernetesClient(unittest.TestCase):
         timeout = 60
 
         # Mock time progression to exceed timeout - provide enough values
-        mock_time.side_effect = [0, 0, 30, 65, 70, 75]  # Provide more values to avoid StopIteration
+        mock_time.side_effect = itertools.count(0, 10)  # Every clock read advances 10 seconds
 
         # Mock DaemonSet that never becomes ready
         mock_daemonset = MagicMock()
@@ -1997,7 +2278,7 @@ class TestKubernetesClient(unittest.TestCase):
             namespace=namespace
         )
 
-    @patch("time.sleep", return_value=None)
+    @patch("clients.kubernetes_client.watch.Watch")
     @patch("clients.kubernetes_client.KubernetesClient.get_pod_logs")
     @patch("kubernetes.client.CoreV1Api.delete_namespaced_pod")
     @patch("kubernetes.client.CoreV1Api.read_namespaced_pod")
@@ -2010,7 +2291,7 @@ class TestKubernetesClient(unittest.TestCase):
         mock_read_pod,
         _mock_delete_pod,
         mock_get_logs,
-        mock_sleep
+        mock_watch
     ):
         """Test successful nvidia-smi verification."""
         node = MagicMock()
@@ -2020,18 +2301,23 @@ class TestKubernetesClient(unittest.TestCase):
         # Mock describe_node to return the node with GPU allocation
         mock_describe_node.return_value = node
 
-        # Simulate pod status: first Pending, then Succeeded
-        mock_read_pod.side_effect = [
-            MagicMock(status=MagicMock(phase="Pending")),
-            MagicMock(status=MagicMock(phase="Succeeded")),
-        ]
+        # Simulate pod status: first Pending, then Succeeded through the watch
+        mock_read_pod.return_value = MagicMock(status=MagicMock(phase="Pending"))
+        mock_watch.return_value.stream.return_value = iter([
+            {"type": "MODIFIED", "object": MagicMock(status=MagicMock(phase="Running"))},
+            {"type": "MODIFIED", "object": MagicMock(status=MagicMock(phase="Succeeded"))},
+        ])
         mock_get_logs.return_value = "NVIDIA-SMI GPU driver info"
+        timings = {}
 
-        result = self.client.verify_nvidia_smi_on_node([node])
+        result = self.client.verify_nvidia_smi_on_node([node], timings=timings)
 
         self.assertIn("gpu-node-1", result)
         self.assertTrue(result["gpu-node-1"]["device_status"])
-        mock_sleep.assert_called()
+        mock_read_pod.assert_called_once()
+        mock_watch.return_value.stop.assert_called_once()
+        self.assertEqual(set(timings["gpu-node-1"]),
+                         {"gpu_allocatable_wait_seconds", "pod_completion_seconds", "total_seconds"})
 
         # Verify that the pod was created with 1 GPU requested for validation
         pod_spec = mock_create_pod.call_args[1]['body']
@@ -2157,10 +2443,7 @@ class TestKubernetesClient(unittest.TestCase):
 
         # First describe (pre-loop) sees 0; after one wait iteration it sees 56.
         mock_describe_node.side_effect = [zero_node, ready_node]
-        mock_read_pod.side_effect = [
-            MagicMock(status=MagicMock(phase="Pending")),
-            MagicMock(status=MagicMock(phase="Succeeded")),
-        ]
+        mock_read_pod.return_value = MagicMock(status=MagicMock(phase="Succeeded"))
         mock_get_logs.return_value = "NVIDIA-SMI GPU driver info"
 
         result = self.client.verify_nvidia_smi_on_node([zero_node])
@@ -2172,6 +2455,71 @@ class TestKubernetesClient(unittest.TestCase):
         pod_spec = mock_create_pod.call_args[1]["body"]
         self.assertEqual(pod_spec.spec.containers[0].resources.limits["nvidia.com/gpu"], "1")
 
+    @patch("clients.kubernetes_client.KubernetesClient._verify_nvidia_smi_single_node")
+    def test_verify_nvidia_smi_runs_nodes_concurrently(self, mock_verify_single):
+        """Test that nodes are verified concurrently and results keep the node order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def verify_single(node_name, _namespace, _timings):
+            barrier.wait()  # Only passes if all three nodes are in flight at once
+            return None if node_name == "cpu" else {"pod_name": f"pod-{node_name}", "logs": "", "device_status": True}
+
+        mock_verify_single.side_effect = verify_single
+        nodes = []
+        for name in ("b", "cpu", "a"):
+            node = MagicMock()
+            node.metadata.name = name
+            nodes.append(node)
+
+        result = self.client.verify_nvidia_smi_on_node(nodes, max_workers=3)
+
+        self.assertEqual(list(result), ["b", "a"])
+        self.assertEqual(result["a"]["pod_name"], "pod-a")
+
+    @patch("time.sleep", return_value=None)
+    @patch("clients.kubernetes_client.watch.Watch")
+    @patch("kubernetes.client.CoreV1Api.read_namespaced_pod")
+    def test_wait_for_pod_completion_polls_after_watch_expired(self, mock_read_pod, mock_watch, _mock_sleep):
+        """Test that an expired watch falls back to polling the pod."""
+        mock_read_pod.side_effect = [
+            MagicMock(status=MagicMock(phase="Pending")),
+            MagicMock(status=MagicMock(phase="Failed")),
+        ]
+        mock_watch.return_value.stream.side_effect = ApiException(status=410)
+
+        pod = self.client._wait_for_pod_completion("p", "default")  # pylint: disable=protected-access
+
+        self.assertEqual(pod.status.phase, "Failed")
+        self.assertEqual(mock_read_pod.call_count, 2)
+
+    @patch("clients.kubernetes_client.watch.Watch")
+    @patch("clients.kubernetes_client.KubernetesClient.get_pod_logs")
+    @patch("kubernetes.client.CoreV1Api.delete_namespaced_pod")
+    @patch("kubernetes.client.CoreV1Api.read_namespaced_pod")
+    @patch("kubernetes.client.CoreV1Api.create_namespaced_pod")
+    def test_verify_managed_gpu_systemd_services(
+        self, _mock_create_pod, mock_read_pod, mock_delete_pod, mock_get_logs, mock_watch
+    ):
+        """Test systemd service verification keeps its result shape and times out without completion."""
+        mock_read_pod.return_value = MagicMock(status=MagicMock(phase="Succeeded"))
+        mock_get_logs.return_value = ("nvidia-dcgm: active\nnvidia-dcgm-exporter: active\n"
+                                      "nvidia-device-plugin: inactive\n")
+        node = MagicMock()
+        node.metadata.name = "gpu-node"
+        timings = {}
+
+        result = self.client.verify_managed_gpu_systemd_services([node], timings=timings)
+
+        self.assertEqual(set(result["gpu-node"]), {"pod_name", "logs", "all_services_active"})
+        self.assertFalse(result["gpu-node"]["all_services_active"])
+        self.assertIn("total_seconds", timings["gpu-node"])
+        mock_delete_pod.assert_called_once()
+
+        mock_read_pod.return_value = MagicMock(status=MagicMock(phase="Running"))
+        mock_watch.return_value.stream.return_value = iter([])
+        with self.assertRaises(TimeoutError):
+            self.client.verify_managed_gpu_systemd_services([node])
+
     @patch("kubernetes.client.AppsV1Api.create_namespaced_daemon_set")
     @patch("requests.get")
     def test_install_gpu_device_plugin_success(self, mock_requests_get, mock_create_ds):
@@ -2248,6 +2596,145 @@ spec: {}
             field_selector="spec.nodeName=node-1"
         )
 
+    def test_group_manifests_by_tier(self):
+        """Test that manifests are grouped into dependency tiers in their original order."""
+        manifests = [
+            {"kind": "Deployment", "metadata": {"name": "app"}},
+            {"kind": "ClusterRole", "metadata": {"name": "role"}},
+            {"kind": "Namespace", "metadata": {"name": "ns"}},
+            {"kind": "CustomResourceDefinition", "metadata": {"name": "crd"}},
+            {"kind": "Stage", "metadata": {"name": "stage"}},
+        ]
+
+        tiers = self.client._group_manifests_by_tier(manifests)  # pylint: disable=protected-access
+
+        self.assertEqual([[m["metadata"]["name"] for m in tier] for tier in tiers],
+                         [["ns", "crd"], ["role"], ["app", "stage"]])
+
+    @patch('clients.kubernetes_client.KubernetesClient._apply_single_manifest')
+    def test_apply_manifests_bulk_applies_tiers_in_order(self, mock_apply_single):
+        """Test bulk apply runs every tier and reports per-object latency."""
+        manifests = [
+            {"kind": "Deployment", "metadata": {"name": "app", "namespace": "ns"}},
+            {"kind": "ServiceAccount", "metadata": {"name": "sa", "namespace": "ns"}},
+            {"kind": "Namespace", "metadata": {"name": "ns"}},
+        ]
+
+        results = self.client.apply_manifests_bulk(manifests, namespace="ns", max_workers=4)
+
+        applied = [c.args[0]["metadata"]["name"] for c in mock_apply_single.call_args_list]
+        self.assertEqual(applied, ["ns", "sa", "app"])
+        mock_apply_single.assert_any_call(manifests[0], namespace="ns")
+        self.assertEqual([(r["name"], r["tier"]) for r in results], [("ns", 0), ("sa", 1), ("app", 2)])
+        self.assertTrue(all(r["error"] is None and r["latency_seconds"] >= 0 for r in results))
+
+    @patch('clients.kubernetes_client.KubernetesClient._apply_single_manifest')
+    def test_apply_manifests_bulk_stops_after_failed_tier(self, mock_apply_single):
+        """Test that a failure in one tier is reported and later tiers are not applied."""
+        def apply_single(manifest, namespace=None):  # pylint: disable=unused-argument
+            if manifest["kind"] == "Namespace":
+                raise Exception("boom")
+
+        mock_apply_single.side_effect = apply_single
+        manifests = [
+            {"kind": "Namespace", "metadata": {"name": "ns"}},
+            {"kind": "Deployment", "metadata": {"name": "app"}},
+        ]
+
+        with self.assertRaises(Exception) as context:
+            self.client.apply_manifests_bulk(manifests)
+
+        self.assertIn("Namespace/ns: boom", str(context.exception))
+        mock_apply_single.assert_called_once()
+
+    @patch('clients.kubernetes_client.KubernetesClient._delete_single_manifest')
+    def test_delete_manifests_bulk_reverses_tiers(self, mock_delete_single):
+        """Test bulk delete removes workloads before the namespace they live in."""
+        manifests = [
+            {"kind": "Namespace", "metadata": {"name": "ns"}},
+            {"kind": "Deployment", "metadata": {"name": "app"}},
+        ]
+
+        self.client.delete_manifests_bulk(manifests, ignore_not_found=False)
+
+        deleted = [c.args[0]["metadata"]["name"] for c in mock_delete_single.call_args_list]
+        self.assertEqual(deleted, ["app", "ns"])
+        mock_delete_single.assert_any_call(manifests[0], ignore_not_found=False, namespace=None)
+
+    @patch('clients.kubernetes_client.KubernetesClient.apply_manifests_bulk')
+    @patch('requests.get')
+    def test_apply_manifest_from_url_parallel(self, mock_requests_get, mock_apply_bulk):
+        """Test that parallel=True routes the expanded manifests to apply_manifests_bulk."""
+        mock_requests_get.return_value.text = "kind: Namespace\nmetadata:\n  name: ns\n"
+
+        self.client.apply_manifest_from_url("https://example.com/manifest.yaml", parallel=True, max_workers=3)
+
+        mock_apply_bulk.assert_called_once_with(
+            [{"kind": "Namespace", "metadata": {"name": "ns"}}], namespace=None, max_workers=3, server_side=False)
+
+    @patch('clients.kubernetes_client.dynamic.DynamicClient')
+    def test_server_side_apply_manifest_namespaced(self, mock_dynamic_client):
+        """Test server-side apply sends one apply patch with the namespace override and field manager."""
+        dyn = mock_dynamic_client.return_value
+        resource = dyn.resources.get.return_value
+        resource.namespaced = True
+        manifest = {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": {"name": "app", "namespace": "a"}}
+
+        self.client.server_side_apply_manifest(manifest, namespace="b")
+
+        mock_dynamic_client.assert_called_once_with(self.client.api_client)
+        dyn.resources.get.assert_called_once_with(api_version="apps/v1", kind="Deployment")
+        dyn.server_side_apply.assert_called_once_with(
+            resource, body={"apiVersion": "apps/v1", "kind": "Deployment",
+                            "metadata": {"name": "app", "namespace": "b"}},
+            name="app", namespace="b", field_manager="telescope", force_conflicts=True)
+        self.assertEqual(manifest["metadata"]["namespace"], "a")
+
+    @patch('clients.kubernetes_client.dynamic.DynamicClient')
+    def test_server_side_apply_manifest_cluster_scoped_custom_kind(self, mock_dynamic_client):
+        """Test that kinds outside the create/update chain are applied through discovery."""
+        dyn = mock_dynamic_client.return_value
+        dyn.resources.get.return_value.namespaced = False
+        manifest = {"apiVersion": "example.com/v1", "kind": "Widget", "metadata": {"name": "w"}}
+
+        self.client.server_side_apply_manifest(manifest, namespace="ignored")
+        self.client.server_side_apply_manifest(manifest)
+
+        mock_dynamic_client.assert_called_once()
+        self.assertEqual(dyn.server_side_apply.call_args.kwargs["namespace"], None)
+        self.assertEqual(dyn.server_side_apply.call_count, 2)
+
+    @patch('clients.kubernetes_client.dynamic.DynamicClient')
+    def test_server_side_apply_manifest_error(self, mock_dynamic_client):
+        """Test that API errors are wrapped with the object kind and name."""
+        mock_dynamic_client.return_value.server_side_apply.side_effect = Exception("conflict")
+        manifest = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "cm"}}
+
+        with self.assertRaises(Exception) as context:
+            self.client.server_side_apply_manifest(manifest)
+
+        self.assertIn("Error applying ConfigMap cm", str(context.exception))
+
+    @patch('clients.kubernetes_client.KubernetesClient._apply_single_manifest')
+    @patch('clients.kubernetes_client.KubernetesClient.server_side_apply_manifest')
+    def test_apply_manifest_from_file_server_side(self, mock_server_side_apply, mock_apply_single):
+        """Test that server_side=True bypasses the create/update path."""
+        manifest = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "cm"}}
+
+        self.client.apply_manifest_from_file(manifest_dict=manifest, server_side=True)
+
+        mock_server_side_apply.assert_called_once_with(manifest, namespace=None)
+        mock_apply_single.assert_not_called()
+
+    @patch('kubernetes.client.RbacAuthorizationV1Api')
+    def test_rbac_api_instance_is_reused(self, mock_rbac_api):
+        """Test that applying several RBAC objects builds the RBAC API client once."""
+        self.client._apply_single_manifest({"kind": "ClusterRole", "metadata": {"name": "a"}})  # pylint: disable=protected-access
+        self.client._apply_single_manifest({"kind": "ClusterRole", "metadata": {"name": "b"}})  # pylint: disable=protected-access
+
+        mock_rbac_api.assert_called_once_with(self.client.api_client)
+        self.assertEqual(mock_rbac_api.return_value.create_cluster_role.call_count, 2)
+
     @patch('requests.get')
     @patch('clients.kubernetes_client.KubernetesClient._apply_single_manifest')
     def test_apply_manifest_from_url_success_single_document(self, mock_apply_single,
@@ -84,7 +84,8 @@ class TestPodRoleCommand(unittest.TestCase):
             command="test-command",
             container_name="client-container",
             dest_path="/tmp/result.txt",
-            namespace=self.namespace
+            namespace=self.namespace,
+            stream_output=True,
         )
 
     @patch('clients.pod_command.execute_with_retries')
@@ -109,9 +110,24 @@ class TestPodRoleCommand(unittest.TestCase):
             command="test-command",
             container_name="server-container",
             dest_path="/tmp/result.txt",
-            namespace=self.namespace
+            namespace=self.namespace,
+            stream_output=True,
+        )
+
+    @patch('clients.pod_command.execute_with_retries')
+    def test_run_command_for_role_without_result_file_returns_full_output(self, mock_execute_with_retries):
+        self.pod_cmd.k8s_client.get_pod_name_and_ip.return_value = {
+            "name": "client-pod", "ip": "10.0.0.2"}
+
+        self.pod_cmd.run_command_for_role(
+            role="client",
+            command="test-command",
+            result_file=""
         )
 
+        _, kwargs = mock_execute_with_retries.call_args
+        self.assertFalse(kwargs["stream_output"])
+
     def test_run_command_for_role_invalid_role(self):
         with self.assertRaises(ValueError) as context:
             self.pod_cmd.run_command_for_role(
@@ -167,7 +183,8 @@ class TestPodRoleCommand(unittest.TestCase):
                 command="validate-cmd",
                 container_name="client-container",
                 dest_path="",
-                namespace=self.namespace
+                namespace=self.namespace,
+                stream_output=False,
             ),
             call(
                 self.k8s_client.run_pod_exec_command,
@@ -175,7 +192,8 @@ class TestPodRoleCommand(unittest.TestCase):
                 command="validate-cmd",
                 container_name="server-container",
                 dest_path="",
-                namespace=self.namespace
+                namespace=self.namespace,
+                stream_output=False,
             )
         ]
         mock_execute_with_retries.assert_has_calls(execute_calls)
@@ -0,0 +1,88 @@
+"""
+Unit tests for ReadinessWatcher
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.models import V1ListMeta, V1Node, V1NodeList, V1ObjectMeta
+from kubernetes.client.rest import ApiException
+
+from clients.readiness_watcher import ReadinessWatcher, WatchExpiredError
+
+
+def _node(name, ready, resource_version="1"):
+    node = V1Node(metadata=V1ObjectMeta(name=name, resource_version=resource_version))
+    node.ready = ready
+    return node
+
+
+def _node_list(nodes, resource_version="100"):
+    return V1NodeList(items=nodes, metadata=V1ListMeta(resource_version=resource_version))
+
+
+class TestReadinessWatcher(unittest.TestCase):
+    """Tests for the list-then-watch readiness tracker."""
+
+    def setUp(self):
+        self.list_func = MagicMock()
+        self.watcher = ReadinessWatcher(self.list_func, lambda node: node.ready,
+                                        label_selector="pool=a", field_selector=None)
+
+    def test_list_kwargs_drop_none(self):
+        self.assertEqual(self.watcher.list_kwargs, {"label_selector": "pool=a"})
+
+    @patch("clients.readiness_watcher.watch.Watch")
+    def test_wait_returns_without_watch_when_list_is_ready(self, mock_watch):
+        self.list_func.return_value = _node_list([_node("n1", True), _node("n2", True)])
+
+        self.assertTrue(self.watcher.wait(2, 60))
+
+        self.list_func.assert_called_once_with(label_selector="pool=a")
+        mock_watch.assert_not_called()
+        self.assertEqual(set(self.watcher.ready_times), {"n1", "n2"})
+
+    @patch("clients.readiness_watcher.watch.Watch")
+    def test_wait_follows_watch_events(self, mock_watch):
+        self.list_func.return_value = _node_list([_node("n1", True), _node("n2", False)])
+        mock_watch.return_value.stream.return_value = iter([
+            {"type": "MODIFIED", "object": _node("n2", True, "101")},
+            {"type": "ADDED", "object": _node("n3", False, "102")},
+        ])
+
+        self.assertTrue(self.watcher.wait(2, 60))
+
+        _, kwargs = mock_watch.return_value.stream.call_args
+        self.assertEqual(kwargs["resource_version"], "100")
+        self.assertEqual(kwargs["label_selector"], "pool=a")
+        mock_watch.return_value.stop.assert_called_once()
+        self.assertEqual([n.metadata.name for n in self.watcher.ready_objects()], ["n1", "n2"])
+        self.assertEqual(self.watcher.resource_version, "101")
+
+    @patch("clients.readiness_watcher.watch.Watch")
+    def test_deleted_event_removes_ready_object(self, mock_watch):
+        self.list_func.return_value = _node_list([_node("n1", True), _node("n2", False)])
+        mock_watch.return_value.stream.return_value = iter([
+            {"type": "DELETED", "object": _node("n2", False, "101")},
+        ])
+
+        self.assertTrue(self.watcher.wait(None, 60))
+        self.assertEqual(list(self.watcher.objects), ["n1"])
+
+    @patch("clients.readiness_watcher.watch.Watch")
+    def test_wait_raises_watch_expired_on_410(self, mock_watch):
+        self.list_func.return_value = _node_list([_node("n1", False)])
+        mock_watch.return_value.stream.side_effect = ApiException(status=410, reason="Gone")
+
+        with self.assertRaises(WatchExpiredError):
+            self.watcher.wait(1, 60)
+
+    @patch("clients.readiness_watcher.time.time")
+    def test_wait_returns_false_on_timeout(self, mock_time):
+        mock_time.side_effect = [1000, 2000]
+        self.list_func.return_value = _node_list([_node("n1", False)])
+
+        self.assertFalse(self.watcher.wait(1, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
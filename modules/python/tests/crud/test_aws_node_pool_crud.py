@@ -164,6 +164,7 @@ class TestAWSNodePoolCRUD(unittest.TestCase):  # pylint: disable=too-many-public
             gpu_node_group=False,
             progressive=False,
             scale_step_size=1,
+            pipelined=False,
         )
 
     def test_scale_node_group_progressive(self):
@@ -198,6 +199,7 @@ class TestAWSNodePoolCRUD(unittest.TestCase):  # pylint: disable=too-many-public
             gpu_node_group=False,
             progressive=True,
             scale_step_size=scale_step_size,
+            pipelined=False,
         )
 
     def test_scale_node_group_failure(self):
@@ -451,6 +453,7 @@ class TestAWSNodePoolCRUD(unittest.TestCase):  # pylint: disable=too-many-public
             gpu_node_group=True,
             progressive=False,
             scale_step_size=1,
+            pipelined=False,
         )
 
     def test_all_operations_scale_failure_continues_to_delete(self):
@@ -20,6 +20,11 @@ class TestAzureNodePoolCRUD(unittest.TestCase):
         self.mock_aks_client = mock_aks_client_cls.return_value
         self.mock_aks_client.get_cluster_name.return_value = "fake-cluster"
 
+        # Workload creation records an Operation per workload instance
+        self.operation_context_patcher = mock.patch("crud.azure.node_pool_crud.OperationContext")
+        self.mock_operation_context = self.operation_context_patcher.start()
+        self.mock_operation = self.mock_operation_context.return_value.__enter__.return_value
+
         # Create test directory for result files
         self.test_result_dir = "/tmp/test_results"
         os.makedirs(self.test_result_dir, exist_ok=True)
@@ -35,6 +40,7 @@ class TestAzureNodePoolCRUD(unittest.TestCase):
         """Clean up after tests"""
         # Stop patches
         self.aks_client_patcher.stop()
+        self.operation_context_patcher.stop()
 
         try:
             os.rmdir(self.test_result_dir)
@@ -113,6 +119,7 @@ class TestAzureNodePoolCRUD(unittest.TestCase):
             enable_managed_gpu=False,
             progressive=False,
             scale_step_size=1,
+            pipelined=False,
             gpu_instance_profile=None,
             gpu_mig_strategy=None,
         )
@@ -143,6 +150,7 @@ class TestAzureNodePoolCRUD(unittest.TestCase):
             enable_managed_gpu=False,
             progressive=False,
             scale_step_size=1,
+            pipelined=False,
             gpu_instance_profile=None,
             gpu_mig_strategy=None,
         )
@@ -265,6 +273,30 @@ class TestAzureNodePoolCRUD(unittest.TestCase):
         # Verify time.sleep was NOT called (no operations after create)
         mock_time.sleep.assert_not_called()
 
+    @mock.patch("crud.azure.node_pool_crud.get_teardown_queue")
+    @mock.patch("crud.azure.node_pool_crud.time")
+    def test_all_background_delete_queues_deletion(self, _mock_time, mock_get_queue):
+        """Test that all() queues the delete instead of waiting when background_delete is set"""
+        self.node_pool_crud.create_node_pool = mock.MagicMock(return_value=True)
+        self.node_pool_crud.scale_node_pool = mock.MagicMock(return_value=True)
+        self.node_pool_crud.delete_node_pool = mock.MagicMock(return_value=True)
+
+        result = self.node_pool_crud.all(
+            node_pool_name="test-pool",
+            vm_size="Standard_DS2_v2",
+            node_count=1,
+            target_count=3,
+            background_delete=True,
+        )
+
+        self.assertTrue(result)
+        self.node_pool_crud.delete_node_pool.assert_not_called()
+        mock_get_queue.return_value.submit.assert_called_once_with(
+            "delete node pool test-pool",
+            self.node_pool_crud.delete_node_pool,
+            kwargs={"node_pool_name": "test-pool"},
+        )
+
     @mock.patch("crud.azure.node_pool_crud.time")
     def test_all_scale_up_fails_continues(self, mock_time):
         """Test that all() continues to scale down and delete when scale up fails"""
@@ -350,6 +382,26 @@ class TestAzureNodePoolCRUD(unittest.TestCase):
         # Verify
         self.assertTrue(result)
 
+    def test_create_deployment_records_pod_readiness(self):
+        """Test that each deployment's pod readiness percentiles are recorded in its operation"""
+        mock_k8s_client = mock.MagicMock()
+        self.mock_aks_client.k8s_client = mock_k8s_client
+        mock_k8s_client.create_template.return_value = "apiVersion: apps/v1\nkind: Deployment\n"
+        mock_k8s_client.wait_for_condition.return_value = True
+
+        result = self.node_pool_crud.create_deployment(node_pool_name="test-pool", replicas=4)
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_operation_context.call_args[0][0], "create_deployment")
+        self.assertEqual(self.mock_operation_context.call_args[0][2]["node_pool_name"], "test-pool")
+        timeline = mock_k8s_client.wait_for_pods_ready.call_args.kwargs["timeline"]
+        self.assertIsNotNone(timeline)
+        readiness = next(
+            c.args[1] for c in self.mock_operation.add_metadata.call_args_list
+            if c.args[0] == "pod_readiness_times"
+        )
+        self.assertEqual(readiness["P100"]["target_count"], 4)
+
     def test_create_deployment_failure(self):
         """Test deployment creation failure"""
         # Setup
@@ -3,12 +3,14 @@ Unit tests for crud/main.py module (functions beyond collect_benchmark_results)
 """
 # pylint: disable=too-many-lines
 
+import argparse
 import unittest
 from unittest import mock
 import os
 import tempfile
 import shutil
 import json
+import threading
 
 from crud.main import (
     get_node_pool_crud_class,
@@ -18,7 +20,10 @@ from crud.main import (
     check_for_progressive_scaling,
     collect_benchmark_results,
     handle_node_pool_all,
+    handle_node_pool_matrix,
+    load_matrix_spec,
 )
+from crud.operation import OperationContext
 
 
 class TestNodePoolCRUDFunctions(unittest.TestCase):
@@ -121,6 +126,7 @@ class TestNodePoolCRUDFunctions(unittest.TestCase):
             node_count=5,
             progressive=True,  # Should be True because scale_step_size != target_count
             scale_step_size=1,
+            pipelined=mock_args.pipelined,
             gpu_node_pool=False,
             enable_managed_gpu=False,
             gpu_instance_profile=mock_args.gpu_instance_profile,
@@ -155,6 +161,7 @@ class TestNodePoolCRUDFunctions(unittest.TestCase):
             node_count=3,
             progressive=False,  # Should be False because scale_step_size == target_count
             scale_step_size=3,
+            pipelined=mock_args.pipelined,
             gpu_node_pool=False,
             enable_managed_gpu=False,
             gpu_instance_profile=mock_args.gpu_instance_profile,
@@ -195,6 +202,7 @@ class TestNodePoolCRUDFunctions(unittest.TestCase):
             node_count=10,
             progressive=True,
             scale_step_size=2,
+            pipelined=mock_args.pipelined,
             gpu_node_pool=False,
             enable_managed_gpu=False,
             gpu_instance_profile=mock_args.gpu_instance_profile,
@@ -289,6 +297,8 @@ class TestNodePoolCRUDFunctions(unittest.TestCase):
             target_count=3,
             progressive=True,  # Should be True because scale_step_size != target_count
             scale_step_size=1,
+            pipelined=mock_args.pipelined,
+            background_delete=mock_args.background_delete,
             gpu_node_pool=True,
             enable_managed_gpu=False,
             step_wait_time=30,
@@ -421,7 +431,7 @@ class TestNodePoolCRUDFunctions(unittest.TestCase):
                 main()  # Use the imported main function
 
         # Verify collect function was called and exit code was 0
-        mock_collect_func.assert_called_once()
+        mock_collect_func.assert_called_once_with(expand_snapshots=False)
         self.assertEqual(cm.exception.code, 0)
 
     @mock.patch("crud.main.AzureNodePoolCRUD")
@@ -689,6 +699,24 @@ class TestCollectBenchmarkResults(unittest.TestCase):
         # Verify
         self.assertEqual(result, 0)
 
+    @mock.patch("crud.main.get_env_vars")
+    def test_collect_benchmark_results_expand_snapshots(self, mock_get_env_vars):
+        """Test that compacted node pool snapshots are rebuilt on request"""
+        mock_get_env_vars.side_effect = {"RESULT_DIR": self.test_dir}.get
+        for name, count in (("create", 1), ("scale", 3)):
+            with OperationContext(name, "azure", result_dir=self.test_dir) as op:
+                op.add_metadata("nodepool_info", {"name": "pool1", "count": count, "vm_size": "D4"})
+
+        self.assertEqual(collect_benchmark_results(expand_snapshots=True), 0)
+
+        with open(os.path.join(self.test_dir, "results.json"), "r", encoding="utf-8") as f:
+            rows = [json.loads(json.loads(line)["operation_info"]) for line in f]
+        self.assertEqual(
+            sorted(row["metadata"]["nodepool_info"]["count"] for row in rows), [1, 3]
+        )
+        for row in rows:
+            self.assertEqual(row["metadata"]["nodepool_info"]["vm_size"], "D4")
+
 
 class TestHandleNodePoolAll(unittest.TestCase):
     """Tests for the handle_node_pool_all function"""
@@ -788,6 +816,120 @@ class TestHandleNodePoolAll(unittest.TestCase):
         self.assertEqual(call_args["gpu_node_pool"], False)
 
 
+class TestHandleNodePoolMatrix(unittest.TestCase):
+    """Tests for the matrix command"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.spec_path = os.path.join(self.test_dir, "matrix.yaml")
+        with open(self.spec_path, "w", encoding="utf-8") as file:
+            file.write(
+                "pools:\n"
+                "  - node_pool_name: pool1\n"
+                "    vm_size: Standard_D4s_v3\n"
+                "    target_count: 4\n"
+                "    scale_step_size: 2\n"
+                "  - node_pool_name: pool2\n"
+                "    vm_size: Standard_NC40ads_H100_v5\n"
+                "    gpu_node_pool: true\n"
+            )
+        self.args = argparse.Namespace(
+            cloud="azure",
+            spec=self.spec_path,
+            node_count=0,
+            target_count=2,
+            scale_step_size=2,
+            step_wait_time=0,
+            pipelined=False,
+            background_delete=False,
+            gpu_node_pool=False,
+            enable_managed_gpu=False,
+            gpu_instance_profile=None,
+            gpu_mig_strategy=None,
+            max_concurrent_pools=None,
+            max_concurrent_operations=2,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_load_matrix_spec_applies_defaults(self):
+        pools = load_matrix_spec(self.spec_path, self.args)
+
+        self.assertEqual([pool["node_pool_name"] for pool in pools], ["pool1", "pool2"])
+        self.assertEqual(pools[0]["target_count"], 4)
+        self.assertFalse(pools[0]["gpu_node_pool"])
+        self.assertEqual(pools[1]["target_count"], 2)
+        self.assertTrue(pools[1]["gpu_node_pool"])
+        self.assertIsNone(pools[1]["gpu_mig_strategy"])
+
+    def test_load_matrix_spec_rejects_invalid_pools(self):
+        for content in (
+            "pools: []\n",
+            "- node_pool_name: pool1\n",
+            "- {node_pool_name: p, vm_size: v, max_pods: 3}\n",
+            "- {node_pool_name: p, vm_size: v}\n- {node_pool_name: p, vm_size: v}\n",
+        ):
+            with open(self.spec_path, "w", encoding="utf-8") as file:
+                file.write(content)
+            with self.assertRaises(ValueError):
+                load_matrix_spec(self.spec_path, self.args)
+
+    def test_aws_pools_omit_azure_gpu_kwargs(self):
+        self.args.cloud = "aws"
+
+        pools = load_matrix_spec(self.spec_path, self.args)
+
+        self.assertNotIn("gpu_instance_profile", pools[0])
+        self.assertNotIn("gpu_mig_strategy", pools[0])
+
+    def test_runs_pools_concurrently_on_scoped_copies(self):
+        node_pool_crud = mock.MagicMock()
+        both_started = threading.Barrier(2, timeout=5)
+        crud_copies = []
+
+        def fake_copy(obj):
+            if obj is node_pool_crud:
+                crud = mock.MagicMock()
+                crud.all.side_effect = lambda **_kwargs: both_started.wait() is not None
+                crud_copies.append(crud)
+                return crud
+            return mock.MagicMock()
+
+        with mock.patch("crud.main.copy.copy", side_effect=fake_copy):
+            result = handle_node_pool_matrix(node_pool_crud, self.args)
+
+        self.assertEqual(result, 0)
+        node_pool_crud.aks_client.operation_limiter.set_limit.assert_called_once_with(2)
+        node_pool_crud.all.assert_not_called()
+        calls = sorted((c.kwargs for crud in crud_copies for c in crud.all.call_args_list),
+                       key=lambda kwargs: kwargs["node_pool_name"])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0]["vm_size"], "Standard_D4s_v3")
+        self.assertTrue(calls[0]["progressive"])
+        self.assertFalse(calls[1]["progressive"])
+        self.assertTrue(calls[1]["gpu_node_pool"])
+
+    @mock.patch("crud.main.logger")
+    def test_failed_pool_fails_run(self, mock_logger):
+        node_pool_crud = mock.MagicMock()
+        node_pool_crud.all.side_effect = [True, Exception("create failed")]
+
+        with mock.patch("crud.main.copy.copy", side_effect=lambda obj: obj):
+            result = handle_node_pool_matrix(node_pool_crud, self.args)
+
+        self.assertEqual(result, 1)
+        self.assertEqual(node_pool_crud.all.call_count, 2)
+        self.assertIn("Matrix run failed", mock_logger.error.call_args[0][0])
+
+    @mock.patch("crud.main.logger")
+    def test_invalid_spec_returns_error(self, mock_logger):
+        self.args.spec = os.path.join(self.test_dir, "missing.yaml")
+
+        self.assertEqual(handle_node_pool_matrix(mock.MagicMock(), self.args), 1)
+        mock_logger.error.assert_called_once()
+
+
 class TestMainFunctionIntegration(unittest.TestCase):
     """Integration tests for the main function"""
 
@@ -365,6 +365,25 @@ class TestOperationContext(unittest.TestCase):
         self.assertEqual(len(files), 1)
         self.assertTrue(files[0].startswith("gcp_test_operation_"))
 
+    @mock.patch("crud.operation.datetime")
+    def test_operation_context_same_second_files_not_overwritten(self, mock_datetime):
+        """Operations finishing in the same second get distinct, pool-qualified files"""
+        mock_now = mock.MagicMock()
+        mock_now.strftime.return_value = "20230101_120100"
+        mock_datetime.now.return_value = mock_now
+        mock_datetime.fromisoformat.return_value = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        for _ in range(2):
+            with OperationContext(
+                "scale_up", "azure", {"node_pool_name": "pool1"}, result_dir=self.temp_dir
+            ):
+                pass
+
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)),
+            ["azure_scale_up_pool1_20230101_120100.json", "azure_scale_up_pool1_20230101_120100_1.json"],
+        )
+
     def test_operation_context_no_result_dir(self):
         """Test OperationContext without result directory"""
         # Execute
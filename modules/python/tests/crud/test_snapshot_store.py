@@ -0,0 +1,106 @@
+"""
+Unit tests for crud/snapshot_store.py module
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from crud.operation import OperationContext
+from crud.snapshot_store import (
+    SnapshotStore,
+    apply_diff,
+    diff_snapshots,
+    get_snapshot_store,
+    is_snapshot_ref,
+)
+
+
+class TestDiffSnapshots(unittest.TestCase):
+    """Tests for the structural diff helpers"""
+
+    def test_diff_round_trip(self):
+        base = {"name": "pool", "count": 1, "labels": {"a": "1", "b": "2"}, "zones": ["1"]}
+        current = {"name": "pool", "count": 5, "labels": {"a": "1", "c": "3"}, "zones": ["1", "2"]}
+
+        changes = diff_snapshots(base, current)
+
+        self.assertIn({"op": "set", "path": ["count"], "value": 5}, changes)
+        self.assertIn({"op": "remove", "path": ["labels", "b"]}, changes)
+        self.assertIn({"op": "set", "path": ["zones"], "value": ["1", "2"]}, changes)
+        self.assertEqual(apply_diff(base, changes), current)
+        self.assertEqual(base["labels"], {"a": "1", "b": "2"})
+
+    def test_identical_snapshots_have_no_diff(self):
+        self.assertEqual(diff_snapshots({"a": {"b": 1}}, {"a": {"b": 1}}), [])
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Tests for SnapshotStore"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_first_snapshot_full_then_references(self):
+        store = SnapshotStore(self.test_dir)
+        snapshot = {"name": "pool1", "count": 1}
+
+        first = store.record("nodepool_info", snapshot)
+        unchanged = store.record("nodepool_info", snapshot)
+        changed = store.record("nodepool_info", {"name": "pool1", "count": 4})
+
+        self.assertEqual(first, snapshot)
+        self.assertTrue(is_snapshot_ref(unchanged))
+        self.assertNotIn("diff", unchanged)
+        self.assertEqual(changed["diff"], [{"op": "set", "path": ["count"], "value": 4}])
+        self.assertEqual(store.resolve(changed), {"name": "pool1", "count": 4})
+        self.assertEqual(store.resolve(unchanged), snapshot)
+
+    def test_objects_are_tracked_separately(self):
+        store = SnapshotStore(self.test_dir)
+
+        self.assertEqual(store.record("nodepool_info", {"name": "a"}), {"name": "a"})
+        self.assertEqual(store.record("nodepool_info", {"name": "b"}), {"name": "b"})
+        self.assertEqual(store.record("cluster_info", {"name": "a"}), {"name": "a"})
+
+    def test_base_is_shared_across_processes(self):
+        SnapshotStore(self.test_dir).record("cluster_info", {"name": "c", "version": "1.30"})
+
+        # A new store (e.g. the next CLI invocation of the run) reads the base from disk.
+        ref = SnapshotStore(self.test_dir).record("cluster_info", {"name": "c", "version": "1.31"})
+
+        self.assertTrue(is_snapshot_ref(ref))
+        self.assertEqual(SnapshotStore(self.test_dir).resolve(ref), {"name": "c", "version": "1.31"})
+
+    def test_resolve_missing_base_raises(self):
+        with self.assertRaises(ValueError):
+            SnapshotStore(self.test_dir).resolve({"snapshot_ref": "cluster_info/x", "snapshot_hash": "0"})
+
+    def test_operation_context_compacts_saved_metadata(self):
+        for count in (1, 1):
+            with OperationContext("scale", "azure", result_dir=self.test_dir) as op:
+                op.add_metadata("cluster_info", {"name": "c", "count": count})
+                op.add_metadata("ready_nodes", count)
+
+        saved = []
+        for file_name in sorted(os.listdir(self.test_dir)):
+            if file_name.endswith(".json"):
+                with open(os.path.join(self.test_dir, file_name), "r", encoding="utf-8") as f:
+                    saved.append(json.load(f)["operation_info"]["metadata"])
+
+        self.assertEqual(saved[0]["cluster_info"], {"name": "c", "count": 1})
+        self.assertTrue(is_snapshot_ref(saved[1]["cluster_info"]))
+        self.assertEqual(saved[1]["ready_nodes"], 1)
+        self.assertEqual(
+            get_snapshot_store(self.test_dir).expand_metadata(saved[1])["cluster_info"],
+            {"name": "c", "count": 1},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
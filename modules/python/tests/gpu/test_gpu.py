@@ -410,26 +410,25 @@ class TestGPU(unittest.TestCase):
         mock_pod = MagicMock()
         mock_pod.metadata.name = "test-pod"
         _mock_execute_with_retries.return_value = [mock_pod]
-        mock_k8s_client.get_pod_logs.return_value = b"test logs content"
         provider = "azure"
 
-        with patch("builtins.open", mock_open()) as mock_file:
-            execute(
-                provider=provider,
-                config_dir=self.test_config_dir,
-                result_dir=self.test_result_dir,
-                topology_vm_size='ndv4',
-            )
+        execute(
+            provider=provider,
+            config_dir=self.test_config_dir,
+            result_dir=self.test_result_dir,
+            topology_vm_size='ndv4',
+        )
 
-            mock_topology.assert_called_once_with(vm_size='ndv4')
-            mock_k8s_client.apply_manifest_from_file.assert_called_once_with(
-                manifest_dict=unittest.mock.ANY
-            )
-            # Verify execute_with_retries is called once for waiting for pods
-            _mock_execute_with_retries.assert_called_once()
-            mock_file.assert_called_once_with(
-                f"{self.test_result_dir}/raw.log", "w", encoding="utf-8"
-            )
+        mock_topology.assert_called_once_with(vm_size='ndv4')
+        mock_k8s_client.apply_manifest_from_file.assert_called_once_with(
+            manifest_dict=unittest.mock.ANY
+        )
+        # Verify execute_with_retries is called once for waiting for pods
+        _mock_execute_with_retries.assert_called_once()
+        mock_k8s_client.stream_pod_logs.assert_called_once_with(
+            "test-pod", namespace="mpi-operator", dest=f"{self.test_result_dir}/raw.log",
+            line_callback=unittest.mock.ANY
+        )
 
     @patch("yaml.safe_load")
     @patch("gpu.main.execute_with_retries")
@@ -447,26 +446,25 @@ class TestGPU(unittest.TestCase):
         mock_pod = MagicMock()
         mock_pod.metadata.name = "test-pod"
         _mock_execute_with_retries.return_value = [mock_pod]
-        mock_k8s_client.get_pod_logs.return_value = b"test logs content"
         provider = "aws"
 
-        with patch("builtins.open", mock_open()) as mock_file:
-            execute(
-                provider=provider,
-                config_dir=self.test_config_dir,
-                result_dir=self.test_result_dir,
-                topology_vm_size="",
-            )
+        execute(
+            provider=provider,
+            config_dir=self.test_config_dir,
+            result_dir=self.test_result_dir,
+            topology_vm_size="",
+        )
 
-            mock_topology.assert_not_called()
-            mock_k8s_client.apply_manifest_from_file.assert_called_once_with(
-                manifest_dict=unittest.mock.ANY
-            )
-            # Verify execute_with_retries is called once for waiting for pods
-            _mock_execute_with_retries.assert_called_once()
-            mock_file.assert_called_once_with(
-                f"{self.test_result_dir}/raw.log", "w", encoding="utf-8"
-            )
+        mock_topology.assert_not_called()
+        mock_k8s_client.apply_manifest_from_file.assert_called_once_with(
+            manifest_dict=unittest.mock.ANY
+        )
+        # Verify execute_with_retries is called once for waiting for pods
+        _mock_execute_with_retries.assert_called_once()
+        mock_k8s_client.stream_pod_logs.assert_called_once_with(
+            "test-pod", namespace="mpi-operator", dest=f"{self.test_result_dir}/raw.log",
+            line_callback=unittest.mock.ANY
+        )
 
     def test_parse_nccl_test_results_success(self):
         """Test parsing NCCL test results from log file."""
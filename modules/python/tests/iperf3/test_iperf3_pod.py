@@ -30,7 +30,8 @@ class TestIPerfsPod(unittest.TestCase):
             command=command,
             container_name=container_name,
             dest_path=result_file,
-            namespace=self.namespace
+            namespace=self.namespace,
+            stream_output=bool(result_file),
         )
 
     def _assert_run_command_server(self, command, result_file):
@@ -50,14 +51,16 @@ class TestIPerfsPod(unittest.TestCase):
             command=command_constants.IPERF3_VERSION_CMD,
             container_name='iperf3-client',
             dest_path="",
-            namespace=self.namespace
+            namespace=self.namespace,
+            stream_output=False,
         )
         self.iperf3.k8s_client.run_pod_exec_command.assert_any_call(
             pod_name="server-pod",
             command=command_constants.IPERF3_VERSION_CMD,
             container_name='iperf3-server',
             dest_path="",
-            namespace=self.namespace
+            namespace=self.namespace,
+            stream_output=False,
         )
 
     def test_run_iperf3(self):
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """Unit tests for AKSMachineClient."""
-# pylint: disable=protected-access
+# pylint: disable=protected-access,too-many-lines
 import itertools
 import tempfile
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest import mock
 
 from clients.aks_machine_client import AKSMachineClient, MachineProvisioningFailed
+from clients.arm_throttle import ArmThrottleGovernor
 
 
 class TestAKSMachineClient(unittest.TestCase):
@@ -50,6 +53,9 @@ class TestAKSMachineClient(unittest.TestCase):
             result_dir=self.test_result_dir,
         )
 
+        # Isolate the throttle buckets from the process-wide governor.
+        self.client.arm_throttle = ArmThrottleGovernor()
+
         # Stub inherited helpers that the Machine methods enrich metadata with.
         self.client.get_cluster_name = mock.MagicMock(return_value="fake-cluster")
         self.client.get_cluster_data = mock.MagicMock(return_value={"name": "fake-cluster"})
@@ -99,6 +105,33 @@ class TestAKSMachineClient(unittest.TestCase):
                 agent_pool_name="apool", vm_size="Standard_D2_v3"
             )
 
+    @mock.patch("time.sleep")
+    @mock.patch.object(AKSMachineClient, "make_request")
+    def test_create_machine_agentpool_follows_async_operation(self, mock_make_request, _mock_sleep):
+        """PUT 201 with Azure-AsyncOperation -> status resource polled, server end time recorded."""
+        put_resp = SimpleNamespace(status_code=201, text="", headers={
+            "Azure-AsyncOperation": "https://management.azure.com/operations/op1",
+        })
+        status_resp = SimpleNamespace(
+            status_code=200, text="", headers={},
+            json=lambda: {"status": "Succeeded", "endTime": "2024-05-01T10:00:42Z"},
+        )
+        mock_make_request.side_effect = [put_resp, status_resp]
+
+        self.client.create_machine_agentpool(
+            agent_pool_name="apool", vm_size="Standard_D2_v3"
+        )
+
+        self.assertEqual(
+            mock_make_request.call_args.args[:2],
+            ("GET", "https://management.azure.com/operations/op1"),
+        )
+        lro = next(c.args[1] for c in self.mock_operation.add_metadata.call_args_list
+                   if c.args[0] == "arm_lro")
+        self.assertEqual(lro["status"], "Succeeded")
+        self.assertEqual(lro["end_time_source"], "endTime")
+        self.assertEqual(lro["kind"], "agentpool_put:apool")
+
     @mock.patch.object(AKSMachineClient, "_wait_for_agentpool_provisioning",
                        return_value=False)
     @mock.patch.object(AKSMachineClient, "make_request")
@@ -166,6 +199,7 @@ class TestAKSMachineClient(unittest.TestCase):
         self.assertIn("successful_machines", metadata_keys)
         self.mock_operation.add_metadata.assert_any_call("successful_machines", 2)
         self.assertIn("percentile_node_readiness_times", metadata_keys)
+        self.assertIn("timeline_node_readiness_times", metadata_keys)
         self.assertIn("node_readiness_time", metadata_keys)
         self.assertIn("cluster_info", metadata_keys)
 
@@ -515,6 +549,8 @@ class TestAKSMachineClient(unittest.TestCase):
         self.assertEqual(env["P100"]["target_nodes"], 3)
         for p in (50, 70, 90, 99, 100):
             self.assertTrue(env[f"P{p}"]["success"])
+        self.mock_k8s.start_informers.assert_called_once_with(("nodes",))
+        self.mock_k8s.stop_informers.assert_called_once()
 
     def test_wait_readiness_baseline_clamp(self):
         """When baseline_count is large relative to expected, the clamp
@@ -569,7 +605,7 @@ class TestAKSMachineClient(unittest.TestCase):
         # target_total=3 (baseline=0, expected=3). Sequence: ready=0,1,2 then
         # deadline crosses before reaching 3.
         ready_seq = iter([[], [object()], [object()] * 2, [object()] * 2])
-        self.mock_k8s.get_ready_nodes.side_effect = lambda label_selector: next(
+        self.mock_k8s.get_ready_nodes.side_effect = lambda label_selector, lightweight: next(
             ready_seq, [object()] * 2
         )
         clock = {"now": 0.0}
@@ -668,8 +704,11 @@ class TestAKSMachineClient(unittest.TestCase):
             expected_names={"m1"},
         )
         self.mock_k8s.get_ready_nodes.assert_called_once_with(
-            label_selector="agentpool=apool"
+            label_selector="agentpool=apool", lightweight=True
         )
+        # The node watch is stopped even though the wait raised
+        self.mock_k8s.start_informers.assert_called_once_with(("nodes",))
+        self.mock_k8s.stop_informers.assert_called_once()
 
     def test_wait_readiness_machine_failure_check_uses_bounded_cadence(self):
         """ListMachines is not called on every 2s ListNodes poll."""
@@ -759,8 +798,8 @@ class TestAKSMachineClient(unittest.TestCase):
         # Exactly one worker's slice survives.
         self.assertEqual(len(successful), 2)
 
-    def test_scale_machine_batch_rejects_non_exact_multiple(self):
-        """scale_machine_count must be an exact multiple of machine_workers."""
+    def test_scale_machine_batch_accepts_remainder_shard(self):
+        """A count that is not a multiple of machine_workers gets a remainder shard."""
         request = SimpleNamespace(
             agent_pool_name="apool",
             cluster_name="fake-cluster",
@@ -769,9 +808,59 @@ class TestAKSMachineClient(unittest.TestCase):
             timeout=60,
             machine_workers=3,
         )
-        names = ["m-1", "m-2", "m-3", "m-4"]  # 4 not divisible by 3
-        with self.assertRaises(ValueError):
-            self.client._scale_machine_batch(request, names)
+        names = ["m-1", "m-2", "m-3", "m-4", "m-5"]
+        with mock.patch.object(
+            AKSMachineClient,
+            "_create_batch_machines",
+            side_effect=lambda req, chunk, worker_id: list(chunk),
+        ) as mock_create_batch:
+            successful = self.client._scale_machine_batch(request, names)
+        self.assertEqual(sorted(successful), names)
+        chunks = sorted(
+            (call.args[2], call.args[1]) for call in mock_create_batch.call_args_list
+        )
+        self.assertEqual(chunks, [(0, ["m-1", "m-2"]), (1, ["m-3", "m-4"]), (2, ["m-5"])])
+
+    def test_shard_machine_names_caps_shard_size(self):
+        """Shards never exceed the BatchPutMachine limit; the tail is a remainder."""
+        names = [f"m-{i}" for i in range(120)]
+        shards = AKSMachineClient._shard_machine_names(names, 1)
+        self.assertEqual([len(shard) for shard in shards], [50, 50, 20])
+        self.assertEqual([name for shard in shards for name in shard], names)
+        self.assertEqual(AKSMachineClient._shard_machine_names([], 4), [])
+
+    def test_scale_machine_batch_respects_concurrency_cap(self):
+        """No more than batch_concurrency shards are in flight at once."""
+        request = SimpleNamespace(
+            agent_pool_name="apool",
+            cluster_name="fake-cluster",
+            resource_group="fake-rg",
+            vm_size="Standard_D2_v3",
+            timeout=60,
+            machine_workers=8,
+            batch_concurrency=2,
+        )
+        names = [f"m-{i}" for i in range(8)]
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def fake_create(req, chunk, worker_id):  # pylint: disable=unused-argument
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return list(chunk)
+
+        with mock.patch.object(
+            AKSMachineClient, "_create_batch_machines", side_effect=fake_create
+        ) as mock_create_batch:
+            successful = self.client._scale_machine_batch(request, names)
+        self.assertEqual(sorted(successful), sorted(names))
+        self.assertEqual(mock_create_batch.call_count, 8)
+        self.assertLessEqual(peak[0], 2)
 
     def test_scale_machine_batch_rejects_non_positive_workers(self):
         """machine_workers must be positive."""
@@ -786,8 +875,8 @@ class TestAKSMachineClient(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.client._scale_machine_batch(request, ["m-1"])
 
-    def test_scale_machine_batch_rejects_calculated_batch_over_limit(self):
-        """Fail fast before ARM when calculated per-worker batch size exceeds 50."""
+    def test_scale_machine_batch_splits_oversized_worker_slices(self):
+        """Per-worker slices above 50 are split into more shards instead of failing."""
         request = SimpleNamespace(
             agent_pool_name="apool",
             cluster_name="fake-cluster",
@@ -798,11 +887,16 @@ class TestAKSMachineClient(unittest.TestCase):
         )
         names = [f"m-{i}" for i in range(1, 1001)]
         with mock.patch.object(
-            AKSMachineClient, "_create_batch_machines"
+            AKSMachineClient,
+            "_create_batch_machines",
+            side_effect=lambda req, chunk, worker_id: list(chunk),
         ) as mock_create_batch:
-            with self.assertRaisesRegex(ValueError, "calculated batch size"):
-                self.client._scale_machine_batch(request, names)
-        mock_create_batch.assert_not_called()
+            successful = self.client._scale_machine_batch(request, names)
+        self.assertEqual(set(successful), set(names))
+        self.assertEqual(mock_create_batch.call_count, 20)
+        self.assertTrue(
+            all(len(call.args[1]) == 50 for call in mock_create_batch.call_args_list)
+        )
 
     def test_scale_machine_batch_allows_calculated_batch_at_limit(self):
         """A calculated per-worker batch size of exactly 50 is allowed."""
@@ -871,6 +965,8 @@ class TestAKSMachineClient(unittest.TestCase):
         self.assertIsInstance(metric["execution_time_seconds"], float)
         self.assertGreaterEqual(metric["execution_time_seconds"], 0.0)
         self.assertEqual(metric["total_machines_in_batch"], 3)
+        self.assertEqual(metric["shard_index"], 0)
+        self.assertLessEqual(metric["submit_time"], metric["ack_time"])
         # Inspect the batch_header_value kwarg.
         import json as _json  # pylint: disable=import-outside-toplevel
         kwargs = mock_make_batch.call_args.kwargs
@@ -961,6 +1057,53 @@ class TestAKSMachineClient(unittest.TestCase):
             )
         self.assertEqual(mock_request.call_count, 2)
 
+    def test_make_batch_request_429_honours_retry_after(self):
+        """A 429 with Retry-After waits on the governor instead of the fixed backoff."""
+        responses = [
+            mock.MagicMock(status_code=429, headers={"Retry-After": "3"}),
+            mock.MagicMock(status_code=201, headers={}),
+        ]
+        with mock.patch.object(
+            self.client._session, "request", side_effect=responses,
+        ) as mock_request, mock.patch.object(
+            self.client.arm_throttle, "acquire"
+        ) as mock_acquire, mock.patch.object(
+            self.client.arm_throttle, "observe"
+        ) as mock_observe, mock.patch(
+            "clients.aks_machine_client.time.sleep"
+        ) as mock_sleep:
+            self.client._make_batch_request(
+                "PUT",
+                "https://fake/url",
+                {},
+                timeout=30,
+                batch_header_value="{}",
+            )
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_acquire.call_count, 2)
+        mock_acquire.assert_called_with("batch_writes")
+        mock_observe.assert_any_call("batch_writes", 429, {"Retry-After": "3"})
+        mock_sleep.assert_not_called()
+
+    def test_make_request_reports_to_throttle_governor(self):
+        """make_request acquires a read token for GET and observes the response headers."""
+        with mock.patch.object(
+            self.client._session, "request"
+        ) as mock_request, mock.patch.object(
+            self.client.arm_throttle, "acquire"
+        ) as mock_acquire, mock.patch.object(
+            self.client.arm_throttle, "observe"
+        ) as mock_observe:
+            mock_request.return_value.status_code = 200
+            mock_request.return_value.headers = {
+                "x-ms-ratelimit-remaining-subscription-reads": "249"
+            }
+            self.client.make_request("GET", "https://fake/url")
+        mock_acquire.assert_called_once_with("reads")
+        mock_observe.assert_called_once_with(
+            "reads", 200, {"x-ms-ratelimit-remaining-subscription-reads": "249"}
+        )
+
     def test_make_batch_request_429_exhausted_raises(self):
         """429 across the full retry budget -> RuntimeError."""
         with mock.patch.object(
@@ -1,5 +1,5 @@
 import os
-import json
+import shutil
 import tempfile
 import sys
 import unittest
@@ -205,14 +205,12 @@ class TestClusterLoaderFunctions(unittest.TestCase):
         self.assertIn('"autoscale_type": "down"', content)
         self.assertIn('"autoscale_result": "success"', content)
 
-    @patch('clusterloader2.autoscale.autoscale.parse_xml_to_json')
-    @patch('os.path.join', autospec=True)
-    def test_collect_clusterloader2_no_testsuites(self, mock_path_join, mock_parse_xml_to_json):
-        # Mock the XML parsing to return no testsuites
-        mock_parse_xml_to_json.return_value = json.dumps({"testsuites": []})
-
-        # Mock the path join
-        mock_path_join.return_value = "/mock/path/junit.xml"
+    def test_collect_clusterloader2_no_testsuites(self):
+        # A report without any testsuite
+        cl2_report_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cl2_report_dir)
+        with open(os.path.join(cl2_report_dir, "junit.xml"), "w", encoding="utf-8") as f:
+            f.write("<testsuites></testsuites>")
 
         # Call the function and expect an exception
         with self.assertRaises(Exception) as context:
@@ -221,7 +219,7 @@ class TestClusterLoaderFunctions(unittest.TestCase):
               capacity_type="on-demand",
               node_count=3,
               pod_count=30,
-              cl2_report_dir="/mock/path",
+              cl2_report_dir=cl2_report_dir,
               cloud_info="mock-cloud",
               run_id="mock-run-id",
               run_url="http://mock-run-url",
@@ -232,6 +230,7 @@ class TestClusterLoaderFunctions(unittest.TestCase):
             )
 
         self.assertIn("No testsuites found in the report", str(context.exception))
+        self.assertFalse(os.path.exists("/mock/result/file"))
 
     @patch('clusterloader2.autoscale.autoscale.override_config_clusterloader2')
     def test_override_command(self, mock_override):
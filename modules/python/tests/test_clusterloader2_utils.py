@@ -0,0 +1,180 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from clusterloader2.utils import (
+    ReportInfo,
+    classify_report,
+    get_measurement,
+    iter_cl2_records,
+    iter_cl2_reports,
+    iter_junit_testcases,
+    parse_junit_xml,
+    parse_xml_to_json,
+    process_cl2_reports,
+    write_cl2_reports,
+)
+
+
+class TestClassifyReport(unittest.TestCase):
+    def test_known_reports(self):
+        cases = {
+            "StatefulPodStartupLatency_PodStartupLatency_load_2025-01-01T00:00:00Z.json":
+                ReportInfo("StatefulPodStartupLatency_PodStartupLatency", "load", "2025-01-01T00:00:00Z"),
+            "APIResponsivenessPrometheusSimple_load_2025-01-01T00:00:00Z.json":
+                ReportInfo("APIResponsivenessPrometheus", "load", "2025-01-01T00:00:00Z"),
+            "SchedulingThroughputPrometheus_job_2025-01-01T00:00:00Z.json":
+                ReportInfo("SchedulingThroughputPrometheus", "job", "2025-01-01T00:00:00Z"),
+            "SchedulingThroughput_job_2025-01-01T00:00:00Z.json":
+                ReportInfo("SchedulingThroughput", "job", "2025-01-01T00:00:00Z"),
+            "GenericPrometheusQuery Kube API Latency_load_2026-02-25T13:51:31Z.json":
+                ReportInfo("Kube API Latency", "load", "2026-02-25T13:51:31Z"),
+            "GenericPrometheusQuery_cilium_cpu_load_2026-02-25T13:51:31Z.json":
+                ReportInfo("cilium_cpu", "load", "2026-02-25T13:51:31Z"),
+            "ResourceUsageSummary_load.json": ReportInfo("ResourceUsageSummary", "load.json", None),
+        }
+        for file_name, expected in cases.items():
+            with self.subTest(file_name=file_name):
+                self.assertEqual(classify_report(file_name), expected)
+
+    def test_unknown_reports(self):
+        for file_name in ["junit.xml", "GenericPrometheusQueryX_load.json", "JobLifecycleLatency.json"]:
+            with self.subTest(file_name=file_name):
+                self.assertIsNone(classify_report(file_name))
+                self.assertEqual(get_measurement(os.path.join("/reports", file_name)), (None, None))
+
+
+class TestCL2ReportCollector(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.report_dir = self._tmp_dir.name
+        self.template = {"run_id": "run", "group": None, "measurement": None, "result": None}
+        self._write_report("PodStartupLatency_PodStartupLatency_load_2025-01-01T00:00:00Z.json",
+                           {"dataItems": [{"data": {"Perc50": 1}}, {"data": {"Perc99": 2}}]})
+        self._write_report("APIResponsivenessPrometheus_load_2025-01-01T00:00:00Z.json",
+                           {"dataItems": []})
+        self._write_report("SchedulingThroughput_load_2025-01-01T00:00:00Z.json",
+                           {"average": 10})
+        self._write_report("junit.xml", None)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write_report(self, name, data):
+        with open(os.path.join(self.report_dir, name), "w", encoding="utf-8") as f:
+            f.write("<testsuites/>" if data is None else json.dumps(data))
+
+    def test_iter_cl2_records(self):
+        records = list(iter_cl2_records(self.report_dir, self.template))
+
+        self.assertEqual(
+            [(r["measurement"], r["group"], r["result"]) for r in records],
+            [
+                ("PodStartupLatency_PodStartupLatency", "load", {"data": {"Perc50": 1}}),
+                ("PodStartupLatency_PodStartupLatency", "load", {"data": {"Perc99": 2}}),
+                ("SchedulingThroughput", "load", {"average": 10}),
+            ],
+        )
+        self.assertIsNone(self.template["measurement"])
+
+    def test_write_cl2_reports_streams_ndjson(self):
+        # The result file lives next to the reports and must not be read back as one
+        result_file = os.path.join(self.report_dir, "SchedulingThroughput_results.json")
+
+        expected = process_cl2_reports(self.report_dir, self.template)
+
+        count = write_cl2_reports(self.report_dir, self.template, result_file)
+
+        with open(result_file, "r", encoding="utf-8") as f:
+            content = f.read()
+        self.assertEqual(count, 3)
+        self.assertEqual(content, expected)
+        self.assertEqual([json.loads(line)["run_id"] for line in content.splitlines()], ["run"] * 3)
+
+    @patch("clusterloader2.utils.PARALLEL_INGEST_MIN_REPORTS", 2)
+    def test_parallel_ingest_keeps_file_order(self):
+        for i in range(8):
+            self._write_report(f"JobLifecycleLatency_job{i}_2025-01-01T00:00:00Z.json", {"index": i})
+
+        serial = list(iter_cl2_reports(self.report_dir, max_workers=1))
+        parallel = list(iter_cl2_reports(self.report_dir, max_workers=3))
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual([data["index"] for _, measurement, _, data in parallel
+                          if measurement == "JobLifecycleLatency"], list(range(8)))
+
+    def test_write_cl2_reports_append(self):
+        result_file = os.path.join(self.report_dir, "out", "results.json")
+        os.makedirs(os.path.dirname(result_file))
+        with open(result_file, "w", encoding="utf-8") as f:
+            f.write('{"summary": true}\n')
+
+        write_cl2_reports(self.report_dir, self.template, result_file, mode="a")
+
+        with open(result_file, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(json.loads(lines[0]), {"summary": True})
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="ClusterLoaderV2" tests="3" failures="1" errors="0" time="10.5">
+    <testcase name="autoscale overall" classname="ClusterLoaderV2" time="10.5"></testcase>
+    <testcase name="WaitForRunningPodsUp 0" classname="ClusterLoaderV2" time="4.2"></testcase>
+    <testcase name="WaitForRunningPodsDown 0" classname="ClusterLoaderV2" time="6.3">
+      <failure type="Failure">timed out waiting for pods</failure>
+    </testcase>
+  </testsuite>
+  <testsuite name="Second" tests="1" failures="0" errors="0">
+    <testcase name="other" classname="Second" time="1"></testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+class TestJUnitParser(unittest.TestCase):
+    def setUp(self):
+        fd, self.junit_file = tempfile.mkstemp(suffix=".xml")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(JUNIT_XML)
+
+    def tearDown(self):
+        os.remove(self.junit_file)
+
+    def test_parse_junit_xml(self):
+        result = parse_junit_xml(self.junit_file)
+
+        self.assertEqual([suite["name"] for suite in result["testsuites"]], ["ClusterLoaderV2", "Second"])
+        suite = result["testsuites"][0]
+        self.assertEqual((suite["tests"], suite["failures"], suite["errors"]), (3, 1, 0))
+        self.assertEqual(suite["testcases"][1], {
+            "name": "WaitForRunningPodsUp 0",
+            "classname": "ClusterLoaderV2",
+            "time": "4.2",
+            "failure": None,
+        })
+        self.assertEqual(suite["testcases"][2]["failure"], "timed out waiting for pods")
+        self.assertEqual(json.loads(parse_xml_to_json(self.junit_file)), result)
+
+    def test_iter_junit_testcases(self):
+        self.assertEqual(
+            [case["name"] for case in iter_junit_testcases(self.junit_file)],
+            ["autoscale overall", "WaitForRunningPodsUp 0", "WaitForRunningPodsDown 0"],
+        )
+        self.assertEqual([case["name"] for case in iter_junit_testcases(self.junit_file, suite_index=1)], ["other"])
+
+    def test_iter_junit_testcases_without_testsuite(self):
+        with open(self.junit_file, "w", encoding="utf-8") as f:
+            f.write("<testsuites></testsuites>")
+
+        with self.assertRaises(Exception) as context:
+            list(iter_junit_testcases(self.junit_file))
+
+        self.assertIn("No testsuites found in the report", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
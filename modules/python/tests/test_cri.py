@@ -1,5 +1,4 @@
 import os
-import json
 import tempfile
 import unittest
 import sys
@@ -203,10 +202,10 @@ class TestCRIClusterLoaderFunctions(unittest.TestCase):
             content = f.read()
         self.assertIn('"status": "failure"', content)
 
-    @patch('clusterloader2.cri.cri.parse_xml_to_json')
-    def test_collect_clusterloader2_no_testsuites(self, mock_parse_xml_to_json):
+    @patch('clusterloader2.cri.cri.parse_junit_xml')
+    def test_collect_clusterloader2_no_testsuites(self, mock_parse_junit_xml):
         # Mock XML parsing with no testsuites
-        mock_parse_xml_to_json.return_value = json.dumps({"testsuites": []})
+        mock_parse_junit_xml.return_value = {"testsuites": []}
 
         # Call the function and expect an exception
         with self.assertRaises(Exception) as context:
@@ -23,7 +23,7 @@ with patch("clients.kubernetes_client.config.load_kube_config") as mock_load_kub
     # Now import the module where the global KUBERNETERS_CLIENT is defined
     from csi.csi import (
         wait_for_condition, calculate_percentiles, log_duration,
-        create_statefulset, collect_attach_detach
+        create_statefulset, collect_attach_detach, execute_attach_detach
     )
 
 class TestCSI(unittest.TestCase):
@@ -111,6 +111,13 @@ class TestCSI(unittest.TestCase):
         self.assertEqual(result, 5)
         self.assertEqual(check_function.call_count, 3)
 
+    @patch("csi.csi.time.sleep")
+    def test_wait_for_condition_keeps_fixed_interval_while_idle(self, mock_sleep):
+        check_function = MagicMock(side_effect=[["disk-0"]] * 5 + [["disk-0", "disk-1"]])
+        result = wait_for_condition(check_function, 2, "gte", 1)
+        self.assertEqual(result, 2)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1] * 5)
+
     @patch("clients.kubernetes_client.KubernetesClient.get_app_client")
     def test_create_statefulset_success(self, mock_get_app_client):
         namespace = "test"
@@ -174,6 +181,17 @@ class TestCSI(unittest.TestCase):
         )
         self.assertEqual(actual_statefulset, expected_statefulset)
 
+    @patch("csi.csi.create_statefulset", side_effect=Exception("create failed"))
+    @patch("csi.csi.KUBERNETERS_CLIENT")
+    def test_execute_attach_detach_stops_informers_on_failure(self, mock_client, _mock_create_statefulset):
+        with patch("os.path.exists", return_value=True):
+            with self.assertRaises(Exception) as context:
+                execute_attach_detach(10, "default", 0, "/tmp/result")
+
+        self.assertEqual(str(context.exception), "create failed")
+        mock_client.start_informers.assert_called_once()
+        mock_client.stop_informers.assert_called_once_with()
+
     @patch("builtins.open", new_callable=mock_open)
     @patch("os.makedirs")
     @patch("os.path.join")
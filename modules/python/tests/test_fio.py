@@ -48,7 +48,13 @@ class TestFio(unittest.TestCase):
         mock_pod.status.container_statuses = None
         mock_k8s_client.wait_for_job_completed.return_value = "fio"
         mock_k8s_client.get_pods_by_namespace.return_value = [mock_pod]
-        mock_k8s_client.get_pod_logs.return_value = '{"jobs": [{"result": "success"}]}'
+        fio_report = b'{"jobs": [{"result": "success"}]}'
+
+        def stream_pod_logs(_pod_name, dest):
+            dest.write(fio_report)
+            return len(fio_report)
+
+        mock_k8s_client.stream_pod_logs.side_effect = stream_pod_logs
 
         # Mock subprocess.run to simulate command execution
         mock_run.return_value = MagicMock(returncode=0, stdout=b'{"result": "success"}')
@@ -96,8 +102,11 @@ class TestFio(unittest.TestCase):
             namespace="default", label_selector="job-name=fio-0"
         )
 
-        # Verify pod logs were retrieved
-        mock_k8s_client.get_pod_logs.assert_called_once_with("fio-pod-12345")
+        # Verify pod logs were streamed and the parsed report saved
+        mock_k8s_client.stream_pod_logs.assert_called_once()
+        self.assertEqual(mock_k8s_client.stream_pod_logs.call_args[0][0], "fio-pod-12345")
+        mock_k8s_client.get_pod_logs.assert_not_called()
+        mock_open_file.return_value.write.assert_any_call('{"jobs": [{"result": "success"}]}\n')
 
         # Verify files were written (result file and metadata file)
         self.assertEqual(
@@ -1,5 +1,15 @@
+import json
+import os
+import tempfile
 import unittest
-from kusto.generate_commands import infer_type, generate_kusto_commands
+from kusto.generate_commands import (
+    SchemaInferrer,
+    generate_kusto_commands,
+    generate_table_commands,
+    infer_type,
+    parse_csl_schema,
+    unify_types,
+)
 
 class TestInferType(unittest.TestCase):
     def test_infer_bool(self):
@@ -86,5 +96,105 @@ class TestGenerateKustoCommands(unittest.TestCase):
         result = generate_kusto_commands(data, table_name)
         self.assertEqual(result, expected_result)
 
+    def test_generate_kusto_commands_with_schema(self):
+        data = {
+            'timestamp': '2022-01-01T12:00:00Z',
+            'node_count': -1,
+            'result': None,
+            'cloud_info': 'aws',
+            'fortio_namespaces': 2,
+        }
+
+        result = generate_kusto_commands(data, 'cl2_table', 'cl2')
+
+        self.assertTrue(result.startswith(
+            ".create table ['cl2_table'] (['timestamp']:datetime, ['node_count']:long, "
+            "['result']:dynamic, ['cloud_info']:dynamic, ['fortio_namespaces']:real)"
+        ))
+
+    def test_generate_kusto_commands_alter_merge(self):
+        data = {'timestamp': '2022-01-01T12:00:00Z', 'node_count': 10, 'new_column': 'abc'}
+
+        result = generate_kusto_commands(
+            data, 'test_table', existing_columns=[('timestamp', 'datetime'), ('node_count', 'real')]
+        )
+
+        self.assertEqual(result, (
+            ".alter-merge table ['test_table'] (['new_column']:string)\n\n"
+            ".create-or-alter table ['test_table'] ingestion json mapping 'test_table_mapping' '["
+            "{\"column\":\"timestamp\", \"Properties\":{\"Path\":\"$[\\'timestamp\\']\"}},"
+            "{\"column\":\"node_count\", \"Properties\":{\"Path\":\"$[\\'node_count\\']\"}},"
+            "{\"column\":\"new_column\", \"Properties\":{\"Path\":\"$[\\'new_column\\']\"}}"
+            "]'"
+        ))
+
+    def test_generate_table_commands_without_new_columns(self):
+        result = generate_table_commands([('a', 'real')], 't', existing_columns=[('a', 'real'), ('b', 'string')])
+
+        self.assertNotIn('.alter-merge', result)
+        self.assertTrue(result.startswith(".create-or-alter table ['t'] ingestion json mapping"))
+        self.assertIn("{\"column\":\"b\"", result)
+
+    def test_parse_csl_schema(self):
+        self.assertEqual(
+            parse_csl_schema("timestamp:datetime, ['node_count']:real,result:dynamic"),
+            [('timestamp', 'datetime'), ('node_count', 'real'), ('result', 'dynamic')],
+        )
+
+
+class TestSchemaInferrer(unittest.TestCase):
+    def test_unify_types(self):
+        self.assertEqual(unify_types(None, 'real'), 'real')
+        self.assertEqual(unify_types('real', None), 'real')
+        self.assertEqual(unify_types('real', 'real'), 'real')
+        self.assertEqual(unify_types('real', 'datetime'), 'string')
+        self.assertEqual(unify_types('bool', 'string'), 'string')
+        self.assertEqual(unify_types('string', 'dynamic'), 'dynamic')
+        self.assertEqual(unify_types('dynamic', 'real'), 'dynamic')
+
+    def test_infer_null_and_native_values(self):
+        self.assertEqual(infer_type(None), 'dynamic')
+        self.assertEqual(infer_type(True), 'bool')
+
+    def test_types_unified_across_rows(self):
+        inferrer = SchemaInferrer()
+        inferrer.update({'wait_for_pods_seconds': -1, 'details': None, 'status': 'failure', 'result': None})
+        inferrer.update({'wait_for_pods_seconds': '161.03', 'details': 'timed out', 'status': 'success',
+                         'result': {'value': 1}})
+        inferrer.update({'wait_for_pods_seconds': 95.8, 'details': None, 'status': 'true', 'extra': None})
+
+        self.assertEqual(inferrer.columns(), [
+            ('wait_for_pods_seconds', 'real'),
+            ('details', 'string'),
+            ('status', 'string'),
+            ('result', 'dynamic'),
+            ('extra', 'dynamic'),
+        ])
+
+    def test_schema_types_override_inference(self):
+        inferrer = SchemaInferrer('cl2')
+        inferrer.update({'node_count': -1, 'cloud_info': 'aws', 'max_pods': 110})
+
+        self.assertEqual(inferrer.columns(), [
+            ('node_count', 'long'), ('cloud_info', 'dynamic'), ('max_pods', 'real'),
+        ])
+
+    def test_infer_file_samples_rows(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'value': None}) + '\n\n')
+                f.write(json.dumps({'value': 1}) + '\n')
+                f.write(json.dumps({'value': 'abc', 'late_column': 1}) + '\n')
+
+            self.assertEqual(SchemaInferrer().infer_file(path, sample_rows=2).columns(), [('value', 'real')])
+            self.assertEqual(
+                SchemaInferrer().infer_file(path, sample_rows=0).columns(),
+                [('value', 'string'), ('late_column', 'real')],
+            )
+        finally:
+            os.remove(path)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -93,37 +93,34 @@ class TestJobControllerBenchmark(unittest.TestCase):
             scrape_containerd=True,
         )
 
-    @patch("clusterloader2.job_controller.job_controller.parse_xml_to_json")
-    @patch("clusterloader2.job_controller.job_controller.process_cl2_reports")
+    @patch("clusterloader2.job_controller.job_controller.parse_junit_xml")
+    @patch("clusterloader2.job_controller.job_controller.write_cl2_reports")
     def test_collect_clusterloader2(
-        self, mock_process_cl2_reports, mock_parse_xml_to_json
+        self, mock_write_cl2_reports, mock_parse_junit_xml
     ):
         # Setup mock return values
-        mock_parse_xml_to_json.return_value = json.dumps(
-            {"testsuites": [{"failures": 0}]}
-        )
-        mock_process_cl2_reports.return_value = "mock_content"
+        mock_parse_junit_xml.return_value = {"testsuites": [{"failures": 0}]}
 
-        fd, tmp_path = tempfile.mkstemp()
-        try:
-            benchmark = JobController(
-                cl2_report_dir="report_dir",
-                cloud_info=json.dumps({"cloud": "aws"}),
-                run_id="run123",
-                run_url="http://example.com/run123",
-                result_file=tmp_path,
-                test_type="unit-test",
-                node_count=3,
-                job_count=1000,
-                job_throughput=50,
-            )
-            benchmark.collect_clusterloader2()
-            with open(tmp_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            self.assertEqual(content, "mock_content")
-        finally:
-            os.close(fd)
-            os.remove(tmp_path)
+        benchmark = JobController(
+            cl2_report_dir="report_dir",
+            cloud_info=json.dumps({"cloud": "aws"}),
+            run_id="run123",
+            run_url="http://example.com/run123",
+            result_file="/tmp/results.json",
+            test_type="unit-test",
+            node_count=3,
+            job_count=1000,
+            job_throughput=50,
+        )
+        benchmark.collect_clusterloader2()
+
+        mock_write_cl2_reports.assert_called_once()
+        report_dir, template, result_file = mock_write_cl2_reports.call_args[0]
+        self.assertEqual(report_dir, "report_dir")
+        self.assertEqual(result_file, "/tmp/results.json")
+        self.assertEqual(template["status"], "success")
+        self.assertEqual(template["provider"], "aws")
+        self.assertEqual(template["job_count"], 1000)
 
 
 class TestJobControllerParser(unittest.TestCase):
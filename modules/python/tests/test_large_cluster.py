@@ -252,7 +252,7 @@ class TestLargeCluster(unittest.TestCase):
     # ==================== validate_clusterloader2() Tests ====================
 
     @patch('clusterloader2.large_cluster.large_cluster.KubernetesClient')
-    @patch('clusterloader2.large_cluster.large_cluster.time.sleep')
+    @patch('utils.polling.time.sleep')
     def test_validate_clusterloader2_immediate_success(self, mock_sleep, mock_kube_client_class):
         """Test immediate success scenario"""
         mock_kube_client = MagicMock()
@@ -268,8 +268,8 @@ class TestLargeCluster(unittest.TestCase):
         mock_sleep.assert_not_called()
 
     @patch('clusterloader2.large_cluster.large_cluster.KubernetesClient')
-    @patch('clusterloader2.large_cluster.large_cluster.time.sleep')
-    @patch('clusterloader2.large_cluster.large_cluster.time.time')
+    @patch('utils.polling.time.sleep')
+    @patch('utils.polling.time.time')
     def test_validate_clusterloader2_delayed_success(self, mock_time, mock_sleep, mock_kube_client_class):
         """Test delayed success scenario"""
         mock_kube_client = MagicMock()
@@ -281,9 +281,11 @@ class TestLargeCluster(unittest.TestCase):
         ]
         mock_kube_client_class.return_value = mock_kube_client
 
-        # Mock time progression
+        # Mock time progression: poller start, then an expiry check and a sleep per poll
         start_time = 1000
-        mock_time.side_effect = [start_time, start_time + 60, start_time + 120, start_time + 180]  # Time progression
+        mock_time.side_effect = [
+            start_time, start_time, start_time + 60, start_time + 60, start_time + 120, start_time + 120
+        ]
 
         validate_clusterloader2(node_count=10, operation_timeout_in_minutes=5)
 
@@ -292,8 +294,8 @@ class TestLargeCluster(unittest.TestCase):
         mock_sleep.assert_called()
 
     @patch('clusterloader2.large_cluster.large_cluster.KubernetesClient')
-    @patch('clusterloader2.large_cluster.large_cluster.time.sleep')
-    @patch('clusterloader2.large_cluster.large_cluster.time.time')
+    @patch('utils.polling.time.sleep')
+    @patch('utils.polling.time.time')
     def test_validate_clusterloader2_timeout_failure(self, mock_time, mock_sleep, mock_kube_client_class):
         """Test timeout failure scenario"""
         mock_kube_client = MagicMock()
@@ -304,17 +306,18 @@ class TestLargeCluster(unittest.TestCase):
         # Mock timeout scenario
         start_time = 1000
         timeout_time = start_time + (2 * 60)  # 2 minutes timeout
-        mock_time.side_effect = [start_time, timeout_time + 1]  # Exceed timeout
+        # Poller start, one poll, then the budget is spent before the next sleep
+        mock_time.side_effect = [start_time, start_time, timeout_time + 1, timeout_time + 1]
 
         with self.assertRaises(Exception) as context:
             validate_clusterloader2(node_count=20, operation_timeout_in_minutes=2)
 
-            self.assertIn("Only 15 nodes are ready, expected 20 nodes!", str(context.exception))
+        self.assertIn("Only 15 nodes are ready, expected 20 nodes!", str(context.exception))
         mock_sleep.assert_not_called()
 
     @patch('clusterloader2.large_cluster.large_cluster.KubernetesClient')
-    @patch('clusterloader2.large_cluster.large_cluster.time.sleep')
-    @patch('clusterloader2.large_cluster.large_cluster.time.time')
+    @patch('utils.polling.time.sleep')
+    @patch('utils.polling.time.time')
     def test_validate_clusterloader2_too_many_ready_nodes_failure(self, mock_time, mock_sleep, mock_kube_client_class):
         """Test there are more ready node than required"""
         mock_kube_client = MagicMock()
@@ -324,7 +327,8 @@ class TestLargeCluster(unittest.TestCase):
 
         # Mock timeout scenario
         start_time = 1000
-        mock_time.side_effect = start_time
+        timeout_time = start_time + (2 * 60)
+        mock_time.side_effect = [start_time, start_time, timeout_time + 1, timeout_time + 1]
 
         with self.assertRaises(Exception) as context:
             validate_clusterloader2(
@@ -332,11 +336,10 @@ class TestLargeCluster(unittest.TestCase):
                 operation_timeout_in_minutes=2
             )
 
-            self.assertIn(
-                "Only 5 nodes are ready, expected 2 nodes!",
-                str(context.exception)
-            )
-
+        self.assertIn(
+            "Only 5 nodes are ready, expected 2 nodes!",
+            str(context.exception)
+        )
         mock_sleep.assert_not_called()
 
     @patch('clusterloader2.large_cluster.large_cluster.KubernetesClient')
@@ -492,15 +495,15 @@ class TestLargeCluster(unittest.TestCase):
             json.dump(data, f)
         return file_path
 
-    @patch('clusterloader2.large_cluster.large_cluster.parse_xml_to_json')
-    @patch('clusterloader2.large_cluster.large_cluster.get_measurement')
+    @patch('clusterloader2.large_cluster.large_cluster.parse_junit_xml')
+    @patch('clusterloader2.utils.get_measurement')
     def test_collect_clusterloader2_successful_test(self, mock_get_measurement, mock_parse_xml):
         """Test successful test scenario"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock parse_xml_to_json
-            mock_parse_xml.return_value = json.dumps({
+            # Mock parse_junit_xml
+            mock_parse_xml.return_value = {
                 "testsuites": [{"failures": 0}]
-            })
+            }
 
             # Create measurement file
             self.create_mock_measurement_file(temp_dir, "measurement1.json")
@@ -523,15 +526,15 @@ class TestLargeCluster(unittest.TestCase):
                 self.assertIn('"status": "success"', content)
                 self.assertIn('"test_measurement"', content)
 
-    @patch('clusterloader2.large_cluster.large_cluster.parse_xml_to_json')
-    @patch('clusterloader2.large_cluster.large_cluster.get_measurement')
+    @patch('clusterloader2.large_cluster.large_cluster.parse_junit_xml')
+    @patch('clusterloader2.utils.get_measurement')
     def test_collect_clusterloader2_failed_test(self, mock_get_measurement, mock_parse_xml):
         """Test failed test scenario"""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Mock parse_xml_to_json with failures
-            mock_parse_xml.return_value = json.dumps({
+            mock_parse_xml.return_value = {
                 "testsuites": [{"failures": 2}]
-            })
+            }
 
             # Create measurement file
             self.create_mock_measurement_file(temp_dir, "measurement1.json")
@@ -550,14 +553,14 @@ class TestLargeCluster(unittest.TestCase):
                 content = f.read()
                 self.assertIn('"status": "failure"', content)
 
-    @patch('clusterloader2.large_cluster.large_cluster.parse_xml_to_json')
-    @patch('clusterloader2.large_cluster.large_cluster.get_measurement')
+    @patch('clusterloader2.large_cluster.large_cluster.parse_junit_xml')
+    @patch('clusterloader2.utils.get_measurement')
     def test_collect_clusterloader2_no_data_items(self, mock_get_measurement, mock_parse_xml):
         """Test scenario with empty data items"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            mock_parse_xml.return_value = json.dumps({
+            mock_parse_xml.return_value = {
                 "testsuites": [{"failures": 0}]
-            })
+            }
 
             # Create measurement file with empty dataItems
             self.create_mock_measurement_file(temp_dir, "measurement1.json",
@@ -575,14 +578,14 @@ class TestLargeCluster(unittest.TestCase):
             # Result file should be created but with minimal content
             self.assertTrue(os.path.exists(result_file))
 
-    @patch('clusterloader2.large_cluster.large_cluster.parse_xml_to_json')
-    @patch('clusterloader2.large_cluster.large_cluster.get_measurement')
+    @patch('clusterloader2.large_cluster.large_cluster.parse_junit_xml')
+    @patch('clusterloader2.utils.get_measurement')
     def test_collect_clusterloader2_multiple_measurements(self, mock_get_measurement, mock_parse_xml):
         """Test scenario with multiple measurement files"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            mock_parse_xml.return_value = json.dumps({
+            mock_parse_xml.return_value = {
                 "testsuites": [{"failures": 0}]
-            })
+            }
 
             # Create multiple measurement files
             self.create_mock_measurement_file(temp_dir, "measurement1.json")
@@ -619,13 +622,13 @@ class TestLargeCluster(unittest.TestCase):
                     **self.test_params
                 )
 
-    @patch('clusterloader2.large_cluster.large_cluster.parse_xml_to_json')
+    @patch('clusterloader2.large_cluster.large_cluster.parse_junit_xml')
     def test_collect_clusterloader2_empty_testsuites(self, mock_parse_xml):
         """Test scenario with empty testsuites array"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            mock_parse_xml.return_value = json.dumps({
+            mock_parse_xml.return_value = {
                 "testsuites": []
-            })
+            }
 
             result_file = os.path.join(temp_dir, "result.json")
 
@@ -655,12 +658,12 @@ class TestLargeCluster(unittest.TestCase):
                     **self.test_params
                 )
 
-    @patch('clusterloader2.large_cluster.large_cluster.parse_xml_to_json')
+    @patch('clusterloader2.large_cluster.large_cluster.parse_junit_xml')
     def test_collect_clusterloader2_invalid_json_structure_junit_xml(self, mock_parse_xml):
-        """Test handling of junit.xml that creates invalid JSON"""
+        """Test handling of junit.xml parsed into an unexpected structure"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Simulate parse_xml_to_json returning invalid JSON
-            mock_parse_xml.return_value = '{"testsuites": invalid_json}'
+            # Simulate parse_junit_xml returning a structure without testsuites
+            mock_parse_xml.return_value = {"testsuite": "invalid"}
 
             result_file = os.path.join(temp_dir, "result.json")
 
@@ -75,6 +75,7 @@ class TestMachineCRUD(unittest.TestCase):
             machine_workers=4,
             readiness_wait_timeout=1800,
             tags={"owner": "perf"},
+            batch_concurrency=3,
         )
 
         self.assertTrue(result)
@@ -88,6 +89,7 @@ class TestMachineCRUD(unittest.TestCase):
             timeout=900,
             readiness_wait_timeout=1800,
             tags={"owner": "perf"},
+            batch_concurrency=3,
         )
 
     def test_scale_machine_defaults_match_signature(self):
@@ -103,6 +105,7 @@ class TestMachineCRUD(unittest.TestCase):
         self.assertEqual(kwargs["machine_workers"], 1)
         self.assertEqual(kwargs["readiness_wait_timeout"], 1200)
         self.assertIsNone(kwargs["tags"])
+        self.assertIsNone(kwargs["batch_concurrency"])
 
     def test_scale_machine_swallows_exception(self):
         self.mock_client.scale_machine.side_effect = RuntimeError("boom")
@@ -0,0 +1,82 @@
+"""Unit tests for the lookup cache."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.lookup_cache import LookupCache
+
+
+class TestLookupCache(unittest.TestCase):
+    """Tests for LookupCache."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self._tmp_dir.name, "cache", "lookups.json")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_get_or_load_calls_loader_once(self):
+        cache = LookupCache()
+        loader = mock.MagicMock(return_value={"id": "lt-1"})
+
+        self.assertEqual(cache.get_or_load(("launch_template", "us-east-1", "tpl"), loader), {"id": "lt-1"})
+        self.assertEqual(cache.get_or_load(("launch_template", "us-east-1", "tpl"), loader), {"id": "lt-1"})
+
+        loader.assert_called_once_with()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_none_results_are_not_cached(self):
+        cache = LookupCache()
+        loader = mock.MagicMock(side_effect=[None, "lt-1"])
+
+        self.assertIsNone(cache.get_or_load(("launch_template", "tpl"), loader))
+        self.assertEqual(cache.get_or_load(("launch_template", "tpl"), loader), "lt-1")
+
+    @mock.patch("utils.lookup_cache.time.time")
+    def test_entries_expire(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = LookupCache(default_ttl_seconds=60)
+        cache.set(("subnets", "run"), ["subnet-1"])
+
+        mock_time.return_value = 1059.0
+        self.assertEqual(cache.get(("subnets", "run")), ["subnet-1"])
+        mock_time.return_value = 1061.0
+        self.assertIsNone(cache.get(("subnets", "run")))
+
+    def test_entries_persist_to_file(self):
+        LookupCache(self.path).set(("cluster", "us-east-1", "run"), {"name": "c", "version": "1.31"})
+
+        self.assertEqual(
+            LookupCache(self.path).get(("cluster", "us-east-1", "run")), {"name": "c", "version": "1.31"}
+        )
+
+    def test_unreadable_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        cache = LookupCache(self.path)
+
+        self.assertIsNone(cache.get(("cluster",)))
+        cache.set(("cluster",), "c")
+        self.assertEqual(LookupCache(self.path).get(("cluster",)), "c")
+
+    def test_invalidate_by_prefix_and_value(self):
+        cache = LookupCache(self.path)
+        cache.set(("launch_template", "us-east-1", "a"), "lt-1")
+        cache.set(("launch_template", "us-east-1", "b"), "lt-2")
+        cache.set(("launch_template_x", "us-east-1"), "lt-3")
+        cache.set(("subnets", "us-east-1", "run"), ["subnet-1"])
+
+        self.assertEqual(cache.invalidate("launch_template", "us-east-1", value="lt-2"), 1)
+        self.assertEqual(cache.get(("launch_template", "us-east-1", "a")), "lt-1")
+        self.assertEqual(cache.invalidate("launch_template"), 1)
+        self.assertEqual(cache.get(("launch_template_x", "us-east-1")), "lt-3")
+        self.assertIsNone(LookupCache(self.path).get(("launch_template", "us-east-1", "a")))
+        self.assertEqual(cache.invalidate(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for operation_limiter module
+"""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.operation_limiter import ClusterOperationLimiter
+
+
+class TestClusterOperationLimiter(unittest.TestCase):
+    """Tests for ClusterOperationLimiter"""
+
+    def _max_in_flight(self, limiter, cluster_names):
+        lock = threading.Lock()
+        in_flight = {}
+        peak = {}
+        barrier = threading.Barrier(len(cluster_names), timeout=0.2)
+
+        def run(cluster_name):
+            with limiter.slot(cluster_name):
+                with lock:
+                    in_flight[cluster_name] = in_flight.get(cluster_name, 0) + 1
+                    peak[cluster_name] = max(peak.get(cluster_name, 0), in_flight[cluster_name])
+                try:
+                    # Give the other operations a chance to overlap.
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+                with lock:
+                    in_flight[cluster_name] -= 1
+
+        with ThreadPoolExecutor(max_workers=len(cluster_names)) as executor:
+            list(executor.map(run, cluster_names))
+        return peak
+
+    def test_limit_is_per_cluster(self):
+        limiter = ClusterOperationLimiter(max_concurrent=1)
+
+        peak = self._max_in_flight(limiter, ["c1", "c1", "c1", "c2", "c2"])
+
+        self.assertEqual(peak, {"c1": 1, "c2": 1})
+
+    def test_no_limit_by_default(self):
+        peak = self._max_in_flight(ClusterOperationLimiter(), ["c1", "c1", "c1"])
+
+        self.assertEqual(peak, {"c1": 3})
+
+    def test_slot_released_on_error(self):
+        limiter = ClusterOperationLimiter(max_concurrent=1)
+
+        with self.assertRaises(RuntimeError):
+            with limiter.slot("c1"):
+                raise RuntimeError("put failed")
+
+        with limiter.slot("c1") as waited:
+            self.assertLess(waited, 1)
+
+    def test_acquire_returns_held_slot(self):
+        limiter = ClusterOperationLimiter(max_concurrent=1)
+        operation_slot = limiter.acquire("c1")
+        waiter = threading.Thread(target=lambda: limiter.acquire("c1").release())
+
+        waiter.start()
+        waiter.join(timeout=0.1)
+        self.assertTrue(waiter.is_alive())
+        operation_slot.release()
+        operation_slot.release()  # releasing twice frees the slot only once
+        waiter.join()
+
+        with limiter.slot("c1") as waited:
+            self.assertLess(waited, 1)
+        self.assertEqual(ClusterOperationLimiter().acquire("c1").waited, 0.0)
+
+    def test_invalid_limit_raises(self):
+        with self.assertRaises(ValueError):
+            ClusterOperationLimiter(max_concurrent=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Unit tests for output_sink module
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from utils.output_sink import OutputSink
+
+
+class TestOutputSink(unittest.TestCase):
+    """Tests for OutputSink"""
+
+    def test_write_to_file_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "out.log")
+            with OutputSink(path, buffer_size=4) as sink:
+                sink.write("hello ")
+                sink.write(b"world\n")
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), b"hello world\n")
+            self.assertEqual(sink.bytes_written, 12)
+
+    def test_buffer_is_flushed_when_full(self):
+        chunks = []
+        sink = OutputSink(chunks.append, buffer_size=8)
+
+        sink.write("1234")
+        self.assertEqual(chunks, [])
+        sink.write("56789")
+        self.assertEqual(chunks, [b"123456789"])
+
+        sink.write("x")
+        sink.close()
+        self.assertEqual(chunks, [b"123456789", b"x"])
+
+    def test_line_callback_across_chunks(self):
+        lines = []
+        with OutputSink(io.BytesIO(), line_callback=lines.append) as sink:
+            sink.write("a\r\nb")
+            sink.write("c\n\nlast")
+
+        self.assertEqual(lines, ["a", "bc", "", "last"])
+        self.assertEqual(sink.lines, 4)
+
+    def test_long_line_is_split_to_bound_memory(self):
+        lines = []
+        with OutputSink(line_callback=lines.append, buffer_size=4) as sink:
+            sink.write("abcdefghij\n")
+
+        self.assertEqual(lines, ["abcd", "efgh", "ij"])
+
+    def test_tail_keeps_last_bytes(self):
+        sink = OutputSink(tail_size=5)
+        sink.write("0123456789")
+        self.assertEqual(sink.tail, "56789")
+
+    def test_unsupported_destination(self):
+        with self.assertRaises(ValueError):
+            OutputSink(42)
+
+
+if __name__ == "__main__":
+    unittest.main()
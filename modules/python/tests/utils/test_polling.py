@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Unit tests for polling module
+"""
+
+import itertools
+import unittest
+from unittest import mock
+
+from utils.polling import AdaptivePoller
+
+
+class TestAdaptivePoller(unittest.TestCase):
+    """Tests for AdaptivePoller"""
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.time", return_value=0)
+    def test_interval_grows_and_resets_on_state_change(self, _mock_time, mock_sleep):
+        poller = AdaptivePoller(timeout_seconds=100, initial_interval=1, max_interval=5, jitter=0)
+
+        for state in (0, 0, 0, 0, 1, 1):
+            self.assertTrue(poller.sleep(state=state))
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1, 2, 4, 5, 1, 2])
+        self.assertEqual(poller.attempts, 6)
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.time", side_effect=itertools.chain([0, 9], itertools.repeat(10)))
+    def test_sleep_is_capped_by_deadline(self, _mock_time, mock_sleep):
+        poller = AdaptivePoller(timeout_seconds=10, initial_interval=5, jitter=0)
+
+        self.assertTrue(poller.sleep())
+        mock_sleep.assert_called_once_with(1)
+
+        self.assertFalse(poller.sleep())
+        self.assertTrue(poller.expired())
+        mock_sleep.assert_called_once()
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.time", return_value=100)
+    def test_shared_deadline(self, _mock_time, _mock_sleep):
+        poller = AdaptivePoller(deadline=130)
+        self.assertEqual(poller.remaining(), 30)
+        self.assertFalse(poller.expired())
+
+    @mock.patch("time.sleep")
+    def test_jitter_bounds(self, mock_sleep):
+        poller = AdaptivePoller(initial_interval=10, multiplier=1, jitter=0.2)
+
+        for _ in range(20):
+            poller.sleep()
+
+        self.assertTrue(all(8 <= c.args[0] <= 12 for c in mock_sleep.call_args_list))
+
+    def test_no_timeout_never_expires(self):
+        self.assertFalse(AdaptivePoller().expired())
+
+
+if __name__ == "__main__":
+    unittest.main()
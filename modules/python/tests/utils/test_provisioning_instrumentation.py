@@ -3,14 +3,20 @@
 Unit tests for provisioning_instrumentation module
 """
 
+import threading
 import unittest
 from unittest import mock
 
 from azure.core.exceptions import HttpResponseError
 
+from clients.arm_lro import AdaptiveArmPolling
+
 from utils.provisioning_instrumentation import (
+    ReadyNodeTracker,
     begin_create_or_update_with_retry,
     instrument_nodepool_provisioning,
+    instrument_provisioning,
+    run_pipelined_steps,
 )
 
 
@@ -94,6 +100,121 @@ class TestInstrumentNodepoolProvisioning(unittest.TestCase):
         self.assertIn("K8s timeout", str(ctx.exception))
 
 
+class TestInstrumentProvisioning(unittest.TestCase):
+    """Tests for the cloud-agnostic instrument_provisioning engine"""
+
+    @mock.patch("utils.provisioning_instrumentation.time")
+    def test_timings_measured_from_given_start_time(self, mock_time):
+        """An explicit start_time is used as the baseline for both timings"""
+        mock_time.time.side_effect = [150, 120]
+
+        op = mock.MagicMock()
+        control_plane_callable = mock.MagicMock(return_value=False)
+        ready_nodes = [mock.MagicMock()]
+        k8s_callable = mock.MagicMock(return_value=ready_nodes)
+
+        result = instrument_provisioning(
+            node_pool_name="ng1",
+            op=op,
+            control_plane_callable=control_plane_callable,
+            k8s_wait_callable=k8s_callable,
+            control_plane="EKS",
+            start_time=100,
+        )
+
+        self.assertEqual(result, ready_nodes)
+        op.add_metadata.assert_any_call("command_execution_time", 50)
+        op.add_metadata.assert_any_call("node_readiness_time", 20)
+        op.add_metadata.assert_any_call("retry_occurred", False)
+
+    @mock.patch("utils.provisioning_instrumentation.time")
+    def test_observed_ready_timestamps_recorded(self, mock_time):
+        """The times the readiness wait first observed each node Ready are summarized in op"""
+        mock_time.time.side_effect = [150, 120]
+
+        op = mock.MagicMock()
+        ready_timestamps = {}
+        nodes = []
+        for name in ("n1", "n2"):
+            node = mock.MagicMock()
+            node.metadata.name = name
+            node.status.conditions = []
+            nodes.append(node)
+
+        def k8s_callable():
+            ready_timestamps.update({"n1": 110, "n2": 118})
+            return nodes
+
+        instrument_provisioning(
+            node_pool_name="ng1",
+            op=op,
+            control_plane_callable=mock.MagicMock(return_value=False),
+            k8s_wait_callable=k8s_callable,
+            start_time=100,
+            ready_timestamps=ready_timestamps,
+        )
+
+        observed = next(
+            c.args[1] for c in op.add_metadata.call_args_list
+            if c.args[0] == "observed_node_readiness_times"
+        )
+        self.assertEqual(observed["P50"]["elapsed_time_seconds"], 10)
+        self.assertEqual(observed["P100"]["elapsed_time_seconds"], 18)
+
+
+class TestReadyNodeTracker(unittest.TestCase):
+    """Tests for ReadyNodeTracker"""
+
+    def test_wait_for_returns_once_target_crossed(self):
+        """Scaling up, a target is reached even if more nodes are ready than requested"""
+        listings = iter([["n1"], ["n1", "n2", "n3"]])
+        with ReadyNodeTracker(lambda: next(listings, ["n1", "n2", "n3"]), poll_interval=0.01) as tracker:
+            self.assertEqual(tracker.wait_for(2, timeout_seconds=5), ["n1", "n2", "n3"])
+
+    def test_wait_for_scaling_down(self):
+        with ReadyNodeTracker(lambda: ["n1"], scaling_up=False, poll_interval=0.01) as tracker:
+            self.assertEqual(tracker.wait_for(2, timeout_seconds=5), ["n1"])
+
+    def test_wait_for_timeout_raises(self):
+        with ReadyNodeTracker(lambda: ["n1"], poll_interval=0.01) as tracker:
+            with self.assertRaises(Exception) as ctx:
+                tracker.wait_for(3, timeout_seconds=0.05)
+        self.assertIn("Only 1 nodes are ready, expected 3 nodes!", str(ctx.exception))
+
+
+class TestRunPipelinedSteps(unittest.TestCase):
+    """Tests for run_pipelined_steps"""
+
+    def test_next_step_starts_before_previous_readiness(self):
+        """Step 2 is submitted while step 1 still waits for its nodes"""
+        step2_started = threading.Event()
+
+        def run_step(step_index, step, control_plane_done):
+            control_plane_done.set()
+            if step_index == 0:
+                # Only finishes once the next step has been submitted.
+                self.assertTrue(step2_started.wait(5))
+            else:
+                step2_started.set()
+            return step
+
+        self.assertEqual(run_pipelined_steps([2, 4], run_step), [2, 4])
+
+    def test_failure_stops_further_steps(self):
+        calls = []
+
+        def run_step(step_index, step, control_plane_done):
+            calls.append(step)
+            if step_index == 1:
+                raise ValueError("update failed")
+            control_plane_done.set()
+            return step
+
+        with self.assertRaises(ValueError):
+            run_pipelined_steps([1, 2, 3], run_step)
+        self.assertEqual(calls, [1, 2])
+
+
 class TestBeginCreateOrUpdateWithRetry(unittest.TestCase):
     """Tests for begin_create_or_update_with_retry"""
 
@@ -118,6 +239,32 @@ class TestBeginCreateOrUpdateWithRetry(unittest.TestCase):
         self.assertFalse(result)
         sdk_client.agent_pools.begin_create_or_update.assert_called_once()
 
+    @mock.patch("utils.provisioning_instrumentation.time")
+    def test_uses_adaptive_polling_and_records_lro_timing(self, mock_time):
+        """The SDK LRO is polled by AdaptiveArmPolling and its timing lands in op metadata"""
+        mock_time.sleep = mock.MagicMock()
+
+        mock_poller = mock.MagicMock()
+        mock_poller.done.return_value = True
+        sdk_client = mock.MagicMock()
+        sdk_client.agent_pools.begin_create_or_update.return_value = mock_poller
+        op = mock.MagicMock()
+
+        begin_create_or_update_with_retry(
+            aks_sdk_client=sdk_client,
+            resource_group="rg",
+            cluster_name="cluster1",
+            node_pool_name="pool1",
+            parameters={},
+            op=op,
+        )
+
+        polling = sdk_client.agent_pools.begin_create_or_update.call_args.kwargs["polling"]
+        self.assertIsInstance(polling, AdaptiveArmPolling)
+        self.assertEqual(polling.tracker.kind, "agentpool_put:pool1")
+        mock_poller.wait.assert_called_once()
+        op.add_metadata.assert_called_once_with("arm_lro", polling.tracker.summary())
+
     @mock.patch("utils.provisioning_instrumentation.time")
     def test_retries_on_operation_not_allowed(self, mock_time):
         """Returns True (retry occurred) after transient OperationNotAllowed"""
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Unit tests for readiness_timeline module
+"""
+
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from kubernetes.client.models import (
+    V1Node, V1NodeCondition, V1NodeStatus, V1ObjectMeta, V1Pod, V1PodCondition, V1PodStatus
+)
+
+from utils.readiness_timeline import ReadinessTimeline, add_observed_readiness, get_ready_transition_time
+
+START = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _node(name, offset_seconds, status="True"):
+    return V1Node(
+        metadata=V1ObjectMeta(name=name),
+        status=V1NodeStatus(conditions=[
+            V1NodeCondition(type="MemoryPressure", status="False"),
+            V1NodeCondition(type="Ready", status=status,
+                            last_transition_time=datetime.fromtimestamp(START + offset_seconds, timezone.utc)),
+        ]),
+    )
+
+
+class TestGetReadyTransitionTime(unittest.TestCase):
+    """Tests for get_ready_transition_time"""
+
+    def test_node_ready(self):
+        self.assertEqual(get_ready_transition_time(_node("n1", 12)), START + 12)
+
+    def test_node_not_ready(self):
+        self.assertIsNone(get_ready_transition_time(_node("n1", 12, status="False")))
+
+    def test_pod_naive_timestamp_is_utc(self):
+        pod = V1Pod(
+            metadata=V1ObjectMeta(name="p1"),
+            status=V1PodStatus(conditions=[
+                V1PodCondition(type="Ready", status="True", last_transition_time=datetime(2026, 1, 1, 0, 0, 5)),
+            ]),
+        )
+        self.assertEqual(get_ready_transition_time(pod), START + 5)
+
+    def test_object_without_status(self):
+        self.assertIsNone(get_ready_transition_time(object()))
+
+
+class TestReadinessTimeline(unittest.TestCase):
+    """Tests for ReadinessTimeline"""
+
+    def setUp(self):
+        self.timeline = ReadinessTimeline(START)
+        self.timeline.record_all([_node(f"n{i}", 10 * i) for i in range(1, 11)] + [_node("old", -60)])
+
+    def test_baseline_objects_are_excluded(self):
+        self.assertEqual(self.timeline.baseline, {"old"})
+        self.assertEqual(len(self.timeline.transition_times), 10)
+
+    def test_percentiles(self):
+        result = self.timeline.percentiles((50, 90, 100))
+
+        self.assertEqual(result["P50"]["target_count"], 5)
+        self.assertEqual(result["P50"]["elapsed_time_seconds"], 50)
+        self.assertEqual(result["P90"]["elapsed_time_seconds"], 90)
+        self.assertEqual(result["P100"]["elapsed_time_seconds"], 100)
+        self.assertEqual(result["P100"]["transition_timestamp"], "2026-01-01T00:01:40Z")
+        self.assertTrue(all(value["success"] for value in result.values()))
+
+    def test_percentiles_with_missing_objects(self):
+        result = self.timeline.percentiles((50, 100), total=20)
+
+        self.assertEqual(result["P50"]["target_count"], 10)
+        self.assertEqual(result["P50"]["elapsed_time_seconds"], 100)
+        self.assertFalse(result["P100"]["success"])
+        self.assertIsNone(result["P100"]["elapsed_time_seconds"])
+
+    def test_percentiles_empty(self):
+        result = ReadinessTimeline(START).percentiles((50,))
+        self.assertFalse(result["P50"]["success"])
+        self.assertEqual(result["P50"]["target_count"], 0)
+
+    def test_add_to_operation(self):
+        op = mock.MagicMock()
+
+        result = self.timeline.add_to_operation(op, "timeline_node_readiness_times", (100,))
+
+        op.add_metadata.assert_called_once_with("timeline_node_readiness_times", result)
+        self.assertEqual(result["P100"]["elapsed_time_seconds"], 100)
+
+
+class TestObservedReadiness(unittest.TestCase):
+    """Tests for recording the times a wait observed objects Ready"""
+
+    def test_record_observed_uses_observed_time(self):
+        timeline = ReadinessTimeline(START)
+
+        self.assertEqual(timeline.record_observed(_node("n1", 10), START + 14), START + 14)
+        self.assertEqual(timeline.elapsed_times(), [14])
+
+    def test_record_observed_baseline(self):
+        timeline = ReadinessTimeline(START)
+
+        self.assertIsNone(timeline.record_observed(_node("old", -60), START + 1))
+        self.assertEqual(timeline.baseline, {"old"})
+
+    def test_add_observed_readiness(self):
+        op = mock.MagicMock()
+        nodes = [_node("old", -60), _node("n1", 10), _node("n2", 20)]
+        observed = {"old": START + 1, "n1": START + 12, "n2": START + 25}
+
+        result = add_observed_readiness(op, "observed_node_readiness_times", START, nodes, observed)
+
+        op.add_metadata.assert_called_once_with("observed_node_readiness_times", result)
+        self.assertEqual(result["P50"]["elapsed_time_seconds"], 12)
+        self.assertEqual(result["P100"]["elapsed_time_seconds"], 25)
+
+    def test_add_observed_readiness_skips_baseline_only(self):
+        op = mock.MagicMock()
+
+        result = add_observed_readiness(op, "observed_node_readiness_times", START,
+                                        [_node("old", -60)], {"old": START + 1})
+
+        self.assertIsNone(result)
+        op.add_metadata.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
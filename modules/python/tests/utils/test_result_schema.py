@@ -0,0 +1,146 @@
+"""Unit tests for the result schema registry and columnar export."""
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import pyarrow.ipc
+import pyarrow.parquet
+
+from utils.result_schema import (
+    BOOL,
+    DATETIME,
+    DYNAMIC,
+    LONG,
+    REAL,
+    STRING,
+    convert_value,
+    export_parquet,
+    export_records,
+    get_schema,
+    list_schemas,
+    read_ndjson,
+    write_columnar,
+)
+
+
+class TestConvertValue(unittest.TestCase):
+    """Tests for convert_value."""
+
+    def test_conversions(self):
+        cases = [
+            ("10", LONG, 10),
+            (10.0, LONG, 10),
+            (10.5, LONG, None),
+            ("abc", LONG, None),
+            ("4.25", REAL, 4.25),
+            ("True", BOOL, True),
+            ("maybe", BOOL, None),
+            ({"a": 1}, STRING, '{"a": 1}'),
+            ({"cloud": "aws"}, DYNAMIC, '{"cloud": "aws"}'),
+            ('{"cloud": "aws"}', DYNAMIC, '{"cloud": "aws"}'),
+            ("2025-01-01T00:00:00Z", DATETIME, datetime(2025, 1, 1, tzinfo=timezone.utc)),
+            ("not a date", DATETIME, None),
+            (None, REAL, None),
+        ]
+        for value, column_type, expected in cases:
+            with self.subTest(value=value, column_type=column_type):
+                self.assertEqual(convert_value(value, column_type), expected)
+
+
+class TestResultSchema(unittest.TestCase):
+    """Tests for the registered schemas."""
+
+    def test_registry(self):
+        self.assertTrue({"cl2", "crud", "fio", "iperf3", "nccl"} <= set(list_schemas()))
+        with self.assertRaises(ValueError):
+            get_schema("unknown")
+
+    def test_crud_columns_derived_from_operation_info(self):
+        record = {
+            "timestamp": "2025-01-01T00:00:00Z",
+            "region": "eastus",
+            "operation_info": json.dumps({
+                "name": "create_node_pool",
+                "success": True,
+                "duration": 120,
+                "start_timestamp": "2025-01-01T00:00:00+00:00",
+            }),
+            "run_id": "run",
+            "run_url": "http://run",
+        }
+
+        row = get_schema("crud").normalize(record)
+
+        self.assertEqual(row["operation_name"], "create_node_pool")
+        self.assertIs(row["success"], True)
+        self.assertEqual(row["duration"], 120.0)
+        self.assertEqual(row["start_timestamp"], datetime(2025, 1, 1, tzinfo=timezone.utc))
+        self.assertIsNone(row["end_timestamp"])
+        self.assertEqual(row["operation_info"], record["operation_info"])
+        self.assertIsNone(row["extra"])
+
+    def test_unknown_keys_go_to_extra(self):
+        row = get_schema("cl2").normalize({"node_count": "5", "max_pods": 110, "measurement": "m"})
+
+        self.assertEqual(row["node_count"], 5)
+        self.assertEqual(row["measurement"], "m")
+        self.assertEqual(json.loads(row["extra"]), {"max_pods": 110})
+
+    def test_kusto_columns_exclude_derived_columns(self):
+        columns = dict(get_schema("crud").kusto_columns())
+
+        self.assertEqual(columns["operation_info"], DYNAMIC)
+        self.assertNotIn("operation_name", columns)
+
+
+class TestExportParquet(unittest.TestCase):
+    """Tests for export_parquet."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.ndjson_path = os.path.join(self._tmp_dir.name, "results.json")
+        with open(self.ndjson_path, "w", encoding="utf-8") as f:
+            for i in range(3):
+                f.write(json.dumps({"timestamp": "2025-01-01T00:00:00Z", "node_count": i,
+                                    "result": {"value": i}, "run_id": "run"}) + "\n")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_export_parquet(self):
+        path = export_parquet(self.ndjson_path, "cl2")
+
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(path, os.path.join(self._tmp_dir.name, "results.parquet"))
+        self.assertEqual(table.column("node_count").to_pylist(), [0, 1, 2])
+        self.assertEqual(str(table.schema.field("timestamp").type), "timestamp[us, tz=UTC]")
+
+        self.assertEqual(table.column("result").to_pylist(), ['{"value": 0}', '{"value": 1}', '{"value": 2}'])
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_write_columnar_arrow_ipc_in_batches(self):
+        path = os.path.join(self._tmp_dir.name, "results.arrow")
+
+        count = write_columnar(read_ndjson(self.ndjson_path), path, get_schema("cl2"), batch_size=2)
+
+        with pyarrow.ipc.open_file(path) as reader:
+            self.assertEqual(reader.num_record_batches, 2)
+            table = reader.read_all()
+        self.assertEqual(count, 3)
+        self.assertEqual(table.column("run_id").to_pylist(), ["run"] * 3)
+
+    def test_missing_results_file(self):
+        self.assertIsNone(export_parquet(os.path.join(self._tmp_dir.name, "missing.json"), "cl2"))
+
+    @mock.patch("utils.result_schema.write_columnar", side_effect=OSError("disk full"))
+    def test_export_records_failure_is_not_raised(self, _mock_write_columnar):
+        path = os.path.join(self._tmp_dir.name, "results.parquet")
+
+        self.assertIsNone(export_records([{"run_id": "run"}], path, "cl2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Unit tests for the teardown queue."""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from utils.teardown_queue import TeardownQueue
+
+
+class TestTeardownQueue(unittest.TestCase):
+    """Tests for TeardownQueue."""
+
+    def setUp(self):
+        self.queue = TeardownQueue(max_workers=4, max_retries=2, backoff_seconds=0)
+
+    def test_submit_returns_before_task_finishes(self):
+        release = threading.Event()
+        delete = mock.MagicMock(side_effect=lambda name: release.wait(5))
+
+        future = self.queue.submit("delete ns", delete, args=("ns",))
+
+        self.assertFalse(future.done())
+        self.assertEqual(self.queue.pending(), 1)
+        release.set()
+        self.assertTrue(self.queue.drain())
+        delete.assert_called_once_with("ns")
+        self.assertEqual(self.queue.pending(), 0)
+
+    def test_tasks_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        for i in range(3):
+            self.queue.submit(f"delete node {i}", barrier.wait)
+
+        self.assertTrue(self.queue.drain())
+        self.assertEqual(len(self.queue.results()), 3)
+
+    def test_failed_task_is_retried(self):
+        delete = mock.MagicMock(side_effect=[Exception("conflict"), False, None])
+
+        self.queue.submit("delete pool", delete, kwargs={"node_pool_name": "np"})
+
+        self.assertTrue(self.queue.drain())
+        self.assertEqual(delete.call_count, 3)
+        delete.assert_called_with(node_pool_name="np")
+        self.assertEqual(self.queue.results()[0]["attempts"], 3)
+
+    def test_drain_reports_failure_and_writes_results(self):
+        self.queue.submit("delete pool", mock.MagicMock(return_value=False), max_retries=0)
+        self.queue.submit("delete ns", mock.MagicMock(return_value=None))
+
+        with tempfile.TemporaryDirectory() as result_dir:
+            result_file = os.path.join(result_dir, "teardown.json")
+            self.assertFalse(self.queue.drain(result_file=result_file))
+            with open(result_file, "r", encoding="utf-8") as f:
+                records = {record["name"]: record for record in json.load(f)}
+
+        self.assertFalse(records["delete pool"]["success"])
+        self.assertEqual(records["delete pool"]["attempts"], 1)
+        self.assertTrue(records["delete ns"]["success"])
+        self.assertIsNotNone(records["delete ns"]["latency_seconds"])
+
+    def test_drain_timeout(self):
+        release = threading.Event()
+        self.queue.submit("slow delete", release.wait)
+
+        self.assertFalse(self.queue.drain(timeout=0.01))
+        self.assertEqual(self.queue.pending(), 1)
+        release.set()
+        self.assertTrue(self.queue.drain())
+
+
+if __name__ == "__main__":
+    unittest.main()
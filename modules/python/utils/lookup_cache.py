@@ -0,0 +1,144 @@
+"""
+Lookup Cache Module
+
+TTL cache for cloud lookups whose answers rarely change within a run (the
+cluster of a run ID, its subnets and node role, instance type details,
+launch template IDs). Entries are persisted to a JSON file when a path is
+given, so the separate create/scale/delete invocations of one run share it
+and skip the pre-flight API calls after the first one::
+
+    cache = LookupCache(os.path.join(result_dir, "cache", "eks_lookups.json"))
+    details = cache.get_or_load(
+        ("instance_type", region, "m5.large"),
+        lambda: ec2.describe_instance_types(InstanceTypes=["m5.large"])["InstanceTypes"][0],
+        ttl_seconds=24 * 3600,
+    )
+
+Keys are tuples of strings; ``invalidate`` drops an exact key or every key
+starting with the given parts.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 6 * 3600
+_KEY_SEPARATOR = "|"
+_MISSING = object()
+
+
+class LookupCache:
+    """Thread-safe TTL cache with optional JSON file persistence."""
+
+    def __init__(self, path: Optional[str] = None, default_ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            path: JSON file backing the cache, or None to keep it in memory only.
+            default_ttl_seconds: Lifetime of entries stored without an explicit TTL.
+        """
+        self.path = path
+        self.default_ttl_seconds = default_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @staticmethod
+    def _key(key: Tuple) -> str:
+        return _KEY_SEPARATOR.join(str(part) for part in key)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable lookup cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        now = time.time()
+        entries = {key: entry for key, entry in self._entries.items() if entry["expires_at"] > now}
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a partial file.
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist lookup cache {self.path}: {e}")
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """Return the cached value of ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(self._key(key))
+            if entry is None or entry["expires_at"] <= time.time():
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry["value"]
+
+    def set(self, key: Tuple, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store ``value`` (JSON serializable) under ``key``."""
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[self._key(key)] = {"value": value, "expires_at": time.time() + ttl}
+            self._save()
+
+    def get_or_load(self, key: Tuple, loader: Callable[[], Any], ttl_seconds: Optional[float] = None,
+                    cache_if: Callable[[Any], bool] = lambda value: value is not None) -> Any:
+        """
+        Return the cached value of ``key``, calling ``loader`` and caching its result on a miss.
+
+        Args:
+            key: Cache key parts.
+            loader: Zero-arg callable doing the actual lookup.
+            ttl_seconds: Lifetime of a newly loaded entry.
+            cache_if: Results for which this returns False (default: None) are not cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = loader()
+        if cache_if(value):
+            self.set(key, value, ttl_seconds)
+        return value
+
+    def invalidate(self, *prefix: Any, value: Any = _MISSING) -> int:
+        """
+        Drop entries whose key starts with ``prefix`` (all entries if empty).
+
+        Args:
+            prefix: Leading key parts.
+            value: If given, only drop entries holding this value.
+
+        Returns:
+            Number of entries dropped.
+        """
+        key_prefix = self._key(prefix)
+        with self._lock:
+            dropped = [
+                key for key, entry in self._entries.items()
+                if (not prefix or key == key_prefix or key.startswith(key_prefix + _KEY_SEPARATOR))
+                and (value is _MISSING or entry["value"] == value)
+            ]
+            for key in dropped:
+                del self._entries[key]
+            if dropped:
+                self._save()
+        return len(dropped)
@@ -0,0 +1,110 @@
+"""
+Operation Limiter Module
+
+Caps the number of control-plane operations (ARM node pool PUT/DELETE on AKS,
+node group create/update/delete calls on EKS) that run against one cluster at
+the same time. A single client instance is shared by every node pool of a
+``matrix`` run, so the limit applies across all of them; without a limit the
+control plane rejects or serializes the overlapping operations on its own
+(e.g. ``OperationNotAllowed`` from AKS) and the retries distort the timings.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+
+class ClusterOperationLimiter:
+    """
+    Per-cluster bound on concurrent control-plane operations.
+
+    Typical use::
+
+        limiter = ClusterOperationLimiter(max_concurrent=2)
+        with limiter.slot(cluster_name):
+            poller = client.agent_pools.begin_create_or_update(...)
+            poller.result()
+
+    With ``max_concurrent=None`` (the default) ``slot`` does not block.
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None):
+        """
+        Args:
+            max_concurrent: Maximum operations in flight per cluster, or None for no limit.
+        """
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self.max_concurrent = None
+        self.set_limit(max_concurrent)
+
+    def set_limit(self, max_concurrent: Optional[int]) -> None:
+        """Change the limit. Operations already holding a slot are not affected."""
+        if max_concurrent is not None and max_concurrent <= 0:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
+        with self._lock:
+            self.max_concurrent = max_concurrent
+            self._semaphores = {}
+
+    def _semaphore(self, cluster_name: str) -> Optional[threading.BoundedSemaphore]:
+        with self._lock:
+            if self.max_concurrent is None:
+                return None
+            if cluster_name not in self._semaphores:
+                self._semaphores[cluster_name] = threading.BoundedSemaphore(self.max_concurrent)
+            return self._semaphores[cluster_name]
+
+    def acquire(self, cluster_name: str, label: str = "") -> "OperationSlot":
+        """
+        Wait for one of the cluster's operation slots and return it held.
+
+        Take the slot before starting any timer of the operation, so queueing
+        behind other operations is not measured as the operation itself.
+        """
+        semaphore = self._semaphore(cluster_name)
+        if semaphore is None:
+            return OperationSlot(None, 0.0)
+        start = time.monotonic()
+        semaphore.acquire()  # pylint: disable=consider-using-with
+        waited = time.monotonic() - start
+        if waited >= 1:
+            logger.info(
+                f"{label}waited {waited:.1f}s for a control-plane operation slot on cluster {cluster_name}"
+            )
+        return OperationSlot(semaphore, waited)
+
+    @contextmanager
+    def slot(self, cluster_name: str, label: str = ""):
+        """
+        Hold one of the cluster's operation slots for the duration of the block.
+
+        Yields:
+            Seconds spent waiting for the slot.
+        """
+        operation_slot = self.acquire(cluster_name, label=label)
+        try:
+            yield operation_slot.waited
+        finally:
+            operation_slot.release()
+
+
+class OperationSlot:
+    """A held operation slot; ``release`` may be called more than once."""
+
+    def __init__(self, semaphore: Optional[threading.BoundedSemaphore], waited: float):
+        self.waited = waited
+        self._semaphore = semaphore
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            semaphore, self._semaphore = self._semaphore, None
+        if semaphore is not None:
+            semaphore.release()
@@ -0,0 +1,128 @@
+"""
+Output Sink Module
+
+Bounded-buffer writer for streamed pod exec and log output. Chunks are written
+through to a file path, a binary file object or a callable, and optionally
+split into lines for incremental parsing, so memory use does not grow with
+the size of the output.
+"""
+
+from collections import deque
+from typing import Callable, Optional, Union
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_TAIL_SIZE = 4 * 1024
+
+
+class OutputSink:
+    """
+    Write-through sink for streamed output.
+
+    Data is buffered up to ``buffer_size`` bytes before it is flushed to
+    ``dest``. If ``line_callback`` is given it is called with every complete
+    line (decoded, without the line terminator). A line longer than
+    ``buffer_size`` is passed to the callback in ``buffer_size`` pieces. The
+    last ``tail_size`` bytes are kept in ``tail`` for error reporting.
+    """
+
+    def __init__(self, dest: Union[str, Callable, object, None] = None,
+                 line_callback: Optional[Callable[[str], None]] = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 tail_size: int = DEFAULT_TAIL_SIZE,
+                 encoding: str = "utf-8"):
+        """
+        Args:
+            dest: File path to write to, a binary file-like object with ``write``,
+                  a callable taking bytes, or None to discard the data.
+            line_callback: Optional callable invoked with each complete line.
+            buffer_size: Maximum number of bytes held before flushing to ``dest``.
+            tail_size: Number of trailing bytes kept for ``tail``.
+            encoding: Encoding used for str chunks and for decoding lines.
+        """
+        self.line_callback = line_callback
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self.bytes_written = 0
+        self.lines = 0
+        self._buffer = bytearray()
+        self._partial_line = bytearray()
+        self._tail = deque(maxlen=tail_size)
+        self._file = None
+        self._owns_file = False
+        if isinstance(dest, str):
+            self._file = open(dest, "wb")  # pylint: disable=consider-using-with
+            self._owns_file = True
+            self._write_func = self._file.write
+        elif dest is None:
+            self._write_func = None
+        elif hasattr(dest, "write"):
+            self._write_func = dest.write
+        elif callable(dest):
+            self._write_func = dest
+        else:
+            raise ValueError(f"Unsupported output sink destination: {type(dest).__name__}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def tail(self) -> str:
+        """The last ``tail_size`` bytes written, decoded."""
+        return bytes(self._tail).decode(self.encoding, errors="replace")
+
+    def write(self, chunk: Union[str, bytes]) -> None:
+        """Write a chunk of output."""
+        if not chunk:
+            return
+        data = chunk.encode(self.encoding) if isinstance(chunk, str) else bytes(chunk)
+        self.bytes_written += len(data)
+        self._tail.extend(data)
+        if self.line_callback is not None:
+            self._split_lines(data)
+        if self._write_func is not None:
+            self._buffer.extend(data)
+            if len(self._buffer) >= self.buffer_size:
+                self.flush()
+
+    def _emit_line(self, line: bytes) -> None:
+        self.lines += 1
+        self.line_callback(line.rstrip(b"\r").decode(self.encoding, errors="replace"))
+
+    def _split_lines(self, data: bytes) -> None:
+        self._partial_line.extend(data)
+        while True:
+            newline = self._partial_line.find(b"\n", 0, self.buffer_size + 1)
+            if newline >= 0:
+                self._emit_line(bytes(self._partial_line[:newline]))
+                del self._partial_line[:newline + 1]
+            elif len(self._partial_line) >= self.buffer_size:
+                self._emit_line(bytes(self._partial_line[:self.buffer_size]))
+                del self._partial_line[:self.buffer_size]
+            else:
+                break
+
+    def flush(self) -> None:
+        """Write the buffered data to the destination."""
+        if self._buffer and self._write_func is not None:
+            self._write_func(bytes(self._buffer))
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush buffered data, emit a trailing partial line and close a file opened by the sink."""
+        self.flush()
+        if self._partial_line and self.line_callback is not None:
+            self._emit_line(bytes(self._partial_line))
+        self._partial_line.clear()
+        if self._owns_file and self._file is not None:
+            self._file.close()
+            self._file = None
+        logger.debug(f"Output sink closed after {self.bytes_written} bytes and {self.lines} lines")
@@ -0,0 +1,88 @@
+"""
+Polling Module
+
+Adaptive, jittered polling used by the wait helpers. The interval starts
+short, grows exponentially while the observed state does not change, and
+resets to the initial interval as soon as it changes, so short operations
+are noticed quickly and long waits do not hammer the apiserver. Sleeps are
+capped at the remaining deadline budget.
+"""
+
+import math
+import random
+import time
+from typing import Any, Optional
+
+_NO_STATE = object()
+
+
+class AdaptivePoller:
+    """
+    Deadline-bounded poller with jittered exponential backoff.
+
+    Typical use::
+
+        poller = AdaptivePoller(timeout_seconds=600, initial_interval=2, max_interval=10)
+        while not poller.expired():
+            ready = count_ready()
+            if ready == expected:
+                return
+            poller.sleep(state=ready)
+    """
+
+    def __init__(self, timeout_seconds: Optional[float] = None, deadline: Optional[float] = None,
+                 initial_interval: float = 1.0, max_interval: float = 30.0,
+                 multiplier: float = 2.0, jitter: float = 0.1):
+        """
+        Args:
+            timeout_seconds: Budget from now. Ignored if ``deadline`` is given; if both
+                             are None the poller never expires.
+            deadline: Absolute ``time.time()`` deadline, to share a budget with the caller.
+            initial_interval: First sleep, and the sleep used right after a state change.
+            max_interval: Upper bound for the sleep while the state is unchanged.
+            multiplier: Growth factor applied after each unchanged poll.
+            jitter: Relative jitter (0.1 = +/-10%) applied to each sleep.
+        """
+        if deadline is None:
+            deadline = math.inf if timeout_seconds is None else time.time() + timeout_seconds
+        self.deadline = deadline
+        self.initial_interval = initial_interval
+        self.max_interval = max(initial_interval, max_interval)
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.interval = initial_interval
+        self.attempts = 0
+        self._last_state = _NO_STATE
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (never negative)."""
+        return max(0.0, self.deadline - time.time())
+
+    def expired(self) -> bool:
+        return time.time() >= self.deadline
+
+    def sleep(self, state: Any = _NO_STATE) -> bool:
+        """
+        Sleep until the next poll.
+
+        Args:
+            state: Optional value summarising what the last poll observed (e.g. a ready
+                   count). If it differs from the previous poll's state the interval is
+                   reset to ``initial_interval``; otherwise it grows up to ``max_interval``.
+
+        Returns:
+            False without sleeping if the deadline has passed, True otherwise.
+        """
+        if state is not _NO_STATE:
+            if self._last_state is not _NO_STATE and state != self._last_state:
+                self.interval = self.initial_interval
+            self._last_state = state
+
+        remaining = self.remaining()
+        if remaining <= 0:
+            return False
+        delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        time.sleep(min(delay, remaining))
+        self.interval = min(self.interval * self.multiplier, self.max_interval)
+        self.attempts += 1
+        return True
@@ -1,88 +1,259 @@
 """
 Provisioning Instrumentation Module
 
-Runs ARM operations and K8s node readiness checks concurrently,
-capturing separate timing metrics for each. This enables regression
-analysis by surfacing whether ARM or K8s is the provisioning bottleneck.
+Runs a cloud control-plane operation (ARM for AKS, the EKS nodegroup API for
+EKS) and the K8s node readiness check concurrently, capturing separate timing
+metrics for each. Both are measured from the same start time, so the numbers
+are comparable across clouds and surface whether the control plane or K8s is
+the provisioning bottleneck.
 """
 
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
 
 from azure.core.exceptions import HttpResponseError
+from clients.arm_lro import DEFAULT_MAX_INTERVAL_SECONDS, AdaptiveArmPolling, ArmLroTracker
+from clients.arm_throttle import bind_throttle_usage
 from utils.logger_config import get_logger
+from utils.readiness_timeline import add_observed_readiness
 
 logger = get_logger(__name__)
 
 
-def instrument_nodepool_provisioning(
+def instrument_provisioning(
     node_pool_name,
     op,
-    arm_callable,
+    control_plane_callable,
     k8s_wait_callable,
     label="",
+    control_plane="ARM",
+    start_time: Optional[float] = None,
+    ready_timestamps: Optional[dict] = None,
 ):
     """
-    Run ARM operation and K8s node readiness check concurrently using threads.
+    Run a control-plane operation and K8s node readiness check concurrently using threads.
 
     Args:
-        node_pool_name: Name of the node pool being provisioned
+        node_pool_name: Name of the node pool / node group being provisioned
         op: Operation context for recording timing metadata
-        arm_callable: A zero-arg callable that performs the ARM operation and blocks
-                      until complete (e.g. begin_create_or_update_with_retry)
+        control_plane_callable: A zero-arg callable that performs (or waits for) the
+                                control-plane operation and blocks until it completes.
+                                Its truthiness is recorded as ``retry_occurred``.
         k8s_wait_callable: A zero-arg callable that waits for K8s nodes to be ready
                            and returns the list of ready nodes
         label: Optional label for log messages
+        control_plane: Name of the control plane used in log messages (e.g. "ARM", "EKS")
+        start_time: Optional ``time.time()`` the operation was issued at, when the
+                    request was sent before calling this function. Defaults to now.
+        ready_timestamps: Optional dict ``k8s_wait_callable`` fills with the time it first
+                          observed each node Ready (``wait_for_nodes_ready(ready_timestamps=...)``);
+                          summarized as ``observed_node_readiness_times`` percentiles.
 
     Returns:
         List of ready nodes
 
     Raises:
-        Exception: If either the ARM operation or K8s readiness check fails.
+        Exception: If either the control-plane operation or K8s readiness check fails.
     """
-    start_time = time.time()
+    if start_time is None:
+        start_time = time.time()
 
     with ThreadPoolExecutor(max_workers=2) as executor:
-        arm_future = executor.submit(
-            lambda: (arm_callable(), time.time())
+        control_plane_future = executor.submit(
+            bind_throttle_usage(lambda: (control_plane_callable(), time.time()))
         )
         k8s_future = executor.submit(
-            lambda: (k8s_wait_callable(), time.time())
+            bind_throttle_usage(lambda: (k8s_wait_callable(), time.time()))
         )
 
-    arm_exc = arm_future.exception()
+    control_plane_exc = control_plane_future.exception()
     k8s_exc = k8s_future.exception()
 
-    if arm_exc or k8s_exc:
+    if control_plane_exc or k8s_exc:
         elapsed = time.time() - start_time
-        arm_status = f"FAILED: {arm_exc}" if arm_exc else "succeeded"
+        control_plane_status = f"FAILED: {control_plane_exc}" if control_plane_exc else "succeeded"
         k8s_status = f"FAILED: {k8s_exc}" if k8s_exc else "succeeded"
         logger.error(
-            "Concurrent operation failed after %.2fs - ARM: %s, K8s readiness: %s",
-            elapsed, arm_status, k8s_status
+            "Concurrent operation failed after %.2fs - %s: %s, K8s readiness: %s",
+            elapsed, control_plane, control_plane_status, k8s_status
         )
-        if arm_exc:
-            raise arm_exc
+        if control_plane_exc:
+            raise control_plane_exc
         raise k8s_exc
 
-    arm_result, arm_timestamp = arm_future.result()
+    control_plane_result, control_plane_timestamp = control_plane_future.result()
     ready_nodes, ready_timestamp = k8s_future.result()
 
     node_readiness_time = ready_timestamp - start_time
-    command_execution_time = arm_timestamp - start_time
+    command_execution_time = control_plane_timestamp - start_time
 
     op.add_metadata("node_readiness_time", node_readiness_time)
     op.add_metadata("command_execution_time", command_execution_time)
-    op.add_metadata("retry_occurred", bool(arm_result))
+    op.add_metadata("retry_occurred", bool(control_plane_result))
+    if ready_timestamps is not None:
+        add_observed_readiness(op, "observed_node_readiness_times", start_time, ready_nodes, ready_timestamps)
     logger.info(
-        "[%s] %sARM completed in %.2fs, K8s nodes ready in %.2fs | Delta: %.2fs",
-        node_pool_name, label, command_execution_time, node_readiness_time,
+        "[%s] %s%s completed in %.2fs, K8s nodes ready in %.2fs | Delta: %.2fs",
+        node_pool_name, label, control_plane, command_execution_time, node_readiness_time,
         abs(command_execution_time - node_readiness_time)
     )
 
     return ready_nodes
 
 
+def instrument_nodepool_provisioning(
+    node_pool_name,
+    op,
+    arm_callable,
+    k8s_wait_callable,
+    label="",
+    ready_timestamps=None,
+):
+    """
+    Run ARM operation and K8s node readiness check concurrently using threads.
+
+    AKS wrapper around ``instrument_provisioning``; ``arm_callable`` performs the
+    ARM operation and blocks until complete (e.g. begin_create_or_update_with_retry).
+    """
+    return instrument_provisioning(
+        node_pool_name=node_pool_name,
+        op=op,
+        control_plane_callable=arm_callable,
+        k8s_wait_callable=k8s_wait_callable,
+        label=label,
+        control_plane="ARM",
+        ready_timestamps=ready_timestamps,
+    )
+
+
+class ReadyNodeTracker:
+    """
+    Background poller of the ready nodes of one node pool, shared by pipelined scale steps.
+
+    ``wait_for_nodes_ready`` waits for an exact node count, which a step never
+    observes once the next step's nodes start joining. The tracker instead
+    lists the ready nodes on a single thread and wakes every step whose target
+    has been crossed (reached or exceeded when scaling up, reached or gone
+    below when scaling down).
+    """
+
+    def __init__(self, list_ready_nodes: Callable[[], List], scaling_up: bool = True,
+                 poll_interval: float = 2.0):
+        """
+        Args:
+            list_ready_nodes: Zero-arg callable returning the currently ready nodes.
+            scaling_up: Whether targets are reached from below (True) or above (False).
+            poll_interval: Seconds between two node listings.
+        """
+        self.list_ready_nodes = list_ready_nodes
+        self.scaling_up = scaling_up
+        self.poll_interval = poll_interval
+        self._nodes = None
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="ready-node-tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                nodes = list(self.list_ready_nodes())
+                with self._condition:
+                    self._nodes = nodes
+                    self._condition.notify_all()
+            except Exception as e:
+                logger.warning(f"Listing ready nodes failed, retrying: {e}")
+            self._stopped.wait(self.poll_interval)
+
+    def _reached(self, target: int) -> bool:
+        if self._nodes is None:
+            return False
+        count = len(self._nodes)
+        return count >= target if self.scaling_up else count <= target
+
+    def wait_for(self, target: int, timeout_seconds: float) -> List:
+        """
+        Block until the ready node count crosses ``target``.
+
+        Returns:
+            The ready nodes observed when the target was crossed.
+
+        Raises:
+            Exception: If the target is not crossed within ``timeout_seconds``.
+        """
+        deadline = time.time() + timeout_seconds
+        with self._condition:
+            while not self._reached(target):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    ready_count = len(self._nodes or [])
+                    raise Exception(f"Only {ready_count} nodes are ready, expected {target} nodes!")
+                self._condition.wait(remaining)
+            return list(self._nodes)
+
+
+def run_pipelined_steps(steps: Sequence[int], run_step: Callable, label: str = "") -> List:
+    """
+    Run scale steps so that step N+1 starts as soon as step N's control-plane operation completes.
+
+    Args:
+        steps: Node counts to scale through, in order
+        run_step: ``run_step(step_index, step, control_plane_done)`` performs one step
+                  end to end (including its node readiness wait and its own operation
+                  record) and must set the ``threading.Event`` ``control_plane_done``
+                  as soon as the control-plane operation has finished. The event is
+                  also set when ``run_step`` returns or raises.
+        label: Optional label for log messages
+
+    Returns:
+        The results of ``run_step`` for every step, in order.
+
+    Raises:
+        Exception: The first step failure, after every started step has finished.
+            No new step is started once a step failed.
+    """
+    futures = []
+    with ThreadPoolExecutor(max_workers=max(1, len(steps))) as executor:
+        for step_index, step in enumerate(steps):
+            control_plane_done = threading.Event()
+            future = executor.submit(run_step, step_index, step, control_plane_done)
+            future.add_done_callback(lambda _future, done=control_plane_done: done.set())
+            futures.append(future)
+            control_plane_done.wait()
+            if future.done() and future.exception():
+                logger.error(
+                    "%sstep %s/%s to %s nodes failed; not starting further steps",
+                    label, step_index + 1, len(steps), step
+                )
+                break
+            logger.info(
+                "%sstep %s/%s to %s nodes: control plane done, readiness tracked in background",
+                label, step_index + 1, len(steps), step
+            )
+
+    for future in futures:
+        if future.exception():
+            raise future.exception()
+    return [future.result() for future in futures]
+
+
 def begin_create_or_update_with_retry(
     aks_sdk_client,
     resource_group,
@@ -92,39 +263,47 @@ def begin_create_or_update_with_retry(
     label="",
     retries=10,
     retry_wait=30,
-    poll_interval=30,
+    poll_interval=DEFAULT_MAX_INTERVAL_SECONDS,
     timeout=1800,
+    op=None,
 ):
     """
     Call begin_create_or_update with retry on OperationNotAllowed/EtagMismatch,
-    polling every poll_interval seconds and raising TimeoutError after timeout seconds.
+    raising TimeoutError after timeout seconds.
     timeout defaults to 1800s (30 min) for slow GPU node provisioning (A100 MIG).
 
+    The LRO is polled by ``AdaptiveArmPolling``: tightly around the completion
+    time expected from earlier PUTs on the same node pool, backing off to at
+    most ``poll_interval`` seconds (or the server's Retry-After) otherwise. If
+    ``op`` is given, the server-reported start/end times and the detection lag
+    are added to its metadata as ``arm_lro``.
+
     Returns:
         bool: True if a retry occurred, False if the operation succeeded on the first attempt.
     """
     retry_occurred = False
     for attempt in range(retries):
         try:
+            tracker = ArmLroTracker(
+                kind=f"agentpool_put:{node_pool_name}",
+                max_interval=poll_interval,
+                label=f"Node pool {node_pool_name} {label}",
+            )
             poller = aks_sdk_client.agent_pools.begin_create_or_update(
                 resource_group_name=resource_group,
                 resource_name=cluster_name,
                 agent_pool_name=node_pool_name,
                 parameters=parameters,
+                polling=AdaptiveArmPolling(tracker),
             )
-            elapsed = 0
-            while not poller.done():
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-                if elapsed >= timeout:
-                    raise TimeoutError(
-                        f"Node pool {node_pool_name} {label}timed out after {timeout}s"
-                    )
-                logger.info(
-                    f"Waiting for node pool {node_pool_name} {label}to complete "
-                    f"({elapsed}s elapsed)..."
+            poller.wait(timeout=max(0, timeout - tracker.elapsed()))
+            if not poller.done():
+                raise TimeoutError(
+                    f"Node pool {node_pool_name} {label}timed out after {timeout}s"
                 )
             poller.result()
+            if op is not None:
+                op.add_metadata("arm_lro", tracker.summary())
             return retry_occurred
         except HttpResponseError as e:
             if any(code in str(e) for code in ("OperationNotAllowed", "EtagMismatch")) and attempt < retries - 1:
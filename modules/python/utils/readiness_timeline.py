@@ -0,0 +1,165 @@
+"""
+Readiness Timeline Module
+
+Records the exact Ready ``lastTransitionTime`` of nodes and pods, taken from
+the objects themselves, and computes readiness percentiles from those
+timestamps. Unlike sampling a ready count on a poll interval, the resulting
+numbers are not quantized by the poll interval or inflated by apiserver
+latency.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+DEFAULT_PERCENTILES = (50, 70, 90, 99, 100)
+
+
+def get_ready_transition_time(obj) -> Optional[float]:
+    """
+    Return the Ready condition's lastTransitionTime as epoch seconds.
+
+    Works for both V1Node and V1Pod model objects. Returns None if the object
+    has no Ready condition with status True.
+    """
+    status = getattr(obj, "status", None)
+    for condition in getattr(status, "conditions", None) or []:
+        if condition.type == "Ready" and condition.status == "True":
+            transition_time = condition.last_transition_time
+            if transition_time is None:
+                return None
+            if transition_time.tzinfo is None:
+                transition_time = transition_time.replace(tzinfo=timezone.utc)
+            return transition_time.timestamp()
+    return None
+
+
+class ReadinessTimeline:
+    """
+    Per-object Ready transition recorder.
+
+    Objects whose Ready transition happened before ``start_time`` are counted
+    as baseline (already Ready before the measured operation) and excluded
+    from the percentiles.
+    """
+
+    def __init__(self, start_time: float):
+        """
+        Args:
+            start_time: Epoch seconds the operation started; percentiles are
+                        reported as seconds elapsed since this time.
+        """
+        self.start_time = start_time
+        self.transition_times: Dict[str, float] = {}
+        self.baseline = set()
+
+    def record(self, obj) -> Optional[float]:
+        """Record the Ready transition of a single node or pod. Returns the timestamp recorded, if any."""
+        transition_time = get_ready_transition_time(obj)
+        if transition_time is None:
+            return None
+        name = obj.metadata.name
+        if transition_time < self.start_time:
+            self.baseline.add(name)
+            return None
+        self.transition_times[name] = transition_time
+        return transition_time
+
+    def record_all(self, objects: Iterable) -> None:
+        """Record the Ready transition of every object in ``objects``."""
+        for obj in objects:
+            self.record(obj)
+
+    def record_observed(self, obj, observed_time: float) -> Optional[float]:
+        """
+        Record ``observed_time``, when a wait first saw ``obj`` Ready, as its transition.
+
+        The object's own Ready ``lastTransitionTime`` still decides whether it is
+        baseline. Returns the timestamp recorded, if any.
+        """
+        transition_time = get_ready_transition_time(obj)
+        name = obj.metadata.name
+        if transition_time is not None and transition_time < self.start_time:
+            self.baseline.add(name)
+            return None
+        self.transition_times[name] = observed_time
+        return observed_time
+
+    def elapsed_times(self) -> list:
+        """Sorted seconds from ``start_time`` to each recorded Ready transition."""
+        return sorted(t - self.start_time for t in self.transition_times.values())
+
+    def percentiles(self, percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+                    total: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute readiness percentiles.
+
+        Args:
+            percentiles: Percentiles to compute (e.g. 50, 90, 100).
+            total: Expected number of objects. Defaults to the number recorded;
+                   pass the requested count so that objects that never became
+                   Ready make the higher percentiles fail.
+
+        Returns:
+            Dict keyed by "P<n>" with target_count, elapsed_time_seconds,
+            transition_timestamp (ISO 8601, UTC), percentage and success.
+        """
+        elapsed = self.elapsed_times()
+        total = len(elapsed) if total is None else total
+        result = {}
+        for p in percentiles:
+            target = max(1, math.ceil((p / 100.0) * total)) if total > 0 else 0
+            success = 0 < target <= len(elapsed)
+            result[f"P{p}"] = {
+                "target_count": target,
+                "elapsed_time_seconds": elapsed[target - 1] if success else None,
+                "transition_timestamp": (
+                    datetime.fromtimestamp(self.start_time + elapsed[target - 1], timezone.utc)
+                    .strftime("%Y-%m-%dT%H:%M:%SZ") if success else None
+                ),
+                "percentage": p,
+                "success": success,
+            }
+        return result
+
+    def add_to_operation(self, op, key: str, percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+                         total: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Compute percentiles and add them to ``op`` metadata under ``key``. Returns the percentiles."""
+        result = self.percentiles(percentiles, total)
+        op.add_metadata(key, result)
+        summary = ", ".join(f"{name}={value['elapsed_time_seconds']}" for name, value in result.items())
+        logger.info(f"{key}: {summary}")
+        return result
+
+
+def add_observed_readiness(op, key: str, start_time: float, ready_objects: Iterable,
+                           ready_timestamps: Dict[str, float]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Add percentiles of when a readiness wait first observed each object Ready to ``op``.
+
+    Args:
+        op: Operation to add the percentiles to, under ``key``.
+        start_time: Epoch seconds the measured operation started.
+        ready_objects: The ready nodes or pods the wait returned.
+        ready_timestamps: Name -> epoch seconds filled by the wait's ``ready_timestamps``.
+
+    Returns:
+        The percentiles, or None if nothing was observed or no object became
+        Ready after ``start_time``.
+    """
+    if not ready_timestamps:
+        return None
+    timeline = ReadinessTimeline(start_time)
+    for obj in ready_objects or []:
+        observed_time = ready_timestamps.get(obj.metadata.name)
+        if observed_time is not None:
+            timeline.record_observed(obj, observed_time)
+    if not timeline.transition_times:
+        return None
+    return timeline.add_to_operation(op, key)
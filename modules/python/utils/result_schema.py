@@ -0,0 +1,361 @@
+"""
+Result Schema Module
+
+Typed, per-scenario schemas for the ``results.json`` NDJSON files, and a
+columnar (Parquet or Arrow IPC) writer producing a typed copy next to them::
+
+    export_parquet(f"{result_dir}/results.json", "crud")
+    # -> {result_dir}/results.parquet
+
+Every column has a fixed type instead of one inferred from a sample line.
+Columns may be derived from a nested path, e.g. ``operation_info.success``,
+so JSON-in-string fields such as ``operation_info`` are also exposed as typed
+columns. Keys a schema does not know are kept as JSON in an ``extra`` column.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 10000
+
+# Column types use the Kusto type names
+STRING = "string"
+LONG = "long"
+REAL = "real"
+BOOL = "bool"
+DATETIME = "datetime"
+DYNAMIC = "dynamic"
+
+
+@dataclass(frozen=True)
+class Column:
+    """A typed result column, read from ``path`` in the record (default: the column name)."""
+    name: str
+    type: str
+    path: Tuple[str, ...] = ()
+
+
+def _parse_json(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _lookup(value: Any, keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        value = _parse_json(value)
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _to_long(value: Any) -> Optional[int]:
+    if isinstance(value, float) and not value.is_integer():
+        return None
+    return int(value)
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    if isinstance(value, str):
+        if value.lower() not in ("true", "false"):
+            return None
+        return value.lower() == "true"
+    return bool(value)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _to_dynamic(value: Any) -> Optional[str]:
+    # Stored as JSON text; strings are assumed to already hold JSON (e.g. cloud_info)
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+_CONVERTERS = {
+    STRING: _to_string,
+    LONG: _to_long,
+    REAL: float,
+    BOOL: _to_bool,
+    DATETIME: _to_datetime,
+    DYNAMIC: _to_dynamic,
+}
+
+
+def convert_value(value: Any, column_type: str) -> Any:
+    """Convert a value to a column type; values that do not convert become None."""
+    if value is None:
+        return None
+    try:
+        return _CONVERTERS[column_type](value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+@dataclass(frozen=True)
+class ResultSchema:
+    """The columns of one scenario's result records."""
+    name: str
+    columns: Tuple[Column, ...]
+    extra_column: Optional[str] = "extra"
+    _known_keys: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_known_keys", frozenset(
+            column.path[0] if column.path else column.name for column in self.columns
+        ))
+
+    def normalize(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the typed row of a result record."""
+        row = {}
+        parsed_roots = {}
+        for column in self.columns:
+            if column.path:
+                # Parse a JSON-in-string root such as operation_info once per record
+                root = column.path[0]
+                if root not in parsed_roots:
+                    parsed_roots[root] = _parse_json(record.get(root))
+                value = _lookup(parsed_roots[root], column.path[1:])
+            else:
+                value = record.get(column.name)
+            row[column.name] = convert_value(value, column.type)
+        if self.extra_column:
+            extra = {key: value for key, value in record.items() if key not in self._known_keys}
+            row[self.extra_column] = json.dumps(extra) if extra else None
+        return row
+
+    def kusto_columns(self) -> List[Tuple[str, str]]:
+        """(name, Kusto type) of the columns stored as-is in the NDJSON records."""
+        return [(column.name, column.type) for column in self.columns if not column.path]
+
+    def arrow_schema(self):
+        """The pyarrow schema of the typed rows."""
+        arrow_types = {
+            STRING: pyarrow.string(),
+            LONG: pyarrow.int64(),
+            REAL: pyarrow.float64(),
+            BOOL: pyarrow.bool_(),
+            DATETIME: pyarrow.timestamp("us", tz="UTC"),
+            DYNAMIC: pyarrow.string(),
+        }
+        fields = [pyarrow.field(column.name, arrow_types[column.type]) for column in self.columns]
+        if self.extra_column:
+            fields.append(pyarrow.field(self.extra_column, pyarrow.string()))
+        return pyarrow.schema(fields)
+
+
+_SCHEMAS: Dict[str, ResultSchema] = {}
+
+
+def register_schema(schema: ResultSchema) -> ResultSchema:
+    """Add a schema to the registry, replacing one with the same name."""
+    _SCHEMAS[schema.name] = schema
+    return schema
+
+
+def get_schema(name: str) -> ResultSchema:
+    """Return a registered schema."""
+    if name not in _SCHEMAS:
+        raise ValueError(f"Unknown result schema: {name}. Known schemas: {sorted(_SCHEMAS)}")
+    return _SCHEMAS[name]
+
+
+def list_schemas() -> List[str]:
+    """Names of the registered schemas."""
+    return sorted(_SCHEMAS)
+
+
+_RUN_COLUMNS = (
+    Column("run_id", STRING),
+    Column("run_url", STRING),
+)
+
+# ClusterLoader2 measurement records (clusterloader2.utils.iter_cl2_records and
+# the per-scenario summary records)
+CL2_SCHEMA = register_schema(ResultSchema("cl2", (
+    Column("timestamp", DATETIME),
+    Column("status", STRING),
+    Column("test_type", STRING),
+    Column("node_count", LONG),
+    Column("group", STRING),
+    Column("measurement", STRING),
+    Column("percentile", STRING),
+    Column("result", DYNAMIC),
+    Column("data", DYNAMIC),
+    Column("provider", STRING),
+    Column("cloud_info", DYNAMIC),
+    *_RUN_COLUMNS,
+)))
+
+# crud Operation records (crud.main.collect_benchmark_results)
+CRUD_SCHEMA = register_schema(ResultSchema("crud", (
+    Column("timestamp", DATETIME),
+    Column("region", STRING),
+    Column("operation_info", DYNAMIC),
+    *_RUN_COLUMNS,
+    Column("operation_name", STRING, ("operation_info", "name")),
+    Column("cloud", STRING, ("operation_info", "cloud")),
+    Column("success", BOOL, ("operation_info", "success")),
+    Column("duration", REAL, ("operation_info", "duration")),
+    Column("unit", STRING, ("operation_info", "unit")),
+    Column("start_timestamp", DATETIME, ("operation_info", "start_timestamp")),
+    Column("end_timestamp", DATETIME, ("operation_info", "end_timestamp")),
+    Column("error_message", STRING, ("operation_info", "error_message")),
+)))
+
+# fio records (fio.fio.collect)
+FIO_SCHEMA = register_schema(ResultSchema("fio", (
+    Column("timestamp", DATETIME),
+    Column("vm_size", STRING),
+    Column("cloud_info", DYNAMIC),
+    *(Column(f"{op}_{metric}", REAL) for op in ("read", "write")
+      for metric in ("iops_avg", "bw_avg", "lat_avg", "lat_p50", "lat_p99", "lat_p999")),
+    Column("metadata", DYNAMIC),
+    Column("raw_result", DYNAMIC),
+    Column("run_url", STRING),
+)))
+
+# iperf3 records (iperf3.iperf3_pod.Iperf3Pod.collect_iperf3)
+IPERF3_SCHEMA = register_schema(ResultSchema("iperf3", (
+    Column("timestamp", DATETIME),
+    Column("metric", STRING),
+    Column("target_bandwidth", REAL),
+    Column("parallel", LONG),
+    Column("datapath", STRING),
+    Column("unit", STRING),
+    Column("result_info", DYNAMIC),
+    Column("os_info", DYNAMIC),
+    Column("netstat_info", DYNAMIC),
+    Column("ip_link_info", DYNAMIC),
+    Column("kubernetes_info", DYNAMIC),
+    Column("cloud_info", DYNAMIC),
+    Column("run_url", STRING),
+    Column("raw_data", STRING),
+    Column("test_engine", STRING),
+)))
+
+# NCCL records (gpu.main.collect)
+NCCL_SCHEMA = register_schema(ResultSchema("nccl", (
+    Column("timestamp", DATETIME),
+    Column("operation_info", DYNAMIC),
+    *_RUN_COLUMNS,
+    Column("test_type", STRING, ("operation_info", "test_type")),
+    Column("nccl_tests_version", STRING, ("operation_info", "nccl_tests_version")),
+    Column("cloud_info", DYNAMIC, ("operation_info", "cloud_info")),
+    Column("nccl_result", DYNAMIC, ("operation_info", "result")),
+)))
+
+
+def _batched(records: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def write_columnar(records: Iterable[Dict[str, Any]], path: str, schema: ResultSchema,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Write result records as typed rows, in batches.
+
+    Args:
+        records: Result records, e.g. the parsed lines of a results.json file.
+        path: Output file; ``.arrow`` / ``.feather`` writes Arrow IPC, anything else Parquet.
+        schema: Schema of the records.
+        batch_size: Rows converted and written at a time (one Parquet row group each).
+
+    Returns:
+        Number of rows written.
+    """
+    arrow_schema = schema.arrow_schema()
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    count = 0
+    if path.endswith((".arrow", ".feather")):
+        writer = pyarrow.ipc.new_file(tmp_path, arrow_schema)
+    else:
+        writer = pyarrow.parquet.ParquetWriter(tmp_path, arrow_schema, compression="zstd")
+    try:
+        for batch in _batched(records, batch_size):
+            rows = [schema.normalize(record) for record in batch]
+            writer.write_table(pyarrow.Table.from_pylist(rows, schema=arrow_schema))
+            count += len(rows)
+    finally:
+        writer.close()
+    # Readers never see a partially written file
+    os.replace(tmp_path, path)
+    return count
+
+
+def read_ndjson(ndjson_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of an NDJSON file, skipping blank lines."""
+    with open(ndjson_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def export_records(records: Iterable[Dict[str, Any]], path: str, schema_name: str) -> Optional[str]:
+    """
+    Best-effort typed export of result records next to the NDJSON results.
+
+    Failures are logged rather than raised, since the NDJSON file stays the result
+    of record.
+
+    Returns:
+        ``path``, or None if the export failed.
+    """
+    try:
+        count = write_columnar(records, path, get_schema(schema_name))
+    except Exception as e:
+        logger.warning(f"Failed to export {schema_name} results to {path}: {e}")
+        return None
+    logger.info(f"Exported {count} {schema_name} results to {path}")
+    return path
+
+
+def export_parquet(ndjson_path: str, schema_name: str, parquet_path: Optional[str] = None) -> Optional[str]:
+    """
+    Write a typed Parquet copy of an NDJSON results file.
+
+    Args:
+        ndjson_path: The results.json NDJSON file.
+        schema_name: Registered schema of its records, e.g. ``cl2`` or ``crud``.
+        parquet_path: Output path, defaults to ``ndjson_path`` with a ``.parquet`` extension.
+
+    Returns:
+        The Parquet path, or None if nothing was written.
+    """
+    if parquet_path is None:
+        parquet_path = f"{os.path.splitext(ndjson_path)[0]}.parquet"
+    if not os.path.exists(ndjson_path):
+        logger.warning(f"Results file {ndjson_path} not found, skipping typed export")
+        return None
+    return export_records(read_ndjson(ndjson_path), parquet_path, schema_name)
@@ -0,0 +1,157 @@
+"""
+Teardown Queue Module
+
+Runs cleanup work (node pool / node group deletes, namespace deletes, KWOK
+node deletes) in the background so a benchmark can move on to its next phase
+instead of blocking until every delete finished. Deletes are retried, timed,
+and ``drain`` waits for all of them before the process exits, so nothing is
+leaked silently::
+
+    queue = get_teardown_queue()
+    queue.submit(f"delete namespace {ns}", client.delete_namespace, args=(ns,))
+    ...
+    if not queue.drain():
+        sys.exit(1)
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.logger_config import get_logger, setup_logging
+
+# Configure logging
+setup_logging()
+logger = get_logger(__name__)
+
+DEFAULT_TEARDOWN_WORKERS = 8
+
+
+class TeardownQueue:
+    """
+    Background executor for delete intents.
+
+    A task fails when it raises or returns ``False`` (the convention of the
+    CRUD delete methods); failed tasks are retried with a linear backoff.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_TEARDOWN_WORKERS, max_retries: int = 2,
+                 backoff_seconds: float = 5):
+        """
+        Args:
+            max_workers: Deletes running at the same time.
+            max_retries: Default retries per task after the first attempt.
+            backoff_seconds: Retry ``n`` waits ``n * backoff_seconds``.
+        """
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._results: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, func: Callable[..., Any], args: Tuple = (),
+               kwargs: Optional[Dict[str, Any]] = None, max_retries: Optional[int] = None) -> Future:
+        """
+        Queue a delete intent and return immediately.
+
+        Args:
+            name: Description used in logs and results, e.g. ``delete node pool np1``.
+            func: The delete call.
+            args: Positional arguments for ``func``.
+            kwargs: Keyword arguments for ``func``.
+            max_retries: Overrides the queue's retry count for this task.
+
+        Returns:
+            Future resolving to the task result record (see ``drain``).
+        """
+        retries = self.max_retries if max_retries is None else max_retries
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="teardown"
+                )
+            future = self._executor.submit(self._run, name, func, args, kwargs or {}, retries)
+            self._pending.append(future)
+        logger.info(f"Queued teardown: {name}")
+        return future
+
+    def _run(self, name: str, func: Callable[..., Any], args: Tuple,
+             kwargs: Dict[str, Any], retries: int) -> Dict[str, Any]:
+        start = time.perf_counter()
+        error = None
+        attempt = 0
+        for attempt in range(1, retries + 2):
+            try:
+                if func(*args, **kwargs) is not False:
+                    error = None
+                    break
+                error = f"{name} returned False"
+            except Exception as e:
+                error = str(e)
+            if attempt <= retries:
+                logger.warning(f"Teardown '{name}' attempt {attempt} failed: {error}, retrying")
+                time.sleep(self.backoff_seconds * attempt)
+        record = {
+            "name": name,
+            "success": error is None,
+            "attempts": attempt,
+            "latency_seconds": round(time.perf_counter() - start, 3),
+            "error": error,
+        }
+        if error is None:
+            logger.info(f"Teardown '{name}' finished in {record['latency_seconds']}s")
+        else:
+            logger.error(f"Teardown '{name}' failed after {attempt} attempts: {error}")
+        with self._lock:
+            self._results.append(record)
+        return record
+
+    def pending(self) -> int:
+        """Number of queued or running tasks."""
+        with self._lock:
+            return sum(1 for future in self._pending if not future.done())
+
+    def drain(self, timeout: Optional[float] = None, result_file: Optional[str] = None) -> bool:
+        """
+        Wait for every queued task.
+
+        Args:
+            timeout: Seconds to wait in total, or None to wait indefinitely.
+            result_file: Optional path to write the task records (name, success,
+                         attempts, latency_seconds, error) to as JSON.
+
+        Returns:
+            True if every task succeeded within the timeout.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            logger.info(f"Draining {len(pending)} teardown tasks")
+        done, not_done = wait(pending, timeout=timeout)
+        if not_done:
+            logger.error(f"{len(not_done)} teardown tasks still running after {timeout}s")
+            with self._lock:
+                self._pending.extend(not_done)
+        with self._lock:
+            results = list(self._results)
+        if result_file:
+            with open(result_file, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+        return not not_done and all(future.result()["success"] for future in done)
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Records of the finished tasks."""
+        with self._lock:
+            return list(self._results)
+
+
+_default_queue = TeardownQueue()
+
+
+def get_teardown_queue() -> TeardownQueue:
+    """Return the process-wide teardown queue."""
+    return _default_queue